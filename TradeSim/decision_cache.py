@@ -0,0 +1,224 @@
+"""
+On-disk cache of precomputed strategy decisions.
+
+Cache files are compressed .npz archives holding the int8 decision tensor of a
+DecisionStore together with its strategy/ticker/date axes, a mask of the
+(ticker, date) cells that were computed and a fingerprint of each ticker's
+price history.
+
+The file name is a hash of everything that changes what a decision is: the
+ideal_period mapping, the source of the strategy modules and the precompute
+function, the TA-Lib version and the precompute mode. Tickers and dates are
+cells inside the file, so a later run over an overlapping window only computes
+the (ticker, date) cells that are missing or whose price history changed.
+"""
+
+import hashlib
+import inspect
+import json
+import os
+import sys
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+import talib
+
+from TradeSim.decisions import MISSING, DecisionStore
+from TradeSim.utils import SCALAR_ONLY_STRATEGIES, _trading_days
+
+
+def decision_cache_key(strategies, ideal_period, precompute):
+    """
+    Hashes the inputs that decide what a strategy returns for a given price window.
+    """
+    strategy_modules = sorted({strategy.__module__ for strategy in strategies})
+    if precompute.__name__.endswith("_vectorized"):
+        strategy_modules.append("strategies.talib_indicators_vect")
+
+    digest = hashlib.sha256()
+    digest.update(precompute.__name__.encode())
+    digest.update(json.dumps(ideal_period, sort_keys=True).encode())
+    digest.update(json.dumps(sorted(SCALAR_ONLY_STRATEGIES)).encode())
+    digest.update(talib.__version__.encode())
+    for strategy in strategies:
+        digest.update(strategy.__name__.encode())
+    for module_name in strategy_modules:
+        digest.update(inspect.getsource(sys.modules[module_name]).encode())
+    digest.update(inspect.getsource(sys.modules[precompute.__module__]).encode())
+    return digest.hexdigest()[:32]
+
+
+def price_fingerprint(history):
+    """
+    Hashes a ticker's price history (index and values).
+    """
+    if history is None or history.empty:
+        return ""
+    hashed = pd.util.hash_pandas_object(history, index=True).to_numpy()
+    return hashlib.sha256(hashed.tobytes()).hexdigest()[:32]
+
+
+def load_decision_cache(path):
+    """
+    Returns (store, computed, fingerprints) from a cache file, or None if absent.
+    """
+    if not os.path.exists(path):
+        return None
+    with np.load(path, allow_pickle=False) as archive:
+        store = DecisionStore(
+            archive["strategy_names"].tolist(),
+            archive["tickers"].tolist(),
+            archive["dates"].tolist(),
+        )
+        store.codes[:] = archive["codes"]
+        computed = archive["computed"].copy()
+        fingerprints = dict(
+            zip(archive["tickers"].tolist(), archive["fingerprints"].tolist())
+        )
+    return store, computed, fingerprints
+
+
+def save_decision_cache(path, store, computed, fingerprints):
+    """
+    Atomically writes a DecisionStore and its computed mask to a cache file.
+    """
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp.npz"
+    np.savez_compressed(
+        tmp_path,
+        codes=store.codes,
+        computed=computed,
+        strategy_names=np.array(store.strategy_names, dtype=str),
+        tickers=np.array(store.tickers, dtype=str),
+        dates=np.array(store.dates, dtype=str),
+        fingerprints=np.array(
+            [fingerprints.get(ticker, "") for ticker in store.tickers], dtype=str
+        ),
+    )
+    os.replace(tmp_path, path)
+
+
+def cached_precompute_strategy_decisions(
+    precompute,
+    strategies,
+    ticker_price_history,
+    train_tickers,
+    ideal_period,
+    start_date,
+    end_date,
+    logger,
+    cache_dir,
+):
+    """
+    Runs precompute (precompute_strategy_decisions or its vectorized version)
+    through the on-disk cache, computing only cells missing from it.
+    """
+    if isinstance(start_date, str):
+        start_date = datetime.strptime(start_date, "%Y-%m-%d")
+    if isinstance(end_date, str):
+        end_date = datetime.strptime(end_date, "%Y-%m-%d")
+
+    strategy_names = [strategy.__name__ for strategy in strategies]
+    dates = [day.strftime("%Y-%m-%d") for day in _trading_days(start_date, end_date)]
+    fingerprints = {
+        ticker: price_fingerprint(ticker_price_history.get(ticker))
+        for ticker in train_tickers
+    }
+    path = os.path.join(
+        cache_dir, f"{decision_cache_key(strategies, ideal_period, precompute)}.npz"
+    )
+
+    store = DecisionStore(strategy_names, train_tickers, dates)
+    computed = np.zeros((len(train_tickers), len(dates)), dtype=bool)
+    cached = load_decision_cache(path)
+    if cached is not None:
+        cached_store, cached_computed, cached_fingerprints = cached
+        store.update(cached_store)
+        for t, ticker in enumerate(train_tickers):
+            c = cached_store.ticker_index.get(ticker)
+            if c is None or cached_fingerprints.get(ticker) != fingerprints[ticker]:
+                # Price history changed: drop whatever the cache had for it.
+                store.codes[:, t, :] = MISSING
+                continue
+            for d, date_str in enumerate(dates):
+                cached_d = cached_store.date_index.get(date_str)
+                if cached_d is not None:
+                    computed[t, d] = cached_computed[c, cached_d]
+
+    missing_tickers = [
+        ticker for t, ticker in enumerate(train_tickers) if not computed[t].all()
+    ]
+    logger.info(
+        f"Decision cache {path}: {int(computed.sum())}/{computed.size} "
+        f"(ticker, date) cells cached."
+    )
+
+    if missing_tickers:
+        missing_rows = [store.ticker_index[ticker] for ticker in missing_tickers]
+        missing_dates = np.flatnonzero(~computed[missing_rows].all(axis=0))
+        fresh = precompute(
+            strategies,
+            ticker_price_history,
+            missing_tickers,
+            ideal_period,
+            datetime.strptime(dates[missing_dates[0]], "%Y-%m-%d"),
+            datetime.strptime(dates[missing_dates[-1]], "%Y-%m-%d"),
+            logger,
+        )
+        for t_fresh, ticker in enumerate(fresh.tickers):
+            t = store.ticker_index[ticker]
+            for d_fresh, date_str in enumerate(fresh.dates):
+                d = store.date_index[date_str]
+                store.codes[:, t, d] = fresh.codes[:, t_fresh, d_fresh]
+                computed[t, d] = True
+
+        save_decision_cache(
+            path,
+            *_merge_with_cache(store, computed, fingerprints, cached),
+        )
+
+    return store
+
+
+def _merge_with_cache(store, computed, fingerprints, cached):
+    """
+    Combines this run's cells with the other tickers/dates already in the cache.
+    """
+    if cached is None:
+        return store, computed, fingerprints
+
+    cached_store, cached_computed, cached_fingerprints = cached
+    tickers = list(
+        dict.fromkeys(
+            list(cached_store.tickers)
+            + [t for t in store.tickers if t not in cached_store.ticker_index]
+        )
+    )
+    dates = sorted(set(cached_store.dates) | set(store.dates))
+    merged = DecisionStore(store.strategy_names, tickers, dates)
+    merged_computed = np.zeros((len(tickers), len(dates)), dtype=bool)
+    merged_fingerprints = dict(cached_fingerprints)
+
+    for c, ticker in enumerate(cached_store.tickers):
+        if ticker in store.ticker_index and (
+            cached_fingerprints.get(ticker) != fingerprints[ticker]
+        ):
+            continue  # Stale: replaced by this run's cells below.
+        t = merged.ticker_index[ticker]
+        d_cols = [merged.date_index[date_str] for date_str in cached_store.dates]
+        merged.codes[:, t, d_cols] = cached_store.codes[:, c, :]
+        merged_computed[t, d_cols] = cached_computed[c]
+
+    for t_store, ticker in enumerate(store.tickers):
+        t = merged.ticker_index[ticker]
+        d_cols = [merged.date_index[date_str] for date_str in store.dates]
+        if cached_fingerprints.get(ticker) != fingerprints[ticker]:
+            merged.codes[:, t, :] = MISSING
+            merged_computed[t, :] = False
+        done = computed[t_store]
+        merged.codes[:, t, np.array(d_cols)[done]] = store.codes[:, t_store, done]
+        merged_computed[t, np.array(d_cols)[done]] = True
+        merged_fingerprints[ticker] = fingerprints[ticker]
+
+    return merged, merged_computed, merged_fingerprints
@@ -0,0 +1,284 @@
+"""
+Compact storage for precomputed strategy decisions.
+
+Decisions are held in a dense int8 array shaped (strategy, ticker, date) with
+the strategies.signals codes (BUY/SELL/HOLD as 1/-1/0) and MISSING marking
+cells that were never computed (no price data, no ideal period or a failing
+strategy). The simulator reads the codes (day_signals).
+
+DecisionStore still behaves like the nested dict it replaces, so
+precomputed_decisions[strategy_name][ticker].get(date_str) keeps returning
+"Buy", "Sell", "Hold" or None.
+"""
+
+from collections.abc import Mapping
+
+import numpy as np
+
+from strategies.signals import BUY, HOLD, MISSING, SELL, SIGNAL_NAMES, to_signal
+
+ACTION_TO_CODE = {action: code for code, action in SIGNAL_NAMES.items()}
+CODE_TO_ACTION = SIGNAL_NAMES
+
+
+def encode_actions(actions):
+    """
+    Converts an iterable of signals (1/-1/0 or "Buy"/"Sell"/"Hold") to int8 codes.
+    """
+    actions = np.asarray(actions)
+    if actions.dtype.kind in "iub":
+        codes = actions.astype(np.int8)
+    elif actions.dtype.kind == "f":
+        codes = np.where(np.isnan(actions), MISSING, actions).astype(np.int8)
+    else:
+        try:
+            codes = np.array(
+                [ACTION_TO_CODE[action] for action in actions.tolist()],
+                dtype=np.int8,
+            )
+        except KeyError as e:
+            raise ValueError(f"Unknown strategy action: {e.args[0]!r}") from None
+
+    invalid = ~np.isin(codes, (BUY, SELL, HOLD, MISSING))
+    if invalid.any():
+        raise ValueError(f"Unknown strategy signal: {codes[invalid][0]}")
+    return codes
+
+
+class DecisionStore(Mapping):
+    """
+    Dense (strategy, ticker, date) decision tensor with a nested-dict style accessor.
+    """
+
+    def __init__(self, strategy_names, tickers, dates):
+        self.strategy_names = list(strategy_names)
+        self.tickers = list(tickers)
+        self.dates = list(dates)
+        self.strategy_index = {name: i for i, name in enumerate(self.strategy_names)}
+        self.ticker_index = {ticker: i for i, ticker in enumerate(self.tickers)}
+        self.date_index = {date_str: i for i, date_str in enumerate(self.dates)}
+        self.codes = np.full(
+            (len(self.strategy_names), len(self.tickers), len(self.dates)),
+            MISSING,
+            dtype=np.int8,
+        )
+        self._views = {}
+
+    @classmethod
+    def from_dicts(cls, decisions, tickers=None, dates=None):
+        """
+        Builds a store from the nested {strategy: {ticker: {date_str: action}}} dict.
+        Actions are signals or action strings, as accepted by set.
+        """
+        if tickers is None:
+            tickers = sorted(
+                {ticker for by_ticker in decisions.values() for ticker in by_ticker}
+            )
+        if dates is None:
+            dates = sorted(
+                {
+                    date_str
+                    for by_ticker in decisions.values()
+                    for by_date in by_ticker.values()
+                    for date_str in by_date
+                }
+            )
+        store = cls(decisions.keys(), tickers, dates)
+        for strategy_name, by_ticker in decisions.items():
+            for ticker, by_date in by_ticker.items():
+                for date_str, action in by_date.items():
+                    store.set(strategy_name, ticker, date_str, action)
+        return store
+
+    def set(self, strategy_name, ticker, date_str, action):
+        """
+        Writes one decision: a BUY/SELL/HOLD signal or an action string
+        ("Buy", "sell", "strong buy", ...).
+        """
+        self.codes[
+            self.strategy_index[strategy_name],
+            self.ticker_index[ticker],
+            self.date_index[date_str],
+        ] = encode_actions([to_signal(action)])[0]
+
+    def set_series(self, strategy_name, ticker, date_positions, signals):
+        """
+        Writes a run of signals for one strategy/ticker at the given date positions.
+        """
+        self.codes[
+            self.strategy_index[strategy_name],
+            self.ticker_index[ticker],
+            date_positions,
+        ] = encode_actions(signals)
+
+    def get_action(self, strategy_name, ticker, date_str, default=None):
+        s = self.strategy_index.get(strategy_name)
+        t = self.ticker_index.get(ticker)
+        d = self.date_index.get(date_str)
+        if s is None or t is None or d is None:
+            return default
+        return CODE_TO_ACTION.get(int(self.codes[s, t, d]), default)
+
+    def day_actions(self, ticker, date_str):
+        """
+        Returns {strategy_name: action} for one ticker and date, with None for
+        missing cells, reading the whole strategy column in one go.
+        """
+        t = self.ticker_index.get(ticker)
+        d = self.date_index.get(date_str)
+        if t is None or d is None:
+            return dict.fromkeys(self.strategy_names)
+        return dict(
+            zip(
+                self.strategy_names,
+                map(CODE_TO_ACTION.get, self.codes[:, t, d].tolist()),
+            )
+        )
+
+    def day_signals(self, ticker, date_str):
+        """
+        Returns {strategy_name: signal} (BUY/SELL/HOLD) for one ticker and
+        date, with None for missing cells.
+        """
+        t = self.ticker_index.get(ticker)
+        d = self.date_index.get(date_str)
+        if t is None or d is None:
+            return dict.fromkeys(self.strategy_names)
+        return {
+            name: None if code == MISSING else code
+            for name, code in zip(self.strategy_names, self.codes[:, t, d].tolist())
+        }
+
+    def day_codes(self, tickers, date_str, strategy_names=None):
+        """
+        Returns the (tickers x strategies) int8 codes for one date, in the
+        given strategy order (the store's by default), with MISSING for
+        unknown tickers, strategies or dates.
+        """
+        if strategy_names is None:
+            strategy_names = self.strategy_names
+        codes = np.full((len(tickers), len(strategy_names)), MISSING, dtype=np.int8)
+        d = self.date_index.get(date_str)
+        if d is None:
+            return codes
+        s_src = [self.strategy_index.get(name, -1) for name in strategy_names]
+        t_src = [self.ticker_index.get(ticker, -1) for ticker in tickers]
+        s_known = [i for i, s in enumerate(s_src) if s >= 0]
+        t_known = [i for i, t in enumerate(t_src) if t >= 0]
+        if s_known and t_known:
+            day = self.codes[:, :, d]
+            codes[np.ix_(t_known, s_known)] = day[
+                np.ix_([s_src[i] for i in s_known], [t_src[i] for i in t_known])
+            ].T
+        return codes
+
+    def update(self, other):
+        """
+        Copies every computed cell of another DecisionStore into this one.
+        """
+        s_src = [
+            i
+            for i, name in enumerate(other.strategy_names)
+            if name in self.strategy_index
+        ]
+        t_src = [
+            i for i, ticker in enumerate(other.tickers) if ticker in self.ticker_index
+        ]
+        d_src = [
+            i for i, date_str in enumerate(other.dates) if date_str in self.date_index
+        ]
+        s_dst = [self.strategy_index[other.strategy_names[i]] for i in s_src]
+        t_dst = [self.ticker_index[other.tickers[i]] for i in t_src]
+        d_dst = [self.date_index[other.dates[i]] for i in d_src]
+        if not (s_src and t_src and d_src):
+            return
+
+        src = other.codes[np.ix_(s_src, t_src, d_src)]
+        dst = self.codes[np.ix_(s_dst, t_dst, d_dst)]
+        self.codes[np.ix_(s_dst, t_dst, d_dst)] = np.where(src == MISSING, dst, src)
+
+    def to_dicts(self):
+        return {
+            strategy_name: {
+                ticker: dict(by_date) for ticker, by_date in by_ticker.items()
+            }
+            for strategy_name, by_ticker in self.items()
+        }
+
+    def __getitem__(self, strategy_name):
+        view = self._views.get(strategy_name)
+        if view is None:
+            view = _StrategyDecisions(self, self.strategy_index[strategy_name])
+            self._views[strategy_name] = view
+        return view
+
+    def __iter__(self):
+        return iter(self.strategy_names)
+
+    def __len__(self):
+        return len(self.strategy_names)
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["_views"] = {}
+        return state
+
+
+class _StrategyDecisions(Mapping):
+    """
+    Ticker -> decisions view over one strategy row of a DecisionStore.
+    """
+
+    def __init__(self, store, strategy_position):
+        self._store = store
+        self._position = strategy_position
+        self._views = {}
+
+    def __getitem__(self, ticker):
+        view = self._views.get(ticker)
+        if view is None:
+            view = _TickerDecisions(
+                self._store,
+                self._store.codes[self._position, self._store.ticker_index[ticker]],
+            )
+            self._views[ticker] = view
+        return view
+
+    def __iter__(self):
+        return iter(self._store.tickers)
+
+    def __len__(self):
+        return len(self._store.tickers)
+
+
+class _TickerDecisions(Mapping):
+    """
+    Date string -> action view over one (strategy, ticker) row of a DecisionStore.
+    """
+
+    def __init__(self, store, codes):
+        self._date_index = store.date_index
+        self._dates = store.dates
+        self._codes = codes
+
+    def get(self, date_str, default=None):
+        d = self._date_index.get(date_str)
+        if d is None:
+            return default
+        return CODE_TO_ACTION.get(int(self._codes[d]), default)
+
+    def __getitem__(self, date_str):
+        action = self.get(date_str)
+        if action is None:
+            raise KeyError(date_str)
+        return action
+
+    def __contains__(self, date_str):
+        return self.get(date_str) is not None
+
+    def __iter__(self):
+        for d in np.flatnonzero(self._codes != MISSING):
+            yield self._dates[d]
+
+    def __len__(self):
+        return int(np.count_nonzero(self._codes != MISSING))
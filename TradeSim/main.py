@@ -7,6 +7,7 @@ from push import push
 
 # from push import push
 from pymongo import MongoClient
+from sweep import run_sweep
 from testing import test
 from training import train
 from variables import config_dict
@@ -15,9 +16,23 @@ import wandb
 
 # Local module imports after standard/third-party imports
 from config import FINANCIAL_PREP_API_KEY, mongo_url
-from control import mode, test_period_end, train_period_start, train_tickers
+from control import (
+    mode,
+    sweep_parameters,
+    test_period_end,
+    train_decision_cache_dir,
+    train_period_start,
+    train_precompute_mode,
+    train_tickers,
+)
 from helper_files.client_helper import get_ndaq_tickers, strategies
-from TradeSim.utils import initialize_simulation, precompute_strategy_decisions
+from TradeSim.decision_cache import cached_precompute_strategy_decisions
+from TradeSim.price_matrix import ClosePriceMatrix
+from TradeSim.utils import (
+    initialize_simulation,
+    precompute_strategy_decisions,
+    precompute_strategy_decisions_vectorized,
+)
 
 # Ensure sys.path manipulation is at the top, before other local imports
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -45,13 +60,14 @@ logger.addHandler(file_handler)
 if __name__ == "__main__":
     mongo_client = MongoClient(mongo_url, tlsCAFile=ca)
 
-    # Initialize W&B run
+    # Initialize W&B run (a sweep starts one run per configuration instead)
     wandb.login()
-    wandb.init(
-        project=config_dict["project_name"],
-        config=config_dict,
-        name=config_dict["experiment_name"],
-    )
+    if mode != "sweep":
+        wandb.init(
+            project=config_dict["project_name"],
+            config=config_dict,
+            name=config_dict["experiment_name"],
+        )
 
     # If no tickers provided, fetch Nasdaq tickers
     if not train_tickers:
@@ -67,17 +83,36 @@ if __name__ == "__main__":
         FINANCIAL_PREP_API_KEY,
         logger,
     )
+    # Aligned dates x tickers close prices for the simulators' price lookups
+    price_matrix = ClosePriceMatrix.from_history(ticker_price_history)
 
     # Precompute all strategy decisions
-    precomputed_decisions = precompute_strategy_decisions(
-        strategies,
-        ticker_price_history,
-        train_tickers,
-        ideal_period,
-        train_period_start,
-        test_period_end,
-        logger,
-    )
+    if train_precompute_mode == "vectorized":
+        precompute = precompute_strategy_decisions_vectorized
+    else:
+        precompute = precompute_strategy_decisions
+    if train_decision_cache_dir:
+        precomputed_decisions = cached_precompute_strategy_decisions(
+            precompute,
+            strategies,
+            ticker_price_history,
+            train_tickers,
+            ideal_period,
+            train_period_start,
+            test_period_end,
+            logger,
+            train_decision_cache_dir,
+        )
+    else:
+        precomputed_decisions = precompute(
+            strategies,
+            ticker_price_history,
+            train_tickers,
+            ideal_period,
+            train_period_start,
+            test_period_end,
+            logger,
+        )
 
     if mode == "train":
         train(
@@ -86,6 +121,7 @@ if __name__ == "__main__":
             mongo_client,
             precomputed_decisions,
             logger,
+            price_matrix=price_matrix,
         )
 
     elif mode == "test":
@@ -95,8 +131,18 @@ if __name__ == "__main__":
             mongo_client,
             precomputed_decisions,
             logger,
+            price_matrix=price_matrix,
         )
     elif mode == "push":
         push()
+    elif mode == "sweep":
+        run_sweep(
+            sweep_parameters,
+            ticker_price_history,
+            ideal_period,
+            precomputed_decisions,
+            logger,
+            price_matrix=price_matrix,
+        )
     # elif mode == "push":
     #     push()
@@ -0,0 +1,301 @@
+"""
+Array-backed portfolio engine for the TradeSim strategy accounts.
+
+Holds cash, positions, holding prices, trade counters and points for every
+strategy in NumPy arrays and runs each ticker's buy/sell/hold pass as one
+vectorized step across all strategies. It reproduces simulate_trading_day,
+execute_trade, update_points_and_trades and local_update_portfolio_values
+exactly, including holdings order and int/float types, and converts back to
+the trading_simulator/points dicts used by training, testing and push.
+"""
+
+import numpy as np
+
+from control import (
+    trade_asset_limit,
+    train_loss_price_change_ratio_d1,
+    train_loss_price_change_ratio_d2,
+    train_loss_profit_time_d1,
+    train_loss_profit_time_d2,
+    train_loss_profit_time_else,
+    train_profit_price_change_ratio_d1,
+    train_profit_price_change_ratio_d2,
+    train_profit_profit_time_d1,
+    train_profit_profit_time_d2,
+    train_profit_profit_time_else,
+    train_rank_asset_limit,
+    train_rank_liquidity_limit,
+)
+from strategies.signals import BUY, MISSING, SELL
+
+# Sort key used for tickers a strategy does not hold.
+_NOT_HELD = np.iinfo(np.int64).max
+
+
+class PortfolioEngine:
+    """
+    Simulated accounts for all strategies, shaped (strategy,) or (strategy, ticker).
+    """
+
+    def __init__(self, strategy_names, tickers, start_cash=50000):
+        self.strategy_names = list(strategy_names)
+        self.tickers = list(tickers)
+        self.ticker_index = {ticker: i for i, ticker in enumerate(self.tickers)}
+        self.start_cash = start_cash
+        n_strategies, n_tickers = len(self.strategy_names), len(self.tickers)
+
+        self.cash = np.full(n_strategies, start_cash, dtype=np.float64)
+        self.portfolio_value = np.full(n_strategies, start_cash, dtype=np.float64)
+        self.points = np.zeros(n_strategies, dtype=np.float64)
+        self.total_trades = np.zeros(n_strategies, dtype=np.int64)
+        self.successful_trades = np.zeros(n_strategies, dtype=np.int64)
+        self.neutral_trades = np.zeros(n_strategies, dtype=np.int64)
+        self.failed_trades = np.zeros(n_strategies, dtype=np.int64)
+        self.quantity = np.zeros((n_strategies, n_tickers), dtype=np.int64)
+        self.price = np.zeros((n_strategies, n_tickers), dtype=np.float64)
+        # Order in which each holding was opened, so holdings iterate (and
+        # portfolio values are summed) in the same order as the dicts did.
+        self.acquired = np.full((n_strategies, n_tickers), _NOT_HELD, dtype=np.int64)
+        self._next_acquired = 0
+        # The dicts start with int cash/points and only turn float once touched.
+        self.cash_is_float = np.zeros(n_strategies, dtype=bool)
+        self.portfolio_value_is_float = np.zeros(n_strategies, dtype=bool)
+        self.points_is_float = np.zeros(n_strategies, dtype=bool)
+        self._decision_rows = (None, None)
+
+    @classmethod
+    def from_dicts(cls, trading_simulator, points, tickers, start_cash=50000):
+        """
+        Builds an engine from trading_simulator/points dicts (e.g. loaded results).
+        """
+        strategy_names = list(trading_simulator)
+        tickers = list(tickers)
+        for account in trading_simulator.values():
+            for ticker in account["holdings"]:
+                if ticker not in tickers:
+                    tickers.append(ticker)
+
+        engine = cls(strategy_names, tickers, start_cash)
+        for s, strategy_name in enumerate(strategy_names):
+            account = trading_simulator[strategy_name]
+            engine.cash[s] = account["amount_cash"]
+            engine.cash_is_float[s] = isinstance(account["amount_cash"], float)
+            engine.portfolio_value[s] = account["portfolio_value"]
+            engine.portfolio_value_is_float[s] = isinstance(
+                account["portfolio_value"], float
+            )
+            engine.total_trades[s] = account["total_trades"]
+            engine.successful_trades[s] = account["successful_trades"]
+            engine.neutral_trades[s] = account["neutral_trades"]
+            engine.failed_trades[s] = account["failed_trades"]
+            engine.points[s] = points.get(strategy_name, 0)
+            engine.points_is_float[s] = isinstance(points.get(strategy_name, 0), float)
+            for ticker, holding in account["holdings"].items():
+                t = engine.ticker_index[ticker]
+                engine.quantity[s, t] = holding["quantity"]
+                engine.price[s, t] = holding["price"]
+                engine.acquired[s, t] = engine._next_acquired
+                engine._next_acquired += 1
+        return engine
+
+    def to_dicts(self):
+        """
+        Returns (trading_simulator, points) in the dict format of TradeSim.utils.
+        """
+        trading_simulator = {}
+        points = {}
+        for s, strategy_name in enumerate(self.strategy_names):
+            held = np.flatnonzero(self.quantity[s])
+            held = held[np.argsort(self.acquired[s, held], kind="stable")]
+            trading_simulator[strategy_name] = {
+                "holdings": {
+                    self.tickers[t]: {
+                        "quantity": int(self.quantity[s, t]),
+                        "price": float(self.price[s, t]),
+                    }
+                    for t in held
+                },
+                "amount_cash": self._number(self.cash[s], self.cash_is_float[s]),
+                "total_trades": int(self.total_trades[s]),
+                "successful_trades": int(self.successful_trades[s]),
+                "neutral_trades": int(self.neutral_trades[s]),
+                "failed_trades": int(self.failed_trades[s]),
+                "portfolio_value": self._number(
+                    self.portfolio_value[s], self.portfolio_value_is_float[s]
+                ),
+            }
+            points[strategy_name] = self._number(
+                self.points[s], self.points_is_float[s]
+            )
+        return trading_simulator, points
+
+    @staticmethod
+    def _number(value, is_float):
+        return float(value) if is_float else int(value)
+
+    def decision_codes(self, precomputed_decisions, ticker, date_str):
+        """
+        Returns the int8 decision code of every engine strategy for one ticker-day.
+        """
+        store, rows = self._decision_rows
+        if store is not precomputed_decisions:
+            rows = np.array(
+                [
+                    precomputed_decisions.strategy_index.get(name, -1)
+                    for name in self.strategy_names
+                ]
+            )
+            self._decision_rows = (precomputed_decisions, rows)
+
+        codes = np.full(len(self.strategy_names), MISSING, dtype=np.int8)
+        t = precomputed_decisions.ticker_index.get(ticker)
+        d = precomputed_decisions.date_index.get(date_str)
+        if t is not None and d is not None:
+            known = rows >= 0
+            codes[known] = precomputed_decisions.codes[rows[known], t, d]
+        return codes
+
+    def simulate_trading_day(
+        self,
+        current_date,
+        price_matrix,
+        train_tickers,
+        precomputed_decisions,
+        time_delta,
+        logger,
+    ):
+        """
+        Array version of TradeSim.utils.simulate_trading_day, reading closes from
+        a ClosePriceMatrix.
+        """
+        date_str = current_date.strftime("%Y-%m-%d")
+        logger.info(f"Simulating trading for {date_str}.")
+
+        d = price_matrix.day(date_str)
+        if d is None:
+            return
+        closes, priced = price_matrix.row(d, train_tickers)
+        for ticker, current_price, has_price in zip(train_tickers, closes, priced):
+            if has_price:
+                codes = self.decision_codes(precomputed_decisions, ticker, date_str)
+
+                missing = codes == MISSING
+                if missing.any():
+                    logger.warning(
+                        f"No precomputed decision for {ticker}, {date_str} "
+                        f"({int(missing.sum())} strategies)"
+                    )
+                self.trade_ticker(
+                    self.ticker_index[ticker], current_price, codes, time_delta
+                )
+
+    def trade_ticker(self, t, current_price, codes, time_delta):
+        """
+        Applies one ticker's decisions for all strategies at current_price.
+
+        Mirrors compute_trade_quantities followed by execute_trade, with every
+        strategy's account evaluated independently, so the order across
+        strategies does not matter.
+        """
+        quantity = self.quantity[:, t]
+        cash = self.cash
+        total_portfolio_value = self.portfolio_value
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            # Buy: compute_trade_quantities, then execute_trade's liquidity and
+            # asset-limit checks against the pre-trade account.
+            max_investment = total_portfolio_value * trade_asset_limit
+            buy_qty = np.minimum(
+                np.floor_divide(max_investment, current_price),
+                np.floor_divide(cash, current_price),
+            )
+            buy_qty = np.where(np.isfinite(buy_qty), buy_qty, 0).astype(np.int64)
+            buys = (
+                (codes == BUY)
+                & (cash > train_rank_liquidity_limit)
+                & (buy_qty > 0)
+                & (
+                    ((quantity + buy_qty) * current_price) / total_portfolio_value
+                    < train_rank_asset_limit
+                )
+            )
+
+            # Sell half (at least one) of an existing holding.
+            sell_qty = np.minimum(quantity, np.maximum(1, quantity // 2))
+            sells = (codes == SELL) & (quantity > 0) & (quantity >= sell_qty)
+            ratio = current_price / self.price[:, t]
+
+        if buys.any():
+            opened = buys & (quantity == 0)
+            n_opened = int(opened.sum())
+            self.acquired[opened, t] = np.arange(
+                self._next_acquired, self._next_acquired + n_opened
+            )
+            self._next_acquired += n_opened
+
+            cash[buys] -= buy_qty[buys] * current_price
+            quantity[buys] += buy_qty[buys]
+            self.price[buys, t] = current_price
+            self.total_trades[buys] += 1
+            self.cash_is_float |= buys
+
+        if sells.any():
+            cash[sells] += sell_qty[sells] * current_price
+            self.cash_is_float |= sells
+
+            holding_price = self.price[:, t]
+            successful = sells & (current_price > holding_price)
+            neutral = sells & (current_price == holding_price)
+            failed = sells & ~successful & ~neutral
+
+            profit = np.select(
+                [
+                    ratio < train_profit_price_change_ratio_d1,
+                    ratio < train_profit_price_change_ratio_d2,
+                ],
+                [
+                    time_delta * train_profit_profit_time_d1,
+                    time_delta * train_profit_profit_time_d2,
+                ],
+                time_delta * train_profit_profit_time_else,
+            )
+            loss = np.select(
+                [
+                    ratio > train_loss_price_change_ratio_d1,
+                    ratio > train_loss_price_change_ratio_d2,
+                ],
+                [
+                    -time_delta * train_loss_profit_time_d1,
+                    -time_delta * train_loss_profit_time_d2,
+                ],
+                -time_delta * train_loss_profit_time_else,
+            )
+            self.points[successful] += profit[successful]
+            self.points[failed] += loss[failed]
+            self.points_is_float |= successful | failed
+            self.successful_trades[successful] += 1
+            self.neutral_trades[neutral] += 1
+            self.failed_trades[failed] += 1
+
+            quantity[sells] -= sell_qty[sells]
+            closed = sells & (quantity == 0)
+            self.acquired[closed, t] = _NOT_HELD
+            self.price[closed, t] = 0.0
+            self.total_trades[sells] += 1
+
+    def update_portfolio_values(self, current_date, price_matrix):
+        """
+        Array version of local_update_portfolio_values; returns the active count.
+        """
+        closes, priced = price_matrix.row(price_matrix.day(current_date), self.tickers)
+
+        # Sum position values left to right in holdings order, as the dict loop did.
+        counted = (self.quantity != 0) & priced
+        order = np.argsort(self.acquired, axis=1, kind="stable")
+        values = np.where(counted, self.quantity * closes, 0.0)
+        amount = np.add.accumulate(np.take_along_axis(values, order, axis=1), axis=1)
+        amount = amount[:, -1] if len(self.tickers) else np.zeros(len(self.cash))
+
+        self.portfolio_value = amount + self.cash
+        self.portfolio_value_is_float = self.cash_is_float | counted.any(axis=1)
+        return int(np.count_nonzero(self.portfolio_value != self.start_cash))
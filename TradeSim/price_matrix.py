@@ -0,0 +1,91 @@
+"""
+Aligned close-price matrix for TradeSim price lookups.
+
+Built once after initialize_simulation, it holds every ticker's close on a
+shared dates x tickers float64 grid with a validity mask marking which
+(date, ticker) cells exist in the price history. Simulators resolve the date
+row once per day and read prices by integer offset instead of doing a pandas
+label lookup per ticker.
+"""
+
+import numpy as np
+
+
+class ClosePriceMatrix:
+    """
+    Close prices shaped (date, ticker) with date/ticker index maps and a mask.
+    """
+
+    def __init__(self, dates, tickers, close, valid):
+        self.dates = list(dates)
+        self.tickers = list(tickers)
+        self.date_index = {date_str: i for i, date_str in enumerate(self.dates)}
+        self.ticker_index = {ticker: i for i, ticker in enumerate(self.tickers)}
+        self.close = close
+        self.valid = valid
+
+    @classmethod
+    def from_history(cls, ticker_price_history, tickers=None):
+        """
+        Aligns the "Close" column of every ticker (default: all of them in
+        ticker_price_history) on the union of their dates.
+        """
+        tickers = list(ticker_price_history if tickers is None else tickers)
+        date_strs = {}
+        for ticker in tickers:
+            history = ticker_price_history.get(ticker)
+            if history is not None and not history.empty:
+                date_strs[ticker] = history.index.strftime("%Y-%m-%d")
+
+        dates = sorted(set().union(*date_strs.values())) if date_strs else []
+        date_index = {date_str: i for i, date_str in enumerate(dates)}
+        close = np.full((len(dates), len(tickers)), np.nan, dtype=np.float64)
+        valid = np.zeros((len(dates), len(tickers)), dtype=bool)
+
+        for t, ticker in enumerate(tickers):
+            if ticker not in date_strs:
+                continue
+            rows = np.fromiter(
+                (date_index[date_str] for date_str in date_strs[ticker]),
+                dtype=np.intp,
+                count=len(date_strs[ticker]),
+            )
+            close[rows, t] = ticker_price_history[ticker]["Close"].to_numpy(
+                dtype=np.float64
+            )
+            valid[rows, t] = True
+
+        return cls(dates, tickers, close, valid)
+
+    def day(self, current_date):
+        """
+        Returns the row of a date (datetime or "YYYY-MM-DD"), or None if absent.
+        """
+        if not isinstance(current_date, str):
+            current_date = current_date.strftime("%Y-%m-%d")
+        return self.date_index.get(current_date)
+
+    def has_price(self, d, ticker):
+        t = self.ticker_index.get(ticker)
+        return d is not None and t is not None and bool(self.valid[d, t])
+
+    def price(self, d, ticker):
+        """
+        Returns the close at row d; raises KeyError like .loc when there is none.
+        """
+        if not self.has_price(d, ticker):
+            raise KeyError(ticker)
+        return self.close[d, self.ticker_index[ticker]]
+
+    def row(self, d, tickers):
+        """
+        Returns (closes, valid) for the given tickers at row d.
+        """
+        columns = np.array([self.ticker_index.get(ticker, -1) for ticker in tickers])
+        known = columns >= 0
+        closes = np.full(len(columns), np.nan, dtype=np.float64)
+        valid = np.zeros(len(columns), dtype=bool)
+        if d is not None:
+            closes[known] = self.close[d, columns[known]]
+            valid[known] = self.valid[d, columns[known]]
+        return closes, valid
@@ -0,0 +1,195 @@
+"""
+Shared-memory price history for the TradeSim process pool.
+
+The per-ticker price frames are packed once into a single
+multiprocessing.shared_memory block that pool workers attach to read-only, so
+tasks only need to carry small descriptors instead of pickled DataFrames.
+
+Layout of the block (all tickers concatenated along the row axis):
+  - values: float64 array shaped (total_rows, len(fields)), NaN where a ticker
+    does not have a column
+  - index:  int64 array shaped (total_rows,) holding each row's timestamp
+
+Each ticker owns a contiguous run of rows, so rebuilding its frame is a
+zero-copy view with the ticker's original index, columns and dtypes.
+"""
+
+from collections.abc import Mapping
+from multiprocessing import shared_memory
+
+import numpy as np
+import pandas as pd
+
+
+class SharedPriceHistory(Mapping):
+    """
+    Read-only ticker -> DataFrame mapping backed by one shared memory block.
+    """
+
+    def __init__(self, shm, descriptor, owner=False):
+        self._shm = shm
+        self._owner = owner
+        self.descriptor = descriptor
+        total_rows = descriptor["total_rows"]
+        n_fields = len(descriptor["fields"])
+
+        self.values = np.ndarray(
+            (total_rows, n_fields), dtype=np.float64, buffer=shm.buf
+        )
+        self.index = np.ndarray(
+            (total_rows,),
+            dtype=np.int64,
+            buffer=shm.buf,
+            offset=self.values.nbytes,
+        )
+        self.values.flags.writeable = False
+        self.index.flags.writeable = False
+        self._frames = {}
+
+    @classmethod
+    def create(cls, ticker_price_history, tickers):
+        """
+        Packs ticker_price_history into a new shared memory block.
+
+        Tickers with no data (None or an empty frame) are recorded with zero rows.
+        """
+        fields = []
+        layout = {}
+        total_rows = 0
+        for ticker in tickers:
+            history = ticker_price_history.get(ticker)
+            if history is None or history.empty:
+                history = None
+            else:
+                if not isinstance(history.index, pd.DatetimeIndex):
+                    raise TypeError(f"{ticker} price history needs a DatetimeIndex")
+                for column in history.columns:
+                    if column not in fields:
+                        fields.append(column)
+            n_rows = 0 if history is None else len(history)
+            layout[ticker] = {"start": total_rows, "stop": total_rows + n_rows}
+            total_rows += n_rows
+
+        field_position = {field: i for i, field in enumerate(fields)}
+        values_nbytes = total_rows * len(fields) * 8
+        index_nbytes = total_rows * 8
+        shm = shared_memory.SharedMemory(
+            create=True, size=max(values_nbytes + index_nbytes, 1)
+        )
+        try:
+            values = np.ndarray(
+                (total_rows, len(fields)), dtype=np.float64, buffer=shm.buf
+            )
+            index = np.ndarray(
+                (total_rows,), dtype=np.int64, buffer=shm.buf, offset=values_nbytes
+            )
+            values[:] = np.nan
+
+            for ticker in tickers:
+                history = ticker_price_history.get(ticker)
+                rows = slice(layout[ticker]["start"], layout[ticker]["stop"])
+                if history is None or history.empty:
+                    layout[ticker].update(
+                        columns=[], dtypes=[], index_dtype=None, index_name=None
+                    )
+                    continue
+                columns = list(history.columns)
+                values[rows, [field_position[c] for c in columns]] = history.to_numpy(
+                    dtype=np.float64, na_value=np.nan
+                )
+                index[rows] = history.index.asi8
+                layout[ticker].update(
+                    columns=columns,
+                    dtypes=[str(dtype) for dtype in history.dtypes],
+                    index_dtype=str(history.index.dtype),
+                    index_name=history.index.name,
+                )
+            del values, index
+        except BaseException:
+            shm.close()
+            shm.unlink()
+            raise
+
+        descriptor = {
+            "name": shm.name,
+            "total_rows": total_rows,
+            "fields": fields,
+            "tickers": list(tickers),
+            "layout": layout,
+        }
+        return cls(shm, descriptor, owner=True)
+
+    @classmethod
+    def attach(cls, descriptor):
+        """
+        Attaches to a block created by SharedPriceHistory.create in another process.
+        """
+        shm = shared_memory.SharedMemory(name=descriptor["name"])
+        return cls(shm, descriptor)
+
+    def frame(self, ticker):
+        """
+        Returns the ticker's price history as a DataFrame over the shared block.
+        """
+        frame = self._frames.get(ticker)
+        if frame is not None:
+            return frame
+
+        info = self.descriptor["layout"][ticker]
+        start, stop = info["start"], info["stop"]
+        if start == stop:
+            frame = pd.DataFrame()
+        else:
+            positions = [self.descriptor["fields"].index(c) for c in info["columns"]]
+            if positions == list(range(positions[0], positions[0] + len(positions))):
+                block = self.values[start:stop, positions[0] : positions[-1] + 1]
+            else:
+                block = self.values[start:stop, positions]
+            index = self._build_index(self.index[start:stop], info["index_dtype"])
+            index.name = info["index_name"]
+            frame = pd.DataFrame(
+                block, index=index, columns=info["columns"], copy=False
+            )
+            # Columns that were not float64 (e.g. integer Volume) are restored as copies.
+            for column, dtype in zip(info["columns"], info["dtypes"]):
+                if dtype != "float64":
+                    frame[column] = frame[column].astype(dtype)
+
+        self._frames[ticker] = frame
+        return frame
+
+    @staticmethod
+    def _build_index(int_values, index_dtype):
+        if "," not in index_dtype:
+            return pd.DatetimeIndex(int_values.view(index_dtype))
+        # Timezone-aware dtypes look like "datetime64[ns, America/New_York]".
+        unit, tz = (part.strip() for part in index_dtype[11:-1].split(",", 1))
+        naive = pd.DatetimeIndex(int_values.view(f"datetime64[{unit}]"))
+        return naive.tz_localize("UTC").tz_convert(tz)
+
+    def close(self):
+        """
+        Detaches from the block; the creating process also frees it.
+        """
+        self._frames.clear()
+        self.values = self.index = None
+        self._shm.close()
+        if self._owner:
+            self._shm.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def __getitem__(self, ticker):
+        if ticker not in self.descriptor["layout"]:
+            raise KeyError(ticker)
+        return self.frame(ticker)
+
+    def __iter__(self):
+        return iter(self.descriptor["tickers"])
+
+    def __len__(self):
+        return len(self.descriptor["tickers"])
@@ -0,0 +1,217 @@
+"""
+Parameter sweep for TradeSim.
+
+Runs train and test for many control.py configurations while downloading the
+price history and precomputing strategy decisions only once. Configurations
+run in parallel worker processes that inherit the precomputed data, apply
+their overrides to the loaded modules, log to their own wandb run and report
+one row of the results table.
+"""
+
+import importlib
+import itertools
+import multiprocessing
+import os
+import sys
+
+import certifi
+import pandas as pd
+from pymongo import MongoClient
+
+import wandb
+
+# Add the parent directory to the Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)) + "/..")
+
+import control
+from config import mongo_url
+from helper_files.client_helper import strategies
+from TradeSim.price_matrix import ClosePriceMatrix
+
+ca = certifi.where()
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Changing these would need a new download/precompute, so they cannot be swept.
+FIXED_PARAMETERS = {
+    "mode",
+    "train_tickers",
+    "train_period_start",
+    "train_period_end",
+    "test_period_start",
+    "test_period_end",
+    "train_precompute_mode",
+    "train_decision_cache_dir",
+}
+
+# Shared with the forked workers so the price history and decisions are never pickled.
+_sweep_context = {}
+
+
+def expand_sweep(sweep_parameters):
+    """
+    Expands a grid (dict of lists) or a list of override dicts into configurations.
+    """
+    if isinstance(sweep_parameters, dict):
+        names = list(sweep_parameters)
+        configurations = [
+            dict(zip(names, values))
+            for values in itertools.product(*(sweep_parameters[n] for n in names))
+        ]
+    else:
+        configurations = [dict(overrides) for overrides in sweep_parameters]
+
+    for overrides in configurations:
+        for name in overrides:
+            if not hasattr(control, name):
+                raise ValueError(f"Unknown sweep parameter: {name}")
+            if name in FIXED_PARAMETERS:
+                raise ValueError(
+                    f"{name} cannot be swept; it is fixed by the precompute"
+                )
+    return configurations
+
+
+def apply_overrides(overrides):
+    """
+    Applies control.py overrides in this process.
+
+    Modules import parameters with `from control import ...`, so every loaded
+    repo module still bound to the original value is patched as well, and
+    config_dict is rebuilt from the new values.
+    """
+    originals = {name: getattr(control, name) for name in overrides}
+    repo_modules = [
+        module
+        for module in list(sys.modules.values())
+        if getattr(module, "__file__", None)
+        and os.path.abspath(module.__file__).startswith(REPO_ROOT)
+    ]
+
+    for name, value in overrides.items():
+        for module in repo_modules:
+            if module is control or vars(module).get(name, None) is originals[name]:
+                setattr(module, name, value)
+
+    for module_name in ("variables", "TradeSim.variables"):
+        variables = sys.modules.get(module_name)
+        if variables is None:
+            continue
+        old_config = variables.config_dict
+        importlib.reload(variables)
+        for module in repo_modules:
+            if vars(module).get("config_dict", None) is old_config:
+                module.config_dict = variables.config_dict
+
+
+def top_ranked_strategies(rank, count=10):
+    """
+    Returns the names of the count best ranked strategies, best first.
+
+    update_strategy_ranks gives rank 1 to the lowest score, and
+    rank_to_coefficient grows with the rank, so the best have the highest.
+    """
+    return sorted(rank, key=rank.get, reverse=True)[:count]
+
+
+def _run_configuration(job):
+    """
+    Trains and tests one configuration in a worker process.
+    """
+    from testing import test, update_strategy_ranks
+    from training import train
+
+    position, overrides = job
+    logger = _sweep_context["logger"]
+    experiment_name = f"{_sweep_context['experiment_name']}_sweep{position:03d}"
+    apply_overrides(
+        {**overrides, "experiment_name": experiment_name, "simulation_day_sleep": 0}
+    )
+    config_dict = sys.modules["variables"].config_dict
+
+    row = {"experiment_name": experiment_name, **overrides}
+    mongo_client = MongoClient(mongo_url, tlsCAFile=ca)
+    run = wandb.init(
+        project=config_dict["project_name"],
+        config={**config_dict, "sweep_overrides": overrides},
+        name=experiment_name,
+        group=_sweep_context["experiment_name"],
+        reinit=True,
+    )
+    try:
+        logger.info(f"Sweep {experiment_name}: {overrides}")
+        train_results = train(
+            _sweep_context["ticker_price_history"],
+            _sweep_context["ideal_period"],
+            mongo_client,
+            _sweep_context["precomputed_decisions"],
+            logger,
+            price_matrix=_sweep_context["price_matrix"],
+        )
+        rank = update_strategy_ranks(
+            strategies, train_results["points"], train_results["trading_simulator"]
+        )
+        metrics, account = test(
+            _sweep_context["ticker_price_history"],
+            _sweep_context["ideal_period"],
+            mongo_client,
+            _sweep_context["precomputed_decisions"],
+            logger,
+            tear_sheet=False,
+            price_matrix=_sweep_context["price_matrix"],
+        )
+        row.update(metrics)
+        row["test_portfolio_value"] = account["total_portfolio_value"]
+        row["test_cash"] = account["cash"]
+        row["top_ranked_strategies"] = ",".join(top_ranked_strategies(rank))
+    except Exception as e:
+        logger.error(f"Sweep {experiment_name} failed: {e}")
+        row["error"] = str(e)
+    finally:
+        run.finish()
+        mongo_client.close()
+    return row
+
+
+def run_sweep(
+    sweep_parameters,
+    ticker_price_history,
+    ideal_period,
+    precomputed_decisions,
+    logger,
+    processes=control.sweep_processes,
+    price_matrix=None,
+):
+    """
+    Runs every sweep configuration against one set of precomputed decisions and
+    writes the results table to results/{experiment_name}_sweep.csv.
+    """
+    configurations = expand_sweep(sweep_parameters)
+    if not configurations:
+        logger.warning("No sweep configurations given; nothing to run.")
+        return pd.DataFrame()
+    logger.info(f"Running a sweep of {len(configurations)} configurations.")
+    if price_matrix is None:
+        price_matrix = ClosePriceMatrix.from_history(ticker_price_history)
+
+    _sweep_context.update(
+        ticker_price_history=ticker_price_history,
+        ideal_period=ideal_period,
+        precomputed_decisions=precomputed_decisions,
+        price_matrix=price_matrix,
+        logger=logger,
+        experiment_name=control.experiment_name,
+    )
+    # Workers are forked so they inherit _sweep_context without pickling it.
+    context = multiprocessing.get_context("fork")
+    with context.Pool(processes=min(processes, len(configurations))) as pool:
+        rows = pool.map(_run_configuration, enumerate(configurations), chunksize=1)
+
+    results = pd.DataFrame(rows)
+    results_dir = "results"
+    if not os.path.exists(results_dir):
+        os.makedirs(results_dir)
+    results_path = os.path.join(results_dir, f"{control.experiment_name}_sweep.csv")
+    results.to_csv(results_path, index=False)
+    logger.info(f"Sweep results saved to {results_path}")
+    return results
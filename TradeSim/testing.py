@@ -5,6 +5,7 @@ import time
 from datetime import datetime, timedelta
 
 import certifi
+import numpy as np
 import pandas as pd
 from pymongo import MongoClient
 from variables import config_dict
@@ -13,6 +14,7 @@ import wandb
 from config import FINANCIAL_PREP_API_KEY, mongo_url
 from control import (
     benchmark_asset,
+    simulation_day_sleep,
     test_period_end,
     test_period_start,
     trade_asset_limit,
@@ -28,17 +30,12 @@ from control import (
 
 train_tickers
 from helper_files.client_helper import get_ndaq_tickers, strategies
-from helper_files.train_client_helper import (
-    calculate_metrics,
-    generate_tear_sheet,
-    local_update_portfolio_values,
-)
-from TradeSim.utils import (
-    compute_trade_quantities,
-    simulate_trading_day,
-    update_time_delta,
-)
-from trading_client import weighted_majority_decision_and_median_quantity
+from helper_files.train_client_helper import calculate_metrics, generate_tear_sheet
+from strategies.signals import BUY, HOLD, MISSING, SELL, signal_name
+from TradeSim.portfolio_engine import PortfolioEngine
+from TradeSim.price_matrix import ClosePriceMatrix
+from TradeSim.utils import compute_trade_quantities, update_time_delta
+from trading_client import weighted_majority_decisions
 
 results_dir = "results"
 if not os.path.exists(results_dir):
@@ -85,9 +82,7 @@ def check_stop_loss_take_profit(account, ticker, current_price):
     return account
 
 
-def execute_buy_orders(
-    buy_heap, suggestion_heap, account, ticker_price_history, current_date
-):
+def execute_buy_orders(buy_heap, suggestion_heap, account, price_matrix, current_date):
     """
     Executes buy orders from the buy and suggestion heaps
     """
@@ -103,9 +98,7 @@ def execute_buy_orders(
 
         _, quantity, ticker = heapq.heappop(heap)
         # print(f"Executing BUY order for {ticker} of quantity {quantity}")
-        current_price = ticker_price_history[ticker].loc[
-            current_date.strftime("%Y-%m-%d")
-        ]["Close"]
+        current_price = price_matrix.price(price_matrix.day(current_date), ticker)
 
         account["trades"].append(
             {
@@ -164,10 +157,17 @@ def update_strategy_ranks(strategies, points, trading_simulator):
 
 
 def test(
-    ticker_price_history, ideal_period, mongo_client, precomputed_decisions, logger
+    ticker_price_history,
+    ideal_period,
+    mongo_client,
+    precomputed_decisions,
+    logger,
+    tear_sheet=True,
+    price_matrix=None,
 ):
     """
     Runs the testing phase of the trading simulator.
+    Returns the final metrics and the test account.
     """
     global train_tickers
     logger.info("Starting testing phase...")
@@ -191,6 +191,7 @@ def test(
 
     # Initialize testing variables
     strategy_to_coefficient = {}
+    strategy_names = [strategy.__name__ for strategy in strategies]
     account = initialize_test_account()
     rank = update_strategy_ranks(strategies, points, trading_simulator)
     start_date = datetime.strptime(test_period_start, "%Y-%m-%d")
@@ -200,14 +201,15 @@ def test(
     logger.info(f"Testing period: {start_date} to {end_date}")
     if not train_tickers:
         train_tickers = get_ndaq_tickers(mongo_client, FINANCIAL_PREP_API_KEY)
+    engine = PortfolioEngine.from_dicts(trading_simulator, points, train_tickers)
+    if price_matrix is None:
+        price_matrix = ClosePriceMatrix.from_history(ticker_price_history)
     while current_date <= end_date:
         logger.info(f"Processing date: {current_date.strftime('%Y-%m-%d')}")
 
         # Skip non-trading days
-        if (
-            current_date.weekday() >= 5
-            or current_date.strftime("%Y-%m-%d")
-            not in ticker_price_history[train_tickers[0]].index
+        if current_date.weekday() >= 5 or not price_matrix.has_price(
+            price_matrix.day(current_date), train_tickers[0]
         ):
             logger.info(
                 f"Skipping {current_date.strftime('%Y-%m-%d')} (weekend or missing data)."
@@ -225,64 +227,72 @@ def test(
         # Process trading day
         buy_heap, suggestion_heap = [], []
         date_str = current_date.strftime("%Y-%m-%d")
-        for ticker in train_tickers:
-            if date_str in ticker_price_history[ticker].index:
-                daily_data = ticker_price_history[ticker].loc[date_str]
-                current_price = daily_data["Close"]
+        d = price_matrix.day(date_str)
+        closes, priced = price_matrix.row(d, train_tickers)
+
+        # Phase 1: vote on every ticker at once. The vote does not depend on
+        # the account, except that compute_trade_quantities turns Sell into
+        # Hold when nothing is held, so vote both ways.
+        codes = precomputed_decisions.day_codes(train_tickers, date_str, strategy_names)
+        weights = [strategy_to_coefficient[name] for name in strategy_names]
+        votes = {}
+        for held, vote_codes in (
+            (True, codes),
+            (False, np.where(codes == SELL, HOLD, codes)),
+        ):
+            decisions, _, buy_weights, sell_weights, hold_weights = (
+                weighted_majority_decisions(vote_codes, None, weights)
+            )
+            votes[held] = list(
+                zip(
+                    decisions.tolist(),
+                    buy_weights.tolist(),
+                    sell_weights.tolist(),
+                    hold_weights.tolist(),
+                )
+            )
+
+        # Phase 2: apply the votes ticker by ticker, in the original order, as
+        # stop losses and sells change the account for later tickers.
+        for t, (ticker, current_price, has_price) in enumerate(
+            zip(train_tickers, closes, priced)
+        ):
+            if has_price:
                 # logger.info(f"{ticker} - Current price: {current_price}")
 
                 # Check stop loss and take profit
                 account = check_stop_loss_take_profit(account, ticker, current_price)
 
-                # Get strategy decisions
-                decisions_and_quantities = []
-                portfolio_qty = account["holdings"].get(ticker, {}).get("quantity", 0)
-
-                for strategy in strategies:
-                    strategy_name = strategy.__name__
-
-                    # Get precomputed strategy decision
-                    action = precomputed_decisions[strategy_name][ticker].get(date_str)
-
-                    if action is None:
-                        # Skip if no precomputed decision (should not happen if properly precomputed)
-                        logger.warning(
-                            f"No precomputed decision for {ticker}, {strategy_name}, {date_str}"
-                        )
-                        continue
-
-                    account_cash = account["cash"]
-                    total_portfolio_value = account["total_portfolio_value"]
+                for position in np.flatnonzero(codes[t] == MISSING):
+                    # Skip if no precomputed decision (should not happen if properly precomputed)
+                    logger.warning(
+                        f"No precomputed decision for {ticker}, {strategy_names[position]}, {date_str}"
+                    )
 
-                    # Compute trade decision and quantity based on precomputed action
-                    decision, qty = compute_trade_quantities(
-                        action,
+                # Process weighted decisions
+                portfolio_qty = account["holdings"].get(ticker, {}).get("quantity", 0)
+                decision, buy_weight, sell_weight, hold_weight = votes[
+                    portfolio_qty > 0
+                ][t]
+                # Every strategy voting for the decision gets the same quantity
+                # from compute_trade_quantities, so that is the median quantity.
+                quantity = 0
+                if decision != HOLD and (codes[t] == decision).any():
+                    _, quantity = compute_trade_quantities(
+                        decision,
                         current_price,
-                        account_cash,
+                        account["cash"],
                         portfolio_qty,
-                        total_portfolio_value,
+                        account["total_portfolio_value"],
                     )
-
-                    weight = strategy_to_coefficient[strategy.__name__]
-                    decisions_and_quantities.append((decision, qty, weight))
-
-                # Process weighted decisions
-                (
-                    decision,
-                    quantity,
-                    buy_weight,
-                    sell_weight,
-                    hold_weight,
-                ) = weighted_majority_decision_and_median_quantity(
-                    decisions_and_quantities
-                )
                 logger.info(
-                    f"{ticker} - Decision: {decision}, Quantity: {quantity}, Buy Weight: {buy_weight}, Sell Weight: {sell_weight}, Hold Weight: {hold_weight}"
+                    f"{ticker} - Decision: {signal_name(decision)}, Quantity: {quantity}, "
+                    f"Buy Weight: {buy_weight}, Sell Weight: {sell_weight}, Hold Weight: {hold_weight}"
                 )
 
                 # Execute trading decisions
                 if (
-                    decision == "buy"
+                    decision == BUY
                     and ((portfolio_qty + quantity) * current_price)
                     / account["total_portfolio_value"]
                     <= train_trade_asset_limit
@@ -296,7 +306,7 @@ def test(
                         ),
                     )
 
-                elif decision == "sell" and ticker in account["holdings"]:
+                elif decision == SELL and ticker in account["holdings"]:
                     quantity = max(quantity, 1)
                     quantity = account["holdings"][ticker]["quantity"]
                     account["trades"].append(
@@ -338,26 +348,22 @@ def test(
 
         # Execute buy orders
         account = execute_buy_orders(
-            buy_heap, suggestion_heap, account, ticker_price_history, current_date
+            buy_heap, suggestion_heap, account, price_matrix, current_date
         )
 
         # Simulate ranking updates
-        trading_simulator, points = simulate_trading_day(
+        engine.simulate_trading_day(
             current_date,
-            strategies,
-            trading_simulator,
-            points,
-            time_delta,
-            ticker_price_history,
+            price_matrix,
             train_tickers,
             precomputed_decisions,
+            time_delta,
             logger,
         )
 
         # Update portfolio values
-        active_count, trading_simulator = local_update_portfolio_values(
-            current_date, strategies, trading_simulator, ticker_price_history, logger
-        )
+        active_count = engine.update_portfolio_values(current_date, price_matrix)
+        trading_simulator, points = engine.to_dicts()
 
         # Update time delta
         time_delta = update_time_delta(time_delta, train_time_delta_mode)
@@ -365,9 +371,7 @@ def test(
         # Calculate and update total portfolio value
         total_value = account["cash"]
         for ticker in account["holdings"]:
-            current_price = ticker_price_history[ticker].loc[
-                current_date.strftime("%Y-%m-%d")
-            ]["Close"]
+            current_price = price_matrix.price(d, ticker)
             total_value += account["holdings"][ticker]["quantity"] * current_price
         account["total_portfolio_value"] = total_value
 
@@ -387,7 +391,7 @@ def test(
         logger.info("-------------------------------------------------")
 
         current_date += timedelta(days=1)
-        time.sleep(5)
+        time.sleep(simulation_day_sleep)
 
     # Calculate final metrics and generate tear sheet
     metrics = calculate_metrics(account_values)
@@ -396,8 +400,9 @@ def test(
     logger.info("Final metrics calculated.")
     logger.info(metrics)
 
-    generate_tear_sheet(account_values, filename=f"{benchmark_asset}_vs_strategy")
-    logger.info("Tear sheet generated.")
+    if tear_sheet:
+        generate_tear_sheet(account_values, filename=f"{benchmark_asset}_vs_strategy")
+        logger.info("Tear sheet generated.")
 
     # Print final results
     logger.info("Testing Completed.")
@@ -405,3 +410,4 @@ def test(
     logger.info(f"Account Cash: ${account['cash']: ,.2f}")
     logger.info(f"Total Portfolio Value: ${account['total_portfolio_value']: ,.2f}")
     logger.info("-------------------------------------------------")
+    return metrics, account
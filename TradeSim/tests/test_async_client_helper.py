@@ -0,0 +1,517 @@
+import asyncio
+import logging
+import os
+import sys
+import time
+from types import SimpleNamespace
+
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.append(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+)
+import ranking_client
+import trading_client
+from helper_files import async_client_helper, client_helper
+from helper_files.async_client_helper import (
+    gather_bounded,
+    get_data_async,
+    get_histories_async,
+)
+from helper_files.history_codec import encode_history
+from helper_files.ideal_periods import IdealPeriodRegistry
+from helper_files.ranking_unit_of_work import RankingUnitOfWork
+from strategies.signals import BUY, SELL
+
+logger = logging.getLogger(__name__)
+
+
+class StubCursor:
+    """Cursor with motor's awaitable to_list."""
+
+    def __init__(self, docs):
+        self.docs = docs
+
+    async def to_list(self, length):
+        return list(self.docs if length is None else self.docs[:length])
+
+
+class StubCollection:
+    """In-memory collection with motor's awaitable methods."""
+
+    def __init__(self):
+        self.docs = []
+        self.calls = []
+
+    def _matches(self, filter):
+        return [
+            doc
+            for doc in self.docs
+            if all(doc.get(key) == value for key, value in (filter or {}).items())
+        ]
+
+    async def find_one(self, filter=None):
+        self.calls.append(("find_one", filter))
+        matches = self._matches(filter)
+        return matches[0] if matches else None
+
+    def find(self, filter=None, projection=None):
+        self.calls.append(("find", filter))
+        return StubCursor(self._matches(filter))
+
+    async def insert_one(self, doc):
+        self.calls.append(("insert_one", doc))
+        self.docs.append(doc)
+
+    async def update_one(self, filter, update, upsert=False):
+        self.calls.append(("update_one", filter))
+        matches = self._matches(filter)
+        if matches:
+            doc = matches[0]
+        elif upsert:
+            doc = dict(filter)
+            self.docs.append(doc)
+        else:
+            return
+        doc.update(update.get("$set", {}))
+        for key, value in update.get("$inc", {}).items():
+            doc[key] = doc.get(key, 0) + value
+
+    async def delete_one(self, filter):
+        self.calls.append(("delete_one", filter))
+        matches = self._matches(filter)
+        if matches:
+            self.docs.remove(matches[0])
+
+    async def bulk_write(self, requests, **kwargs):
+        self.calls.append(("bulk_write", requests, kwargs))
+
+    def count(self, method):
+        return sum(call[0] == method for call in self.calls)
+
+
+class StubDatabase:
+    def __init__(self):
+        self.collections = {}
+
+    def __getattr__(self, name):
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return self.collections.setdefault(name, StubCollection())
+
+
+class StubSession:
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    async def with_transaction(self, callback):
+        return await callback(self)
+
+
+class StubMotorClient:
+    """motor client whose databases and collections are created on access."""
+
+    def __init__(self):
+        self.databases = {}
+        self.sessions = []
+
+    def __getattr__(self, name):
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return self.databases.setdefault(name, StubDatabase())
+
+    async def start_session(self):
+        self.sessions.append(StubSession())
+        return self.sessions[-1]
+
+
+def make_history(n_rows=600):
+    rng = np.random.default_rng(0)
+    dates = pd.DatetimeIndex(
+        pd.bdate_range(end="2024-12-31", periods=n_rows).values, name="Date"
+    ).tz_localize("America/New_York")
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.02, n_rows)))
+    return pd.DataFrame(
+        {
+            "Open": close * 0.995,
+            "High": close * 1.01,
+            "Low": close * 0.99,
+            "Close": close,
+            "Volume": rng.integers(1_000, 1_000_000, n_rows),
+        },
+        index=dates,
+    )
+
+
+def sell_strategy(ticker, data):
+    return SELL
+
+
+def buy_strategy(ticker, data):
+    return BUY
+
+
+def fake_yfinance(history):
+    return SimpleNamespace(
+        Ticker=lambda ticker, session: SimpleNamespace(history=lambda period: history)
+    )
+
+
+@pytest.fixture(autouse=True)
+def offline(monkeypatch):
+    """Cache misses raise instead of downloading."""
+
+    def download(period):
+        raise ConnectionError(f"no download of {period} in tests")
+
+    monkeypatch.setattr(
+        async_client_helper,
+        "yf",
+        SimpleNamespace(
+            Ticker=lambda ticker, session: SimpleNamespace(history=download)
+        ),
+    )
+
+
+@pytest.fixture
+def motor_client():
+    client = StubMotorClient()
+    client.IndicatorsDatabase.Indicators.docs.extend(
+        [
+            {"indicator": "sell_strategy", "ideal_period": "1y"},
+            {"indicator": "buy_strategy", "ideal_period": "6mo"},
+        ]
+    )
+    client.HistoricalDatabase.HistoricalDatabase.docs.append(
+        encode_history("AAPL", "1y", make_history())
+    )
+    return client
+
+
+@pytest.fixture
+def latest_price(monkeypatch):
+    prices = {"AAPL": 104.0}
+    monkeypatch.setattr(async_client_helper, "get_latest_price", prices.get)
+    return prices
+
+
+def test_gather_bounded_limits_concurrency(caplog):
+    running, peak = [0], [0]
+
+    async def work(item, offset):
+        running[0] += 1
+        peak[0] = max(peak[0], running[0])
+        await asyncio.sleep(0.01)
+        running[0] -= 1
+        if item == 3:
+            raise ValueError("fail")
+        return item + offset
+
+    results = asyncio.run(
+        gather_bounded(work, list(range(10)), 100, concurrency=4, logger=logger)
+    )
+
+    assert peak[0] == 4
+    assert results == [100, 101, 102, None, 104, 105, 106, 107, 108, 109]
+    assert "Error processing 3: fail" in caplog.text
+
+
+def test_gather_bounded_abandons_a_stalled_item(caplog):
+    stopped = []
+
+    async def work(item):
+        if item == "STALL":
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                stopped.append(item)
+                raise
+        return item
+
+    start = time.monotonic()
+    results = asyncio.run(
+        gather_bounded(
+            work, ["A", "STALL", "B"], concurrency=2, logger=logger, task_timeout=0.1
+        )
+    )
+
+    assert time.monotonic() - start < 1
+    assert results == ["A", None, "B"]
+    assert stopped == ["STALL"]
+    assert "Cycle abandoned 1 running and cancelled 0 queued items" in caplog.text
+
+
+def test_gather_bounded_cycle_timeout_cancels_queued_items(caplog):
+    started = []
+
+    async def work(item):
+        started.append(item)
+        await asyncio.sleep(0.15)
+        return item
+
+    start = time.monotonic()
+    results = asyncio.run(
+        gather_bounded(
+            work, list(range(5)), concurrency=1, logger=logger, cycle_timeout=0.2
+        )
+    )
+
+    assert time.monotonic() - start < 0.5
+    # The first item finishes, the second is abandoned, the rest never start.
+    assert results == [0, None, None, None, None]
+    assert started == [0, 1]
+    assert "Cycle abandoned 1 running and cancelled 3 queued items" in caplog.text
+
+
+def test_get_data_async_reads_the_cache(motor_client):
+    history = asyncio.run(get_data_async("AAPL", motor_client, "1y"))
+
+    pd.testing.assert_frame_equal(history, make_history(), check_freq=False)
+    cache = motor_client.HistoricalDatabase.HistoricalDatabase
+    assert cache.calls == [("find_one", {"ticker": "AAPL", "period": "1y"})]
+
+
+def test_get_data_async_downloads_and_stores_a_miss(motor_client, monkeypatch):
+    downloaded = make_history(30)
+    monkeypatch.setattr(async_client_helper, "yf", fake_yfinance(downloaded))
+
+    history = asyncio.run(get_data_async("MSFT", motor_client, "1mo"))
+
+    assert history is downloaded
+    cache = motor_client.HistoricalDatabase.HistoricalDatabase
+    assert cache.count("insert_one") == 1
+    stored = cache.docs[-1]
+    assert (stored["ticker"], stored["period"], stored["format"]) == (
+        "MSFT",
+        "1mo",
+        1,
+    )
+
+
+def test_get_histories_async_reads_the_longest_period_once(motor_client):
+    histories = asyncio.run(
+        get_histories_async(
+            "AAPL", motor_client, ["6mo", "1y", "1mo", "6mo", "max"], logger
+        )
+    )
+
+    # "max" is not cached and the download fails, so it is left out.
+    assert list(histories) == ["6mo", "1y", "1mo"]
+    cache = motor_client.HistoricalDatabase.HistoricalDatabase
+    assert [call[1]["period"] for call in cache.calls] == ["1y", "max"]
+    year = histories["1y"]
+    assert histories["6mo"].index[-1] == year.index[-1]
+    assert len(histories["1mo"]) < len(histories["6mo"]) < len(year)
+
+
+def test_refresh_async_reloads_after_version_bump(motor_client):
+    registry = IdealPeriodRegistry()
+    indicators = motor_client.IndicatorsDatabase.Indicators
+
+    assert asyncio.run(registry.refresh_async(motor_client)) is True
+    assert asyncio.run(registry.refresh_async(motor_client)) is False
+    assert dict(registry) == {"sell_strategy": "1y", "buy_strategy": "6mo"}
+    assert indicators.count("find") == 1
+
+    indicators.docs[0]["ideal_period"] = "2y"
+    motor_client.IndicatorsDatabase.IndicatorsVersion.docs.append({"version": 1})
+    assert asyncio.run(registry.refresh_async(motor_client)) is True
+    assert registry["sell_strategy"] == "2y"
+    assert indicators.count("find") == 2
+
+
+def test_unit_of_work_load_and_commit_async(motor_client):
+    db = motor_client.trading_simulator
+    db.algorithm_holdings.docs.append(
+        {
+            "strategy": "sell_strategy",
+            "holdings": {"AAPL": {"quantity": 2, "price": 100.0}},
+            "amount_cash": 50_000.0,
+            "portfolio_value": 50_200.0,
+        }
+    )
+    db.time_delta.docs.append({"time_delta": 0.5})
+
+    unit_of_work = asyncio.run(RankingUnitOfWork.load_async(motor_client))
+    assert unit_of_work.time_delta == 0.5
+    ranking_client.simulate_trade("AAPL", sell_strategy, None, 104.0, unit_of_work)
+
+    assert asyncio.run(unit_of_work.commit_async(motor_client, logger)) == 1
+    ((_, holdings_ops, kwargs),) = db.algorithm_holdings.calls[-1:]
+    assert [op._filter for op in holdings_ops] == [{"strategy": "sell_strategy"}]
+    assert kwargs == {"ordered": True, "session": motor_client.sessions[0]}
+    assert db.points_tally.count("bulk_write") == 1
+    assert unit_of_work.closed
+
+
+def test_ranking_process_tickers_async(motor_client, latest_price, monkeypatch):
+    monkeypatch.setattr(ranking_client, "strategies", [sell_strategy, buy_strategy])
+    db = motor_client.trading_simulator
+    db.algorithm_holdings.docs.extend(
+        [
+            {
+                "strategy": "sell_strategy",
+                "holdings": {"AAPL": {"quantity": 2, "price": 100.0}},
+                "amount_cash": 50_000.0,
+                "portfolio_value": 50_200.0,
+            },
+            {
+                "strategy": "buy_strategy",
+                "holdings": {},
+                "amount_cash": 100_000.0,
+                "portfolio_value": 100_000.0,
+            },
+        ]
+    )
+    db.time_delta.docs.append({"time_delta": 0.5})
+
+    # MSFT has no price and is skipped.
+    asyncio.run(
+        ranking_client.process_tickers_async(
+            ["AAPL", "MSFT"], motor_client, IdealPeriodRegistry()
+        )
+    )
+
+    ((_, holdings_ops, kwargs),) = [
+        call for call in db.algorithm_holdings.calls if call[0] == "bulk_write"
+    ]
+    assert kwargs["session"] is motor_client.sessions[0]
+    buy_update, sell_update = (op._doc for op in holdings_ops)
+    assert buy_update["$set"]["holdings.AAPL"] == {"quantity": 96, "price": 104.0}
+    assert sell_update["$inc"]["amount_cash"] == 104.0
+    # Both strategies' periods were served from one cache read.
+    cache = motor_client.HistoricalDatabase.HistoricalDatabase
+    assert cache.calls == [("find_one", {"ticker": "AAPL", "period": "1y"})]
+
+
+@pytest.fixture
+def trading_state(monkeypatch):
+    monkeypatch.setattr(trading_client, "buy_heap", [])
+    monkeypatch.setattr(trading_client, "suggestion_heap", [])
+    monkeypatch.setattr(trading_client, "sold", False)
+    monkeypatch.setattr(trading_client, "strategies", [buy_strategy])
+    return trading_client
+
+
+def run_trading_ticker(motor_client, orders):
+    alpaca = SimpleNamespace(submit_order=lambda request: orders.append(request))
+    registry = IdealPeriodRegistry()
+    asyncio.run(registry.refresh_async(motor_client))
+    asyncio.run(
+        trading_client.process_ticker_async(
+            "AAPL",
+            alpaca,
+            motor_client,
+            {"buy_strategy": 1.0},
+            registry,
+            SimpleNamespace(cash="100000", portfolio_value="100000"),
+        )
+    )
+
+
+def test_trading_process_ticker_async_queues_a_buy(
+    motor_client, latest_price, trading_state
+):
+    motor_client.HistoricalDatabase.HistoricalDatabase.docs.append(
+        encode_history("AAPL", "6mo", make_history(130))
+    )
+    orders = []
+    run_trading_ticker(motor_client, orders)
+
+    assert trading_state.buy_heap == [(-1.0, 96, "AAPL")]
+    assert orders == []
+    assert trading_state.sold is False
+
+
+def test_trading_process_ticker_async_sells_at_stop_loss(
+    motor_client, latest_price, trading_state
+):
+    trades = motor_client.trades
+    trades.assets_quantities.docs.append({"symbol": "AAPL", "quantity": 5})
+    trades.assets_limit.docs.append(
+        {"symbol": "AAPL", "stop_loss_price": 110.0, "take_profit_price": 130.0}
+    )
+    orders = []
+    run_trading_ticker(motor_client, orders)
+
+    (order,) = orders
+    assert (order.symbol, order.qty, order.side.name) == ("AAPL", 5, "SELL")
+    assert trading_state.sold is True
+    assert [(doc["symbol"], doc["side"]) for doc in trades.paper.docs] == [
+        ("AAPL", "SELL")
+    ]
+    # The position is closed, so its quantity and limits are removed.
+    assert trades.assets_quantities.docs == []
+    assert trades.assets_limit.docs == []
+    # The stop-loss exits before reading the history.
+    assert motor_client.HistoricalDatabase.HistoricalDatabase.calls == []
+
+
+def test_load_strategy_coefficients_async(motor_client, monkeypatch):
+    monkeypatch.setattr(trading_client, "strategies", [sell_strategy, buy_strategy])
+    db = motor_client.trading_simulator
+    db.rank.docs.extend(
+        [
+            {"strategy": "sell_strategy", "rank": 2},
+            {"strategy": "buy_strategy", "rank": 1},
+        ]
+    )
+    db.rank_to_coefficient.docs.extend(
+        [{"rank": 1, "coefficient": 0.9}, {"rank": 2, "coefficient": 0.5}]
+    )
+
+    coefficients = asyncio.run(
+        trading_client.load_strategy_coefficients_async(motor_client)
+    )
+
+    assert coefficients == {"sell_strategy": 0.5, "buy_strategy": 0.9}
+
+
+def test_trading_cycle_async(motor_client, latest_price, trading_state, monkeypatch):
+    latest_price.update({"QQQ": 518.58, "SPY": 591.95})
+    monkeypatch.setattr(
+        client_helper.quote_service, "source", lambda tickers: dict(latest_price)
+    )
+    sleeps = []
+
+    async def sleep(seconds):
+        sleeps.append(seconds)
+
+    monkeypatch.setattr(trading_client.asyncio, "sleep", sleep)
+    motor_client.HistoricalDatabase.HistoricalDatabase.docs.append(
+        encode_history("AAPL", "6mo", make_history(130))
+    )
+    orders = []
+    alpaca = SimpleNamespace(
+        submit_order=orders.append,
+        get_account=lambda: SimpleNamespace(cash="100000", portfolio_value="100000"),
+    )
+
+    asyncio.run(
+        trading_client.trading_cycle_async(
+            ["AAPL"],
+            alpaca,
+            motor_client,
+            {"buy_strategy": 1.0},
+            IdealPeriodRegistry(),
+        )
+    )
+
+    trades = motor_client.trades
+    assert [call[1]["name"] for call in trades.portfolio_values.calls] == [
+        "portfolio_percentage",
+        "ndaq_percentage",
+        "spy_percentage",
+    ]
+    # The queued buy is placed and logged through motor.
+    (order,) = orders
+    assert (order.symbol, order.qty, order.side.name) == ("AAPL", 96, "BUY")
+    assert trades.assets_quantities.docs == [{"symbol": "AAPL", "quantity": 96}]
+    assert trades.assets_limit.docs[0]["stop_loss_price"] == round(104.0 * 0.97, 2)
+    assert trading_state.buy_heap == []
+    assert sleeps == [5]
@@ -0,0 +1,134 @@
+import logging
+import os
+import sys
+import threading
+import time
+
+import pytest
+
+sys.path.append(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+)
+import ranking_client
+import trading_client
+from helper_files.client_helper import quote_service, wait_for_price
+from helper_files.cycle_executor import CycleExecutor
+
+logger = logging.getLogger(__name__)
+
+
+@pytest.fixture
+def executor():
+    executor = CycleExecutor(3, task_timeout=0.3, cycle_timeout=2, name="test")
+    yield executor
+    executor.shutdown()
+
+
+def test_concurrency_is_bounded(executor):
+    lock = threading.Lock()
+    running, peak, seen = [0], [0], []
+
+    def work(item, offset, cancel_event):
+        with lock:
+            running[0] += 1
+            peak[0] = max(peak[0], running[0])
+        time.sleep(0.02)
+        with lock:
+            running[0] -= 1
+            seen.append(item + offset)
+
+    stats = executor.run(work, range(12), 100, logger=logger)
+
+    assert peak[0] == 3
+    assert sorted(seen) == list(range(100, 112))
+    assert stats["tasks"] == stats["completed"] == 12
+    assert stats["failed"] == stats["timed_out"] == stats["cancelled"] == 0
+    assert (
+        0.02 <= stats["median_seconds"] <= stats["p95_seconds"] <= stats["max_seconds"]
+    )
+
+
+def test_stalled_task_is_abandoned_and_cancelled(executor, caplog):
+    stopped = threading.Event()
+
+    def work(item, cancel_event):
+        if item == "STALL":
+            # Stalls until the cycle gives up on it.
+            cancel_event.wait(10)
+            stopped.set()
+        elif item == "FAIL":
+            raise ValueError("fail")
+
+    start = time.monotonic()
+    stats = executor.run(work, ["A", "STALL", "FAIL", "B"], logger=logger)
+
+    assert time.monotonic() - start < 1
+    assert (stats["completed"], stats["failed"], stats["timed_out"]) == (2, 1, 1)
+    assert stopped.wait(1)
+    assert "Error processing FAIL: fail" in caplog.text
+
+
+def test_cycle_timeout_cancels_queued_items():
+    executor = CycleExecutor(1, cycle_timeout=0.2, name="test")
+    try:
+        stats = executor.run(lambda item, cancel_event: time.sleep(0.15), range(5))
+    finally:
+        executor.shutdown()
+
+    # The first item finishes, the second is abandoned, the rest never start.
+    assert (stats["completed"], stats["timed_out"], stats["cancelled"]) == (1, 1, 3)
+    assert stats["cycle_seconds"] < 0.3
+
+
+@pytest.fixture
+def unpriced(monkeypatch):
+    """Quote source that never prices anything, counting its calls."""
+    calls = []
+
+    def source(tickers):
+        calls.append(list(tickers))
+        return {}
+
+    monkeypatch.setattr(quote_service, "source", source)
+    # Every retry reaches the source instead of the cached miss.
+    monkeypatch.setattr(quote_service, "miss_ttl", 0)
+    return calls
+
+
+def test_wait_for_price_gives_up(unpriced):
+    start = time.monotonic()
+
+    assert wait_for_price("NOPRICE", threading.Event(), tries=3, backoff=0.01) is None
+    assert len(unpriced) == 3
+    assert time.monotonic() - start < 1
+
+
+@pytest.mark.parametrize(
+    "process_ticker, args",
+    [
+        (ranking_client.process_ticker, (None, None, None)),
+        (trading_client.process_ticker, (None,) * 7),
+    ],
+)
+def test_unpriced_ticker_stops_when_the_cycle_ends(
+    unpriced, process_ticker, args, monkeypatch
+):
+    monkeypatch.setattr(trading_client, "sold", False)
+    returned = []
+
+    def work(ticker, cancel_event):
+        process_ticker(ticker, *args, cancel_event=cancel_event)
+        returned.append(ticker)
+
+    executor = CycleExecutor(2, task_timeout=0.3, cycle_timeout=0.5, name="test")
+    try:
+        stats = executor.run(work, ["UNPRICED1", "UNPRICED2"])
+        assert stats["timed_out"] == 2
+        # The workers were waiting to retry and return once the cycle ends.
+        deadline = time.monotonic() + 1
+        while len(returned) < 2 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert sorted(returned) == ["UNPRICED1", "UNPRICED2"]
+        assert len(unpriced) == 2
+    finally:
+        executor.shutdown()
@@ -0,0 +1,143 @@
+import logging
+import os
+import sys
+import zlib
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.append(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+)
+from TradeSim.decision_cache import cached_precompute_strategy_decisions
+from TradeSim.decisions import DecisionStore
+from TradeSim.utils import _trading_days
+
+logger = logging.getLogger(__name__)
+
+
+def SMA_indicator(ticker, data):
+    return "Hold"
+
+
+def RSI_indicator(ticker, data):
+    return "Hold"
+
+
+STRATEGIES = [SMA_indicator, RSI_indicator]
+IDEAL_PERIOD = {"SMA_indicator": "1y", "RSI_indicator": "3mo"}
+calls = []
+
+
+def fake_precompute(
+    strategies,
+    ticker_price_history,
+    train_tickers,
+    ideal_period,
+    start_date,
+    end_date,
+    logger,
+):
+    """Deterministic decisions derived from the last close, recording each call."""
+    calls.append((list(train_tickers), start_date, end_date))
+    dates = [day.strftime("%Y-%m-%d") for day in _trading_days(start_date, end_date)]
+    store = DecisionStore([s.__name__ for s in strategies], train_tickers, dates)
+    for ticker in train_tickers:
+        close = ticker_price_history[ticker]["Close"]
+        for date_str in dates:
+            if date_str not in close.index:
+                continue
+            for strategy in strategies:
+                seed = zlib.crc32(f"{strategy.__name__}{date_str}".encode())
+                action = ["Buy", "Sell", "Hold"][(seed + int(close[date_str])) % 3]
+                store.set(strategy.__name__, ticker, date_str, action)
+    return store
+
+
+@pytest.fixture
+def price_history():
+    dates = pd.bdate_range("2024-01-01", periods=40)
+    return {
+        ticker: pd.DataFrame({"Close": np.arange(40.0) + i * 10}, index=dates)
+        for i, ticker in enumerate(["AAA", "BBB", "CCC"])
+    }
+
+
+def _run(cache_dir, price_history, tickers, start, end):
+    return cached_precompute_strategy_decisions(
+        fake_precompute,
+        STRATEGIES,
+        price_history,
+        tickers,
+        IDEAL_PERIOD,
+        start,
+        end,
+        logger,
+        str(cache_dir),
+    )
+
+
+def test_second_run_is_served_from_cache(tmp_path, price_history):
+    calls.clear()
+    first = _run(tmp_path, price_history, ["AAA", "BBB"], "2024-01-02", "2024-01-12")
+    second = _run(tmp_path, price_history, ["AAA", "BBB"], "2024-01-02", "2024-01-12")
+
+    assert len(calls) == 1
+    assert second == first
+    assert np.array_equal(second.codes, first.codes)
+
+
+def test_only_missing_cells_are_computed(tmp_path, price_history):
+    calls.clear()
+    _run(tmp_path, price_history, ["AAA", "BBB"], "2024-01-02", "2024-01-12")
+    extended = _run(tmp_path, price_history, ["AAA", "BBB"], "2024-01-02", "2024-01-19")
+
+    assert calls[1] == (["AAA", "BBB"], datetime(2024, 1, 15), datetime(2024, 1, 19))
+    expected = fake_precompute(
+        STRATEGIES,
+        price_history,
+        ["AAA", "BBB"],
+        IDEAL_PERIOD,
+        datetime(2024, 1, 2),
+        datetime(2024, 1, 19),
+        logger,
+    )
+    assert np.array_equal(extended.codes, expected.codes)
+
+    # The merged cache still serves both the old and the new window.
+    calls.clear()
+    _run(tmp_path, price_history, ["BBB"], "2024-01-08", "2024-01-19")
+    assert calls == []
+
+
+def test_changed_prices_invalidate_ticker(tmp_path, price_history):
+    calls.clear()
+    _run(tmp_path, price_history, ["AAA", "BBB"], "2024-01-02", "2024-01-12")
+    price_history["AAA"] = price_history["AAA"] + 1
+    store = _run(tmp_path, price_history, ["AAA", "BBB"], "2024-01-02", "2024-01-12")
+
+    assert calls[1][0] == ["AAA"]
+    expected = fake_precompute(
+        STRATEGIES,
+        price_history,
+        ["AAA", "BBB"],
+        IDEAL_PERIOD,
+        datetime(2024, 1, 2),
+        datetime(2024, 1, 12),
+        logger,
+    )
+    assert np.array_equal(store.codes, expected.codes)
+
+
+def test_key_depends_on_ideal_period(tmp_path, price_history):
+    calls.clear()
+    _run(tmp_path, price_history, ["AAA"], "2024-01-02", "2024-01-05")
+    IDEAL_PERIOD["RSI_indicator"] = "6mo"
+    try:
+        _run(tmp_path, price_history, ["AAA"], "2024-01-02", "2024-01-05")
+    finally:
+        IDEAL_PERIOD["RSI_indicator"] = "3mo"
+    assert len(calls) == 2
+    assert len(os.listdir(tmp_path)) == 2
@@ -0,0 +1,147 @@
+import os
+import pickle
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.append(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+)
+from strategies.signals import signal_name, to_signal
+from TradeSim.decisions import (
+    BUY,
+    HOLD,
+    MISSING,
+    SELL,
+    DecisionStore,
+    encode_actions,
+)
+
+NESTED = {
+    "RSI_indicator": {
+        "AAPL": {"2024-01-02": "Buy", "2024-01-03": "Sell"},
+        "MSFT": {"2024-01-03": "Hold"},
+    },
+    "SMA_indicator": {"AAPL": {"2024-01-02": "Hold"}, "MSFT": {}},
+}
+
+
+@pytest.fixture
+def store():
+    return DecisionStore.from_dicts(
+        NESTED, tickers=["AAPL", "MSFT"], dates=["2024-01-02", "2024-01-03"]
+    )
+
+
+def test_nested_accessor_matches_dicts(store):
+    assert store["RSI_indicator"]["AAPL"].get("2024-01-02") == "Buy"
+    assert store["RSI_indicator"]["AAPL"].get("2024-01-03") == "Sell"
+    assert store["RSI_indicator"]["MSFT"].get("2024-01-02") is None
+    assert store["SMA_indicator"]["MSFT"].get("2024-01-04") is None
+    assert store.get_action("SMA_indicator", "AAPL", "2024-01-02") == "Hold"
+    assert store.to_dicts() == NESTED
+    assert store == NESTED
+
+
+def test_day_actions(store):
+    assert store.day_actions("AAPL", "2024-01-03") == {
+        "RSI_indicator": "Sell",
+        "SMA_indicator": None,
+    }
+    assert store.day_actions("AAPL", "2024-01-04") == {
+        "RSI_indicator": None,
+        "SMA_indicator": None,
+    }
+
+
+def test_day_signals(store):
+    assert store.day_signals("AAPL", "2024-01-03") == {
+        "RSI_indicator": SELL,
+        "SMA_indicator": None,
+    }
+    assert store.day_signals("MSFT", "2024-01-03") == {
+        "RSI_indicator": HOLD,
+        "SMA_indicator": None,
+    }
+    assert store.day_signals("AAPL", "2024-01-04") == {
+        "RSI_indicator": None,
+        "SMA_indicator": None,
+    }
+
+
+def test_day_codes(store):
+    codes = store.day_codes(
+        ["MSFT", "TSLA", "AAPL"],
+        "2024-01-03",
+        ["SMA_indicator", "RSI_indicator", "MACD_indicator"],
+    )
+    assert codes.dtype == np.int8
+    assert codes.tolist() == [
+        [MISSING, HOLD, MISSING],
+        [MISSING, MISSING, MISSING],
+        [MISSING, SELL, MISSING],
+    ]
+    assert store.day_codes(["AAPL"], "2024-01-02").tolist() == [[BUY, HOLD]]
+    assert (store.day_codes(["AAPL"], "2024-01-04") == MISSING).all()
+
+
+def test_signal_conversions():
+    assert [to_signal(a) for a in ("Buy", "sell", "strong buy", HOLD)] == [
+        BUY,
+        SELL,
+        BUY,
+        HOLD,
+    ]
+    assert [signal_name(s) for s in (BUY, SELL, HOLD)] == ["Buy", "Sell", "Hold"]
+
+
+def test_codes_layout(store):
+    assert store.codes.dtype == np.int8
+    assert store.codes.shape == (2, 2, 2)
+    assert store.codes[0, 0].tolist() == [BUY, SELL]
+    assert store.codes[0, 1].tolist() == [MISSING, HOLD]
+
+
+def test_update_keeps_existing_cells(store):
+    other = DecisionStore(["SMA_indicator"], ["MSFT"], ["2024-01-03"])
+    other.set("SMA_indicator", "MSFT", "2024-01-03", "Sell")
+    store.update(other)
+    assert store["SMA_indicator"]["MSFT"].get("2024-01-03") == "Sell"
+    assert store["SMA_indicator"]["AAPL"].get("2024-01-02") == "Hold"
+
+
+def test_int_and_string_actions_are_stored_alike(store):
+    ints = DecisionStore.from_dicts(
+        {
+            "RSI_indicator": {
+                "AAPL": {"2024-01-02": BUY, "2024-01-03": SELL},
+                "MSFT": {"2024-01-03": HOLD},
+            },
+            "SMA_indicator": {"AAPL": {"2024-01-02": HOLD}, "MSFT": {}},
+        },
+        tickers=["AAPL", "MSFT"],
+        dates=["2024-01-02", "2024-01-03"],
+    )
+    assert (ints.codes == store.codes).all()
+
+    ints.set("SMA_indicator", "MSFT", "2024-01-02", "strong buy")
+    assert ints["SMA_indicator"]["MSFT"].get("2024-01-02") == "Buy"
+    with pytest.raises(ValueError):
+        ints.set("SMA_indicator", "MSFT", "2024-01-02", 2)
+
+
+def test_encode_actions():
+    assert encode_actions([1, -1, 0]).tolist() == [BUY, SELL, HOLD]
+    assert encode_actions(["Buy", "Hold"]).tolist() == [BUY, HOLD]
+    assert encode_actions([1.0, np.nan]).tolist() == [BUY, MISSING]
+    with pytest.raises(ValueError):
+        encode_actions(["Strong Buy"])
+    with pytest.raises(ValueError):
+        encode_actions([2])
+
+
+def test_pickle_roundtrip(store):
+    store["RSI_indicator"]["AAPL"]
+    restored = pickle.loads(pickle.dumps(store))
+    assert restored == NESTED
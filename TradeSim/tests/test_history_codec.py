@@ -0,0 +1,97 @@
+import os
+import sys
+
+import bson
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.append(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+)
+from helper_files.history_codec import decode_history, encode_history
+
+
+@pytest.fixture(params=[None, "America/New_York"])
+def history(request):
+    """Synthetic frame shaped like yf.Ticker.history output."""
+    dates = pd.DatetimeIndex(
+        pd.bdate_range("2024-01-02", periods=250).values, name="Date"
+    )
+    if request.param:
+        dates = dates.tz_localize(request.param)
+    rng = np.random.default_rng(3)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.02, len(dates))))
+    return pd.DataFrame(
+        {
+            "Open": close * 0.995,
+            "High": close * 1.01,
+            "Low": close * 0.99,
+            "Close": close,
+            "Volume": rng.integers(1_000, 1_000_000, len(dates)),
+            "Dividends": 0.0,
+            "Stock Splits": 0.0,
+        },
+        index=dates,
+    )
+
+
+def roundtrip(document):
+    """Encodes and decodes through BSON, as a Mongo insert and find_one do."""
+    return bson.decode(bson.encode(document))
+
+
+def test_columnar_roundtrip(history):
+    document = roundtrip(encode_history("AAA", "1y", history))
+
+    assert document["format"] == 1
+    assert "data" not in document
+    pd.testing.assert_frame_equal(decode_history(document), history)
+
+
+def test_decode_is_zero_copy(history):
+    document = roundtrip(encode_history("AAA", "1y", history))
+    decoded = decode_history(document)
+
+    close = decoded["Close"].to_numpy()
+    assert not close.flags.writeable
+    assert np.shares_memory(close, np.frombuffer(document["columns"]["Close"]["data"]))
+    # Replacing a column leaves the stored bytes untouched.
+    decoded["Close"] = decoded["Close"] * 2
+    pd.testing.assert_series_equal(decode_history(document)["Close"], history["Close"])
+
+
+def test_decoded_columns_are_read_only(history):
+    decoded = decode_history(roundtrip(encode_history("AAA", "1y", history)))
+
+    with pytest.raises(ValueError, match="read-only"):
+        decoded.loc[decoded.index[0], "Open"] = 1.0
+    with pytest.raises(ValueError, match="read-only"):
+        decoded.iloc[0, 0] = 1.0
+
+    writable = decoded.copy()
+    writable.loc[writable.index[0], "Open"] = 1.0
+    assert writable["Open"].iloc[0] == 1.0
+    assert decoded["Open"].iloc[0] == history["Open"].iloc[0]
+
+
+def test_decodes_records_documents(history):
+    records = history.reset_index().to_dict("records")
+    document = roundtrip({"ticker": "AAA", "period": "1y", "data": records})
+
+    decoded = decode_history(document)
+
+    expected = history
+    if history.index.tz is not None:
+        # BSON stores datetimes as naive UTC.
+        expected = history.tz_convert("UTC").tz_localize(None)
+    np.testing.assert_array_equal(decoded.index.values, expected.index.values)
+    pd.testing.assert_frame_equal(decoded, expected, check_index_type=False)
+
+
+def test_non_numeric_columns_fall_back_to_records(history):
+    history = history.assign(Note="x")
+    document = encode_history("AAA", "1y", history)
+
+    assert "format" not in document
+    assert len(document["data"]) == len(history)
@@ -0,0 +1,87 @@
+import os
+import sys
+import threading
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.append(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+)
+from helper_files.history_provider import PERIOD_DAYS, HistoryProvider, slice_period
+from helper_files.train_client_helper import get_historical_data
+
+
+class FakeLoader:
+    """Local get_data that records every read."""
+
+    def __init__(self, histories):
+        self.histories = histories
+        self.calls = []
+        self.lock = threading.Lock()
+
+    def __call__(self, ticker, mongo_client, period):
+        with self.lock:
+            self.calls.append((ticker, period))
+        return self.histories[ticker]
+
+
+@pytest.fixture(params=[None, "America/New_York"])
+def history(request):
+    dates = pd.bdate_range("2022-06-01", "2024-06-28", name="Date")
+    if request.param:
+        dates = dates.tz_localize(request.param)
+    rng = np.random.default_rng(5)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.02, len(dates))))
+    return pd.DataFrame({"Close": close}, index=dates)
+
+
+def test_slices_match_training_windows(history):
+    last_date = datetime(2024, 6, 28)
+    for period in PERIOD_DAYS:
+        expected = get_historical_data("AAA", last_date, period, {"AAA": history})
+        pd.testing.assert_frame_equal(slice_period(history, period), expected)
+
+
+def test_reads_longest_period_once_per_ticker(history):
+    loader = FakeLoader({"AAA": history, "BBB": history.iloc[:-5]})
+    provider = HistoryProvider(None, ["1mo", "3mo", "1y", "3mo"], loader=loader)
+
+    one_month = provider.get("AAA", "1mo")
+    assert provider.get("AAA", "1mo") is one_month
+    assert provider.get("AAA", "1y") is history
+    pd.testing.assert_frame_equal(
+        provider.get("AAA", "3mo"), slice_period(history, "3mo")
+    )
+    provider.get("BBB", "3mo")
+
+    assert loader.calls == [("AAA", "1y"), ("BBB", "1y")]
+    assert provider.loads == 2
+
+
+def test_unsliceable_periods_are_read_on_their_own(history):
+    loader = FakeLoader({"AAA": history})
+    provider = HistoryProvider(None, ["1mo", "1y", "max"], loader=loader)
+
+    provider.get("AAA", "max")
+    provider.get("AAA", "2y")
+    provider.get("AAA", "1mo")
+
+    assert loader.calls == [("AAA", "max"), ("AAA", "2y"), ("AAA", "1y")]
+
+
+def test_threads_share_one_read(history):
+    loader = FakeLoader({"AAA": history})
+    provider = HistoryProvider(None, ["1mo", "6mo", "2y"], loader=loader)
+    threads = [
+        threading.Thread(target=provider.get, args=("AAA", period))
+        for period in ["1mo", "6mo", "2y"] * 4
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert loader.calls == [("AAA", "2y")]
@@ -0,0 +1,60 @@
+import os
+import sys
+from datetime import datetime, timedelta
+
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.append(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+)
+from helper_files.train_client_helper import (
+    HistoryWindowIndex,
+    build_window_indexes,
+    get_historical_data,
+)
+from setup import indicator_periods
+
+
+@pytest.fixture(params=[None, "America/New_York"])
+def ticker_price_history(request):
+    dates = pd.bdate_range("2021-06-01", "2024-06-28", name="Date")
+    if request.param:
+        dates = dates.tz_localize(request.param)
+    rng = np.random.default_rng(11)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.02, len(dates))))
+    history = pd.DataFrame(
+        {"Close": close, "Volume": rng.integers(1, 1000, len(dates))}, index=dates
+    )
+    # A gap in the history, as for a halted ticker.
+    return {"AAA": history.drop(history.index[300:320]), "BBB": None}
+
+
+def test_windows_match_label_slices(ticker_price_history):
+    window_indexes = build_window_indexes(ticker_price_history, ["AAA", "BBB"])
+    assert list(window_indexes) == ["AAA"]
+
+    start = datetime(2023, 1, 1)
+    query_dates = [start + timedelta(days=i) for i in range(0, 540, 3)]
+    for period in sorted(set(indicator_periods.values())):
+        for current_date in query_dates:
+            expected = get_historical_data(
+                "AAA", current_date, period, ticker_price_history
+            )
+            actual = get_historical_data(
+                "AAA", current_date, period, ticker_price_history, window_indexes["AAA"]
+            )
+            pd.testing.assert_frame_equal(actual, expected)
+
+
+def test_arrays_are_views(ticker_price_history):
+    history = ticker_price_history["AAA"]
+    window_index = HistoryWindowIndex(history)
+    current_date = datetime(2024, 3, 15)
+
+    arrays = window_index.arrays("3mo", current_date)
+    expected = get_historical_data("AAA", current_date, "3mo", ticker_price_history)
+    np.testing.assert_array_equal(arrays["Close"], expected["Close"].to_numpy())
+    np.testing.assert_array_equal(arrays["Volume"], expected["Volume"].to_numpy())
+    assert np.shares_memory(arrays["Close"], history["Close"].to_numpy())
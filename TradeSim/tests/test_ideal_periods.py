@@ -0,0 +1,57 @@
+import os
+import sys
+from unittest.mock import MagicMock
+
+sys.path.append(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+)
+from helper_files.ideal_periods import IdealPeriodRegistry, bump_ideal_period_version
+
+
+def make_client(periods, version=None):
+    """MagicMock client serving IndicatorsDatabase from local state."""
+    state = {"periods": dict(periods), "version": version}
+    client = MagicMock()
+    db = client.IndicatorsDatabase
+    db.Indicators.find.side_effect = lambda *args: [
+        {"indicator": indicator, "ideal_period": period}
+        for indicator, period in state["periods"].items()
+    ]
+    db.IndicatorsVersion.find_one.side_effect = lambda *args: (
+        None if state["version"] is None else {"version": state["version"]}
+    )
+    return client, state
+
+
+def test_refresh_loads_periods_once():
+    client, _ = make_client({"RSI_indicator": "1y", "MACD_indicator": "2y"})
+    registry = IdealPeriodRegistry()
+
+    assert registry.refresh(client) is True
+    assert registry.refresh(client) is False
+    assert dict(registry) == {"RSI_indicator": "1y", "MACD_indicator": "2y"}
+    assert registry["RSI_indicator"] == "1y"
+    assert client.IndicatorsDatabase.Indicators.find.call_count == 1
+
+
+def test_refresh_reloads_after_version_bump():
+    client, state = make_client({"RSI_indicator": "1y"}, version=1)
+    registry = IdealPeriodRegistry()
+    registry.refresh(client)
+
+    state["periods"]["RSI_indicator"] = "5y"
+    assert registry.refresh(client) is False
+    assert registry["RSI_indicator"] == "1y"
+
+    state["version"] = 2
+    assert registry.refresh(client) is True
+    assert registry["RSI_indicator"] == "5y"
+    assert registry.version == 2
+
+
+def test_bump_increments_version_counter():
+    client = MagicMock()
+    bump_ideal_period_version(client)
+    client.IndicatorsDatabase.IndicatorsVersion.update_one.assert_called_once_with(
+        {}, {"$inc": {"version": 1}}, upsert=True
+    )
@@ -0,0 +1,149 @@
+import copy
+import json
+import logging
+import os
+import sys
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.append(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+)
+from helper_files.train_client_helper import local_update_portfolio_values
+from TradeSim.decisions import DecisionStore
+from TradeSim.portfolio_engine import PortfolioEngine
+from TradeSim.price_matrix import ClosePriceMatrix
+from TradeSim.utils import simulate_trading_day
+
+logger = logging.getLogger(__name__)
+
+
+def _strategy(name):
+    def strategy(ticker, data):
+        return "Hold"
+
+    strategy.__name__ = name
+    return strategy
+
+
+@pytest.fixture(scope="module")
+def simulation_inputs():
+    rng = np.random.default_rng(7)
+    dates = pd.bdate_range("2024-01-01", periods=60, name="Date")
+    tickers = ["AAA", "BBB", "CCC", "DDD"]
+    ticker_price_history = {}
+    for ticker in tickers:
+        # Coarse prices so some sells land exactly on the holding price.
+        close = np.round(50 + np.cumsum(rng.normal(0, 1.5, len(dates))), 0)
+        ticker_price_history[ticker] = pd.DataFrame({"Close": close}, index=dates)
+    # A ticker with a gap to exercise the "no price today" paths.
+    ticker_price_history["DDD"] = ticker_price_history["DDD"].drop(dates[10:15])
+
+    strategies = [_strategy(f"S{i}_indicator") for i in range(25)]
+    date_strs = [date.strftime("%Y-%m-%d") for date in dates]
+    decisions = DecisionStore(
+        [strategy.__name__ for strategy in strategies], tickers, date_strs
+    )
+    decisions.codes[:] = rng.choice(
+        [1, 1, -1, 0, -128], size=decisions.codes.shape
+    ).astype(np.int8)
+    return dates, tickers, ticker_price_history, strategies, decisions
+
+
+def _run_dicts(dates, tickers, history, strategies, decisions):
+    trading_simulator = {
+        strategy.__name__: {
+            "holdings": {},
+            "amount_cash": 50000,
+            "total_trades": 0,
+            "successful_trades": 0,
+            "neutral_trades": 0,
+            "failed_trades": 0,
+            "portfolio_value": 50000,
+        }
+        for strategy in strategies
+    }
+    points = {strategy.__name__: 0 for strategy in strategies}
+    active_counts = []
+    time_delta = 0.01
+    for date in dates:
+        trading_simulator, points = simulate_trading_day(
+            date,
+            strategies,
+            trading_simulator,
+            points,
+            time_delta,
+            history,
+            tickers,
+            decisions,
+            logger,
+        )
+        active_count, trading_simulator = local_update_portfolio_values(
+            date, strategies, trading_simulator, history, logger
+        )
+        active_counts.append(active_count)
+        time_delta *= 1.1
+    return trading_simulator, points, active_counts
+
+
+def _run_engine(dates, tickers, history, strategies, decisions, engine=None):
+    if engine is None:
+        engine = PortfolioEngine(
+            [strategy.__name__ for strategy in strategies], tickers
+        )
+    price_matrix = ClosePriceMatrix.from_history(history)
+    active_counts = []
+    time_delta = 0.01
+    for date in dates:
+        engine.simulate_trading_day(
+            date, price_matrix, tickers, decisions, time_delta, logger
+        )
+        active_counts.append(engine.update_portfolio_values(date, price_matrix))
+        time_delta *= 1.1
+    return engine, active_counts
+
+
+def test_engine_matches_dict_simulation(simulation_inputs):
+    dates, tickers, history, strategies, decisions = simulation_inputs
+    trading_simulator, points, active_counts = _run_dicts(
+        dates, tickers, history, strategies, decisions
+    )
+    engine, engine_active_counts = _run_engine(
+        dates, tickers, history, strategies, decisions
+    )
+    engine_simulator, engine_points = engine.to_dicts()
+
+    assert engine_active_counts == active_counts
+    # Same values, key order and int/float types as the dict implementation.
+    assert json.dumps(engine_simulator) == json.dumps(trading_simulator)
+    assert json.dumps(engine_points) == json.dumps(points)
+    assert sum(account["neutral_trades"] for account in trading_simulator.values())
+
+
+def test_engine_roundtrips_through_dicts(simulation_inputs):
+    dates, tickers, history, strategies, decisions = simulation_inputs
+    engine, _ = _run_engine(dates[:30], tickers, history, strategies, decisions)
+    trading_simulator, points = engine.to_dicts()
+
+    resumed = PortfolioEngine.from_dicts(
+        copy.deepcopy(trading_simulator), copy.deepcopy(points), tickers
+    )
+    assert resumed.to_dicts() == (trading_simulator, points)
+
+    _run_engine(dates[30:], tickers, history, strategies, decisions, engine)
+    _run_engine(dates[30:], tickers, history, strategies, decisions, resumed)
+    assert json.dumps(resumed.to_dicts()) == json.dumps(engine.to_dicts())
+
+
+def test_untouched_accounts_keep_int_values():
+    engine = PortfolioEngine(["S0_indicator"], ["AAA"])
+    engine.update_portfolio_values(
+        datetime(2024, 1, 2), ClosePriceMatrix.from_history({})
+    )
+    trading_simulator, points = engine.to_dicts()
+    assert trading_simulator["S0_indicator"]["amount_cash"] == 50000
+    assert isinstance(trading_simulator["S0_indicator"]["amount_cash"], int)
+    assert isinstance(points["S0_indicator"], int)
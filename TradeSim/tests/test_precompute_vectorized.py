@@ -0,0 +1,239 @@
+import logging
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+import talib
+
+sys.path.append(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+)
+from helper_files.client_helper import strategies
+from strategies import talib_indicators_vect
+from TradeSim.utils import (
+    SCALAR_ONLY_STRATEGIES,
+    precompute_strategy_decisions,
+    precompute_strategy_decisions_vectorized,
+    split_vectorized_strategies,
+)
+
+logger = logging.getLogger(__name__)
+
+START_DATE = "2024-01-02"
+END_DATE = "2024-01-19"
+
+
+def _synthetic_ohlcv(seed, periods=600):
+    rng = np.random.default_rng(seed)
+    dates = pd.bdate_range(end="2024-01-31", periods=periods)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.02, periods)))
+    open_ = close * (1 + rng.normal(0, 0.01, periods))
+    high = np.maximum(open_, close) * (1 + rng.uniform(0, 0.02, periods))
+    low = np.minimum(open_, close) * (1 - rng.uniform(0, 0.02, periods))
+    volume = rng.integers(1_000_000, 5_000_000, periods).astype(float)
+    df = pd.DataFrame(
+        {"Open": open_, "High": high, "Low": low, "Close": close, "Volume": volume},
+        index=dates,
+    )
+    df.index.name = "Date"
+    return df
+
+
+@pytest.fixture(scope="module")
+def price_history():
+    tickers = ["AAA", "BBB"]
+    ticker_price_history = {
+        ticker: _synthetic_ohlcv(seed) for seed, ticker in enumerate(tickers)
+    }
+    ideal_period = {strategy.__name__: "1y" for strategy in strategies}
+    return ticker_price_history, tickers, ideal_period
+
+
+def test_split_vectorized_strategies():
+    vectorized, scalar = split_vectorized_strategies(strategies)
+    assert len(vectorized) + len(scalar) == len(strategies)
+    assert {strategy.__name__ for strategy in scalar} == SCALAR_ONLY_STRATEGIES
+    for strategy, vectorized_function in vectorized:
+        assert strategy.__name__ == vectorized_function.__name__
+
+
+def test_vectorized_matches_scalar(price_history):
+    ticker_price_history, tickers, ideal_period = price_history
+
+    scalar = precompute_strategy_decisions(
+        strategies,
+        ticker_price_history,
+        tickers,
+        ideal_period,
+        START_DATE,
+        END_DATE,
+        logger,
+    )
+    vectorized = precompute_strategy_decisions_vectorized(
+        strategies,
+        ticker_price_history,
+        tickers,
+        ideal_period,
+        START_DATE,
+        END_DATE,
+        logger,
+    )
+
+    assert vectorized.keys() == scalar.keys()
+    for strategy_name in scalar:
+        for ticker in tickers:
+            assert vectorized[strategy_name][ticker] == scalar[strategy_name][ticker], (
+                strategy_name,
+                ticker,
+            )
+    assert len(vectorized["RSI_indicator"]["AAA"]) == 14
+
+
+def test_vectorized_skips_strategies_without_ideal_period(price_history):
+    ticker_price_history, tickers, ideal_period = price_history
+    ideal_period = dict(ideal_period)
+    del ideal_period["RSI_indicator"]
+
+    vectorized = precompute_strategy_decisions_vectorized(
+        [s for s in strategies if s.__name__ in ("RSI_indicator", "SMA_indicator")],
+        ticker_price_history,
+        tickers,
+        ideal_period,
+        START_DATE,
+        END_DATE,
+        logger,
+    )
+
+    assert vectorized["RSI_indicator"] == {"AAA": {}, "BBB": {}}
+    assert set(vectorized["SMA_indicator"]["AAA"].values()) <= {"Buy", "Sell", "Hold"}
+
+
+def test_price_arrays_match_frame_and_leave_history_unmodified(price_history):
+    ticker_price_history, _, _ = price_history
+    history = ticker_price_history["AAA"]
+    before = history.copy()
+    price_arrays = talib_indicators_vect.PriceArrays.from_frame(history)
+
+    assert not price_arrays["Close"].flags.writeable
+    for name in ("RSI_indicator", "MACD_indicator", "CDLDOJI_indicator"):
+        vectorized_function = getattr(talib_indicators_vect, name)
+        from_frame = vectorized_function(history)
+        assert from_frame.name == name
+        assert from_frame.index.equals(history.index)
+        np.testing.assert_array_equal(
+            np.asarray(vectorized_function(price_arrays)), from_frame.to_numpy()
+        )
+    pd.testing.assert_frame_equal(history, before)
+
+
+def test_indicator_cache_shares_outputs(price_history):
+    ticker_price_history, _, _ = price_history
+    price_arrays = talib_indicators_vect.PriceArrays.from_frame(
+        ticker_price_history["AAA"]
+    )
+
+    plus_di = price_arrays.indicator(
+        talib.PLUS_DI, "High", "Low", "Close", timeperiod=14
+    )
+    assert not plus_di.flags.writeable
+    for name in ("ADX_indicator", "ADXR_indicator", "DX_indicator"):
+        getattr(talib_indicators_vect, name)(price_arrays)
+    assert (
+        price_arrays.indicator(talib.PLUS_DI, "High", "Low", "Close", timeperiod=14)
+        is plus_di
+    )
+    # PLUS_DI and MINUS_DI are computed once; ADXR reuses ADX_indicator's ADX.
+    assert price_arrays.indicator_misses == 4
+    assert price_arrays.indicator_hits == 7
+
+
+@pytest.mark.parametrize(
+    "name, function, kwargs",
+    [
+        ("MA_indicator", talib.MA, {"timeperiod": 30, "matype": 0}),
+        ("APO_indicator", talib.APO, {"fastperiod": 12, "slowperiod": 26, "matype": 0}),
+        ("PPO_indicator", talib.PPO, {"fastperiod": 12, "slowperiod": 26, "matype": 0}),
+    ],
+)
+def test_shared_moving_averages_match_talib(price_history, name, function, kwargs):
+    ticker_price_history, _, _ = price_history
+    history = ticker_price_history["AAA"]
+    close = history["Close"].to_numpy()
+    value = function(close, **kwargs)
+    if name == "MA_indicator":
+        # MA signals on Close crossing the average, the oscillators on zero.
+        value = close - value
+    expected = np.select([value > 0, value < 0], [1, -1], 0)
+
+    signals = getattr(talib_indicators_vect, name)(history)
+    np.testing.assert_array_equal(signals.to_numpy(), expected)
+
+
+@pytest.mark.parametrize("periods", [600, 20, 10])
+def test_derived_adxr_and_stochrsi_match_talib(periods):
+    # Short histories cover shifts longer than the history itself.
+    history = _synthetic_ohlcv(0, periods)
+    high, low, close = (history[c].to_numpy() for c in ("High", "Low", "Close"))
+
+    adxr = talib.ADXR(high, low, close, timeperiod=14)
+    plus_di = talib.PLUS_DI(high, low, close, timeperiod=14)
+    minus_di = talib.MINUS_DI(high, low, close, timeperiod=14)
+    is_trending = adxr > 20
+    expected = np.select(
+        [(plus_di > minus_di) & is_trending, (minus_di > plus_di) & is_trending],
+        [1, -1],
+        0,
+    )
+    np.testing.assert_array_equal(
+        talib_indicators_vect.ADXR_indicator(history).to_numpy(), expected
+    )
+
+    fastk, _ = talib.STOCHRSI(close, timeperiod=14, fastk_period=5, fastd_period=3)
+    expected = np.select([fastk < 20, fastk > 80], [1, -1], 0)
+    np.testing.assert_array_equal(
+        talib_indicators_vect.STOCHRSI_indicator(history).to_numpy(), expected
+    )
+
+
+@pytest.mark.parametrize("periods", [10, 20])
+def test_vectorized_strategies_run_on_short_histories(periods):
+    history = _synthetic_ohlcv(1, periods)
+    vectorized = [
+        function
+        for function in vars(talib_indicators_vect).values()
+        if getattr(function, "price_arrays", False)
+    ]
+    assert talib_indicators_vect.ICHIMOKU_indicator in vectorized
+    for function in vectorized:
+        signals = function(history)
+        assert len(signals) == periods, function.__name__
+
+
+def test_pattern_matrix_matches_talib_patterns(price_history):
+    ticker_price_history, _, _ = price_history
+    history = ticker_price_history["AAA"]
+    ohlc = [history[c].to_numpy() for c in ("Open", "High", "Low", "Close")]
+
+    matrix = talib_indicators_vect.pattern_matrix(*ohlc)
+    assert matrix.shape == (len(talib_indicators_vect.CDL_PATTERNS), len(history))
+    assert matrix.dtype == np.int8
+    for row, pattern in enumerate(talib_indicators_vect.CDL_PATTERNS):
+        params = (
+            {"penetration": 0}
+            if pattern in talib_indicators_vect.PENETRATION_PATTERNS
+            else {}
+        )
+        np.testing.assert_array_equal(
+            matrix[row], np.sign(getattr(talib, pattern)(*ohlc, **params)), pattern
+        )
+
+    # Every CDL strategy reads its row of one shared matrix.
+    price_arrays = talib_indicators_vect.PriceArrays.from_frame(history)
+    for pattern in talib_indicators_vect.CDL_PATTERNS:
+        signals = getattr(talib_indicators_vect, f"{pattern}_indicator")(price_arrays)
+        np.testing.assert_array_equal(
+            signals, matrix[talib_indicators_vect.PATTERN_ROWS[pattern]]
+        )
+    assert price_arrays.indicator_misses == 1
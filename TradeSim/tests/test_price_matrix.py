@@ -0,0 +1,61 @@
+import os
+import sys
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.append(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+)
+from TradeSim.price_matrix import ClosePriceMatrix
+
+
+@pytest.fixture
+def ticker_price_history():
+    dates = pd.bdate_range("2024-01-01", periods=10, name="Date")
+    rng = np.random.default_rng(3)
+    return {
+        "AAA": pd.DataFrame({"Close": rng.uniform(10, 20, 10)}, index=dates),
+        "BBB": pd.DataFrame({"Close": rng.uniform(10, 20, 7)}, index=dates[3:]),
+        "CCC": pd.DataFrame(
+            {"Close": rng.uniform(10, 20, 10)},
+            index=dates.tz_localize("America/New_York"),
+        ),
+        "DDD": None,
+    }
+
+
+def test_matches_label_lookups(ticker_price_history):
+    price_matrix = ClosePriceMatrix.from_history(ticker_price_history)
+    assert price_matrix.tickers == ["AAA", "BBB", "CCC", "DDD"]
+
+    for date_str in price_matrix.dates:
+        d = price_matrix.day(date_str)
+        for ticker, history in ticker_price_history.items():
+            if history is not None and date_str in history.index:
+                expected = history.loc[date_str]["Close"]
+                if isinstance(expected, pd.Series):
+                    expected = expected.iloc[0]
+                assert price_matrix.has_price(d, ticker)
+                assert price_matrix.price(d, ticker) == expected
+            else:
+                assert not price_matrix.has_price(d, ticker)
+
+
+def test_missing_prices(ticker_price_history):
+    price_matrix = ClosePriceMatrix.from_history(ticker_price_history)
+    d = price_matrix.day(datetime(2024, 1, 1))
+    assert d == 0
+    assert price_matrix.day("2023-12-29") is None
+
+    with pytest.raises(KeyError):
+        price_matrix.price(d, "BBB")
+    with pytest.raises(KeyError):
+        price_matrix.price(d, "ZZZ")
+
+    closes, valid = price_matrix.row(d, ["AAA", "BBB", "ZZZ"])
+    assert valid.tolist() == [True, False, False]
+    assert closes[0] == ticker_price_history["AAA"]["Close"].iloc[0]
+    assert np.isnan(closes[1:]).all()
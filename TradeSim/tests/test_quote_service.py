@@ -0,0 +1,164 @@
+import os
+import sys
+import threading
+import types
+from unittest.mock import MagicMock
+
+import pytest
+
+sys.path.append(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+)
+from helper_files import client_helper, quote_service
+from helper_files.quote_service import QuoteService, alpaca_latest_prices
+from ranking_client import update_portfolio_values
+
+
+class FakeSource:
+    """Local price source that records every batched request."""
+
+    def __init__(self, prices):
+        self.prices = prices
+        self.calls = []
+
+    def __call__(self, tickers):
+        self.calls.append(list(tickers))
+        return {
+            ticker: self.prices[ticker] for ticker in tickers if ticker in self.prices
+        }
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def service():
+    source = FakeSource({"AAPL": 190.5, "MSFT": 410.25, "QQQ": 500.0})
+    clock = FakeClock()
+    return QuoteService(source, ttl=60, clock=clock), source, clock
+
+
+def test_refresh_is_one_batched_request(service):
+    quotes, source, _ = service
+    assert quotes.refresh(["AAPL", "MSFT", "QQQ", "AAPL"]) == {
+        "AAPL": 190.5,
+        "MSFT": 410.25,
+        "QQQ": 500.0,
+    }
+    assert quotes.get("AAPL") == 190.5
+    assert quotes.get_many(["QQQ", "MSFT"]) == {"QQQ": 500.0, "MSFT": 410.25}
+    assert source.calls == [["AAPL", "MSFT", "QQQ"]]
+    assert (quotes.requests, quotes.hits, quotes.misses) == (1, 3, 0)
+
+
+def test_stale_and_missing_prices_are_refetched(service):
+    quotes, source, clock = service
+    quotes.refresh(["AAPL", "MSFT"])
+    clock.now = 30
+    source.prices["AAPL"] = 191.0
+    assert quotes.age("AAPL") == 30
+    assert quotes.age("QQQ") is None
+    # Only the stale ticker and the uncached one are requested, together.
+    assert quotes.get_many(["AAPL", "QQQ"], max_age=10) == {
+        "AAPL": 191.0,
+        "QQQ": 500.0,
+    }
+    assert source.calls[-1] == ["AAPL", "QQQ"]
+    assert quotes.age("AAPL") == 0
+
+    clock.now = 91
+    assert quotes.get("MSFT") == 410.25
+    assert source.calls[-1] == ["MSFT"]
+
+
+def test_unknown_ticker_is_requested_again_after_miss_ttl(service):
+    quotes, source, clock = service
+    assert quotes.get_many(["NOPE", "AAPL"]) == {"AAPL": 190.5}
+    assert quotes.get("NOPE") is None
+    assert quotes.age("NOPE") is None
+    assert source.calls == [["NOPE", "AAPL"]]
+
+    clock.now = quotes.miss_ttl + 1
+    source.prices["NOPE"] = 12.5
+    assert quotes.get("NOPE") == 12.5
+    assert source.calls[-1] == ["NOPE"]
+
+
+def test_portfolio_values_request_unpriced_holdings_once(monkeypatch):
+    source = FakeSource({"HELD": 100.0})
+    monkeypatch.setattr(client_helper.quote_service, "source", source)
+    client = MagicMock()
+    holdings = client.trading_simulator.algorithm_holdings
+    holdings.find.return_value = [
+        {
+            "strategy": "test_strategy",
+            "amount_cash": 1_000.0,
+            "holdings": {"HELD": {"quantity": 2}, "UNPRICED": {"quantity": 3}},
+        }
+    ]
+
+    update_portfolio_values(client)
+
+    # The unpriced holding is valued at the 5000 placeholder.
+    assert [sorted(call) for call in source.calls] == [["HELD", "UNPRICED"]]
+    holdings.update_one.assert_called_once_with(
+        {"strategy": "test_strategy"},
+        {"$set": {"portfolio_value": 1_000.0 + 2 * 100.0 + 5_000}},
+        upsert=True,
+    )
+
+
+def test_concurrent_misses_share_one_request(service):
+    quotes, source, _ = service
+    barrier = threading.Barrier(8)
+    results = []
+
+    def read():
+        barrier.wait()
+        results.append(quotes.get("AAPL"))
+
+    threads = [threading.Thread(target=read) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert results == [190.5] * 8
+    assert source.calls == [["AAPL"]]
+
+
+class FakeDataClient:
+    """Local StockHistoricalDataClient serving latest trades."""
+
+    def __init__(self, prices):
+        self.prices = prices
+        self.requests = []
+
+    def get_stock_latest_trade(self, request):
+        symbols = request.symbol_or_symbols
+        self.requests.append(list(symbols))
+        return {
+            symbol: types.SimpleNamespace(price=self.prices[symbol])
+            for symbol in symbols
+            if symbol in self.prices
+        }
+
+
+def test_alpaca_prices_are_batched(monkeypatch):
+    monkeypatch.setattr(quote_service, "ALPACA_SYMBOLS_PER_REQUEST", 2)
+    data_client = FakeDataClient({"AAA": 10.004, "BBB": 20.0, "CCC": 30.0})
+    fallback = FakeSource({"ZZZ": 5.0})
+
+    prices = alpaca_latest_prices(
+        ["AAA", "BBB", "CCC", "ZZZ", "YYY"], data_client, fallback=fallback
+    )
+
+    assert prices == {"AAA": 10.0, "BBB": 20.0, "CCC": 30.0, "ZZZ": 5.0}
+    assert data_client.requests == [["AAA", "BBB"], ["CCC", "ZZZ"], ["YYY"]]
+    # Only the tickers Alpaca could not price go to the fallback.
+    assert fallback.calls == [["ZZZ", "YYY"]]
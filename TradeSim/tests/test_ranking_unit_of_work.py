@@ -0,0 +1,175 @@
+import logging
+import os
+import sys
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+from pymongo.errors import OperationFailure
+
+sys.path.append(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+)
+from control import profit_profit_time_d1
+from helper_files.ranking_unit_of_work import RankingUnitOfWork
+from ranking_client import simulate_trade
+from strategies.signals import BUY, SELL
+
+logger = logging.getLogger(__name__)
+
+
+def sell_strategy(ticker, data):
+    return SELL
+
+
+def buy_strategy(ticker, data):
+    return BUY
+
+
+@pytest.fixture
+def unit_of_work():
+    return RankingUnitOfWork(
+        [
+            {
+                "strategy": "sell_strategy",
+                "holdings": {"AAPL": {"quantity": 2, "price": 100.0}},
+                "amount_cash": 50_000.0,
+                "portfolio_value": 50_200.0,
+            },
+            {
+                "strategy": "buy_strategy",
+                "holdings": {},
+                "amount_cash": 100_000.0,
+                "portfolio_value": 100_000.0,
+            },
+        ],
+        time_delta=0.5,
+    )
+
+
+def test_trades_apply_in_memory(unit_of_work):
+    # Each sell is half the holding, at least 1: the second one sells out.
+    for _ in range(3):
+        simulate_trade("AAPL", sell_strategy, None, 104.0, unit_of_work)
+    simulate_trade("AAPL", buy_strategy, None, 104.0, unit_of_work)
+
+    sold = unit_of_work.strategy_doc("sell_strategy")
+    assert sold["holdings"] == {}
+    assert sold["amount_cash"] == 50_000.0 + 2 * 104.0
+    bought = unit_of_work.strategy_doc("buy_strategy")
+    assert bought["holdings"] == {"AAPL": {"quantity": 96, "price": 104.0}}
+    assert bought["amount_cash"] == 100_000.0 - 96 * 104.0
+
+    holdings_ops, points_ops = unit_of_work.operations()
+    assert [op._filter for op in holdings_ops] == [
+        {"strategy": "buy_strategy"},
+        {"strategy": "sell_strategy"},
+    ]
+    buy_update, sell_update = (op._doc for op in holdings_ops)
+    # Only the traded tickers' fields are written; cash is a change.
+    assert buy_update["$set"]["holdings.AAPL"] == {"quantity": 96, "price": 104.0}
+    assert buy_update["$inc"] == {"amount_cash": -96 * 104.0, "total_trades": 1}
+    assert "$unset" not in buy_update
+    assert sell_update["$unset"] == {"holdings.AAPL": ""}
+    assert sell_update["$inc"] == {
+        "amount_cash": 2 * 104.0,
+        "total_trades": 2,
+        "successful_trades": 2,
+    }
+    assert [op._filter for op in points_ops] == [{"strategy": "sell_strategy"}]
+    assert points_ops[0]._doc["$inc"] == {
+        "total_points": 2 * 0.5 * profit_profit_time_d1
+    }
+
+
+def test_commit_writes_once_in_a_transaction(unit_of_work):
+    simulate_trade("AAPL", sell_strategy, None, 104.0, unit_of_work)
+    mongo_client = MagicMock()
+    session = mongo_client.start_session.return_value.__enter__.return_value
+    session.with_transaction.side_effect = lambda write: write(session)
+
+    assert unit_of_work.commit(mongo_client, logger) == 1
+    db = mongo_client.trading_simulator
+    db.algorithm_holdings.bulk_write.assert_called_once()
+    db.points_tally.bulk_write.assert_called_once()
+    assert db.algorithm_holdings.bulk_write.call_args.kwargs == {
+        "ordered": True,
+        "session": session,
+    }
+    # Nothing is pending after a commit.
+    assert unit_of_work.commit(mongo_client, logger) == 0
+    db.algorithm_holdings.bulk_write.assert_called_once()
+
+
+def test_commit_without_transactions(unit_of_work):
+    simulate_trade("AAPL", sell_strategy, None, 104.0, unit_of_work)
+    mongo_client = MagicMock()
+    session = mongo_client.start_session.return_value.__enter__.return_value
+    session.with_transaction.side_effect = OperationFailure(
+        "Transaction numbers are only allowed on a replica set member or mongos",
+        code=20,
+    )
+
+    assert unit_of_work.commit(mongo_client, logger) == 1
+    db = mongo_client.trading_simulator
+    assert db.algorithm_holdings.bulk_write.call_args.kwargs["session"] is None
+
+
+def test_late_trades_are_rejected_after_commit(unit_of_work, caplog):
+    simulate_trade("AAPL", sell_strategy, None, 104.0, unit_of_work)
+    mongo_client = MagicMock()
+    session = mongo_client.start_session.return_value.__enter__.return_value
+    session.with_transaction.side_effect = lambda write: write(session)
+    assert unit_of_work.commit(mongo_client, logger) == 1
+
+    # An abandoned ticker finishing after the commit.
+    simulate_trade("AAPL", buy_strategy, None, 104.0, unit_of_work)
+
+    assert unit_of_work.rejected == 1
+    assert "Rejected late trade of buy_strategy on AAPL" in caplog.text
+    assert unit_of_work.strategy_doc("buy_strategy")["holdings"] == {}
+    assert unit_of_work.operations() == ([], [])
+
+
+def test_concurrent_tickers_keep_every_trade():
+    tickers = [f"T{i:02d}" for i in range(40)]
+    unit_of_work = RankingUnitOfWork(
+        [
+            {
+                "strategy": "sell_strategy",
+                "holdings": {
+                    ticker: {"quantity": 2, "price": 100.0} for ticker in tickers
+                },
+                "amount_cash": 50_000.0,
+                "portfolio_value": 58_000.0,
+            }
+        ],
+        time_delta=0.5,
+    )
+
+    def sell_all(ticker):
+        for _ in range(2):
+            simulate_trade(ticker, sell_strategy, None, 101.0, unit_of_work)
+
+    threads = [threading.Thread(target=sell_all, args=(t,)) for t in tickers]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    doc = unit_of_work.strategy_doc("sell_strategy")
+    assert doc["holdings"] == {}
+    assert doc["amount_cash"] == pytest.approx(50_000.0 + 80 * 101.0)
+    (update,), _ = unit_of_work.operations()
+    assert update._doc["$unset"] == {f"holdings.{ticker}": "" for ticker in tickers}
+    assert update._doc["$inc"]["total_trades"] == 80
+
+
+def test_dotted_ticker_writes_whole_holdings(unit_of_work):
+    simulate_trade("BRK.B", buy_strategy, None, 104.0, unit_of_work)
+
+    (update,), _ = unit_of_work.operations()
+    assert update._doc["$set"]["holdings"] == {
+        "BRK.B": {"quantity": 96, "price": 104.0}
+    }
+    assert not any(field.startswith("holdings.") for field in update._doc["$set"])
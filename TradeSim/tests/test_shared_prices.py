@@ -0,0 +1,63 @@
+import os
+import pickle
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.append(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+)
+from TradeSim.shared_prices import SharedPriceHistory
+
+
+@pytest.fixture
+def price_history():
+    dates = pd.bdate_range("2024-01-01", periods=30, name="Date")
+    aapl = pd.DataFrame(
+        {
+            "Open": np.linspace(100, 130, 30),
+            "High": np.linspace(101, 131, 30),
+            "Low": np.linspace(99, 129, 30),
+            "Close": np.linspace(100.5, 130.5, 30),
+            "Volume": np.arange(30, dtype=np.int64) * 1000,
+        },
+        index=dates,
+    )
+    msft = aapl.iloc[5:].copy()
+    msft.index = msft.index.tz_localize("America/New_York")
+    msft["Dividends"] = 0.0
+    return {"AAPL": aapl, "MSFT": msft, "EMPTY": pd.DataFrame(), "NONE": None}
+
+
+def test_roundtrip_preserves_frames(price_history):
+    tickers = list(price_history)
+    with SharedPriceHistory.create(price_history, tickers) as shared:
+        attached = SharedPriceHistory.attach(shared.descriptor)
+        for ticker in ("AAPL", "MSFT"):
+            pd.testing.assert_frame_equal(
+                attached[ticker], price_history[ticker], check_freq=False
+            )
+        assert attached["EMPTY"].empty
+        assert attached["NONE"].empty
+        assert list(attached) == tickers
+        attached.close()
+
+
+def test_frames_are_read_only_views(price_history):
+    with SharedPriceHistory.create(price_history, ["AAPL"]) as shared:
+        attached = SharedPriceHistory.attach(shared.descriptor)
+        close = attached["AAPL"]["Close"].to_numpy()
+        assert np.shares_memory(close, attached.values)
+        with pytest.raises(ValueError):
+            attached.values[0, 0] = 1.0
+        del close
+        attached.close()
+
+
+def test_descriptor_is_small(price_history):
+    with SharedPriceHistory.create(price_history, list(price_history)) as shared:
+        assert len(pickle.dumps(shared.descriptor)) < len(pickle.dumps(price_history))
+        with pytest.raises(KeyError):
+            shared["GOOG"]
@@ -0,0 +1,85 @@
+import os
+import sys
+
+import pytest
+
+sys.path.append(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+)
+import control
+import TradeSim.portfolio_engine as portfolio_engine
+import TradeSim.utils as utils
+import TradeSim.variables as variables
+from TradeSim.sweep import apply_overrides, expand_sweep, top_ranked_strategies
+
+
+def test_expand_grid():
+    configurations = expand_sweep(
+        {
+            "train_profit_price_change_ratio_d1": [1.03, 1.05],
+            "train_time_delta_mode": ["additive", "balanced", "multiplicative"],
+        }
+    )
+    assert len(configurations) == 6
+    assert configurations[0] == {
+        "train_profit_price_change_ratio_d1": 1.03,
+        "train_time_delta_mode": "additive",
+    }
+
+
+def test_expand_list_and_validation():
+    assert expand_sweep([{"train_rank_asset_limit": 0.2}, {}]) == [
+        {"train_rank_asset_limit": 0.2},
+        {},
+    ]
+    with pytest.raises(ValueError):
+        expand_sweep({"not_a_parameter": [1]})
+    with pytest.raises(ValueError):
+        expand_sweep({"train_period_start": ["2024-02-01"]})
+
+
+def test_apply_overrides_patches_imported_names():
+    original = control.train_rank_asset_limit
+    try:
+        apply_overrides({"train_rank_asset_limit": 0.9})
+        assert control.train_rank_asset_limit == 0.9
+        assert utils.train_rank_asset_limit == 0.9
+        assert portfolio_engine.train_rank_asset_limit == 0.9
+        assert variables.config_dict["train_rank_asset_limit"] == 0.9
+    finally:
+        apply_overrides({"train_rank_asset_limit": original})
+    assert utils.train_rank_asset_limit == original
+    assert variables.config_dict["train_rank_asset_limit"] == original
+
+
+def test_top_ranked_strategies_are_the_best_scores(monkeypatch):
+    # testing.py imports its TradeSim siblings as top-level modules.
+    monkeypatch.setattr(
+        sys,
+        "path",
+        sys.path + [os.path.dirname(os.path.dirname(os.path.abspath(__file__)))],
+    )
+    from testing import update_strategy_ranks
+
+    names = [f"strategy_{i}" for i in range(12)]
+    strategies = [type(name, (), {"__name__": name}) for name in names]
+    # strategy_i scores i, so strategy_11 is the best.
+    points = {name: 0 for name in names}
+    trading_simulator = {
+        name: {
+            "portfolio_value": float(i),
+            "successful_trades": 0,
+            "failed_trades": 0,
+            "amount_cash": 0.0,
+        }
+        for i, name in enumerate(names)
+    }
+
+    rank = update_strategy_ranks(strategies, points, trading_simulator)
+
+    assert rank["strategy_0"] == 1 and rank["strategy_11"] == 12
+    assert top_ranked_strategies(rank, count=3) == [
+        "strategy_11",
+        "strategy_10",
+        "strategy_9",
+    ]
@@ -0,0 +1,75 @@
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.append(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+)
+from strategies.signals import BUY, HOLD, MISSING, SELL
+from trading_client import (
+    plan_ticker_order,
+    weighted_majority_decision_and_median_quantity,
+    weighted_majority_decisions,
+)
+
+
+@pytest.mark.parametrize("integer_weights", [True, False])
+def test_batched_vote_matches_per_ticker_vote(integer_weights):
+    rng = np.random.default_rng(0)
+    n_tickers, n_strategies = 500, 7
+    decisions = rng.choice([BUY, SELL, HOLD, MISSING], (n_tickers, n_strategies))
+    quantities = rng.integers(0, 20, (n_tickers, n_strategies))
+    if integer_weights:
+        # Small integer weights make ties between the actions common.
+        weights = rng.integers(1, 4, n_strategies)
+    else:
+        weights = rng.choice([0.1, 0.2, 0.3, 0.7], n_strategies)
+
+    batched = weighted_majority_decisions(decisions, quantities, weights)
+
+    for t in range(n_tickers):
+        expected = weighted_majority_decision_and_median_quantity(
+            [
+                (decision, quantity, weight)
+                for decision, quantity, weight in zip(
+                    decisions[t].tolist(), quantities[t].tolist(), weights.tolist()
+                )
+                if decision != MISSING
+            ]
+        )
+        assert tuple(values[t] for values in batched) == expected, t
+
+
+def test_batched_vote_without_strategies_holds():
+    decision, quantity, buy_weight, sell_weight, hold_weight = (
+        weighted_majority_decisions(np.empty((2, 0), dtype=np.int8), None, [])
+    )
+    assert decision.tolist() == [HOLD, HOLD]
+    assert quantity is None
+    assert buy_weight.tolist() == sell_weight.tolist() == hold_weight.tolist() == [0, 0]
+
+
+def test_plan_ticker_order():
+    # One share is 5% of the portfolio, under the 10% trade_asset_limit.
+    prices = dict(
+        current_price=5_000.0, buying_power=50_000.0, portfolio_value=100_000.0
+    )
+    assert plan_ticker_order("A", BUY, 1, 5, 1, 2, portfolio_qty=0, **prices) == (
+        "buy",
+        (-(5 - (1 + 2 * 0.5)), 1, "A"),
+    )
+    assert plan_ticker_order("A", SELL, 0, 1, 5, 2, portfolio_qty=3, **prices) == (
+        "sell",
+        1,
+    )
+    # Not enough buy weight for a suggestion: hold.
+    assert plan_ticker_order("A", HOLD, 0, 5, 1, 9, portfolio_qty=0, **prices) == (
+        None,
+        None,
+    )
+    assert plan_ticker_order("A", SELL, 2, 1, 5, 2, portfolio_qty=0, **prices) == (
+        None,
+        None,
+    )
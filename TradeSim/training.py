@@ -14,6 +14,7 @@ from config import FINANCIAL_PREP_API_KEY
 sys.path.append(os.path.dirname(os.path.abspath(__file__)) + "/..")
 
 from control import (
+    simulation_day_sleep,
     train_period_end,
     train_period_start,
     train_tickers,
@@ -23,8 +24,9 @@ from control import (
 
 train_tickers
 from helper_files.client_helper import get_ndaq_tickers, strategies
-from helper_files.train_client_helper import local_update_portfolio_values
-from TradeSim.utils import simulate_trading_day, update_time_delta
+from TradeSim.portfolio_engine import PortfolioEngine
+from TradeSim.price_matrix import ClosePriceMatrix
+from TradeSim.utils import update_time_delta
 
 results_dir = "results"
 if not os.path.exists(results_dir):
@@ -32,7 +34,12 @@ if not os.path.exists(results_dir):
 
 
 def train(
-    ticker_price_history, ideal_period, mongo_client, precomputed_decisions, logger
+    ticker_price_history,
+    ideal_period,
+    mongo_client,
+    precomputed_decisions,
+    logger,
+    price_matrix=None,
 ):
     """
     get from ndaq100
@@ -43,22 +50,16 @@ def train(
         logger.info(f"Fetched {len(train_tickers)} tickers.")
 
     logger.info(f"Ticker price history initialized for {len(train_tickers)} tickers.")
+    if price_matrix is None:
+        price_matrix = ClosePriceMatrix.from_history(ticker_price_history)
     # logger.info(f"Ideal period determined: {ideal_period}")
 
-    trading_simulator = {
-        strategy.__name__: {
-            "holdings": {},
-            "amount_cash": 50000,
-            "total_trades": 0,
-            "successful_trades": 0,
-            "neutral_trades": 0,
-            "failed_trades": 0,
-            "portfolio_value": 50000,
-        }
-        for strategy in strategies
-    }
-
-    points = {strategy.__name__: 0 for strategy in strategies}
+    # Strategy accounts and points live in arrays; to_dicts() gives the
+    # trading_simulator/points dicts for logging and the results file.
+    engine = PortfolioEngine(
+        [strategy.__name__ for strategy in strategies], train_tickers
+    )
+    trading_simulator, points = engine.to_dicts()
     time_delta = train_time_delta
 
     logger.info("Trading simulator and points initialized.")
@@ -71,10 +72,8 @@ def train(
     while current_date <= end_date:
         logger.info(f"Processing date: {current_date.strftime('%Y-%m-%d')}")
 
-        if (
-            current_date.weekday() >= 5
-            or current_date.strftime("%Y-%m-%d")
-            not in ticker_price_history[train_tickers[0]].index
+        if current_date.weekday() >= 5 or not price_matrix.has_price(
+            price_matrix.day(current_date), train_tickers[0]
         ):
             logger.info(
                 f"Skipping {current_date.strftime('%Y-%m-%d')} (weekend or missing data)."
@@ -82,21 +81,16 @@ def train(
             current_date += timedelta(days=1)
             continue
 
-        trading_simulator, points = simulate_trading_day(
+        engine.simulate_trading_day(
             current_date,
-            strategies,
-            trading_simulator,
-            points,
-            time_delta,
-            ticker_price_history,
+            price_matrix,
             train_tickers,
             precomputed_decisions,
+            time_delta,
             logger,
         )
-
-        active_count, trading_simulator = local_update_portfolio_values(
-            current_date, strategies, trading_simulator, ticker_price_history, logger
-        )
+        active_count = engine.update_portfolio_values(current_date, price_matrix)
+        trading_simulator, points = engine.to_dicts()
 
         logger.info(f"Trading simulator: {trading_simulator}")
         logger.info(f"Points: {points}")
@@ -111,7 +105,7 @@ def train(
 
         # Move to next day
         current_date += timedelta(days=1)
-        time.sleep(5)
+        time.sleep(simulation_day_sleep)
 
     results_dir = "results"
     if not os.path.exists(results_dir):
@@ -158,3 +152,4 @@ def train(
         logger.info(f"{strategy} - {value}")
 
     logger.info("Training completed.")
+    return results
@@ -1,7 +1,7 @@
-import functools
 from datetime import datetime, timedelta
 from multiprocessing import Pool, cpu_count
 
+import numpy as np
 import pandas as pd
 import yfinance as yf
 
@@ -24,7 +24,12 @@ from control import (
     train_time_delta_multiplicative,
 )
 from helper_files.client_helper import get_ndaq_tickers, strategies
-from helper_files.train_client_helper import get_historical_data
+from helper_files.ideal_periods import IdealPeriodRegistry
+from helper_files.train_client_helper import build_window_indexes, get_historical_data
+from strategies import talib_indicators_vect
+from strategies.signals import BUY, HOLD, MISSING, SELL, to_signal
+from TradeSim.decisions import DecisionStore
+from TradeSim.shared_prices import SharedPriceHistory
 from utils.session import limiter
 
 # from strategies.talib_indicators import *
@@ -41,7 +46,7 @@ def initialize_simulation(
     """
     Initializes the simulation by loading necessary data and setting up initial states.
     Optimizations:
-      - Batch fetch indicator periods from MongoDB.
+      - Load indicator periods once through the shared IdealPeriodRegistry.
       - Bulk download ticker historical data using yfinance with threading.
       - Fallback to individual max period download if bulk download returns no data.
     """
@@ -50,19 +55,12 @@ def initialize_simulation(
     ticker_price_history = {}
     ideal_period = {}
 
-    # Connect to MongoDB and batch fetch indicator periods for all strategies.
-    db = mongo_client.IndicatorsDatabase
-    indicator_collection = db.Indicators
-    logger.info("Connected to MongoDB: Retrieved Indicators collection.")
+    # Load every indicator period in one query, like the live clients.
+    indicator_lookup = IdealPeriodRegistry()
+    indicator_lookup.refresh(mongo_client)
+    logger.info("Connected to MongoDB: Loaded indicator periods.")
 
     # Assuming 'strategies' is a global list of strategy objects
-    strategy_names = [strategy.__name__ for strategy in strategies]
-    indicator_docs = list(
-        indicator_collection.find({"indicator": {"$in": strategy_names}})
-    )
-    indicator_lookup = {
-        doc["indicator"]: doc.get("ideal_period") for doc in indicator_docs
-    }
     for strategy in strategies:
         if strategy.__name__ in indicator_lookup:
             ideal_period[strategy.__name__] = indicator_lookup[strategy.__name__]
@@ -230,7 +228,7 @@ def execute_trade(
     Executes a trade based on the strategy decision and updates trading simulator and points
     """
     if (
-        decision == "buy"
+        decision == BUY
         and trading_simulator[strategy.__name__]["amount_cash"]
         > train_rank_liquidity_limit
         and qty > 0
@@ -250,7 +248,7 @@ def execute_trade(
         trading_simulator[strategy.__name__]["total_trades"] += 1
 
     elif (
-        decision == "sell"
+        decision == SELL
         and trading_simulator[strategy.__name__]["holdings"]
         .get(ticker, {})
         .get("quantity", 0)
@@ -297,12 +295,13 @@ def simulate_trading_day(
         if date_str in ticker_price_history[ticker].index:
             daily_data = ticker_price_history[ticker].loc[date_str]
             current_price = daily_data["Close"]
+            day_signals = precomputed_decisions.day_signals(ticker, date_str)
 
             for strategy in strategies:
                 strategy_name = strategy.__name__
 
                 # Get precomputed strategy decision
-                action = precomputed_decisions[strategy_name][ticker].get(date_str)
+                action = day_signals.get(strategy_name)
 
                 if action is None:
                     # Skip if no precomputed decision (should not happen if properly precomputed)
@@ -354,17 +353,18 @@ def compute_trade_quantities(
     """
     Computes trade decision and quantity based on the precomputed action.
     This replaces the quantity calculation part of simulate_strategy.
+    Actions and decisions are strategies.signals codes (BUY, SELL, HOLD).
     """
     max_investment = total_portfolio_value * trade_asset_limit
 
-    if action == "Buy":
-        return "buy", min(
+    if action == BUY:
+        return BUY, min(
             int(max_investment // current_price), int(account_cash // current_price)
         )
-    elif action == "Sell" and portfolio_qty > 0:
-        return "sell", min(portfolio_qty, max(1, int(portfolio_qty * 0.5)))
+    elif action == SELL and portfolio_qty > 0:
+        return SELL, min(portfolio_qty, max(1, int(portfolio_qty * 0.5)))
     else:
-        return "hold", 0
+        return HOLD, 0
 
 
 def precompute_strategy_decisions(
@@ -388,43 +388,43 @@ def precompute_strategy_decisions(
         end_date = datetime.strptime(end_date, "%Y-%m-%d")
 
     # Gather all valid trading days first
-    trading_days = []
-    current_date = start_date
-    while current_date <= end_date:
-        if current_date.weekday() < 5:  # Skip weekends
-            trading_days.append(current_date)
-        current_date += timedelta(days=1)
+    trading_days = _trading_days(start_date, end_date)
 
     # Initialize result structure
-    precomputed_decisions = {
-        strategy.__name__: {ticker: {} for ticker in train_tickers}
-        for strategy in strategies
-    }
-
-    # Prepare parameters for parallel processing
-    # We'll process by date to allow better sharing of historical data
-    worker_func = functools.partial(
-        _process_single_day,
-        strategies=strategies,
-        ticker_price_history=ticker_price_history,
-        train_tickers=train_tickers,
-        ideal_period=ideal_period,
+    precomputed_decisions = DecisionStore(
+        [strategy.__name__ for strategy in strategies],
+        train_tickers,
+        [day.strftime("%Y-%m-%d") for day in trading_days],
     )
 
+    # Pack the price history into shared memory once; tasks only carry the date
+    # and the ticker/strategy ids, workers attach to the block read-only.
+    strategy_ids = tuple(range(len(strategies)))
+    ticker_ids = tuple(range(len(train_tickers)))
+    tasks = [(day, ticker_ids, strategy_ids) for day in trading_days]
+
     # Use a process pool to parallel process dates
     num_workers = min(cpu_count(), len(trading_days))
     logger.info(f"Using {num_workers} worker processes")
 
-    with Pool(processes=num_workers) as pool:
-        results = pool.map(worker_func, trading_days)
+    with SharedPriceHistory.create(ticker_price_history, train_tickers) as shared:
+        with Pool(
+            processes=num_workers,
+            initializer=_init_precompute_worker,
+            initargs=(shared.descriptor, strategies, train_tickers, ideal_period),
+        ) as pool:
+            results = pool.map(_process_day_task, tasks)
 
     # Combine results from all processed days
     for day_results in results:
         if day_results:  # Skip empty results
-            date_str = day_results["date"]
-            for strategy_name, strategy_data in day_results["strategies"].items():
-                for ticker, action in strategy_data.items():
-                    precomputed_decisions[strategy_name][ticker][date_str] = action
+            date_position = precomputed_decisions.date_index[day_results["date"]]
+            strategy_rows, ticker_columns = np.ix_(
+                day_results["strategy_ids"], day_results["ticker_ids"]
+            )
+            precomputed_decisions.codes[
+                strategy_rows, ticker_columns, date_position
+            ] = day_results["codes"]
 
     logger.info(
         f"Strategy decision precomputation complete. Processed {len(results)} trading days."
@@ -432,23 +432,209 @@ def precompute_strategy_decisions(
     return precomputed_decisions
 
 
+# Scalar strategies whose talib_indicators_vect counterpart is missing or applies
+# a different rule/parameters. These keep going through the per-day scalar path
+# so the vectorized precompute produces the same decisions as live trading.
+SCALAR_ONLY_STRATEGIES = {
+    "SAR_indicator",
+    "SAREXT_indicator",
+    "T3_indicator",
+    "ADX_indicator",
+    "ADXR_indicator",
+    "CCI_indicator",
+    "DX_indicator",
+    "MINUS_DI_indicator",
+    "PLUS_DI_indicator",
+    "AD_indicator",
+    "OBV_indicator",
+    "HT_TRENDMODE_indicator",
+    "ATR_indicator",
+    "NATR_indicator",
+    "TRANGE_indicator",
+    "LINEARREG_indicator",
+    "LINEARREG_INTERCEPT_indicator",
+    "STDDEV_indicator",
+    "VAR_indicator",
+}
+
+
+def _trading_days(start_date, end_date):
+    """
+    Returns every weekday between start_date and end_date (inclusive).
+    """
+    trading_days = []
+    current_date = start_date
+    while current_date <= end_date:
+        if current_date.weekday() < 5:  # Skip weekends
+            trading_days.append(current_date)
+        current_date += timedelta(days=1)
+    return trading_days
+
+
+def split_vectorized_strategies(strategies):
+    """
+    Splits scalar strategies into (strategy, vectorized_function) pairs that can be
+    computed over the whole series at once, and strategies that must stay scalar.
+    """
+    vectorized, scalar = [], []
+    for strategy in strategies:
+        vectorized_function = getattr(talib_indicators_vect, strategy.__name__, None)
+        if strategy.__name__ in SCALAR_ONLY_STRATEGIES or vectorized_function is None:
+            scalar.append(strategy)
+        else:
+            vectorized.append((strategy, vectorized_function))
+    return vectorized, scalar
+
+
+def precompute_strategy_decisions_vectorized(
+    strategies,
+    ticker_price_history,
+    train_tickers,
+    ideal_period,
+    start_date,
+    end_date,
+    logger,
+):
+    """
+    Precomputes strategy decisions by running each talib_indicators_vect strategy
+    once per ticker over the full price history and reading the signal for every
+    trading day in one pass.
+
+    Strategies listed in SCALAR_ONLY_STRATEGIES fall back to the per-day scalar path.
+    Indicators are computed over the whole downloaded history rather than the
+    ideal_period window, so strategies whose lookback is longer than their window
+    get warmed-up values instead of the NaN-driven "Hold" of the scalar path.
+    """
+    logger.info("Precomputing strategy decisions with vectorized strategies...")
+
+    if isinstance(start_date, str):
+        start_date = datetime.strptime(start_date, "%Y-%m-%d")
+    if isinstance(end_date, str):
+        end_date = datetime.strptime(end_date, "%Y-%m-%d")
+
+    trading_days = [
+        day.strftime("%Y-%m-%d") for day in _trading_days(start_date, end_date)
+    ]
+    trading_days_index = {day: i for i, day in enumerate(trading_days)}
+    vectorized, scalar = split_vectorized_strategies(strategies)
+    logger.info(
+        f"{len(vectorized)} vectorized strategies, {len(scalar)} scalar fallbacks."
+    )
+
+    precomputed_decisions = DecisionStore(
+        [strategy.__name__ for strategy in strategies], train_tickers, trading_days
+    )
+
+    indicator_hits = indicator_misses = 0
+    for ticker in train_tickers:
+        history = ticker_price_history.get(ticker)
+        if history is None or history.empty:
+            continue
+
+        date_strs = history.index.strftime("%Y-%m-%d")
+        rows = [i for i, day in enumerate(date_strs) if day in trading_days_index]
+        if not rows:
+            continue
+        date_positions = [trading_days_index[date_strs[i]] for i in rows]
+        # One read-only set of column arrays, and the indicators computed
+        # from them, shared by every strategy.
+        price_arrays = talib_indicators_vect.PriceArrays.from_frame(history)
+
+        for strategy, vectorized_function in vectorized:
+            strategy_name = strategy.__name__
+            if strategy_name not in ideal_period:
+                continue
+            try:
+                signals = np.asarray(vectorized_function(price_arrays))
+            except Exception as e:
+                logger.warning(f"{strategy_name} failed for {ticker}: {e}")
+                continue
+
+            precomputed_decisions.set_series(
+                strategy_name, ticker, date_positions, signals[rows]
+            )
+        indicator_hits += price_arrays.indicator_hits
+        indicator_misses += price_arrays.indicator_misses
+
+    logger.info(f"Indicator cache: {indicator_hits} hits, {indicator_misses} misses.")
+
+    if scalar:
+        scalar_decisions = precompute_strategy_decisions(
+            scalar,
+            ticker_price_history,
+            train_tickers,
+            ideal_period,
+            start_date,
+            end_date,
+            logger,
+        )
+        precomputed_decisions.update(scalar_decisions)
+
+    logger.info("Vectorized strategy decision precomputation complete.")
+    return precomputed_decisions
+
+
+# Per-process state for pool workers, set once by _init_precompute_worker.
+_worker_context = {}
+
+
+def _init_precompute_worker(descriptor, strategies, train_tickers, ideal_period):
+    """
+    Pool initializer: attaches the worker to the shared price history block.
+    """
+    _worker_context["ticker_price_history"] = SharedPriceHistory.attach(descriptor)
+    _worker_context["window_indexes"] = build_window_indexes(
+        _worker_context["ticker_price_history"], train_tickers
+    )
+    _worker_context["strategies"] = strategies
+    _worker_context["train_tickers"] = train_tickers
+    _worker_context["ideal_period"] = ideal_period
+
+
+def _process_day_task(task):
+    """
+    Runs _process_single_day for a (date, ticker_ids, strategy_ids) task descriptor.
+    """
+    date, ticker_ids, strategy_ids = task
+    result = _process_single_day(
+        date,
+        [_worker_context["strategies"][i] for i in strategy_ids],
+        _worker_context["ticker_price_history"],
+        [_worker_context["train_tickers"][i] for i in ticker_ids],
+        _worker_context["ideal_period"],
+        _worker_context["window_indexes"],
+    )
+    if result:
+        result["strategy_ids"] = strategy_ids
+        result["ticker_ids"] = ticker_ids
+    return result
+
+
 def _process_single_day(
-    date, strategies, ticker_price_history, train_tickers, ideal_period
+    date,
+    strategies,
+    ticker_price_history,
+    train_tickers,
+    ideal_period,
+    window_indexes=None,
 ):
     """
     Process a single day for all tickers and strategies.
     This function will be executed in a separate process.
+    window_indexes (from build_window_indexes) replaces the per-call date
+    slicing of the price history with precomputed row offsets.
     """
+    window_indexes = window_indexes or {}
     date_str = date.strftime("%Y-%m-%d")
     result = {
         "date": date_str,
-        "strategies": {strategy.__name__: {} for strategy in strategies},
+        "codes": np.full((len(strategies), len(train_tickers)), MISSING, dtype=np.int8),
     }
 
     # Find tickers with data for this date
     available_tickers = [
-        ticker
-        for ticker in train_tickers
+        (ticker_position, ticker)
+        for ticker_position, ticker in enumerate(train_tickers)
         if date_str in ticker_price_history[ticker].index
     ]
 
@@ -456,22 +642,27 @@ def _process_single_day(
         return None  # No tickers have data for this date
 
     # Process each ticker and strategy
-    for ticker in available_tickers:
-        for strategy in strategies:
+    for ticker_position, ticker in available_tickers:
+        for strategy_position, strategy in enumerate(strategies):
             strategy_name = strategy.__name__
 
             try:
                 # Get historical data
                 historical_data = get_historical_data(
-                    ticker, date, ideal_period[strategy_name], ticker_price_history
+                    ticker,
+                    date,
+                    ideal_period[strategy_name],
+                    ticker_price_history,
+                    window_indexes.get(ticker),
                 )
 
                 if historical_data is None or historical_data.empty:
                     continue
 
                 # Compute strategy signal
-                action = strategy(ticker, historical_data)
-                result["strategies"][strategy_name][ticker] = action
+                result["codes"][strategy_position, ticker_position] = to_signal(
+                    strategy(ticker, historical_data)
+                )
 
             except Exception:
                 # Skip errors in worker process
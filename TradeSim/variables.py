@@ -32,6 +32,7 @@ from control import (
     time_delta_multiplicative,
     trade_asset_limit,
     trade_liquidity_limit,
+    train_decision_cache_dir,
     train_loss_price_change_ratio_d1,
     train_loss_price_change_ratio_d2,
     train_loss_profit_time_d1,
@@ -39,6 +40,7 @@ from control import (
     train_loss_profit_time_else,
     train_period_end,
     train_period_start,
+    train_precompute_mode,
     train_profit_price_change_ratio_d1,
     train_profit_price_change_ratio_d2,
     train_profit_profit_time_d1,
@@ -76,6 +78,8 @@ config_dict = {
     "train_period": {"start": train_period_start, "end": train_period_end},
     "test_period": {"start": test_period_start, "end": test_period_end},
     "train_tickers": train_tickers,
+    "train_precompute_mode": train_precompute_mode,
+    "train_decision_cache_dir": train_decision_cache_dir,
     "train_time_delta": {
         "start": train_time_delta,
         "mode": train_time_delta_mode,
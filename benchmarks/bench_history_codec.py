@@ -0,0 +1,109 @@
+"""
+Benchmark: document size and decode time of the HistoricalDatabase cache formats.
+
+Encodes the same synthetic yfinance history (tz-aware Date index, OHLC,
+Volume, Dividends, Stock Splits) in the old records format
+(data.reset_index().to_dict("records")) and in the binary columnar format of
+helper_files/history_codec.py, then measures:
+
+- the BSON document size, what Mongo stores and sends per find_one
+- encode time: building the document and BSON-encoding it
+- decode time: BSON-decoding the document and rebuilding the DataFrame,
+  what get_data does on every cache hit
+
+Usage (from the repo root):
+
+    python benchmarks/bench_history_codec.py --rows 21 252 504 2500
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import bson
+import numpy as np
+import pandas as pd
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from helper_files.history_codec import decode_history, encode_history
+
+
+def synthetic_history(n_rows):
+    rng = np.random.default_rng(0)
+    dates = pd.DatetimeIndex(
+        pd.bdate_range(end="2024-12-31", periods=n_rows).values, name="Date"
+    ).tz_localize("America/New_York")
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.02, n_rows)))
+    return pd.DataFrame(
+        {
+            "Open": close * 0.995,
+            "High": close * 1.01,
+            "Low": close * 0.99,
+            "Close": close,
+            "Volume": rng.integers(1_000, 1_000_000, n_rows),
+            "Dividends": 0.0,
+            "Stock Splits": 0.0,
+        },
+        index=dates,
+    )
+
+
+def encode_records(history):
+    records = history.reset_index().to_dict("records")
+    return {"ticker": "AAA", "period": "max", "data": records}
+
+
+def _best_of(func, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def run(n_rows, repeat):
+    history = synthetic_history(n_rows)
+    results = {}
+    for name, encode in [
+        ("records", encode_records),
+        ("columnar", lambda h: encode_history("AAA", "max", h)),
+    ]:
+        raw = bson.encode(encode(history))
+        results[name] = (
+            len(raw),
+            _best_of(lambda: bson.encode(encode(history)), repeat),
+            _best_of(lambda: decode_history(bson.decode(raw)), repeat),
+        )
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, nargs="+", default=[21, 252, 504, 2500])
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    for n_rows in args.rows:
+        results = run(n_rows, args.repeat)
+        print(f"{n_rows} rows")
+        print(f"  {'':>10} {'records':>12} {'columnar':>12} {'ratio':>8}")
+        size_r, enc_r, dec_r = results["records"]
+        size_c, enc_c, dec_c = results["columnar"]
+        print(
+            f"  {'size':>10} {size_r / 1024:10.1f}KB {size_c / 1024:10.1f}KB "
+            f"{size_r / size_c:7.1f}x"
+        )
+        print(
+            f"  {'encode':>10} {enc_r * 1e3:10.3f}ms {enc_c * 1e3:10.3f}ms "
+            f"{enc_r / enc_c:7.1f}x"
+        )
+        print(
+            f"  {'decode':>10} {dec_r * 1e3:10.3f}ms {dec_c * 1e3:10.3f}ms "
+            f"{dec_r / dec_c:7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
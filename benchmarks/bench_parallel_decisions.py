@@ -0,0 +1,114 @@
+"""
+Benchmark: strategy decision throughput against worker process count.
+
+Writes synthetic OHLCV data for --tickers tickers to a temporary price store,
+then runs compute_and_store_strategy_decisions with every strategy once per
+--processes value (1 is the sequential path) and reports tickers per second.
+The memory budget caps the estimated memory of tickers in flight; with a
+small budget fewer tickers run at once than there are workers.
+
+Speedup is bounded by the number of CPU cores on the machine.
+
+Usage (from the repo root):
+
+    python benchmarks/bench_parallel_decisions.py --tickers 40 --rows 2500 \
+        --processes 1 2 4 --memory-budget-mb 256
+"""
+
+import argparse
+import logging
+import os
+import sys
+import tempfile
+import time
+from multiprocessing import cpu_count
+
+import numpy as np
+import pandas as pd
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "dbs")
+)
+
+logger = logging.getLogger(__name__)
+
+
+def synthetic_download(n_tickers, n_rows):
+    rng = np.random.default_rng(0)
+    dates = pd.bdate_range(end="2024-12-31", periods=n_rows, name="Date")
+    frames = []
+    for i in range(n_tickers):
+        close = np.round(100 * np.exp(np.cumsum(rng.normal(0, 0.02, n_rows))), 2)
+        frames.append(
+            pd.DataFrame(
+                {
+                    "Ticker": f"T{i:04d}",
+                    "Open": close,
+                    "High": np.round(close * 1.01, 2),
+                    "Low": np.round(close * 0.99, 2),
+                    "Close": close,
+                    "Volume": rng.integers(1_000, 1_000_000, n_rows).astype(float),
+                },
+                index=dates,
+            )
+        )
+    return pd.concat(frames)
+
+
+def run(n_tickers, n_rows, processes_list, memory_budget_mb, tmp_dir):
+    from compute_store_strategy_decisions import compute_and_store_strategy_decisions
+    from price_store import write_prices
+
+    from strategies.categorise_talib_indicators_vect import strategies
+
+    store_path = os.path.join(tmp_dir, "price_store.db")
+    tickers = write_prices(store_path, synthetic_download(n_tickers, n_rows))
+
+    results = {}
+    for processes in processes_list:
+        decisions_path = os.path.join(tmp_dir, f"decisions_{processes}.db")
+        start = time.perf_counter()
+        compute_and_store_strategy_decisions(
+            store_path,
+            decisions_path,
+            tickers,
+            strategies,
+            logger,
+            processes=processes,
+            memory_budget_mb=memory_budget_mb,
+        )
+        results[processes] = time.perf_counter() - start
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--tickers", type=int, default=40)
+    parser.add_argument("--rows", type=int, default=2500)
+    parser.add_argument("--processes", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--memory-budget-mb", type=float, default=256)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        results = run(
+            args.tickers,
+            args.rows,
+            args.processes,
+            args.memory_budget_mb,
+            tmp_dir,
+        )
+    print(
+        f"{args.tickers} tickers x {args.rows} rows, "
+        f"{args.memory_budget_mb:g}MB budget, {cpu_count()} CPUs"
+    )
+    print(f"  {'processes':>9} {'time':>9} {'tickers/s':>10} {'speedup':>8}")
+    for processes, elapsed in results.items():
+        print(
+            f"  {processes:>9} {elapsed:8.2f}s {args.tickers / elapsed:10.2f} "
+            f"{results[args.processes[0]] / elapsed:7.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
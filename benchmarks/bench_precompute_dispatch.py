@@ -0,0 +1,178 @@
+"""
+Benchmark: task dispatch overhead and peak memory of the TradeSim precompute pool.
+
+Compares the old dispatch, which pickled the full ticker_price_history dict into
+every pool task via functools.partial, with the shared-memory price history that
+workers attach to once.
+
+Each mode runs in a fresh interpreter so peak memory numbers do not leak
+between runs. Usage (from the repo root):
+
+    python benchmarks/bench_precompute_dispatch.py --tickers 300 --days 60
+"""
+
+import argparse
+import functools
+import json
+import os
+import pickle
+import subprocess
+import sys
+import time
+from datetime import datetime
+from multiprocessing import Pool, cpu_count
+
+import numpy as np
+import pandas as pd
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def synthetic_history(n_tickers, n_rows):
+    rng = np.random.default_rng(0)
+    dates = pd.bdate_range(end="2024-12-31", periods=n_rows, name="Date")
+    history = {}
+    for i in range(n_tickers):
+        close = 100 * np.exp(np.cumsum(rng.normal(0, 0.02, n_rows)))
+        history[f"T{i:04d}"] = pd.DataFrame(
+            {
+                "Open": close,
+                "High": close * 1.01,
+                "Low": close * 0.99,
+                "Close": close,
+                "Volume": rng.integers(1_000, 1_000_000, n_rows),
+            },
+            index=dates,
+        )
+    return history
+
+
+def _memory_stats():
+    stats = {}
+    with open("/proc/self/status") as f:
+        for line in f:
+            if line.startswith(("VmHWM", "VmRSS")):
+                key, value = line.split(":")
+                stats[key] = int(value.split()[0])
+    with open("/proc/self/smaps_rollup") as f:
+        for line in f:
+            if line.startswith("Pss:"):
+                stats["Pss"] = int(line.split()[1])
+    return stats
+
+
+def _with_memory(func, task):
+    func(task)
+    return os.getpid(), _memory_stats()
+
+
+def run(mode, n_tickers, n_rows, n_days, n_strategies, n_workers):
+    from helper_files.client_helper import strategies as all_strategies
+    from TradeSim import utils
+
+    history = synthetic_history(n_tickers, n_rows)
+    tickers = list(history)
+    strategies = all_strategies[:n_strategies]
+    ideal_period = {strategy.__name__: "1y" for strategy in strategies}
+    end = history[tickers[0]].index[-1]
+    trading_days = utils._trading_days(
+        datetime(end.year, end.month, end.day) - pd.Timedelta(days=n_days * 7 // 5),
+        datetime(end.year, end.month, end.day),
+    )
+    num_workers = min(n_workers, len(trading_days))
+
+    start = time.perf_counter()
+    if mode == "before":
+        worker_func = functools.partial(
+            utils._process_single_day,
+            strategies=strategies,
+            ticker_price_history=history,
+            train_tickers=tickers,
+            ideal_period=ideal_period,
+        )
+        task_bytes = len(pickle.dumps(worker_func))
+        with Pool(processes=num_workers) as pool:
+            stats = pool.map(functools.partial(_with_memory, worker_func), trading_days)
+    else:
+        strategy_ids = tuple(range(len(strategies)))
+        ticker_ids = tuple(range(len(tickers)))
+        tasks = [(day, ticker_ids, strategy_ids) for day in trading_days]
+        task_bytes = len(pickle.dumps(tasks[0]))
+        with utils.SharedPriceHistory.create(history, tickers) as shared:
+            with Pool(
+                processes=num_workers,
+                initializer=utils._init_precompute_worker,
+                initargs=(shared.descriptor, strategies, tickers, ideal_period),
+            ) as pool:
+                stats = pool.map(
+                    functools.partial(_with_memory, utils._process_day_task), tasks
+                )
+    elapsed = time.perf_counter() - start
+
+    per_worker = {}
+    for pid, worker_stats in stats:
+        per_worker[pid] = worker_stats
+    return {
+        "mode": mode,
+        "workers": num_workers,
+        "days": len(trading_days),
+        "task_bytes": task_bytes,
+        "seconds": round(elapsed, 3),
+        "parent_peak_rss_mb": round(_memory_stats()["VmHWM"] / 1024, 1),
+        "worker_peak_rss_mb": round(
+            max(s["VmHWM"] for s in per_worker.values()) / 1024, 1
+        ),
+        "workers_pss_mb": round(sum(s["Pss"] for s in per_worker.values()) / 1024, 1),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--tickers", type=int, default=300)
+    parser.add_argument("--rows", type=int, default=2500)
+    parser.add_argument("--days", type=int, default=60)
+    parser.add_argument(
+        "--strategies",
+        type=int,
+        default=0,
+        help="number of strategies to run; 0 measures pure dispatch overhead",
+    )
+    parser.add_argument("--workers", type=int, default=cpu_count())
+    parser.add_argument("--mode", choices=["before", "after"])
+    args = parser.parse_args()
+
+    if args.mode:
+        result = run(
+            args.mode,
+            args.tickers,
+            args.rows,
+            args.days,
+            args.strategies,
+            args.workers,
+        )
+        print(json.dumps(result))
+        return
+
+    for mode in ("before", "after"):
+        output = subprocess.run(
+            [sys.executable, __file__, "--mode", mode]
+            + [f"--tickers={args.tickers}", f"--rows={args.rows}"]
+            + [f"--days={args.days}", f"--strategies={args.strategies}"]
+            + [f"--workers={args.workers}"],
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout
+        result = json.loads(output.strip().splitlines()[-1])
+        print(
+            f"{result['mode']:>6}: {result['seconds']:8.3f}s  "
+            f"task {result['task_bytes'] / 1024:10.1f} KiB  "
+            f"parent peak {result['parent_peak_rss_mb']:8.1f} MB  "
+            f"worker peak {result['worker_peak_rss_mb']:8.1f} MB  "
+            f"workers PSS {result['workers_pss_mb']:8.1f} MB  "
+            f"({result['workers']} workers, {result['days']} days)"
+        )
+
+
+if __name__ == "__main__":
+    main()
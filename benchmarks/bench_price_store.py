@@ -0,0 +1,128 @@
+"""
+Benchmark: read/write time and file size of the price store vs per-ticker tables.
+
+Writes the same synthetic long-format OHLCV data (download_OHLCV_from_yf
+format) with store_OHLCV_in_db (one table per ticker) and with the
+single-table price store, then reads it back three ways:
+
+- all tickers, full history
+- a 10% ticker subset over the last year
+- one ticker (what compute_and_store_strategy_decisions does per ticker)
+
+Usage (from the repo root):
+
+    python benchmarks/bench_price_store.py --tickers 100 3000 --rows 2500
+"""
+
+import argparse
+import logging
+import os
+import sqlite3
+import sys
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "dbs")
+)
+
+logger = logging.getLogger(__name__)
+
+
+def synthetic_download(n_tickers, n_rows):
+    rng = np.random.default_rng(0)
+    dates = pd.bdate_range(end="2024-12-31", periods=n_rows, name="Date")
+    frames = []
+    for i in range(n_tickers):
+        close = np.round(100 * np.exp(np.cumsum(rng.normal(0, 0.02, n_rows))), 2)
+        frames.append(
+            pd.DataFrame(
+                {
+                    "Ticker": f"T{i:04d}",
+                    "Open": close,
+                    "High": np.round(close * 1.01, 2),
+                    "Low": np.round(close * 0.99, 2),
+                    "Close": close,
+                    "Volume": rng.integers(1_000, 1_000_000, n_rows).astype(float),
+                },
+                index=dates,
+            )
+        )
+    return pd.concat(frames)
+
+
+def _timed(func):
+    start = time.perf_counter()
+    result = func()
+    return time.perf_counter() - start, result
+
+
+def _read_tables(db_path, tickers, start_date=None):
+    history = {}
+    with sqlite3.connect(db_path) as con:
+        for ticker in tickers:
+            query = "SELECT * FROM '{tab}'".format(tab=ticker)
+            if start_date:
+                query += f" WHERE Date >= '{start_date}'"
+            history[ticker] = pd.read_sql_query(query, con, index_col="Date")
+    return history
+
+
+def run(n_tickers, n_rows, tmp_dir):
+    from price_store import read_price_history
+    from store_price_data import store_OHLCV_in_db, store_OHLCV_in_price_store
+
+    df = synthetic_download(n_tickers, n_rows)
+    tickers = df["Ticker"].unique().tolist()
+    subset = tickers[::10]
+    start_date = (pd.Timestamp("2024-12-31") - pd.DateOffset(years=1)).strftime(
+        "%Y-%m-%d"
+    )
+    tables_path = os.path.join(tmp_dir, f"tables_{n_tickers}.db")
+    store_path = os.path.join(tmp_dir, f"store_{n_tickers}.db")
+
+    results = {}
+    results["write"] = (
+        _timed(lambda: store_OHLCV_in_db(df, tickers, tables_path, logger))[0],
+        _timed(lambda: store_OHLCV_in_price_store(df, tickers, store_path, logger))[0],
+    )
+    results["read all"] = (
+        _timed(lambda: _read_tables(tables_path, tickers))[0],
+        _timed(lambda: read_price_history(store_path))[0],
+    )
+    results["read 10% / 1y"] = (
+        _timed(lambda: _read_tables(tables_path, subset, start_date))[0],
+        _timed(lambda: read_price_history(store_path, subset, start_date))[0],
+    )
+    results["read 1 ticker"] = (
+        _timed(lambda: _read_tables(tables_path, tickers[-1:]))[0],
+        _timed(lambda: read_price_history(store_path, tickers[-1:]))[0],
+    )
+    sizes = (os.path.getsize(tables_path), os.path.getsize(store_path))
+    return results, sizes
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--tickers", type=int, nargs="+", default=[100, 3000])
+    parser.add_argument("--rows", type=int, default=2500)
+    args = parser.parse_args()
+
+    for n_tickers in args.tickers:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            results, sizes = run(n_tickers, args.rows, tmp_dir)
+        print(f"{n_tickers} tickers x {args.rows} rows")
+        print(f"  {'':>14} {'tables':>10} {'store':>10} {'speedup':>8}")
+        for name, (before, after) in results.items():
+            print(f"  {name:>14} {before:9.3f}s {after:9.3f}s {before / after:7.1f}x")
+        print(
+            f"  {'file size':>14} {sizes[0] / 2**20:8.1f}MB {sizes[1] / 2**20:8.1f}MB"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -15,6 +15,7 @@ try:
     WANDB_API_KEY = env["WANDB_API_KEY"]
     mongo_url = env["MONGO_URL"]
     PRICE_DB_PATH = os.path.join("dbs", "price_data.db")
+    PRICE_STORE_PATH = os.path.join("dbs", "price_store.db")
     STRATEGY_DECISIONS_DB_PATH = os.path.join("dbs", "strategy_decisions.db")
 except KeyError as e:
     print(f"[error]: {e} required environment variable missing")
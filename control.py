@@ -30,6 +30,39 @@ these parameters are useful to fine tune your bot
 stop_loss = 0.03
 take_profit = 0.05
 
+"""
+quote_ttl is how many seconds a latest price stays in the shared quote cache before it is fetched again.
+The live clients refresh the prices of every ticker they need at the start of each cycle through Alpaca's latest
+trades endpoint (up to 200 symbols per request), and get_latest_price reads the cache, so the rate limited
+yfinance session is not spent on one request per ticker.
+quote_miss_ttl is how many seconds a ticker that could not be priced is reported as unpriced before it is requested again.
+"""
+quote_ttl = 60
+quote_miss_ttl = 2
+
+"""
+live_max_workers is how many tickers the live ranking and trading clients process at the same time each cycle.
+live_task_timeout is how many seconds one ticker may take before the cycle stops waiting for it.
+live_cycle_timeout is how many seconds a cycle may take before tickers still queued are skipped until the next cycle.
+Abandoned tickers stop at their next strategy, or while waiting to retry, so they do not write into the next cycle.
+live_price_retries is how many times a ticker's latest price is requested before the ticker is skipped for the cycle.
+live_price_retry_backoff is how many seconds to wait before the first retry; the wait doubles after each retry.
+"""
+live_max_workers = 10
+live_task_timeout = 120
+live_cycle_timeout = 300
+live_price_retries = 3
+live_price_retry_backoff = 5
+
+"""
+live_execution_mode is how the live ranking and trading clients process a cycle's tickers, either 'threads' or 'asyncio'.
+'threads' runs them on the bounded worker pool above, with blocking pymongo calls.
+'asyncio' runs them as coroutines on one event loop with motor for database I/O, with at most
+live_async_concurrency tickers in flight. live_task_timeout and live_cycle_timeout apply to both modes.
+"""
+live_execution_mode = "threads"
+live_async_concurrency = 100
+
 # training_client.py parameters
 """
 mode is switched between 'train', 'test', live, and 'push'.
@@ -41,6 +74,8 @@ There will be an option to:
  - delete this model to start with a new model
 'test' means running running your training results on simulator.
 'push' means pushing your trained bot to the database. This is only available for the ranking client.
+'sweep' means running train and test for every configuration in sweep_parameters (see below) in parallel,
+reusing one data download and strategy decision precompute.
 The default for mode is live to protect against accidental training
 benchmark asset is what benchmark you want to compare to - typically SPY, QQQ, DOW, or NDAQ.
 """
@@ -67,6 +102,41 @@ test_period_end = "2024-01-30"
 
 train_tickers = []
 
+"""
+train_precompute_mode is how strategy decisions are precomputed before train/test, either 'vectorized' or 'scalar'.
+'vectorized' runs each vectorized strategy once per ticker over the whole price history, which is much faster.
+Strategies whose vectorized version uses different rules still run through the scalar path.
+Vectorized indicators are warmed up on the full history instead of only the ideal period window,
+so long-lookback strategies can decide on days where the scalar path would 'Hold' due to missing values.
+'scalar' recomputes every strategy on its ideal period window for every trading day.
+"""
+train_precompute_mode = "vectorized"
+
+"""
+train_decision_cache_dir is where precomputed strategy decisions are cached between runs.
+The cache is keyed by ideal periods, strategy code and precompute mode, and only decisions for
+(ticker, date) pairs that are missing or whose price history changed get recomputed,
+so a train run followed by a test run on the same window precomputes once. Set to "" to disable.
+"""
+train_decision_cache_dir = "cache/decisions"
+
+"""
+simulation_day_sleep is how many seconds train/test pause after each simulated day. Sweeps always run with 0.
+"""
+simulation_day_sleep = 5
+
+"""
+sweep parameters - used when mode is 'sweep'
+sweep_parameters is either a grid, a dict of parameter name -> list of values where every combination is run,
+or a list of dicts where each dict is one configuration. Names are any of the parameters in this file, e.g.
+sweep_parameters = {"train_profit_price_change_ratio_d1": [1.03, 1.05], "train_time_delta_mode": ["additive", "balanced"]}
+The periods, tickers and precompute mode cannot be swept since decisions are precomputed once for all configurations.
+sweep_processes is how many configurations run at the same time.
+Every configuration logs to its own wandb run and all results are written to results/{experiment_name}_sweep.csv
+"""
+sweep_parameters = {}
+sweep_processes = 4
+
 """
 train_time_delta_mode can be multiplicative, additive, or balanced.
 Additive results in less overfitting but could result in underfitting as time goes on
@@ -1,25 +1,40 @@
+import argparse
 import logging
 import logging.config
 import os
+import queue
 import sqlite3
 import sys
 import time
+from collections import deque
+from multiprocessing import Pool
 
 import pandas as pd
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from log_config import LOG_CONFIG  # noqa: E402
 
-from config import PRICE_DB_PATH, STRATEGY_DECISIONS_DB_PATH  # noqa: E402
+from config import PRICE_STORE_PATH, STRATEGY_DECISIONS_DB_PATH  # noqa: E402
 
 # from control import train_tickers  # noqa: E402
 from strategies.categorise_talib_indicators_vect import (
     strategies,
 )  # noqa: E402
+from strategies.talib_indicators_vect import (  # noqa: E402
+    PriceArrays,
+    strategy_signals,
+)
 from dbs.helper_functions import (  # noqa: E402
     get_ndaq_tickers,
     retry_with_backoff,
 )
+from dbs.price_store import (  # noqa: E402
+    is_price_store,
+    read_price_history,
+    stored_row_counts,
+    stored_tickers,
+    tail_start_date,
+)
 
 """
 This script computes and stores strategy decisions for a list of stock tickers.
@@ -33,6 +48,9 @@ It performs the following steps:
 - Stores the combined strategy decisions in a separate SQLite database,
  with one table per ticker.
 
+In incremental mode only the dates after a ticker's last stored decision are
+computed, from a warm-up tail of its price history, and appended.
+
 The script is designed to minimize RAM usage by processing and writing results
  on a per-ticker basis.
 Logging is used throughout to track progress and errors.
@@ -50,13 +68,18 @@ Configuration:
 def check_ticker_tables_exist(db_path, ticker_list):
     """
     Checks if each ticker in ticker_list has a corresponding table
-      in the SQLite database at db_path.
+      in the SQLite database at db_path (or rows in it, if db_path is a
+      single-table price store, see dbs/price_store.py).
     Args:
     db_path (str): Path to the SQLite database containing tables.
     tickers_list (list): List of ticker symbols to process.
 
     Returns a dict: {ticker: True/False}
     """
+    if is_price_store(db_path):
+        tickers_in_store = set(stored_tickers(db_path))
+        return {ticker: ticker in tickers_in_store for ticker in ticker_list}
+
     table_exists = {}
     with sqlite3.connect(db_path) as con:
         cursor = con.cursor()
@@ -70,8 +93,390 @@ def check_ticker_tables_exist(db_path, ticker_list):
     return table_exists
 
 
+def load_price_history(PRICE_DB_PATH, ticker, price_store, start_date=None):
+    """
+    Loads a ticker's price history (from start_date on, if given) from a
+    price store or a per-ticker table database.
+    """
+    if price_store:
+        return read_price_history(PRICE_DB_PATH, [ticker], start_date)[ticker]
+
+    query, params = "SELECT * FROM '{tab}'".format(tab=ticker), []
+    if start_date is not None:
+        query += " WHERE Date >= ?"
+        params.append(start_date)
+    with sqlite3.connect(PRICE_DB_PATH) as con_price_data:
+        return pd.read_sql_query(
+            query, con_price_data, params=params, index_col="Date"
+        )
+
+
+def price_tail_start_date(PRICE_DB_PATH, ticker, price_store, end_date, bars):
+    """
+    Returns the date `bars` rows before end_date in the ticker's price
+    history, or None if the history before end_date is shorter than that.
+    """
+    if price_store:
+        return tail_start_date(PRICE_DB_PATH, ticker, end_date, bars)
+
+    with sqlite3.connect(PRICE_DB_PATH) as con_price_data:
+        row = con_price_data.execute(
+            """SELECT Date FROM '{tab}' WHERE Date <= ?
+            ORDER BY Date DESC LIMIT 1 OFFSET ?""".format(
+                tab=ticker
+            ),
+            (end_date, bars),
+        ).fetchone()
+    return None if row is None else row[0]
+
+
+def read_last_decisions(STRATEGY_DECISIONS_DB_PATH, ticker, rows):
+    """
+    Returns the last `rows` stored decisions of a ticker in date order, or
+    None if the ticker has no decisions table.
+    """
+    with sqlite3.connect(STRATEGY_DECISIONS_DB_PATH) as con:
+        exists = con.execute(
+            "SELECT name FROM sqlite_master WHERE type='table' AND name=?;",
+            (ticker,),
+        ).fetchone()
+        if exists is None:
+            return None
+        return pd.read_sql_query(
+            """SELECT * FROM (SELECT * FROM '{tab}' ORDER BY Date DESC LIMIT ?)
+            ORDER BY Date""".format(
+                tab=ticker
+            ),
+            con,
+            params=(rows,),
+            index_col="Date",
+        )
+
+
+def decisions_equal(computed, stored):
+    """
+    Returns True if computed decisions equal decisions read back from the
+    database: same dates, columns and values (SQLite stores bools as 0/1).
+    """
+    if list(computed.columns) != list(stored.columns) or list(
+        computed.index
+    ) != list(stored.index):
+        return False
+    computed, stored = computed.to_numpy(object), stored.to_numpy(object)
+    return bool(
+        ((computed == stored) | (pd.isna(computed) & pd.isna(stored))).all()
+    )
+
+
+def compute_new_decisions(
+    PRICE_DB_PATH, price_store, ticker, strategies, stored_decisions
+):
+    """
+    Computes a ticker's strategy decisions for the dates after its last
+    stored decision.
+
+    Each strategy declares the bars of history it needs before a date
+    (strategy.warmup, see strategies/categorise_talib_indicators_vect.py).
+    Strategies run on a tail of the price history that covers the longest
+    warm-up before the stored_decisions dates, or on the full history if
+    their warmup is None or missing. The decisions recomputed for the
+    stored_decisions dates must equal the stored ones bit for bit.
+
+    Only those dates are checked. A match shows the tail reproduces the
+    stored decisions there, not that every new date matches a full
+    recompute: that relies on the declared warm-ups being long enough.
+
+    Returns the new decisions (possibly empty), or None if the recomputed
+    decisions do not match the stored ones and a full recompute is needed.
+    """
+    last_date = stored_decisions.index[-1]
+    warmups = [getattr(strategy, "warmup", None) for strategy in strategies]
+    bars = max((w for w in warmups if w is not None), default=0)
+    start_date = price_tail_start_date(
+        PRICE_DB_PATH,
+        ticker,
+        price_store,
+        last_date,
+        bars + len(stored_decisions) - 1,
+    )
+    tail_history = load_price_history(
+        PRICE_DB_PATH, ticker, price_store, start_date
+    )
+    full_history = tail_history
+    if start_date is not None and None in warmups:
+        full_history = load_price_history(PRICE_DB_PATH, ticker, price_store)
+
+    tail_arrays = PriceArrays.from_frame(tail_history)
+    full_arrays = tail_arrays
+    if full_history is not tail_history:
+        full_arrays = PriceArrays.from_frame(full_history)
+
+    strategy_results = []
+    for strategy, warmup in zip(strategies, warmups):
+        history, price_arrays = (
+            (tail_history, tail_arrays)
+            if warmup is not None
+            else (full_history, full_arrays)
+        )
+        strategy_result = strategy_signals([strategy], history, price_arrays)
+        strategy_results.append(
+            strategy_result.iloc[len(history) - len(tail_history) :]
+        )
+    combined_strategy_results = pd.concat(strategy_results, axis=1)
+
+    n_stored = tail_history.index.searchsorted(last_date, side="right")
+    recomputed = combined_strategy_results.iloc[
+        n_stored - len(stored_decisions) : n_stored
+    ]
+    if not decisions_equal(recomputed, stored_decisions):
+        return None
+    return combined_strategy_results.iloc[n_stored:]
+
+
+def compute_ticker_decisions(
+    PRICE_DB_PATH,
+    STRATEGY_DECISIONS_DB_PATH,
+    price_store,
+    ticker,
+    strategies,
+    logger,
+    incremental=False,
+    verify_bars=5,
+):
+    """
+    Computes one ticker's strategy decisions.
+
+    In incremental mode, tickers that already have decisions only get the
+    dates after their last stored decision (compute_new_decisions). Tickers
+    without stored decisions, or whose recomputed decisions differ from the
+    stored ones, get their full history.
+
+    Returns (decisions, if_exists): the decisions DataFrame and "append" if
+    it holds new dates only, "replace" if it holds the full history.
+    """
+    if incremental:
+        stored_decisions = read_last_decisions(
+            STRATEGY_DECISIONS_DB_PATH, ticker, verify_bars
+        )
+        if stored_decisions is not None and len(stored_decisions):
+            new_decisions = compute_new_decisions(
+                PRICE_DB_PATH,
+                price_store,
+                ticker,
+                strategies,
+                stored_decisions,
+            )
+            if new_decisions is not None:
+                return new_decisions, "append"
+            logger.warning(
+                f"Recomputed decisions for {ticker} differ from the "
+                "stored ones, recomputing full history..."
+            )
+
+    # get ticker price data from db
+    ticker_price_history = load_price_history(
+        PRICE_DB_PATH, ticker, price_store
+    )
+
+    # compute strategy decisions, sharing one read-only view of the prices
+    # and the indicators computed from it
+    price_arrays = PriceArrays.from_frame(ticker_price_history)
+    decisions = strategy_signals(
+        strategies, ticker_price_history, price_arrays
+    )
+    logger.debug(
+        f"Indicator cache for {ticker}: {price_arrays.indicator_hits} hits, "
+        f"{price_arrays.indicator_misses} misses."
+    )
+    return decisions, "replace"
+
+
+def _sql_type(dtype):
+    """Returns the SQLite column type to_sql would give a numpy dtype."""
+    if dtype.kind in "biu":
+        return "INTEGER"
+    if dtype.kind == "f":
+        return "REAL"
+    if dtype.kind == "M":
+        return "TIMESTAMP"
+    return "TEXT"
+
+
+def create_decisions_table(con, ticker, decisions):
+    """
+    (Re)creates a ticker's decisions table with the decisions' columns,
+    keyed on Date, like to_sql with if_exists="replace" and index=True.
+
+    The schema is built from the column list because to_sql inserts the
+    index as a column into strategy_signals' one block per column frame,
+    which warns that the frame is highly fragmented on every ticker.
+    """
+    index_name = decisions.index.name or "index"
+    index_type = (
+        "DATE PRIMARY KEY NOT NULL"
+        if index_name == "Date"
+        else _sql_type(decisions.index.dtype)
+    )
+    columns = [f'"{index_name}" {index_type}'] + [
+        f'"{column}" {_sql_type(dtype)}' for column, dtype in decisions.dtypes.items()
+    ]
+    con.execute(f"DROP TABLE IF EXISTS '{ticker}'")
+    con.execute(f"CREATE TABLE '{ticker}' ({', '.join(columns)})")
+
+
+def write_decisions(STRATEGY_DECISIONS_DB_PATH, batch, logger):
+    """
+    Writes a batch of tickers' decisions with one connection and a single
+    transaction for the inserted rows.
+
+    Args:
+        STRATEGY_DECISIONS_DB_PATH (str): Path to the strategy decisions db.
+        batch (list): (ticker, decisions, if_exists) tuples, as returned by
+          compute_ticker_decisions. "replace" recreates the ticker's table,
+          "append" adds rows to it.
+    """
+    with sqlite3.connect(STRATEGY_DECISIONS_DB_PATH) as con_strategy_decisions:
+        for ticker, decisions, if_exists in batch:
+            names = [decisions.index.name or "index", *decisions.columns]
+            columns = ", ".join(f'"{name}"' for name in names)
+            if if_exists == "replace":
+                create_decisions_table(con_strategy_decisions, ticker, decisions)
+            placeholders = ", ".join("?" * len(names))
+            con_strategy_decisions.executemany(
+                f"INSERT INTO '{ticker}' ({columns}) VALUES ({placeholders})",
+                zip(
+                    decisions.index.tolist(),
+                    *(decisions[column].tolist() for column in decisions),
+                ),
+            )
+    for ticker, decisions, if_exists in batch:
+        if if_exists == "append":
+            logger.info(f"Appended {len(decisions)} new dates for {ticker}.")
+        else:
+            logger.info(f"Data for {ticker} saved to database.")
+
+
+def price_row_counts(PRICE_DB_PATH, ticker_list, price_store):
+    """
+    Returns {ticker: rows of price history} for tickers with price data.
+    """
+    if price_store:
+        return stored_row_counts(PRICE_DB_PATH, ticker_list)
+
+    row_counts = {}
+    with sqlite3.connect(PRICE_DB_PATH) as con_price_data:
+        for ticker in ticker_list:
+            row_counts[ticker] = con_price_data.execute(
+                "SELECT COUNT(*) FROM '{tab}'".format(tab=ticker)
+            ).fetchone()[0]
+    return row_counts
+
+
+# Bytes per (date, strategy) decision cell a ticker holds while in flight:
+# strategy results and their concatenation in the worker, the pickled frame
+# sent to the writer and the writer's copy (~10 bytes each, measured).
+DECISION_BYTES_PER_CELL = 40
+
+# Per-process state for pool workers, set once by _init_decision_worker.
+_worker_context = {}
+
+
+def _init_decision_worker(context):
+    """
+    Pool initializer: keeps the arguments shared by every ticker task.
+    """
+    _worker_context.update(context)
+
+
+def _compute_ticker_task(ticker):
+    """
+    Runs compute_ticker_decisions for one ticker in a pool worker.
+    """
+    decisions, if_exists = compute_ticker_decisions(
+        ticker=ticker, **_worker_context
+    )
+    return ticker, decisions, if_exists
+
+
+def compute_decisions_in_pool(
+    ticker_list,
+    row_counts,
+    context,
+    STRATEGY_DECISIONS_DB_PATH,
+    logger,
+    processes,
+    memory_budget_mb=None,
+    write_batch=20,
+):
+    """
+    Computes tickers' decisions in worker processes and writes them from
+    this process, the single writer, in batches (write_decisions).
+
+    A ticker is in flight from its submission to a worker until its
+    decisions are written. Its memory is estimated from its price history
+    length (row_counts) and the number of strategies. A ticker is only
+    submitted while the in-flight estimate stays within memory_budget_mb,
+    so one large ticker at a time still goes through. Buffered results are
+    written when write_batch of them are waiting, when the budget blocks
+    the next ticker, or when no worker is busy.
+    """
+    budget = memory_budget_mb * 2**20 if memory_budget_mb else float("inf")
+    cell_bytes = DECISION_BYTES_PER_CELL * max(len(context["strategies"]), 1)
+    pending = deque(ticker_list)
+    in_flight = {}
+    buffered = []
+    running = 0
+    results = queue.SimpleQueue()
+
+    def fits(ticker):
+        estimate = row_counts.get(ticker, 0) * cell_bytes
+        return not in_flight or sum(in_flight.values()) + estimate <= budget
+
+    with Pool(
+        processes=processes,
+        initializer=_init_decision_worker,
+        initargs=(context,),
+    ) as pool:
+        while pending or in_flight:
+            while pending and fits(pending[0]):
+                ticker = pending.popleft()
+                in_flight[ticker] = row_counts.get(ticker, 0) * cell_bytes
+                running += 1
+                pool.apply_async(
+                    _compute_ticker_task,
+                    (ticker,),
+                    callback=results.put,
+                    error_callback=results.put,
+                )
+
+            if running:
+                result = results.get()
+                running -= 1
+                if isinstance(result, BaseException):
+                    raise result
+                buffered.append(result)
+
+            if buffered and (
+                len(buffered) >= write_batch
+                or not running
+                or (pending and not fits(pending[0]))
+            ):
+                write_decisions(STRATEGY_DECISIONS_DB_PATH, buffered, logger)
+                for ticker, _, _ in buffered:
+                    del in_flight[ticker]
+                buffered = []
+
+
 def compute_and_store_strategy_decisions(
-    PRICE_DB_PATH, STRATEGY_DECISIONS_DB_PATH, ticker_list, strategies, logger
+    PRICE_DB_PATH,
+    STRATEGY_DECISIONS_DB_PATH,
+    ticker_list,
+    strategies,
+    logger,
+    incremental=False,
+    verify_bars=5,
+    processes=1,
+    memory_budget_mb=None,
 ):
     """
     Computes and stores strategy decisions for a list of tickers.
@@ -80,20 +485,40 @@ def compute_and_store_strategy_decisions(
       - Checks if price data exists in the price database.
       - Loads the ticker's historical price data from the database.
       - Applies each strategy function to the price data, collecting their
-        results.
+        results (strategy_signals; vectorized strategies share one
+        read-only view of the prices instead of each copying the frame).
       - Concatenates all strategy results into a single DataFrame.
       - Stores the combined strategy decisions in the strategy decisions
       database,
         replacing any existing table for that ticker.
 
+    In incremental mode, tickers that already have decisions only get the
+    dates after their last stored decision, computed from a warm-up tail of
+    their price history (compute_new_decisions) and appended to their table.
+    The last verify_bars stored decisions are recomputed from the same tail;
+    if they differ, or the table is missing, the ticker is fully recomputed.
+    This spot check covers only those verify_bars dates, so appended
+    decisions match a full recompute only as far as the strategies' warmup
+    declarations are long enough; earlier stored dates are not re-checked.
+
+    With processes > 1, tickers are computed in a process pool and written
+    by this process in batches (compute_decisions_in_pool). memory_budget_mb
+    caps the estimated memory of tickers in flight.
+
     Args:
         PRICE_DB_PATH (str): Path to the SQLite database containing price data
-        tables.
+        tables, or to a single-table price store (dbs/price_store.py).
         STRATEGY_DECISIONS_DB_PATH (str): Path to the SQLite database for
         storing strategy decisions.
         tickers_list (list): List of ticker symbols to process.
         strategies (list): List of strategy functions to apply to
           each ticker's price data.
+        incremental (bool): Append decisions for new dates only.
+        verify_bars (int): Stored decisions recomputed and compared in
+          incremental mode.
+        processes (int): Worker processes; 1 computes in this process.
+        memory_budget_mb (float): Memory budget for tickers in flight when
+          processes > 1; None for no cap.
 
     NOTES:
         Strategy decisions are written to db on a ticker by ticker basis.
@@ -101,9 +526,16 @@ def compute_and_store_strategy_decisions(
         many tickers.
         It may be quicker to to bulk write all at once, however 1GB vps may
         struggle with many tickers.
-        There is a speed v RAM tradeoff.
+        There is a speed v RAM tradeoff. In parallel mode memory_budget_mb
+        sets the tradeoff; the budget does not include the workers' own
+        baseline memory (interpreter, pandas and TA-Lib).
+
+        Incremental mode assumes stored decisions were computed from the
+        same prices. After past prices change (e.g. a --full price reload),
+        run a full recompute.
     """
     start_time = time.time()
+    price_store = is_price_store(PRICE_DB_PATH)
 
     # check ticker price data exists
     table_exists_dict = {}
@@ -117,12 +549,8 @@ def compute_and_store_strategy_decisions(
             f"error checking if tickers exist in {PRICE_DB_PATH}. {e}"
         )
 
-    # Compute and store strategy decisions by ticker
-    for idx, ticker in enumerate(ticker_list):
-        logger.info(
-            f"Computing decisions: {ticker} ({idx + 1}/{len(ticker_list)})."
-            f"{len(strategies)=}"
-        )
+    tickers_with_data = []
+    for ticker in ticker_list:
         # check ticker price data exists
         if table_exists_dict[ticker] is False:
             logger.warning(
@@ -130,38 +558,47 @@ def compute_and_store_strategy_decisions(
                 {table_exists_dict[ticker]=}, skipping..."""
             )
             continue
+        tickers_with_data.append(ticker)
 
-        strategy_results = []
+    context = {
+        "PRICE_DB_PATH": PRICE_DB_PATH,
+        "STRATEGY_DECISIONS_DB_PATH": STRATEGY_DECISIONS_DB_PATH,
+        "price_store": price_store,
+        "strategies": strategies,
+        "logger": logger,
+        "incremental": incremental,
+        "verify_bars": verify_bars,
+    }
 
-        # get ticker price data from db
-        with sqlite3.connect(PRICE_DB_PATH) as con_price_data:
-            ticker_price_history = pd.read_sql_query(
-                "SELECT * FROM '{tab}'".format(tab=ticker),
-                con_price_data,
-                index_col="Date",
+    if processes > 1 and len(tickers_with_data) > 1:
+        logger.info(
+            f"Computing decisions for {len(tickers_with_data)} tickers with "
+            f"{processes} processes, {memory_budget_mb=}. {len(strategies)=}"
+        )
+        compute_decisions_in_pool(
+            tickers_with_data,
+            price_row_counts(PRICE_DB_PATH, tickers_with_data, price_store),
+            context,
+            STRATEGY_DECISIONS_DB_PATH,
+            logger,
+            processes,
+            memory_budget_mb,
+        )
+    else:
+        # Compute and store strategy decisions by ticker
+        for idx, ticker in enumerate(tickers_with_data):
+            logger.info(
+                f"Computing decisions: {ticker} "
+                f"({idx + 1}/{len(tickers_with_data)}). {len(strategies)=}"
             )
-
-        # compute strategy decision
-        for idx, strategy in enumerate(strategies):
-            # strategy_name = strategy.__name__
-            # logger.info(f"{strategy_name} ({idx + 1}/{len(strategies)})")
-            strategy_result = strategy(ticker_price_history.copy())
-            strategy_results.append(strategy_result)
-
-        combined_strategy_results = pd.concat(strategy_results, axis=1)
-
-        # store strategy decisions in db
-        with sqlite3.connect(
-            STRATEGY_DECISIONS_DB_PATH
-        ) as con_strategy_decisions:
-            combined_strategy_results.to_sql(
-                ticker,
-                con_strategy_decisions,
-                if_exists="replace",
-                index=True,
-                dtype={"Date": "DATE PRIMARY KEY NOT NULL"},
+            decisions, if_exists = compute_ticker_decisions(
+                ticker=ticker, **context
+            )
+            write_decisions(
+                STRATEGY_DECISIONS_DB_PATH,
+                [(ticker, decisions, if_exists)],
+                logger,
             )
-            logger.info(f"Data for {ticker} saved to database.")
 
     end_time = time.time()
     elapsed_time = end_time - start_time
@@ -169,6 +606,28 @@ def compute_and_store_strategy_decisions(
 
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Compute and store strategy decisions."
+    )
+    parser.add_argument(
+        "--full",
+        action="store_true",
+        help="recompute every ticker's full history",
+    )
+    parser.add_argument(
+        "--processes",
+        type=int,
+        default=1,
+        help="worker processes computing decisions",
+    )
+    parser.add_argument(
+        "--memory-budget-mb",
+        type=float,
+        default=256,
+        help="memory budget for tickers in flight with --processes > 1",
+    )
+    args = parser.parse_args()
+
     # Get the current filename without extension
     module_name = os.path.splitext(os.path.basename(__file__))[0]
     log_filename = f"log/{module_name}.log"
@@ -189,11 +648,14 @@ if __name__ == "__main__":
 
     try:
         compute_and_store_strategy_decisions(
-            PRICE_DB_PATH,
+            PRICE_STORE_PATH,
             STRATEGY_DECISIONS_DB_PATH,
             ticker_list,
             strategies,
             logger,
+            incremental=not args.full,
+            processes=args.processes,
+            memory_budget_mb=args.memory_budget_mb,
         )
     except Exception as e:
         logger.error(f"An error occurred: {e}")
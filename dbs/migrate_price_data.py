@@ -0,0 +1,51 @@
+import argparse
+import logging
+import logging.config
+import os
+import sys
+import time
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from log_config import LOG_CONFIG  # noqa: E402
+
+from config import PRICE_DB_PATH, PRICE_STORE_PATH  # noqa: E402
+from dbs.price_store import migrate_table_layout  # noqa: E402
+
+"""
+Migrates price_data.db (one SQLite table per ticker, as written by
+store_OHLCV_in_db) to the single-table price store (dbs/price_store.py).
+
+Typical usage (from the repo root):
+    python dbs/migrate_price_data.py
+    python dbs/migrate_price_data.py --source old.db --dest price_store.db
+"""
+
+
+if __name__ == "__main__":
+    # Get the current filename without extension
+    module_name = os.path.splitext(os.path.basename(__file__))[0]
+    log_filename = f"log/{module_name}.log"
+    LOG_CONFIG["handlers"]["file_dynamic"]["filename"] = log_filename
+
+    logging.config.dictConfig(LOG_CONFIG)
+    logger = logging.getLogger(__name__)
+
+    parser = argparse.ArgumentParser(
+        description="Migrate per-ticker price tables to the price store."
+    )
+    parser.add_argument("--source", default=PRICE_DB_PATH)
+    parser.add_argument("--dest", default=PRICE_STORE_PATH)
+    parser.add_argument("--batch-size", type=int, default=100)
+    args = parser.parse_args()
+
+    start_time = time.time()
+    migrated, skipped = migrate_table_layout(
+        args.source, args.dest, logger, batch_size=args.batch_size
+    )
+    logger.info(
+        f"Migrated {len(migrated)} tickers from {args.source} to {args.dest} "
+        f"in {time.time() - start_time:.2f} seconds."
+    )
+    if skipped:
+        logger.warning(f"Skipped {len(skipped)} non-OHLCV tables: {skipped}")
@@ -0,0 +1,276 @@
+"""
+Single-table SQLite price store.
+
+All tickers live in one long-format table, keyed and clustered on
+(Ticker, Date), with typed REAL/INTEGER columns:
+
+    prices(Ticker TEXT, Date TEXT, Open REAL, High REAL, Low REAL,
+           Close REAL, Volume INTEGER, PRIMARY KEY (Ticker, Date))
+    WITHOUT ROWID
+
+Because the table is a WITHOUT ROWID table, rows are stored in primary key
+order. Any ticker subset and date range can be read in one bulk query, and
+each ticker's rows are contiguous on disk.
+
+This replaces the per-ticker table layout of price_data.db (one table per
+ticker written with to_sql). migrate_table_layout copies an existing
+database in that layout into a price store.
+"""
+
+import json
+import sqlite3
+
+import numpy as np
+import pandas as pd
+
+PRICE_TABLE = "prices"
+PRICE_COLUMNS = ["Open", "High", "Low", "Close", "Volume"]
+
+_CREATE_PRICE_TABLE = f"""
+CREATE TABLE IF NOT EXISTS {PRICE_TABLE} (
+    Ticker TEXT NOT NULL,
+    Date TEXT NOT NULL,
+    Open REAL,
+    High REAL,
+    Low REAL,
+    Close REAL,
+    Volume INTEGER,
+    PRIMARY KEY (Ticker, Date)
+) WITHOUT ROWID
+"""
+
+
+def create_price_store(con):
+    """
+    Creates the price table on an open connection if it does not exist.
+    """
+    con.execute(_CREATE_PRICE_TABLE)
+
+
+def is_price_store(db_path):
+    """
+    Returns True if the database at db_path has the price store table.
+    """
+    with sqlite3.connect(db_path) as con:
+        row = con.execute(
+            "SELECT name FROM sqlite_master WHERE type='table' AND name=?;",
+            (PRICE_TABLE,),
+        ).fetchone()
+    return row is not None
+
+
+def stored_tickers(db_path):
+    """
+    Returns the sorted list of tickers with at least one row in the store.
+    """
+    with sqlite3.connect(db_path) as con:
+        create_price_store(con)
+        rows = con.execute(
+            f"SELECT DISTINCT Ticker FROM {PRICE_TABLE} ORDER BY Ticker"
+        ).fetchall()
+    return [row[0] for row in rows]
+
+
+def last_stored_dates(db_path, tickers=None):
+    """
+    Returns {ticker: last stored date ("YYYY-MM-DD")} for tickers with rows.
+    """
+    where, params = "", []
+    if tickers is not None:
+        where = "WHERE Ticker IN (SELECT value FROM json_each(?))"
+        params.append(json.dumps(list(tickers)))
+    with sqlite3.connect(db_path) as con:
+        create_price_store(con)
+        rows = con.execute(
+            f"""SELECT Ticker, MAX(Date) FROM {PRICE_TABLE} {where}
+            GROUP BY Ticker""",
+            params,
+        ).fetchall()
+    return dict(rows)
+
+
+def stored_row_counts(db_path, tickers=None):
+    """
+    Returns {ticker: number of stored rows} for tickers with rows.
+    """
+    where, params = "", []
+    if tickers is not None:
+        where = "WHERE Ticker IN (SELECT value FROM json_each(?))"
+        params.append(json.dumps(list(tickers)))
+    with sqlite3.connect(db_path) as con:
+        create_price_store(con)
+        rows = con.execute(
+            f"""SELECT Ticker, COUNT(*) FROM {PRICE_TABLE} {where}
+            GROUP BY Ticker""",
+            params,
+        ).fetchall()
+    return dict(rows)
+
+
+def tail_start_date(db_path, ticker, end_date, bars):
+    """
+    Returns the date `bars` rows before end_date in the ticker's history, or
+    None if the history before end_date is shorter than that.
+    """
+    with sqlite3.connect(db_path) as con:
+        create_price_store(con)
+        row = con.execute(
+            f"""SELECT Date FROM {PRICE_TABLE} WHERE Ticker = ? AND Date <= ?
+            ORDER BY Date DESC LIMIT 1 OFFSET ?""",
+            (ticker, str(end_date)[:10], bars),
+        ).fetchone()
+    return None if row is None else row[0]
+
+
+def _price_rows(df):
+    """
+    Yields (Ticker, Date, Open, High, Low, Close, Volume) tuples from a
+    long-format frame (Date index, Ticker column), skipping rows with NaNs.
+    """
+    df = df[["Ticker"] + PRICE_COLUMNS].dropna()
+    if isinstance(df.index, pd.DatetimeIndex):
+        dates = df.index.strftime("%Y-%m-%d").tolist()
+    else:
+        dates = [str(date)[:10] for date in df.index]
+    return zip(
+        df["Ticker"].tolist(),
+        dates,
+        *(
+            df[column].to_numpy(dtype=np.float64).tolist()
+            for column in PRICE_COLUMNS[:-1]
+        ),
+        df["Volume"].to_numpy(dtype=np.float64).round().astype(np.int64).tolist(),
+    )
+
+
+def write_prices(db_path, df, replace=True):
+    """
+    Writes long-format OHLCV data to the price store in one transaction.
+
+    Args:
+        db_path (str): Path to the SQLite price store.
+        df (pd.DataFrame): Rows indexed by Date (datetime or "YYYY-MM-DD")
+          with a Ticker column and Open/High/Low/Close/Volume columns, as
+          returned by download_OHLCV_from_yf.
+        replace (bool): Delete each written ticker's existing rows first, so
+          the stored history matches df exactly (the old to_sql "replace").
+          With False, rows are upserted on (Ticker, Date).
+
+    Returns the list of tickers written.
+    """
+    tickers = df["Ticker"].dropna().unique().tolist()
+    with sqlite3.connect(db_path) as con:
+        create_price_store(con)
+        if replace and tickers:
+            con.execute(
+                f"""DELETE FROM {PRICE_TABLE}
+                WHERE Ticker IN (SELECT value FROM json_each(?))""",
+                (json.dumps(tickers),),
+            )
+        con.executemany(
+            f"INSERT OR REPLACE INTO {PRICE_TABLE} VALUES (?, ?, ?, ?, ?, ?, ?)",
+            _price_rows(df),
+        )
+    return tickers
+
+
+def read_prices(db_path, tickers=None, start_date=None, end_date=None):
+    """
+    Reads a ticker subset and date range in one query.
+
+    Args:
+        db_path (str): Path to the SQLite price store.
+        tickers (list): Tickers to read; None reads every ticker.
+        start_date (str): First date ("YYYY-MM-DD") to read, inclusive.
+        end_date (str): Last date ("YYYY-MM-DD") to read, inclusive.
+
+    Returns a long-format DataFrame indexed by Date (string) with a Ticker
+    column and float64 Open/High/Low/Close/Volume columns, sorted by
+    (Ticker, Date).
+    """
+    conditions, params = [], []
+    if tickers is not None:
+        conditions.append("Ticker IN (SELECT value FROM json_each(?))")
+        params.append(json.dumps(list(tickers)))
+    if start_date is not None:
+        conditions.append("Date >= ?")
+        params.append(str(start_date)[:10])
+    if end_date is not None:
+        conditions.append("Date <= ?")
+        params.append(str(end_date)[:10])
+    where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+
+    with sqlite3.connect(db_path) as con:
+        create_price_store(con)
+        rows = con.execute(
+            f"""SELECT Ticker, Date, {', '.join(PRICE_COLUMNS)}
+            FROM {PRICE_TABLE} {where} ORDER BY Ticker, Date""",
+            params,
+        ).fetchall()
+
+    df = pd.DataFrame.from_records(rows, columns=["Ticker", "Date"] + PRICE_COLUMNS)
+    df[PRICE_COLUMNS] = df[PRICE_COLUMNS].astype(np.float64)
+    return df.set_index("Date")
+
+
+def read_price_history(db_path, tickers=None, start_date=None, end_date=None):
+    """
+    Reads a ticker subset and date range in one query and splits it by ticker.
+
+    Returns {ticker: DataFrame} in the format of the per-ticker tables
+    (Date string index, float64 Open/High/Low/Close/Volume columns). Tickers
+    with no rows in the range are left out.
+    """
+    df = read_prices(db_path, tickers, start_date, end_date)
+    ticker_values = df["Ticker"].to_numpy()
+    prices = df[PRICE_COLUMNS]
+
+    history = {}
+    if len(df):
+        starts = np.flatnonzero(np.r_[True, ticker_values[1:] != ticker_values[:-1]])
+        stops = np.r_[starts[1:], len(df)]
+        for start, stop in zip(starts, stops):
+            history[ticker_values[start]] = prices.iloc[start:stop]
+
+    if tickers is not None:
+        history = {ticker: history[ticker] for ticker in tickers if ticker in history}
+    return history
+
+
+def migrate_table_layout(source_db_path, dest_db_path, logger, batch_size=100):
+    """
+    Copies a per-ticker table database (the old price_data.db layout) into a
+    price store.
+
+    Args:
+        source_db_path (str): Database with one OHLCV table per ticker.
+        dest_db_path (str): Price store to write; created if missing.
+        logger: Logger for progress and skipped tables.
+        batch_size (int): Tickers written per transaction.
+
+    Returns (migrated_tickers, skipped_tables).
+    """
+    with sqlite3.connect(source_db_path) as con:
+        tables = [
+            row[0]
+            for row in con.execute(
+                "SELECT name FROM sqlite_master WHERE type='table' ORDER BY name;"
+            ).fetchall()
+        ]
+
+    migrated, skipped = [], []
+    for batch_start in range(0, len(tables), batch_size):
+        frames = []
+        with sqlite3.connect(source_db_path) as con:
+            for table in tables[batch_start : batch_start + batch_size]:
+                df = pd.read_sql_query("SELECT * FROM '{tab}'".format(tab=table), con)
+                if not {"Date", *PRICE_COLUMNS} <= set(df.columns):
+                    logger.warning(f"{table} is not an OHLCV table, skipping...")
+                    skipped.append(table)
+                    continue
+                df["Ticker"] = table
+                frames.append(df.set_index("Date"))
+        if frames:
+            migrated += write_prices(dest_db_path, pd.concat(frames))
+        logger.info(f"Migrated {len(migrated)}/{len(tables)} tables to {dest_db_path}")
+    return migrated, skipped
@@ -1,3 +1,4 @@
+import argparse
 import logging
 import logging.config
 import os
@@ -5,6 +6,7 @@ import sqlite3
 import sys
 import time
 
+import numpy as np
 import pandas as pd
 import yfinance as yf
 
@@ -12,19 +14,32 @@ sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
 from log_config import LOG_CONFIG
 
-from config import PRICE_DB_PATH
+from config import PRICE_STORE_PATH
 from dbs.helper_functions import get_ndaq_tickers, retry_with_backoff
+from dbs.price_store import (
+    PRICE_COLUMNS,
+    last_stored_dates,
+    read_prices,
+    write_prices,
+)
 
 
-def download_OHLCV_from_yf(ticker_list, logger):
-    logger.info(f"start downloading data {len(ticker_list)=}")
-    yf_period = "max"
+def download_OHLCV_from_yf(ticker_list, logger, start_date=None):
+    """
+    Downloads daily OHLCV bars for ticker_list, from start_date
+    ("YYYY-MM-DD", inclusive) if given, otherwise the full ('max') history.
+    """
+    logger.info(f"start downloading data {len(ticker_list)=} {start_date=}")
+    if start_date is None:
+        yf_range = {"period": "max"}
+    else:
+        yf_range = {"start": start_date}
     df = pd.DataFrame()
     try:
         df = yf.download(
             ticker_list,
             group_by="Ticker",
-            period=yf_period,
+            **yf_range,
             interval="1d",
             auto_adjust=True,
             repair=True,
@@ -96,6 +111,181 @@ def store_OHLCV_in_db(df, ticker_list, price_data_db_name, logger):
     return percentage_of_tickers_saved, tickers_with_no_data
 
 
+def store_OHLCV_in_price_store(df, ticker_list, price_store_path, logger):
+    """
+    Saves downloaded OHLCV data for ticker_list to the single-table price
+    store (dbs/price_store.py) in one transaction, replacing each saved
+    ticker's existing history.
+
+    Returns the same (percentage_of_tickers_saved, tickers_with_no_data) as
+    store_OHLCV_in_db.
+    """
+    logger.info(f"Saving {len(ticker_list)} tickers to {price_store_path}")
+    if not ticker_list:
+        logger.warning("Ticker list is empty")
+        return 0, []
+
+    df = df.loc[df["Ticker"].isin(ticker_list)].dropna()
+    tickers_with_data = set(df["Ticker"])
+    tickers_with_no_data = [
+        ticker for ticker in ticker_list if ticker not in tickers_with_data
+    ]
+    for ticker in tickers_with_no_data:
+        logger.warning(f"no OHLCV data for {ticker}")
+
+    tickers_saved = []
+    try:
+        tickers_saved = write_prices(price_store_path, df)
+    except Exception as e:
+        logger.error(
+            f"""error saving OHLCV price data to
+              {price_store_path}: {e}"""
+        )
+
+    percentage_of_tickers_saved = round(
+        (len(tickers_saved) / len(ticker_list)) * 100, 2
+    )
+    logger.info(
+        f"{len(tickers_saved)} of {len(ticker_list)} ({percentage_of_tickers_saved} %) tickers saved to {price_store_path}"
+    )
+    if len(tickers_with_no_data) > 0:
+        logger.warning(
+            f"""no data for {len(tickers_with_no_data)} ticker(s):
+             {tickers_with_no_data}"""
+        )
+    return percentage_of_tickers_saved, tickers_with_no_data
+
+
+def find_adjusted_tickers(stored_df, downloaded_df, last_dates, rtol=1e-6):
+    """
+    Returns the tickers whose stored bars before their last stored date no
+    longer match a fresh download of the same dates.
+
+    auto_adjust rewrites past bars after a split or dividend, so a mismatch
+    (or a stored bar missing from the download) in the overlap window means
+    the ticker's whole history has to be reloaded. The last stored bar is
+    left out of the check since it may have been stored mid-session.
+    """
+    price_columns = ["Open", "High", "Low", "Close"]
+    stored = stored_df.reset_index()
+    stored = stored.loc[stored["Date"] < stored["Ticker"].map(last_dates)]
+    downloaded = downloaded_df.reset_index()
+    downloaded["Date"] = pd.DatetimeIndex(downloaded["Date"]).strftime(
+        "%Y-%m-%d"
+    )
+    overlap = stored.merge(
+        downloaded.dropna(subset=price_columns),
+        on=["Ticker", "Date"],
+        how="left",
+        suffixes=("", "_new"),
+        indicator=True,
+    )
+
+    changed = overlap["_merge"] == "left_only"
+    for column in price_columns:
+        changed |= ~np.isclose(
+            overlap[column].to_numpy(dtype=np.float64),
+            overlap[f"{column}_new"].to_numpy(dtype=np.float64),
+            rtol=rtol,
+            atol=0,
+        )
+    return sorted(set(overlap.loc[changed, "Ticker"]))
+
+
+def update_OHLCV_incremental(
+    price_store_path,
+    ticker_list,
+    logger,
+    overlap_days=10,
+    batch_size=500,
+):
+    """
+    Brings the price store up to date by downloading only the bars after
+    each ticker's last stored date.
+
+    Tickers are grouped by their fetch start date (last stored date minus
+    overlap_days) and downloaded in batches of batch_size tickers per
+    request. The overlap window is compared with the stored bars: tickers
+    whose past bars changed (split/dividend adjustment) or that have no
+    stored bars get a full 'max' reload, the rest have their new bars
+    upserted. Each batch is written in one transaction.
+
+    Returns the same (percentage_of_tickers_saved, tickers_with_no_data) as
+    store_OHLCV_in_price_store.
+    """
+    start_time = time.time()
+    if not ticker_list:
+        logger.warning("Ticker list is empty")
+        return 0, []
+
+    last_dates = last_stored_dates(price_store_path, ticker_list)
+    groups = {}
+    for ticker, last_date in last_dates.items():
+        fetch_start = (
+            pd.Timestamp(last_date) - pd.Timedelta(days=overlap_days)
+        ).strftime("%Y-%m-%d")
+        groups.setdefault(fetch_start, []).append(ticker)
+    reload_tickers = [t for t in ticker_list if t not in last_dates]
+    logger.info(
+        f"Incremental update: {len(last_dates)} stored tickers in "
+        f"{len(groups)} start date group(s), {len(reload_tickers)} new"
+    )
+
+    tickers_saved = []
+    rows_appended = 0
+    for fetch_start, group in sorted(groups.items()):
+        for batch_start in range(0, len(group), batch_size):
+            batch = group[batch_start : batch_start + batch_size]
+            df = download_OHLCV_from_yf(batch, logger, start_date=fetch_start)
+            if df is None or df.empty:
+                continue
+            df = df.loc[df["Ticker"].isin(batch)].dropna(subset=PRICE_COLUMNS)
+            stored_df = read_prices(price_store_path, batch, fetch_start)
+            adjusted = find_adjusted_tickers(stored_df, df, last_dates)
+            if adjusted:
+                logger.info(f"Past bars changed, reloading: {adjusted}")
+                reload_tickers += adjusted
+
+            # Upsert from the last stored bar on, refreshing a partial bar.
+            new_bars = df.loc[
+                ~df["Ticker"].isin(adjusted)
+                & (
+                    df.index.strftime("%Y-%m-%d")
+                    >= df["Ticker"].map(last_dates).to_numpy()
+                )
+            ]
+            tickers_saved += write_prices(
+                price_store_path, new_bars, replace=False
+            )
+            rows_appended += len(new_bars)
+
+    for batch_start in range(0, len(reload_tickers), batch_size):
+        batch = reload_tickers[batch_start : batch_start + batch_size]
+        df = download_OHLCV_from_yf(batch, logger)
+        if df is not None and not df.empty:
+            df = df.loc[df["Ticker"].isin(batch)].dropna(subset=PRICE_COLUMNS)
+            tickers_saved += write_prices(price_store_path, df, replace=True)
+
+    tickers_saved = set(tickers_saved)
+    tickers_with_no_data = [t for t in ticker_list if t not in tickers_saved]
+    percentage_of_tickers_saved = round(
+        (len(tickers_saved) / len(ticker_list)) * 100, 2
+    )
+    logger.info(
+        f"{len(tickers_saved)} of {len(ticker_list)} "
+        f"({percentage_of_tickers_saved} %) tickers updated in "
+        f"{price_store_path}: {rows_appended} bars upserted, "
+        f"{len(reload_tickers)} full reloads, "
+        f"{time.time() - start_time:.2f} seconds"
+    )
+    if tickers_with_no_data:
+        logger.warning(
+            f"""no data for {len(tickers_with_no_data)} ticker(s):
+             {tickers_with_no_data}"""
+        )
+    return percentage_of_tickers_saved, tickers_with_no_data
+
+
 def get_price_data_retry_loop(
     PRICE_DB_PATH,
     ticker_list,
@@ -104,6 +294,7 @@ def get_price_data_retry_loop(
     max_retries=3,
     initial_delay=30,
     backoff_factor=10,
+    store_func=store_OHLCV_in_db,
 ):
     percentage_of_tickers_saved = 0
     tickers_with_no_data = []
@@ -114,8 +305,8 @@ def get_price_data_retry_loop(
         df = download_OHLCV_from_yf(ticker_list, logger)
 
         if df is not None and not df.empty:
-            percentage_of_tickers_saved, tickers_with_no_data = (
-                store_OHLCV_in_db(df, ticker_list, PRICE_DB_PATH, logger)
+            percentage_of_tickers_saved, tickers_with_no_data = store_func(
+                df, ticker_list, PRICE_DB_PATH, logger
             )
 
         if percentage_of_tickers_saved >= ticker_download_threshold:
@@ -145,12 +336,23 @@ if __name__ == "__main__":
     """
     Downloads historical OHLCV data for a list of tickers and stores it in a SQLite database.
 
-    Uses yfinance to download the maximum available
-    historical data ('max' period) with a '1d' interval.
-    Each ticker's data is stored in a separate table named
-    after the ticker symbol within the specified database file. Existing tables
-    for the same ticker will be replaced.
+    All tickers are stored in the single-table price store at
+    PRICE_STORE_PATH (see dbs/price_store.py).
+
+    By default only the bars after each ticker's last stored date are
+    downloaded and upserted (update_OHLCV_incremental); tickers that are new
+    or whose past bars were adjusted get the maximum available history
+    ('max' period). With --full, every ticker's full history is downloaded
+    and existing rows for the same ticker are replaced.
     """
+    parser = argparse.ArgumentParser(description="Update OHLCV price data.")
+    parser.add_argument(
+        "--full",
+        action="store_true",
+        help="redownload the full history of every ticker",
+    )
+    args = parser.parse_args()
+
     # Get the current filename without extension
     module_name = os.path.splitext(os.path.basename(__file__))[0]
     log_filename = f"log/{module_name}.log"
@@ -174,13 +376,22 @@ if __name__ == "__main__":
     # %, retry if downloaded tickers pct less than this.
     ticker_download_threshold = 90
 
-    if ticker_list:
+    if ticker_list and not args.full:
+        percentage_of_tickers_saved, tickers_with_no_data = (
+            update_OHLCV_incremental(PRICE_STORE_PATH, ticker_list, logger)
+        )
+    elif ticker_list:
         percentage_of_tickers_saved, tickers_with_no_data = (
             get_price_data_retry_loop(
-                PRICE_DB_PATH, ticker_list, logger, ticker_download_threshold
+                PRICE_STORE_PATH,
+                ticker_list,
+                logger,
+                ticker_download_threshold,
+                store_func=store_OHLCV_in_price_store,
             )
         )
 
+    if ticker_list:
         # Final check after all retries
         assert (
             percentage_of_tickers_saved >= ticker_download_threshold
@@ -0,0 +1,136 @@
+import logging.config
+import os
+import sys
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+import pandas.testing as pdt
+import pytest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from log_config import LOG_CONFIG
+from price_store import last_stored_dates, read_price_history, write_prices
+from store_price_data import update_OHLCV_incremental
+
+# Configure logging
+module_name = os.path.splitext(os.path.basename(__file__))[0]
+log_filename = f"log/{module_name}.log"
+LOG_CONFIG["handlers"]["file_dynamic"]["filename"] = log_filename
+
+logging.config.dictConfig(LOG_CONFIG)
+logger = logging.getLogger(__name__)
+
+
+def make_history(tickers, end, periods=40):
+    """Long-format bars, as returned by download_OHLCV_from_yf."""
+    frames = []
+    for i, ticker in enumerate(tickers):
+        dates = pd.bdate_range(end=end, periods=periods, name="Date")
+        days = (dates - pd.Timestamp("2025-01-01")).days.to_numpy()
+        close = np.round(50.0 + 10 * i + days * 0.25, 2)
+        frames.append(
+            pd.DataFrame(
+                {
+                    "Ticker": ticker,
+                    "Open": close,
+                    "High": close + 1,
+                    "Low": close - 1,
+                    "Close": close,
+                    "Volume": 1000.0 + days,
+                },
+                index=dates,
+            )
+        )
+    return pd.concat(frames)
+
+
+class FakeYahoo:
+    """Serves bars from source and records each request's start date."""
+
+    def __init__(self, source):
+        self.source = source
+        self.requests = []
+
+    def __call__(self, ticker_list, logger, start_date=None):
+        self.requests.append((sorted(ticker_list), start_date))
+        df = self.source.loc[self.source["Ticker"].isin(ticker_list)]
+        if start_date is not None:
+            df = df.loc[df.index >= start_date]
+        return df
+
+
+@pytest.fixture(scope="function")
+def store(tmp_path):
+    TEST_STORE_PATH = tmp_path / "price_store.db"
+    stored = make_history(["APP", "MSFT"], end="2025-04-18")
+    write_prices(TEST_STORE_PATH, stored)
+    yield TEST_STORE_PATH, make_history(["APP", "MSFT"], end="2025-04-25")
+
+
+def test_incremental_update_appends_new_bars(store):
+    TEST_STORE_PATH, source = store
+    fake = FakeYahoo(source)
+
+    with patch("store_price_data.download_OHLCV_from_yf", fake):
+        percentage_of_tickers_saved, tickers_with_no_data = update_OHLCV_incremental(
+            TEST_STORE_PATH, ["APP", "MSFT"], logger, overlap_days=7
+        )
+
+    assert percentage_of_tickers_saved == 100
+    assert tickers_with_no_data == []
+    # One batched request from the shared start date, no full reload.
+    assert fake.requests == [(["APP", "MSFT"], "2025-04-11")]
+    assert last_stored_dates(TEST_STORE_PATH) == {
+        "APP": "2025-04-25",
+        "MSFT": "2025-04-25",
+    }
+
+    history = read_price_history(TEST_STORE_PATH, start_date="2025-04-21")
+    expected = source.loc[source["Ticker"] == "APP"].drop(columns="Ticker")
+    expected = expected.loc["2025-04-21":]
+    expected.index = expected.index.strftime("%Y-%m-%d")
+    pdt.assert_frame_equal(history["APP"], expected)
+
+
+def test_adjusted_past_bars_trigger_full_reload(store):
+    TEST_STORE_PATH, source = store
+    source = source.copy()
+    # A dividend adjustment rewrites MSFT's past prices.
+    msft = source["Ticker"] == "MSFT"
+    source.loc[msft, ["Open", "High", "Low", "Close"]] *= 0.98
+    fake = FakeYahoo(source)
+
+    with patch("store_price_data.download_OHLCV_from_yf", fake):
+        update_OHLCV_incremental(
+            TEST_STORE_PATH, ["APP", "MSFT"], logger, overlap_days=7
+        )
+
+    assert fake.requests == [
+        (["APP", "MSFT"], "2025-04-11"),
+        (["MSFT"], None),
+    ]
+    history = read_price_history(TEST_STORE_PATH)
+    expected = source.loc[msft].drop(columns="Ticker")
+    expected.index = expected.index.strftime("%Y-%m-%d")
+    pdt.assert_frame_equal(history["MSFT"], expected)
+    assert len(history["APP"]) == 45
+
+
+def test_new_tickers_get_full_history(store):
+    TEST_STORE_PATH, source = store
+    source = pd.concat([source, make_history(["GOOG"], end="2025-04-25")])
+    fake = FakeYahoo(source)
+
+    with patch("store_price_data.download_OHLCV_from_yf", fake):
+        percentage_of_tickers_saved, tickers_with_no_data = update_OHLCV_incremental(
+            TEST_STORE_PATH, ["APP", "GOOG", "TSLA"], logger
+        )
+
+    assert fake.requests == [
+        (["APP"], "2025-04-08"),
+        (["GOOG", "TSLA"], None),
+    ]
+    assert tickers_with_no_data == ["TSLA"]
+    assert percentage_of_tickers_saved == round(2 / 3 * 100, 2)
+    assert len(read_price_history(TEST_STORE_PATH, ["GOOG"])["GOOG"]) == 40
@@ -0,0 +1,174 @@
+import logging.config
+import os
+import sqlite3
+import sys
+
+import numpy as np
+import pandas as pd
+import pandas.testing as pdt
+import pytest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from compute_store_strategy_decisions import (
+    compute_and_store_strategy_decisions,
+)
+from log_config import LOG_CONFIG
+from price_store import write_prices
+
+from strategies.categorise_talib_indicators_vect import strategies
+
+# Configure logging
+module_name = os.path.splitext(os.path.basename(__file__))[0]
+log_filename = f"log/{module_name}.log"
+LOG_CONFIG["handlers"]["file_dynamic"]["filename"] = log_filename
+
+logging.config.dictConfig(LOG_CONFIG)
+logger = logging.getLogger(__name__)
+
+# Several times the longest declared warm-up, so the incremental runs cut the
+# history far from its first bar.
+N_BARS = 6000
+
+
+def make_prices(ticker, periods, seed=0):
+    """Random walk bars (long format) longer than the longest warm-up."""
+    rng = np.random.default_rng(seed)
+    dates = pd.bdate_range(end="2025-04-25", periods=periods, name="Date")
+    close = np.round(100 * np.exp(np.cumsum(rng.normal(0, 0.02, periods))), 2)
+    open_ = np.round(close * (1 + rng.normal(0, 0.005, periods)), 2)
+    spread = np.abs(rng.normal(0, 0.01, periods))
+    return pd.DataFrame(
+        {
+            "Ticker": ticker,
+            "Open": open_,
+            "High": np.round(np.maximum(open_, close) * (1 + spread), 2),
+            "Low": np.round(np.minimum(open_, close) * (1 - spread), 2),
+            "Close": close,
+            "Volume": rng.integers(1_000, 100_000, periods).astype(float),
+        },
+        index=dates,
+    )
+
+
+def read_decisions(db_path, ticker):
+    with sqlite3.connect(db_path) as con:
+        return pd.read_sql_query(f"SELECT * FROM '{ticker}'", con, index_col="Date")
+
+
+@pytest.fixture(scope="function")
+def price_store(tmp_path):
+    TEST_STORE_PATH = tmp_path / "price_store.db"
+    prices = make_prices("APP", N_BARS)
+    # Stored decisions stop three bars before the end of the prices.
+    write_prices(TEST_STORE_PATH, prices.iloc[:-3])
+    yield TEST_STORE_PATH, prices
+
+
+def test_incremental_decisions_match_full_recompute(price_store, tmp_path, caplog):
+    TEST_STORE_PATH, prices = price_store
+    incremental_db = tmp_path / "incremental.db"
+    full_db = tmp_path / "full.db"
+
+    compute_and_store_strategy_decisions(
+        TEST_STORE_PATH, incremental_db, ["APP"], strategies, logger
+    )
+    write_prices(TEST_STORE_PATH, prices)
+    compute_and_store_strategy_decisions(
+        TEST_STORE_PATH,
+        incremental_db,
+        ["APP"],
+        strategies,
+        logger,
+        incremental=True,
+    )
+    compute_and_store_strategy_decisions(
+        TEST_STORE_PATH, full_db, ["APP"], strategies, logger
+    )
+
+    # The new dates were appended, not recomputed after a mismatch.
+    assert "Appended 3 new dates for APP." in caplog.text
+    warmups = [strategy.warmup for strategy in strategies]
+    assert N_BARS >= 4 * max(w for w in warmups if w is not None)
+    full = read_decisions(full_db, "APP")
+    incremental = read_decisions(incremental_db, "APP")
+    assert len(full) == N_BARS
+    # The appended decisions come from a warm-up tail starting thousands of
+    # bars after the first one.
+    pdt.assert_frame_equal(incremental.iloc[-3:], full.iloc[-3:])
+    pdt.assert_frame_equal(incremental, full)
+
+
+def test_incremental_loads_warmup_tail(price_store, tmp_path):
+    TEST_STORE_PATH, prices = price_store
+    TEST_STRATEGY_DECISIONS_DB_PATH = tmp_path / "strategy.db"
+    seen = []
+
+    def mock_strategy(df):
+        seen.append(len(df))
+        out = pd.DataFrame(index=df.index)
+        out["mock_signal"] = np.sign(df["Close"].diff(10)).fillna(0)
+        return out
+
+    mock_strategy.warmup = 10
+
+    compute_and_store_strategy_decisions(
+        TEST_STORE_PATH,
+        TEST_STRATEGY_DECISIONS_DB_PATH,
+        ["APP"],
+        [mock_strategy],
+        logger,
+    )
+    write_prices(TEST_STORE_PATH, prices)
+    compute_and_store_strategy_decisions(
+        TEST_STORE_PATH,
+        TEST_STRATEGY_DECISIONS_DB_PATH,
+        ["APP"],
+        [mock_strategy],
+        logger,
+        incremental=True,
+        verify_bars=5,
+    )
+
+    # Warm-up + verified bars + 3 new bars.
+    assert seen == [N_BARS - 3, 10 + 5 + 3]
+    decisions = read_decisions(TEST_STRATEGY_DECISIONS_DB_PATH, "APP")
+    assert len(decisions) == N_BARS
+    assert decisions.index.is_unique
+
+
+def test_mismatched_decisions_trigger_full_recompute(price_store, tmp_path):
+    TEST_STORE_PATH, prices = price_store
+    TEST_STRATEGY_DECISIONS_DB_PATH = tmp_path / "strategy.db"
+
+    def mock_strategy(df):
+        out = pd.DataFrame(index=df.index)
+        out["mock_signal"] = 1
+        return out
+
+    mock_strategy.warmup = 0
+
+    compute_and_store_strategy_decisions(
+        TEST_STORE_PATH,
+        TEST_STRATEGY_DECISIONS_DB_PATH,
+        ["APP"],
+        [mock_strategy],
+        logger,
+    )
+    with sqlite3.connect(TEST_STRATEGY_DECISIONS_DB_PATH) as con:
+        con.execute(
+            """UPDATE APP SET mock_signal = -1
+            WHERE Date = (SELECT MAX(Date) FROM APP)"""
+        )
+    write_prices(TEST_STORE_PATH, prices)
+    compute_and_store_strategy_decisions(
+        TEST_STORE_PATH,
+        TEST_STRATEGY_DECISIONS_DB_PATH,
+        ["APP"],
+        [mock_strategy],
+        logger,
+        incremental=True,
+    )
+
+    decisions = read_decisions(TEST_STRATEGY_DECISIONS_DB_PATH, "APP")
+    assert len(decisions) == N_BARS
+    assert (decisions["mock_signal"] == 1).all()
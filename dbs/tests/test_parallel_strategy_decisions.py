@@ -0,0 +1,141 @@
+import logging.config
+import os
+import sqlite3
+import sys
+import warnings
+
+import pandas as pd
+import pandas.testing as pdt
+import pytest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from compute_store_strategy_decisions import (
+    compute_and_store_strategy_decisions,
+    write_decisions,
+)
+from log_config import LOG_CONFIG
+from price_store import write_prices
+from test_incremental_strategy_decisions import make_prices, read_decisions
+
+from strategies.categorise_talib_indicators_vect import strategies
+from strategies.talib_indicators_vect import strategy_signals
+
+# Configure logging
+module_name = os.path.splitext(os.path.basename(__file__))[0]
+log_filename = f"log/{module_name}.log"
+LOG_CONFIG["handlers"]["file_dynamic"]["filename"] = log_filename
+
+logging.config.dictConfig(LOG_CONFIG)
+logger = logging.getLogger(__name__)
+
+TICKERS = ["APP", "MSFT", "GOOG", "TSLA", "NVDA"]
+
+
+def failing_strategy(df):
+    raise ValueError("fail")
+
+
+@pytest.fixture(scope="function")
+def price_store(tmp_path):
+    TEST_STORE_PATH = tmp_path / "price_store.db"
+    write_prices(
+        TEST_STORE_PATH,
+        pd.concat(
+            make_prices(ticker, 300 + 50 * i, seed=i)
+            for i, ticker in enumerate(TICKERS)
+        ),
+    )
+    yield TEST_STORE_PATH
+
+
+@pytest.mark.parametrize("memory_budget_mb", [None, 1e-6])
+def test_parallel_decisions_match_sequential(price_store, tmp_path, memory_budget_mb):
+    """Test a pool with or without a binding budget writes the same tables.
+
+    A budget below one ticker's estimate keeps a single ticker in flight.
+    """
+    sequential_db = tmp_path / "sequential.db"
+    parallel_db = tmp_path / "parallel.db"
+
+    compute_and_store_strategy_decisions(
+        price_store, sequential_db, TICKERS, strategies, logger
+    )
+    compute_and_store_strategy_decisions(
+        price_store,
+        parallel_db,
+        TICKERS + ["AMZN"],
+        strategies,
+        logger,
+        processes=2,
+        memory_budget_mb=memory_budget_mb,
+    )
+
+    with sqlite3.connect(parallel_db) as con:
+        tables = con.execute(
+            "SELECT name FROM sqlite_master WHERE type='table' ORDER BY name"
+        ).fetchall()
+    assert tables == [(ticker,) for ticker in sorted(TICKERS)]
+    for ticker in TICKERS:
+        pdt.assert_frame_equal(
+            read_decisions(parallel_db, ticker),
+            read_decisions(sequential_db, ticker),
+        )
+
+
+def test_parallel_incremental_appends(price_store, tmp_path):
+    TEST_STRATEGY_DECISIONS_DB_PATH = tmp_path / "strategy.db"
+    compute_and_store_strategy_decisions(
+        price_store,
+        TEST_STRATEGY_DECISIONS_DB_PATH,
+        TICKERS,
+        strategies,
+        logger,
+    )
+    compute_and_store_strategy_decisions(
+        price_store,
+        TEST_STRATEGY_DECISIONS_DB_PATH,
+        TICKERS,
+        strategies,
+        logger,
+        incremental=True,
+        processes=2,
+    )
+
+    # Nothing new to append: every table keeps its rows.
+    for i, ticker in enumerate(TICKERS):
+        decisions = read_decisions(TEST_STRATEGY_DECISIONS_DB_PATH, ticker)
+        assert len(decisions) == 300 + 50 * i
+
+
+def test_parallel_worker_exception_is_raised(price_store, tmp_path):
+    with pytest.raises(ValueError):
+        compute_and_store_strategy_decisions(
+            price_store,
+            tmp_path / "strategy.db",
+            TICKERS,
+            [failing_strategy],
+            logger,
+            processes=2,
+        )
+
+
+def test_write_decisions_creates_table_without_fragmentation_warning(tmp_path):
+    """Test the replace path keys the table on Date and does not warn."""
+    prices = make_prices("APP", 300).drop(columns="Ticker")
+    # Dates as read back from the price store.
+    prices.index = prices.index.strftime("%Y-%m-%d").rename("Date")
+    decisions = strategy_signals(strategies, prices)
+    db_path = tmp_path / "decisions.db"
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error", pd.errors.PerformanceWarning)
+        write_decisions(db_path, [("APP", decisions, "replace")], logger)
+        write_decisions(db_path, [("APP", decisions.iloc[:10], "replace")], logger)
+
+    with sqlite3.connect(db_path) as con:
+        table_info = con.execute("PRAGMA table_info('APP')").fetchall()
+    assert [(row[1], row[5]) for row in table_info[:1]] == [("Date", 1)]
+    assert [row[1] for row in table_info[1:]] == list(decisions.columns)
+    pdt.assert_frame_equal(
+        read_decisions(db_path, "APP"), decisions.iloc[:10], check_dtype=False
+    )
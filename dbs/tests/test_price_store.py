@@ -0,0 +1,213 @@
+import logging.config
+import os
+import sqlite3
+import sys
+
+import numpy as np
+import pandas as pd
+import pandas.testing as pdt
+import pytest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from compute_store_strategy_decisions import (
+    check_ticker_tables_exist,
+    compute_and_store_strategy_decisions,
+)
+from log_config import LOG_CONFIG
+from price_store import (
+    migrate_table_layout,
+    read_price_history,
+    read_prices,
+    stored_tickers,
+    write_prices,
+)
+from store_price_data import store_OHLCV_in_db, store_OHLCV_in_price_store
+
+# Configure logging
+module_name = os.path.splitext(os.path.basename(__file__))[0]
+log_filename = f"log/{module_name}.log"
+LOG_CONFIG["handlers"]["file_dynamic"]["filename"] = log_filename
+
+logging.config.dictConfig(LOG_CONFIG)
+logger = logging.getLogger(__name__)
+
+
+@pytest.fixture(scope="function")
+def test_data(tmp_path):
+    """Fixture for long-format OHLCV data in the download_OHLCV_from_yf format."""
+    TEST_STORE_PATH = tmp_path / "price_store.db"
+
+    frames = []
+    for i, ticker in enumerate(["APP", "MSFT", "GOOG"]):
+        dates = pd.date_range(end="2025-04-27", periods=5 + i, freq="D")
+        close = 100.0 + i + np.arange(len(dates))
+        frames.append(
+            pd.DataFrame(
+                {
+                    "Ticker": ticker,
+                    "Open": close - 0.5,
+                    "High": close + 1.25,
+                    "Low": close - 1.75,
+                    "Close": close,
+                    "Volume": 500.0 + np.arange(len(dates)),
+                },
+                index=dates,
+            )
+        )
+    df = pd.concat(frames)
+    df.index.name = "Date"
+    yield df, TEST_STORE_PATH
+
+
+def expected_history(df, ticker):
+    expected = df.loc[df["Ticker"] == ticker].drop(columns="Ticker")
+    expected.index = expected.index.strftime("%Y-%m-%d")
+    return expected
+
+
+def test_price_store_db_structure(test_data):
+    """Test the store is one WITHOUT ROWID table keyed on (Ticker, Date)."""
+    df, TEST_STORE_PATH = test_data
+    write_prices(TEST_STORE_PATH, df)
+
+    with sqlite3.connect(TEST_STORE_PATH) as con:
+        tables = con.execute(
+            "SELECT name, sql FROM sqlite_master WHERE type='table';"
+        ).fetchall()
+        table_info = pd.read_sql_query(
+            "PRAGMA table_info(prices)", con, index_col="cid"
+        )
+
+    assert [name for name, _ in tables] == ["prices"]
+    assert "WITHOUT ROWID" in tables[0][1]
+    assert table_info["name"].tolist() == [
+        "Ticker",
+        "Date",
+        "Open",
+        "High",
+        "Low",
+        "Close",
+        "Volume",
+    ]
+    assert table_info["type"].tolist() == [
+        "TEXT",
+        "TEXT",
+        "REAL",
+        "REAL",
+        "REAL",
+        "REAL",
+        "INTEGER",
+    ]
+    assert table_info["pk"].tolist() == [1, 2, 0, 0, 0, 0, 0]
+
+
+def test_read_price_history_roundtrip(test_data):
+    """Test each ticker reads back as its per-ticker table did."""
+    df, TEST_STORE_PATH = test_data
+    write_prices(TEST_STORE_PATH, df)
+
+    assert stored_tickers(TEST_STORE_PATH) == ["APP", "GOOG", "MSFT"]
+    history = read_price_history(TEST_STORE_PATH)
+    for ticker in ["APP", "MSFT", "GOOG"]:
+        pdt.assert_frame_equal(history[ticker], expected_history(df, ticker))
+
+
+def test_read_ticker_subset_and_date_range(test_data):
+    df, TEST_STORE_PATH = test_data
+    write_prices(TEST_STORE_PATH, df)
+
+    history = read_price_history(
+        TEST_STORE_PATH,
+        ["GOOG", "APP", "TSLA"],
+        start_date="2025-04-24",
+        end_date="2025-04-26",
+    )
+    assert list(history) == ["GOOG", "APP"]
+    pdt.assert_frame_equal(
+        history["APP"],
+        expected_history(df, "APP").loc["2025-04-24":"2025-04-26"],
+    )
+
+    long_df = read_prices(TEST_STORE_PATH, ["MSFT"], start_date="2025-04-27")
+    assert long_df["Ticker"].tolist() == ["MSFT"]
+    assert long_df.index.tolist() == ["2025-04-27"]
+
+    assert read_prices(TEST_STORE_PATH, ["TSLA"]).empty
+
+
+def test_write_replaces_ticker_history(test_data):
+    """Test rewriting a ticker replaces its rows and leaves others alone."""
+    df, TEST_STORE_PATH = test_data
+    write_prices(TEST_STORE_PATH, df)
+
+    app = df.loc[df["Ticker"] == "APP"].iloc[:2].copy()
+    app["Close"] = 1.0
+    write_prices(TEST_STORE_PATH, app)
+
+    history = read_price_history(TEST_STORE_PATH)
+    assert history["APP"]["Close"].tolist() == [1.0, 1.0]
+    pdt.assert_frame_equal(history["MSFT"], expected_history(df, "MSFT"))
+
+
+def test_store_OHLCV_in_price_store(test_data):
+    df, TEST_STORE_PATH = test_data
+    percentage_of_tickers_saved, tickers_with_no_data = store_OHLCV_in_price_store(
+        df, ["APP", "TSLA"], TEST_STORE_PATH, logger
+    )
+
+    assert percentage_of_tickers_saved == 50
+    assert tickers_with_no_data == ["TSLA"]
+    assert stored_tickers(TEST_STORE_PATH) == ["APP"]
+
+
+def test_migrate_table_layout(test_data, tmp_path):
+    """Test migrating per-ticker tables gives the same price history."""
+    df, TEST_STORE_PATH = test_data
+    TEST_DB_PATH = tmp_path / "price_data.db"
+    store_OHLCV_in_db(df, ["APP", "MSFT", "GOOG"], TEST_DB_PATH, logger)
+    with sqlite3.connect(TEST_DB_PATH) as con:
+        con.execute("CREATE TABLE notes (text TEXT)")
+
+    migrated, skipped = migrate_table_layout(
+        TEST_DB_PATH, TEST_STORE_PATH, logger, batch_size=2
+    )
+
+    assert sorted(migrated) == ["APP", "GOOG", "MSFT"]
+    assert skipped == ["notes"]
+    history = read_price_history(TEST_STORE_PATH)
+    for ticker in ["APP", "MSFT", "GOOG"]:
+        with sqlite3.connect(TEST_DB_PATH) as con:
+            old = pd.read_sql_query(f"SELECT * FROM '{ticker}'", con, index_col="Date")
+        pdt.assert_frame_equal(history[ticker], old)
+
+
+def test_compute_and_store_strategy_decisions_from_price_store(test_data, tmp_path):
+    df, TEST_STORE_PATH = test_data
+    TEST_STRATEGY_DECISIONS_DB_PATH = tmp_path / "strategy.db"
+    write_prices(TEST_STORE_PATH, df)
+
+    def mock_strategy(df):
+        out = pd.DataFrame(index=df.index)
+        out["mock_signal"] = df["Close"] > 101
+        return out
+
+    assert check_ticker_tables_exist(TEST_STORE_PATH, ["APP", "TSLA"]) == {
+        "APP": True,
+        "TSLA": False,
+    }
+    compute_and_store_strategy_decisions(
+        TEST_STORE_PATH,
+        TEST_STRATEGY_DECISIONS_DB_PATH,
+        ["APP", "TSLA"],
+        [mock_strategy],
+        logger,
+    )
+
+    with sqlite3.connect(TEST_STRATEGY_DECISIONS_DB_PATH) as con:
+        decisions = pd.read_sql_query("SELECT * FROM 'APP'", con, index_col="Date")
+        tables = con.execute(
+            "SELECT name FROM sqlite_master WHERE type='table';"
+        ).fetchall()
+
+    assert tables == [("APP",)]
+    assert decisions["mock_signal"].tolist() == [0, 0, 1, 1, 1]
@@ -0,0 +1,221 @@
+"""
+asyncio helpers for the live clients' "asyncio" execution mode.
+
+With live_execution_mode = "asyncio" in control.py, the ranking and
+trading clients process a cycle's tickers as coroutines on one long-lived
+event loop instead of on the worker threads of cycle_executor.py:
+
+- database reads and writes go through motor (one AsyncIOMotorClient per
+  client, reused across cycles);
+- gather_bounded runs the tickers under a semaphore of
+  live_async_concurrency, with the worker pool's live_task_timeout and
+  live_cycle_timeout deadlines;
+- each ticker's history is read once, for its longest ideal period, and
+  the shorter periods are sliced from it as in history_provider.py;
+- calls without an async API (yfinance, alpaca-py) run on the default
+  thread pool with asyncio.to_thread.
+
+motor is only imported by connect_to_motor. The other helpers take any
+client with motor's awaitable collection API, so they can run against stub
+collections in tests.
+"""
+
+import asyncio
+import time
+from datetime import datetime, timezone
+
+import certifi
+import yfinance as yf
+from alpaca.trading.enums import OrderSide, TimeInForce
+from alpaca.trading.requests import MarketOrderRequest
+
+from control import stop_loss, take_profit
+from helper_files.client_helper import get_latest_price
+from helper_files.history_codec import decode_history, encode_history
+from helper_files.history_provider import can_slice, longest_period, slice_period
+from utils.session import limiter
+
+
+def connect_to_motor(mongo_url):
+    """
+    Returns an AsyncIOMotorClient. Create it on the event loop that uses it.
+    """
+    from motor.motor_asyncio import AsyncIOMotorClient
+
+    return AsyncIOMotorClient(mongo_url, tlsCAFile=certifi.where())
+
+
+async def gather_bounded(
+    function,
+    items,
+    *args,
+    concurrency,
+    logger,
+    task_timeout=None,
+    cycle_timeout=None,
+):
+    """
+    Awaits function(item, *args) for every item, at most `concurrency` at a
+    time, and logs failures, timeouts and the cycle time like
+    CycleExecutor.run.
+
+    An item running longer than task_timeout seconds is cancelled. When
+    cycle_timeout runs out, running items are cancelled and queued ones
+    never start. A call already on the thread pool (asyncio.to_thread)
+    cannot be interrupted; it finishes in the background and its result is
+    dropped. None disables either timeout.
+
+    Returns the results in item order, with None for items that failed,
+    timed out or were cancelled.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    started = set()
+
+    async def bounded(index, item):
+        async with semaphore:
+            started.add(index)
+            return await asyncio.wait_for(function(item, *args), task_timeout)
+
+    start = time.monotonic()
+    tasks = [
+        asyncio.ensure_future(bounded(index, item)) for index, item in enumerate(items)
+    ]
+    pending = set()
+    if tasks:
+        _, pending = await asyncio.wait(tasks, timeout=cycle_timeout)
+    for task in pending:
+        task.cancel()
+    await asyncio.gather(*pending, return_exceptions=True)
+
+    results = [None] * len(tasks)
+    failed, timed_out, cancelled = [], [], []
+    for index, (item, task) in enumerate(zip(items, tasks)):
+        if task in pending:
+            (timed_out if index in started else cancelled).append(item)
+        elif isinstance(task.exception(), asyncio.TimeoutError):
+            timed_out.append(item)
+        elif task.exception() is not None:
+            failed.append(item)
+            logger.error(f"Error processing {item}: {task.exception()}")
+        else:
+            results[index] = task.result()
+    if timed_out or cancelled:
+        logger.warning(
+            f"Cycle abandoned {len(timed_out)} running and cancelled "
+            f"{len(cancelled)} queued items: {timed_out + cancelled}"
+        )
+    completed = len(tasks) - len(failed) - len(timed_out) - len(cancelled)
+    logger.info(
+        f"Cycle processed {completed}/{len(tasks)} items in "
+        f"{time.monotonic() - start:.1f}s ({len(failed)} failed)."
+    )
+    return results
+
+
+async def get_latest_price_async(ticker):
+    """
+    Returns the ticker's latest price from the shared quote cache, or None.
+    """
+    return await asyncio.to_thread(get_latest_price, ticker)
+
+
+async def get_data_async(ticker, motor_client, period):
+    """
+    Returns the ticker's cached history for a period, like get_data.
+
+    On a cache miss the history is downloaded with yfinance and stored.
+    """
+    collection = motor_client.HistoricalDatabase.HistoricalDatabase
+    data = await collection.find_one({"ticker": ticker, "period": period})
+    if data:
+        return decode_history(data)
+
+    data = await asyncio.to_thread(
+        yf.Ticker(ticker, session=limiter).history, period=period
+    )
+    await collection.insert_one(encode_history(ticker, period, data))
+    print("Data fetched from Yahoo Finance")
+    return data
+
+
+async def get_histories_async(ticker, motor_client, periods, logger):
+    """
+    Returns {period: history} for every distinct period. The longest period
+    is read once and the shorter ones are sliced from it; periods that
+    cannot be sliced are read concurrently with it.
+    Periods whose history could not be read are left out.
+    """
+    periods = list(dict.fromkeys(periods))
+    longest = longest_period(periods)
+    reads = [period for period in periods if not can_slice(period, longest)]
+    if longest is not None:
+        reads.insert(0, longest)
+    results = await asyncio.gather(
+        *(get_data_async(ticker, motor_client, period) for period in reads),
+        return_exceptions=True,
+    )
+    histories = {}
+    for period, result in zip(reads, results):
+        if isinstance(result, Exception):
+            logger.warning(
+                f"Error fetching historical data for {ticker} ({period}): {result}"
+            )
+        else:
+            histories[period] = result
+    if longest in histories:
+        for period in periods:
+            if period not in histories and can_slice(period, longest):
+                histories[period] = slice_period(histories[longest], period)
+    return {period: histories[period] for period in periods if period in histories}
+
+
+async def place_order_async(trading_client, symbol, side, quantity, motor_client):
+    """
+    Places a market order and logs it to MongoDB, like place_order.
+    """
+    market_order_data = MarketOrderRequest(
+        symbol=symbol, qty=quantity, side=side, time_in_force=TimeInForce.DAY
+    )
+    order = await asyncio.to_thread(trading_client.submit_order, market_order_data)
+    qty = round(quantity, 3)
+    current_price = await get_latest_price_async(symbol)
+    stop_loss_price = round(current_price * (1 - stop_loss), 2)
+    take_profit_price = round(current_price * (1 + take_profit), 2)
+
+    db = motor_client.trades
+    await db.paper.insert_one(
+        {
+            "symbol": symbol,
+            "qty": qty,
+            "side": side.name,
+            "time_in_force": TimeInForce.DAY.name,
+            "time": datetime.now(tz=timezone.utc),
+        }
+    )
+
+    assets = db.assets_quantities
+    limits = db.assets_limit
+
+    if side == OrderSide.BUY:
+        await assets.update_one(
+            {"symbol": symbol}, {"$inc": {"quantity": qty}}, upsert=True
+        )
+        await limits.update_one(
+            {"symbol": symbol},
+            {
+                "$set": {
+                    "stop_loss_price": stop_loss_price,
+                    "take_profit_price": take_profit_price,
+                }
+            },
+            upsert=True,
+        )
+    elif side == OrderSide.SELL:
+        await assets.update_one(
+            {"symbol": symbol}, {"$inc": {"quantity": -qty}}, upsert=True
+        )
+        if (await assets.find_one({"symbol": symbol}))["quantity"] == 0:
+            await assets.delete_one({"symbol": symbol})
+            await limits.delete_one({"symbol": symbol})
+
+    return order
@@ -10,7 +10,15 @@ from alpaca.trading.enums import OrderSide, TimeInForce
 from alpaca.trading.requests import MarketOrderRequest
 from pymongo import MongoClient
 
-from control import stop_loss, take_profit
+from control import (
+    live_price_retries,
+    live_price_retry_backoff,
+    quote_miss_ttl,
+    quote_ttl,
+    stop_loss,
+    take_profit,
+)
+from helper_files.quote_service import QuoteService, yf_latest_prices
 from strategies.talib_indicators import (
     AD_indicator,
     ADOSC_indicator,
@@ -448,24 +456,50 @@ def market_status(polygon_client):
         return "error"
 
 
+# Latest prices shared by every thread of a client, see quote_service.py
+quote_service = QuoteService(yf_latest_prices, ttl=quote_ttl, miss_ttl=quote_miss_ttl)
+
+
 # Helper to get latest price
 def get_latest_price(ticker):
     """
-    Fetch the latest price for a given stock ticker using yfinance.
+    Fetch the latest price for a given stock ticker from the shared quote cache.
+    The price is fetched with the cache's source (Alpaca in the live clients,
+    yfinance otherwise) if it is not cached or older than quote_ttl.
 
     :param ticker: The stock ticker symbol
     :return: The latest price of the stock
     """
     try:
-        ticker_yahoo = yf.Ticker(ticker, session=limiter)
-        data = ticker_yahoo.history()
-
-        return round(data["Close"].iloc[-1], 2)
+        return quote_service.get(ticker)
     except Exception as e:
         logging.error(f"Error fetching latest price for {ticker}: {e}")
         return None
 
 
+def wait_for_price(
+    ticker, cancel_event, tries=live_price_retries, backoff=live_price_retry_backoff
+):
+    """
+    Returns the ticker's latest price, retrying with a doubling backoff while
+    the quote cache cannot price it.
+
+    Returns None after `tries` requests, or as soon as cancel_event is set.
+    """
+    for attempt in range(tries):
+        current_price = get_latest_price(ticker)
+        if current_price is not None:
+            return current_price
+        if attempt + 1 == tries:
+            break
+        delay = backoff * 2**attempt
+        logging.warning(f"No price for {ticker}. Retrying in {delay}s...")
+        if cancel_event.wait(delay):
+            return None
+    logging.warning(f"No price for {ticker} after {tries} tries. Skipping.")
+    return None
+
+
 def dynamic_period_selector(ticker):
     """
     Determines the best period to use for fetching historical data.
@@ -0,0 +1,161 @@
+"""
+Bounded per-ticker worker pool for the live client cycles.
+
+The live clients used to start one thread per ticker every cycle and join
+all of them, with no cap and no timeout, so one stalled ticker delayed the
+whole cycle. CycleExecutor runs a cycle's tickers on a fixed-size thread
+pool instead:
+
+- at most max_workers tickers run at once; the rest wait in the queue;
+- a ticker running longer than task_timeout is abandoned by the cycle;
+- when cycle_timeout runs out, queued tickers are cancelled and running
+  ones are abandoned;
+- the cycle's cancel event is set when it ends, so abandoned tasks that
+  check it (process_ticker does between strategies and while waiting to
+  retry a price or history) stop instead of writing results into the
+  next cycle.
+
+Python threads cannot be killed, so an abandoned task keeps its worker
+until it returns; the tasks are expected to check the cancel event.
+run returns the cycle's latency stats.
+"""
+
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+import numpy as np
+
+
+class CycleExecutor:
+    """
+    Runs one function per item on a shared bounded thread pool.
+
+    Args:
+        max_workers (int): Items processed at the same time.
+        task_timeout (float): Seconds an item may run before the cycle
+          abandons it. None waits for every item.
+        cycle_timeout (float): Seconds a cycle may take before queued items
+          are cancelled and running ones abandoned. None has no limit.
+        name (str): Thread name prefix.
+    """
+
+    def __init__(
+        self, max_workers, task_timeout=None, cycle_timeout=None, name="cycle"
+    ):
+        self.max_workers = max_workers
+        self.task_timeout = task_timeout
+        self.cycle_timeout = cycle_timeout
+        self._pool = ThreadPoolExecutor(max_workers, thread_name_prefix=name)
+
+    def run(self, function, items, *args, logger=None):
+        """
+        Calls function(item, *args, cancel_event=event) for every item and
+        waits until each call finished, failed, timed out or was cancelled.
+
+        Returns a dict of cycle stats: counts of tasks, completed, failed,
+        timed_out and cancelled items, the cycle time in seconds, and the
+        median, 95th percentile and max run time of completed items.
+        """
+        cancel_event = threading.Event()
+        started = {}
+        durations = []
+        lock = threading.Lock()
+
+        def task(item):
+            start = time.monotonic()
+            with lock:
+                started[item] = start
+            result = function(item, *args, cancel_event=cancel_event)
+            with lock:
+                durations.append(time.monotonic() - start)
+            return result
+
+        cycle_start = time.monotonic()
+        cycle_deadline = (
+            None if self.cycle_timeout is None else cycle_start + self.cycle_timeout
+        )
+        futures = {self._pool.submit(task, item): item for item in items}
+        pending = set(futures)
+        failed, timed_out, cancelled = [], [], []
+
+        while pending:
+            now = time.monotonic()
+            if cycle_deadline is not None and now >= cycle_deadline:
+                for future in pending:
+                    if future.cancel():
+                        cancelled.append(futures[future])
+                    else:
+                        timed_out.append(futures[future])
+                pending = set()
+                break
+
+            # Wake up at the next task or cycle deadline.
+            deadlines = [] if cycle_deadline is None else [cycle_deadline]
+            if self.task_timeout is not None:
+                with lock:
+                    deadlines += [
+                        started[futures[future]] + self.task_timeout
+                        for future in pending
+                        if futures[future] in started
+                    ]
+                # Queued items may start before the next deadline.
+                deadlines.append(now + self.task_timeout)
+            timeout = max(min(deadlines) - now, 0) if deadlines else None
+
+            done, pending = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is not None:
+                    failed.append(futures[future])
+                    if logger is not None:
+                        logger.error(
+                            f"Error processing {futures[future]}: {future.exception()}"
+                        )
+
+            if self.task_timeout is not None:
+                now = time.monotonic()
+                with lock:
+                    expired = {
+                        future
+                        for future in pending
+                        if futures[future] in started
+                        and now - started[futures[future]] >= self.task_timeout
+                    }
+                timed_out += [futures[future] for future in expired]
+                pending -= expired
+
+        cancel_event.set()
+        with lock:
+            completed = np.array(durations)
+        stats = {
+            "tasks": len(futures),
+            "completed": len(futures) - len(failed) - len(timed_out) - len(cancelled),
+            "failed": len(failed),
+            "timed_out": len(timed_out),
+            "cancelled": len(cancelled),
+            "cycle_seconds": time.monotonic() - cycle_start,
+            "median_seconds": float(np.median(completed)) if len(completed) else 0.0,
+            "p95_seconds": (
+                float(np.percentile(completed, 95)) if len(completed) else 0.0
+            ),
+            "max_seconds": float(completed.max()) if len(completed) else 0.0,
+        }
+        if logger is not None:
+            if timed_out or cancelled:
+                logger.warning(
+                    f"Cycle abandoned {len(timed_out)} running and cancelled "
+                    f"{len(cancelled)} queued items: {timed_out + cancelled}"
+                )
+            logger.info(
+                f"Cycle processed {stats['completed']}/{stats['tasks']} items in "
+                f"{stats['cycle_seconds']:.1f}s (median {stats['median_seconds']:.2f}s, "
+                f"p95 {stats['p95_seconds']:.2f}s, max {stats['max_seconds']:.2f}s, "
+                f"{stats['failed']} failed)."
+            )
+        return stats
+
+    def shutdown(self):
+        """
+        Stops the pool without waiting for abandoned tasks.
+        """
+        self._pool.shutdown(wait=False, cancel_futures=True)
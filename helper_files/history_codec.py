@@ -0,0 +1,107 @@
+"""
+Binary columnar format of the HistoricalDatabase Mongo cache.
+
+get_data used to store a history as data.reset_index().to_dict("records"):
+one BSON subdocument per bar, repeating every field name and holding a
+datetime per bar, which reads rebuild with pd.DataFrame and pd.to_datetime.
+encode_history stores each column as one packed little-endian array instead:
+
+    {"ticker": ..., "period": ..., "format": 1,
+     "index": {"name": "Date", "tz": "America/New_York", "unit": "ns",
+               "data": <int64 epoch times in unit (UTC)>},
+     "columns": {"Open": {"dtype": "<f8", "data": <bytes>}, ...}}
+
+Price columns are float64 and volume int64, as yfinance returns them.
+decode_history builds the DataFrame on np.frombuffer views of the stored
+bytes, so no column is copied or parsed. The views are read-only, and so
+are the columns of a decoded frame: replacing a column
+(df["Close"] = ...) or building a new frame works, but writing into one in
+place (df.loc[i, "Close"] = x, df.iloc[...] = ..., df["Close"].values[i] =
+x) raises "assignment destination is read-only". Copy the frame with
+df.copy() before writing into it. HistoryProvider hands the same frame to
+every strategy of a ticker, so in-place writes would leak between them
+anyway.
+
+Documents without a "format" field are in the old records format and are
+still decoded, so an existing cache stays readable until it is rebuilt.
+"""
+
+import numpy as np
+import pandas as pd
+from bson import Binary
+
+HISTORY_FORMAT = 1
+
+
+def _packable(dtype):
+    return dtype.kind in "iuf"
+
+
+def encode_history(ticker, period, history):
+    """
+    Returns the HistoricalDatabase document of a history with a
+    DatetimeIndex. Histories with non-numeric columns are stored as records.
+    """
+    if not isinstance(history.index, pd.DatetimeIndex) or not all(
+        _packable(dtype) for dtype in history.dtypes
+    ):
+        records = history.reset_index().to_dict("records")
+        return {"ticker": ticker, "period": period, "data": records}
+
+    index = history.index
+    tz = None if index.tz is None else str(index.tz)
+    # Naive indexes are stored as if they were UTC, tz-aware ones in UTC.
+    dates = index.asi8.astype("<i8")
+    columns = {}
+    for column in history.columns:
+        values = history[column].to_numpy()
+        if values.dtype.kind == "f":
+            values = values.astype("<f8", copy=False)
+        else:
+            values = values.astype("<i8", copy=False)
+        columns[str(column)] = {
+            "dtype": values.dtype.str,
+            "data": Binary(np.ascontiguousarray(values).tobytes()),
+        }
+    return {
+        "ticker": ticker,
+        "period": period,
+        "format": HISTORY_FORMAT,
+        "index": {
+            "name": index.name or "Date",
+            "tz": tz,
+            "unit": index.unit,
+            "data": Binary(dates.tobytes()),
+        },
+        "columns": columns,
+    }
+
+
+def decode_history(document):
+    """
+    Returns the history DataFrame of a HistoricalDatabase document, in
+    either the columnar or the old records format.
+
+    Columnar documents decode to read-only columns; see the module
+    docstring.
+    """
+    if document.get("format") is None:
+        df = pd.DataFrame(document["data"])
+        df["Date"] = pd.to_datetime(df["Date"])
+        df.set_index("Date", inplace=True)
+        return df
+    if document["format"] != HISTORY_FORMAT:
+        raise ValueError(f"Unknown history format {document['format']}")
+
+    index_doc = document["index"]
+    dates = np.frombuffer(index_doc["data"], dtype="<i8").view(
+        f"M8[{index_doc['unit']}]"
+    )
+    index = pd.DatetimeIndex(dates, name=index_doc["name"])
+    if index_doc["tz"] is not None:
+        index = index.tz_localize("UTC").tz_convert(index_doc["tz"])
+    columns = {
+        column: np.frombuffer(spec["data"], dtype=spec["dtype"])
+        for column, spec in document["columns"].items()
+    }
+    return pd.DataFrame(columns, index=index, copy=False)
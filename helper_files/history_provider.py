@@ -0,0 +1,122 @@
+"""
+Per-cycle ticker histories for the live clients.
+
+process_ticker used to call get_data once per strategy and ideal period, and
+each call read the HistoricalDatabase cache and rebuilt a DataFrame from its
+records. HistoryProvider reads only the longest period the cycle's strategies
+use, once per ticker, and serves the shorter periods as row slices of it:
+
+- a period window covers the calendar days last - PERIOD_DAYS[period]
+  through the last row of the history, the same window TradeSim's
+  get_historical_data takes on current_date;
+- slices are memoised, so a warm provider returns the same frame without
+  reading or rebuilding anything;
+- periods outside PERIOD_DAYS (like "5y" or "max") cannot be sliced and
+  are read with get_data on their own.
+
+A provider lives for one cycle, so the next cycle sees histories refreshed
+in the cache in the meantime.
+"""
+
+import threading
+
+import numpy as np
+
+from strategies.talib_indicators import get_data
+
+PERIOD_DAYS = {
+    "1mo": 30,
+    "3mo": 90,
+    "6mo": 180,
+    "1y": 365,
+    "2y": 730,
+}
+
+
+def longest_period(periods):
+    """
+    Returns the longest of the periods found in PERIOD_DAYS, or None.
+    """
+    known = [period for period in set(periods) if period in PERIOD_DAYS]
+    return max(known, key=PERIOD_DAYS.get) if known else None
+
+
+def can_slice(period, longest):
+    """
+    Returns True if the period's window can be cut from the longest period.
+    """
+    return (
+        longest is not None
+        and period in PERIOD_DAYS
+        and PERIOD_DAYS[period] <= PERIOD_DAYS[longest]
+    )
+
+
+def slice_period(history, period):
+    """
+    Returns the rows of history in the period window ending on its last row.
+    """
+    if history is None or history.empty:
+        return history
+    index = history.index
+    if getattr(index, "tz", None) is not None:
+        index = index.tz_localize(None)
+    # Calendar days in the index's own timezone, like HistoryWindowIndex.
+    days = index.values.astype("datetime64[D]")
+    start = np.searchsorted(days, days[-1] - np.timedelta64(PERIOD_DAYS[period], "D"))
+    return history.iloc[int(start) :]
+
+
+class HistoryProvider:
+    """
+    One cycle's ticker histories, read at most once per ticker and period.
+
+    Args:
+        mongo_client (MongoClient): Client for the HistoricalDatabase cache.
+        periods (iterable): Ideal periods of the cycle's strategies.
+        loader (callable): Takes (ticker, mongo_client, period) and returns
+          the history, like get_data.
+    """
+
+    def __init__(self, mongo_client, periods, loader=get_data):
+        self.mongo_client = mongo_client
+        self.loader = loader
+        self.longest = longest_period(periods)
+        self.loads = 0
+        self._histories = {}  # (ticker, period) -> history
+        self._lock = threading.Lock()
+        # One lock per ticker, so threads asking for the same ticker wait for
+        # one read instead of each reading it.
+        self._ticker_locks = {}
+
+    def get(self, ticker, period):
+        """
+        Returns the ticker's history for the period.
+        """
+        history = self._histories.get((ticker, period))
+        if history is not None:
+            return history
+        with self._lock:
+            ticker_lock = self._ticker_locks.setdefault(ticker, threading.Lock())
+        with ticker_lock:
+            history = self._histories.get((ticker, period))
+            if history is None:
+                if period != self.longest and can_slice(period, self.longest):
+                    history = slice_period(self._read(ticker, self.longest), period)
+                else:
+                    history = self._read(ticker, period)
+                self._histories[(ticker, period)] = history
+        return history
+
+    def _read(self, ticker, period):
+        """
+        Returns the cached history or reads it. The caller holds the
+        ticker's lock.
+        """
+        history = self._histories.get((ticker, period))
+        if history is None:
+            history = self.loader(ticker, self.mongo_client, period)
+            with self._lock:
+                self.loads += 1
+            self._histories[(ticker, period)] = history
+        return history
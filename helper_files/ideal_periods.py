@@ -0,0 +1,89 @@
+"""
+In-process lookup of each strategy's ideal period.
+
+The live clients used to read IndicatorsDatabase.Indicators with one
+find_one per strategy per ticker, for data that only changes when
+setup.initialize_indicator_setup runs. IdealPeriodRegistry holds the whole
+indicator -> ideal period map in memory instead. refresh reads a version
+counter (one small document in IndicatorsDatabase.IndicatorsVersion) and
+reloads the map only when the version changed; initialize_indicator_setup
+bumps the counter after writing the periods with bump_ideal_period_version.
+
+A version counter is used instead of a change stream because change streams
+need a replica set. The live clients refresh once per cycle, and TradeSim's
+initialize_simulation loads the same registry once per run.
+"""
+
+from collections.abc import Mapping
+
+
+def bump_ideal_period_version(mongo_client):
+    """
+    Marks the ideal periods as changed so registries reload them.
+    """
+    mongo_client.IndicatorsDatabase.IndicatorsVersion.update_one(
+        {}, {"$inc": {"version": 1}}, upsert=True
+    )
+
+
+def _version(doc):
+    return None if doc is None else doc.get("version")
+
+
+def _periods(docs):
+    return {doc["indicator"]: doc.get("ideal_period") for doc in docs}
+
+
+class IdealPeriodRegistry(Mapping):
+    """
+    Read-only {indicator name: ideal period} mapping, reloaded from
+    IndicatorsDatabase when its version counter changes.
+
+    The map is swapped in whole on reload, so threads reading it during a
+    refresh see either the old or the new periods.
+    """
+
+    _PROJECTION = {"indicator": 1, "ideal_period": 1}
+
+    def __init__(self):
+        self._periods = {}
+        self.version = None
+        self.loaded = False
+
+    def refresh(self, mongo_client):
+        """
+        Reloads the periods if they are not loaded or their version changed.
+
+        Returns True if the periods were reloaded.
+        """
+        db = mongo_client.IndicatorsDatabase
+        version = _version(db.IndicatorsVersion.find_one({}))
+        if self.loaded and version == self.version:
+            return False
+        self._periods = _periods(db.Indicators.find({}, self._PROJECTION))
+        self.version = version
+        self.loaded = True
+        return True
+
+    async def refresh_async(self, motor_client):
+        """
+        refresh for a motor client.
+        """
+        db = motor_client.IndicatorsDatabase
+        version = _version(await db.IndicatorsVersion.find_one({}))
+        if self.loaded and version == self.version:
+            return False
+        docs = await db.Indicators.find({}, self._PROJECTION).to_list(None)
+        self._periods = _periods(docs)
+        self.version = version
+        self.loaded = True
+        return True
+
+    def __getitem__(self, indicator):
+        return self._periods[indicator]
+
+    def __iter__(self):
+        return iter(self._periods)
+
+    def __len__(self):
+        return len(self._periods)
@@ -0,0 +1,206 @@
+"""
+Shared latest-price cache for the live clients.
+
+get_latest_price used to download a yfinance history frame per ticker per
+call, behind the 2 requests/second limiter session. QuoteService keeps the
+latest prices in a thread-safe TTL cache instead: a client refreshes every
+symbol it needs for a cycle at the start of the cycle, and every thread
+(process_ticker, place_order, update_portfolio_values) reads the cache.
+Prices older than the TTL, or never fetched, are refetched on demand.
+Tickers the source could not price are remembered for miss_ttl seconds, so
+callers asking for them again do not send a source request each time.
+
+The price source is any callable taking a list of tickers and returning
+{ticker: price} for the tickers it could price, so tests can pass a local
+fake. The live clients use alpaca_latest_prices, which prices up to
+ALPACA_SYMBOLS_PER_REQUEST symbols per HTTP request. yf_latest_prices is the
+default for the other callers; it is one yf.download call, but yfinance
+still sends one request per ticker through the limiter, so it is slow for
+many tickers.
+"""
+
+import threading
+import time
+
+import pandas as pd
+import yfinance as yf
+from alpaca.data.requests import StockLatestTradeRequest
+
+from utils.session import limiter
+
+
+def yf_latest_prices(tickers):
+    """
+    Fetches the last close of every ticker with one yfinance download call.
+    yfinance sends one request per ticker through the limiter.
+
+    Returns {ticker: close rounded to 2 decimals}; tickers with no data are
+    left out.
+    """
+    tickers = list(tickers)
+    data = yf.download(
+        tickers=tickers,
+        period="5d",
+        interval="1d",
+        group_by="ticker",
+        progress=False,
+        threads=False,
+        session=limiter,
+    )
+    prices = {}
+    if data is None or data.empty:
+        return prices
+    for ticker in tickers:
+        if isinstance(data.columns, pd.MultiIndex):
+            if ticker not in data.columns.get_level_values(0):
+                continue
+            close = data[ticker]["Close"]
+        else:
+            close = data["Close"]
+        close = close.dropna()
+        if not close.empty:
+            prices[ticker] = round(float(close.iloc[-1]), 2)
+    return prices
+
+
+# Symbols per latest trades request, which keeps the query string short.
+ALPACA_SYMBOLS_PER_REQUEST = 200
+
+
+def alpaca_latest_prices(tickers, data_client, fallback=yf_latest_prices):
+    """
+    Fetches the latest trade price of every ticker from Alpaca, batching the
+    tickers into requests of ALPACA_SYMBOLS_PER_REQUEST symbols.
+
+    Tickers Alpaca has no trade for are priced with fallback. Returns
+    {ticker: price rounded to 2 decimals}; tickers with no price are left
+    out.
+    """
+    tickers = list(tickers)
+    prices = {}
+    for start in range(0, len(tickers), ALPACA_SYMBOLS_PER_REQUEST):
+        request = StockLatestTradeRequest(
+            symbol_or_symbols=tickers[start : start + ALPACA_SYMBOLS_PER_REQUEST]
+        )
+        for ticker, trade in data_client.get_stock_latest_trade(request).items():
+            prices[ticker] = round(float(trade.price), 2)
+    missing = [ticker for ticker in tickers if ticker not in prices]
+    if missing and fallback is not None:
+        prices.update(fallback(missing))
+    return prices
+
+
+class QuoteService:
+    """
+    Thread-safe TTL cache of latest prices in front of a batched source.
+
+    Args:
+        source (callable): Takes a list of tickers and returns
+          {ticker: price}.
+        ttl (float): Seconds a price is served before it is refetched.
+        miss_ttl (float): Seconds a ticker the source could not price is
+          reported as unpriced before it is requested again.
+        clock (callable): Monotonic time in seconds.
+    """
+
+    def __init__(
+        self, source=yf_latest_prices, ttl=60, miss_ttl=5, clock=time.monotonic
+    ):
+        self.source = source
+        self.ttl = ttl
+        self.miss_ttl = miss_ttl
+        self.clock = clock
+        self.hits = 0
+        self.misses = 0
+        self.requests = 0
+        # ticker -> (price, fetched_at); price is None for unpriced tickers.
+        self._quotes = {}
+        self._lock = threading.Lock()
+        # Serialises source calls, so threads missing the same ticker wait
+        # for one fetch instead of each sending their own request.
+        self._fetch_lock = threading.Lock()
+
+    def refresh(self, tickers):
+        """
+        Fetches every ticker in one source request and caches the prices.
+
+        Returns {ticker: price} for the tickers the source could price.
+        """
+        tickers = list(dict.fromkeys(tickers))
+        if not tickers:
+            return {}
+        with self._fetch_lock:
+            return self._fetch(tickers)
+
+    def get_many(self, tickers, max_age=None):
+        """
+        Returns {ticker: price}, fetching every missing or stale ticker in one
+        source request. Tickers the source could not price are left out.
+
+        max_age overrides the TTL for this call.
+        """
+        tickers = list(dict.fromkeys(tickers))
+        prices, stale = self._cached(tickers, max_age)
+        with self._lock:
+            self.hits += len(tickers) - len(stale)
+            self.misses += len(stale)
+        if stale:
+            with self._fetch_lock:
+                # Another thread may have fetched them while this one waited.
+                fetched, stale = self._cached(stale, max_age)
+                prices.update(fetched)
+                if stale:
+                    prices.update(self._fetch(stale))
+        return {ticker: prices[ticker] for ticker in tickers if ticker in prices}
+
+    def get(self, ticker, max_age=None):
+        """
+        Returns the ticker's latest price, or None if the source could not
+        price it.
+        """
+        return self.get_many([ticker], max_age).get(ticker)
+
+    def age(self, ticker):
+        """
+        Returns how many seconds ago the ticker's cached price was fetched,
+        or None if it is not cached.
+        """
+        with self._lock:
+            quote = self._quotes.get(ticker)
+        return None if quote is None or quote[0] is None else self.clock() - quote[1]
+
+    def _cached(self, tickers, max_age):
+        """
+        Returns ({ticker: price} for fresh cached tickers, [stale tickers]).
+        Recently unpriced tickers are in neither.
+        """
+        max_age = self.ttl if max_age is None else max_age
+        miss_age = min(max_age, self.miss_ttl)
+        now = self.clock()
+        prices, stale = {}, []
+        with self._lock:
+            for ticker in tickers:
+                quote = self._quotes.get(ticker)
+                if quote is None:
+                    stale.append(ticker)
+                elif quote[0] is None:
+                    if now - quote[1] > miss_age:
+                        stale.append(ticker)
+                elif now - quote[1] <= max_age:
+                    prices[ticker] = quote[0]
+                else:
+                    stale.append(ticker)
+        return prices, stale
+
+    def _fetch(self, tickers):
+        """
+        Calls the source for tickers and caches the result. The caller holds
+        the fetch lock.
+        """
+        prices = self.source(tickers)
+        fetched_at = self.clock()
+        with self._lock:
+            self.requests += 1
+            for ticker in tickers:
+                self._quotes[ticker] = (prices.get(ticker), fetched_at)
+        return dict(prices)
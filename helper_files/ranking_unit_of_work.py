@@ -0,0 +1,313 @@
+"""
+In-memory strategy state for one ranking cycle.
+
+ranking_client.simulate_trade used to read a strategy's holdings document
+and time_delta and write up to four update_one calls per (ticker,
+strategy), which is tens of thousands of round trips per cycle.
+RankingUnitOfWork loads every strategy's holdings document and time_delta
+once per cycle instead. Trades are applied to the in-memory documents, and
+commit flushes the whole cycle with one ordered bulk_write per collection
+(algorithm_holdings, then points_tally) inside a transaction. Either every
+trade of the cycle is stored or none is, so a crash mid-flush cannot apply
+half a cycle or double count the $inc counters on a retry.
+
+Each strategy's account has its own lock. Ticker threads trading different
+strategies never wait on each other, and two tickers trading the same
+strategy apply their trades one after the other to the same document, so
+neither overwrites the other.
+
+Writes are field-level: only the holdings.<ticker> entries a cycle traded
+are $set (or $unset when sold out), and cash, trade counters and points
+are $inc'ed by the cycle's change. A commit therefore leaves holdings and
+cash changes made by other writers (another client, or an abandoned
+ticker of an earlier cycle) in place instead of overwriting the whole
+holdings map. Tickers that cannot be a field path (containing "." or
+starting with "$") fall back to a $set of the strategy's whole map.
+
+commit closes the unit of work before taking its snapshot of the pending
+writes. Tickers the cycle executor abandoned keep running, and a trade they
+try to apply after that is rejected and logged instead of being wiped by
+the commit or applied to a unit of work nobody commits.
+
+Without a replica set (no transactions), commit falls back to the same
+ordered writes without a transaction.
+"""
+
+import logging
+import threading
+from collections import Counter
+from datetime import datetime
+
+from pymongo import UpdateOne
+from pymongo.errors import OperationFailure
+
+# Server error code for transactions on a standalone server.
+_ILLEGAL_OPERATION = 20
+
+
+class RankingUnitOfWork:
+    """
+    Strategy holdings, cash, trade counters and points for one cycle.
+
+    Args:
+        holdings_docs (iterable): algorithm_holdings documents.
+        time_delta (float): The cycle's time_delta.
+    """
+
+    def __init__(self, holdings_docs, time_delta):
+        self.time_delta = time_delta
+        self.strategies = {doc["strategy"]: doc for doc in holdings_docs}
+        for doc in self.strategies.values():
+            doc.setdefault("holdings", {})
+        # Per-strategy state, created up front so threads only ever touch
+        # the entries of the strategy whose lock they hold.
+        self._locks = {name: threading.RLock() for name in self.strategies}
+        self._tickers = {name: set() for name in self.strategies}
+        self._cash = {name: 0.0 for name in self.strategies}
+        self._counters = {name: Counter() for name in self.strategies}
+        # None until the strategy sells in this cycle.
+        self._points = {name: None for name in self.strategies}
+        self._last_updated = {name: None for name in self.strategies}
+        self.closed = False
+        self.rejected = 0
+
+    @classmethod
+    def load(cls, mongo_client):
+        """
+        Reads every strategy's holdings and time_delta in two queries.
+        """
+        db = mongo_client.trading_simulator
+        return cls(
+            db.algorithm_holdings.find({}), db.time_delta.find_one({})["time_delta"]
+        )
+
+    @classmethod
+    async def load_async(cls, motor_client):
+        """
+        load for a motor client.
+        """
+        db = motor_client.trading_simulator
+        holdings_docs = await db.algorithm_holdings.find({}).to_list(None)
+        return cls(holdings_docs, (await db.time_delta.find_one({}))["time_delta"])
+
+    def strategy_doc(self, strategy_name):
+        """
+        Returns the strategy's in-memory holdings document, or None if it is
+        not in the database. Read it under lock(strategy_name).
+        """
+        return self.strategies.get(strategy_name)
+
+    def lock(self, strategy_name):
+        """
+        Returns the lock owning the strategy's account. Hold it from reading
+        the strategy document until its trade is applied.
+        """
+        return self._locks[strategy_name]
+
+    def close(self):
+        """
+        Stops accepting trades. A trade already being applied holds its
+        strategy's lock, so operations waits for it and includes it.
+        """
+        self.closed = True
+
+    def _accepts(self, strategy_name, ticker):
+        """
+        Returns False, and logs the trade, if the unit of work is closed.
+        The caller holds the strategy's lock.
+        """
+        if not self.closed:
+            return True
+        self.rejected += 1
+        logging.warning(
+            f"Rejected late trade of {strategy_name} on {ticker}: "
+            "the cycle's trades are already committed."
+        )
+        return False
+
+    def buy(self, strategy_name, ticker, quantity, price):
+        """
+        Adds quantity at price to the strategy's holding, averaging the price
+        with what it already holds, and pays for it in cash.
+
+        Returns False if the trade was rejected because the unit of work is
+        closed.
+        """
+        with self._locks[strategy_name]:
+            if not self._accepts(strategy_name, ticker):
+                return False
+            doc = self.strategies[strategy_name]
+            holdings = doc["holdings"]
+            if ticker in holdings:
+                current_qty = holdings[ticker]["quantity"]
+                new_qty = current_qty + quantity
+                average_price = (
+                    holdings[ticker]["price"] * current_qty + price * quantity
+                ) / new_qty
+            else:
+                new_qty = quantity
+                average_price = price
+            holdings[ticker] = {"quantity": new_qty, "price": average_price}
+            doc["amount_cash"] -= quantity * price
+            self._cash[strategy_name] -= quantity * price
+            self._trade(strategy_name, ticker, "total_trades")
+            return True
+
+    def sell(self, strategy_name, ticker, quantity, price, points, outcome):
+        """
+        Sells quantity of the strategy's holding at price and records the
+        trade's points. A holding sold down to zero is removed.
+
+        outcome is the counter to increment: "successful_trades",
+        "neutral_trades" or "failed_trades". Returns False if the trade was
+        rejected because the unit of work is closed.
+        """
+        with self._locks[strategy_name]:
+            if not self._accepts(strategy_name, ticker):
+                return False
+            doc = self.strategies[strategy_name]
+            holdings = doc["holdings"]
+            holdings[ticker]["quantity"] -= quantity
+            if holdings[ticker]["quantity"] == 0:
+                del holdings[ticker]
+            doc["amount_cash"] += quantity * price
+            self._cash[strategy_name] += quantity * price
+            self._points[strategy_name] = (self._points[strategy_name] or 0.0) + points
+            self._trade(strategy_name, ticker, "total_trades", outcome)
+            return True
+
+    def _trade(self, strategy_name, ticker, *counters):
+        self._tickers[strategy_name].add(ticker)
+        self._counters[strategy_name].update(counters)
+        self._last_updated[strategy_name] = datetime.now()
+
+    def _holdings_update(self, strategy_name):
+        """
+        Returns the algorithm_holdings update for a traded strategy.
+        """
+        holdings = self.strategies[strategy_name]["holdings"]
+        tickers = sorted(self._tickers[strategy_name])
+        fields = {"last_updated": self._last_updated[strategy_name]}
+        unset = {}
+        if all("." not in ticker and not ticker.startswith("$") for ticker in tickers):
+            for ticker in tickers:
+                if ticker in holdings:
+                    fields[f"holdings.{ticker}"] = dict(holdings[ticker])
+                else:
+                    unset[f"holdings.{ticker}"] = ""
+        else:
+            fields["holdings"] = {
+                ticker: dict(holding) for ticker, holding in holdings.items()
+            }
+        update = {
+            "$set": fields,
+            "$inc": {
+                "amount_cash": self._cash[strategy_name],
+                **self._counters[strategy_name],
+            },
+        }
+        if unset:
+            update["$unset"] = unset
+        return update
+
+    def operations(self):
+        """
+        Returns the cycle's pending writes as
+        (algorithm_holdings operations, points_tally operations).
+        """
+        holdings_ops, points_ops = [], []
+        for name in sorted(self.strategies):
+            with self._locks[name]:
+                if not self._tickers[name]:
+                    continue
+                holdings_ops.append(
+                    UpdateOne({"strategy": name}, self._holdings_update(name))
+                )
+                if self._points[name] is not None:
+                    points_ops.append(
+                        UpdateOne(
+                            {"strategy": name},
+                            {
+                                "$set": {"last_updated": self._last_updated[name]},
+                                "$inc": {"total_points": self._points[name]},
+                            },
+                            upsert=True,
+                        )
+                    )
+        return holdings_ops, points_ops
+
+    def _clear(self):
+        for name in self.strategies:
+            with self._locks[name]:
+                self._tickers[name].clear()
+                self._cash[name] = 0.0
+                self._counters[name].clear()
+                self._points[name] = None
+                self._last_updated[name] = None
+
+    def commit(self, mongo_client, logger):
+        """
+        Closes the unit of work, writes the pending changes in one
+        transaction and clears them.
+
+        Returns the number of strategies written.
+        """
+        self.close()
+        holdings_ops, points_ops = self.operations()
+        if not holdings_ops:
+            return 0
+        db = mongo_client.trading_simulator
+
+        def write(session=None):
+            db.algorithm_holdings.bulk_write(
+                holdings_ops, ordered=True, session=session
+            )
+            if points_ops:
+                db.points_tally.bulk_write(points_ops, ordered=True, session=session)
+
+        try:
+            with mongo_client.start_session() as session:
+                session.with_transaction(write)
+        except OperationFailure as e:
+            if e.code != _ILLEGAL_OPERATION:
+                raise
+            logger.warning(
+                f"Transactions are not supported, committing without one: {e}"
+            )
+            write()
+        self._clear()
+        logger.info(f"Committed trades of {len(holdings_ops)} strategies.")
+        return len(holdings_ops)
+
+    async def commit_async(self, motor_client, logger):
+        """
+        commit for a motor client.
+        """
+        self.close()
+        holdings_ops, points_ops = self.operations()
+        if not holdings_ops:
+            return 0
+        db = motor_client.trading_simulator
+
+        async def write(session=None):
+            await db.algorithm_holdings.bulk_write(
+                holdings_ops, ordered=True, session=session
+            )
+            if points_ops:
+                await db.points_tally.bulk_write(
+                    points_ops, ordered=True, session=session
+                )
+
+        try:
+            async with await motor_client.start_session() as session:
+                await session.with_transaction(write)
+        except OperationFailure as e:
+            if e.code != _ILLEGAL_OPERATION:
+                raise
+            logger.warning(
+                f"Transactions are not supported, committing without one: {e}"
+            )
+            await write()
+        self._clear()
+        logger.info(f"Committed trades of {len(holdings_ops)} strategies.")
+        return len(holdings_ops)
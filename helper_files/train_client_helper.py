@@ -1,25 +1,90 @@
 import os
 import sys
-from datetime import timedelta
+from datetime import date, timedelta
 
 import matplotlib.pyplot as plt
 import numpy as np
 import quantstats as qs
 
 from control import benchmark_asset
+from helper_files.history_provider import PERIOD_DAYS
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
 
-def get_historical_data(ticker, current_date, period, ticker_price_history):
-    period_start_date = {
-        "1mo": current_date - timedelta(days=30),
-        "3mo": current_date - timedelta(days=90),
-        "6mo": current_date - timedelta(days=180),
-        "1y": current_date - timedelta(days=365),
-        "2y": current_date - timedelta(days=730),
-    }
-    start_date = period_start_date[period]
+
+class HistoryWindowIndex:
+    """
+    Integer [start, end) row offsets of every period window of one ticker's
+    price history, built once so lookups need no date parsing or label slicing.
+
+    A window covers the calendar days current_date - PERIOD_DAYS[period]
+    through current_date inclusive, the same rows as the label slice in
+    get_historical_data.
+    """
+
+    def __init__(self, history, periods=PERIOD_DAYS):
+        index = history.index
+        if getattr(index, "tz", None) is not None:
+            index = index.tz_localize(None)
+        # Calendar day numbers (in the index's own timezone) of each row.
+        self.days = index.values.astype("datetime64[D]").astype(np.int64)
+        self.row_of_day = {day: i for i, day in enumerate(self.days.tolist())}
+        self.ends = np.searchsorted(self.days, self.days, side="right")
+        self.starts = {
+            period: np.searchsorted(self.days, self.days - PERIOD_DAYS[period])
+            for period in periods
+        }
+        self.columns = {
+            column: history[column].to_numpy(copy=False) for column in history.columns
+        }
+
+    @staticmethod
+    def _day_number(current_date):
+        return current_date.toordinal() - _EPOCH_ORDINAL
+
+    def window(self, period, current_date):
+        """
+        Returns the (start, end) row offsets of the period window ending on current_date.
+        """
+        day = self._day_number(current_date)
+        row = self.row_of_day.get(day)
+        if row is not None and period in self.starts:
+            return int(self.starts[period][row]), int(self.ends[row])
+        return (
+            int(np.searchsorted(self.days, day - PERIOD_DAYS[period])),
+            int(np.searchsorted(self.days, day, side="right")),
+        )
+
+    def arrays(self, period, current_date):
+        """
+        Returns the window as {column: ndarray} views of the price history.
+        """
+        start, end = self.window(period, current_date)
+        return {column: values[start:end] for column, values in self.columns.items()}
+
+
+def build_window_indexes(ticker_price_history, tickers):
+    """
+    Builds a HistoryWindowIndex for every ticker that has price history.
+    """
+    window_indexes = {}
+    for ticker in tickers:
+        history = ticker_price_history.get(ticker)
+        if history is not None:
+            window_indexes[ticker] = HistoryWindowIndex(history)
+    return window_indexes
+
+
+def get_historical_data(
+    ticker, current_date, period, ticker_price_history, window_index=None
+):
+    if window_index is not None:
+        start, end = window_index.window(period, current_date)
+        return ticker_price_history[ticker].iloc[start:end]
+
+    start_date = current_date - timedelta(days=PERIOD_DAYS[period])
 
     return ticker_price_history[ticker].loc[
         start_date.strftime("%Y-%m-%d") : current_date.strftime("%Y-%m-%d")
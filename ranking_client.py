@@ -1,14 +1,21 @@
+import asyncio
 import heapq
 import logging
 import threading
 import time
-from datetime import datetime
+from functools import partial
 
 import certifi
+from alpaca.data.historical.stock import StockHistoricalDataClient
 from pymongo import MongoClient
 
-from config import FINANCIAL_PREP_API_KEY, mongo_url
+from config import API_KEY, API_SECRET, FINANCIAL_PREP_API_KEY, mongo_url
 from control import (
+    live_async_concurrency,
+    live_cycle_timeout,
+    live_execution_mode,
+    live_max_workers,
+    live_task_timeout,
     loss_price_change_ratio_d1,
     loss_price_change_ratio_d2,
     loss_profit_time_d1,
@@ -26,8 +33,26 @@ from control import (
     time_delta_mode,
     time_delta_multiplicative,
 )
-from helper_files.client_helper import get_latest_price, get_ndaq_tickers, strategies
-from strategies.talib_indicators import get_data, simulate_strategy
+from helper_files.async_client_helper import (
+    connect_to_motor,
+    gather_bounded,
+    get_histories_async,
+    get_latest_price_async,
+)
+from helper_files.client_helper import (
+    get_latest_price,
+    get_ndaq_tickers,
+    quote_service,
+    strategies,
+    wait_for_price,
+)
+from helper_files.cycle_executor import CycleExecutor
+from helper_files.history_provider import HistoryProvider
+from helper_files.ideal_periods import IdealPeriodRegistry
+from helper_files.quote_service import alpaca_latest_prices
+from helper_files.ranking_unit_of_work import RankingUnitOfWork
+from strategies.signals import BUY, SELL, signal_name
+from strategies.talib_indicators import simulate_strategy
 
 ca = certifi.where()
 
@@ -42,60 +67,44 @@ logging.basicConfig(
 )
 
 
-def process_ticker(ticker, mongo_client):
+def process_ticker(ticker, histories, unit_of_work, ideal_periods, cancel_event=None):
+    """
+    Simulates every strategy's trade on a ticker into the cycle's unit of
+    work, reading its histories from the cycle's HistoryProvider.
+    cancel_event is set by the cycle executor when the cycle stops waiting
+    for this ticker.
+    """
+    if cancel_event is None:
+        cancel_event = threading.Event()
     try:
-        current_price = None
-        while current_price is None:
-            try:
-                current_price = get_latest_price(ticker)
-            except Exception as fetch_error:
-                logging.warning(
-                    f"Error fetching price for {ticker}. Retrying... {fetch_error}"
-                )
+        current_price = wait_for_price(ticker, cancel_event)
+        if current_price is None:
+            return
 
-                return
-
-        indicator_tb = mongo_client.IndicatorsDatabase
-        indicator_collection = indicator_tb.Indicators
         for strategy in strategies:
+            if cancel_event.is_set():
+                return
             historical_data = None
             while historical_data is None:
                 try:
-                    period = indicator_collection.find_one(
-                        {"indicator": strategy.__name__}
-                    )
-                    historical_data = get_data(
-                        ticker, mongo_client, period["ideal_period"]
+                    historical_data = histories.get(
+                        ticker, ideal_periods[strategy.__name__]
                     )
                 except Exception as fetch_error:
                     logging.warning(
                         f"Error fetching historical data for {ticker}. Retrying... {fetch_error}"
                     )
-                    time.sleep(60)
-            db = mongo_client.trading_simulator
-            holdings_collection = db.algorithm_holdings
+                    if cancel_event.wait(60):
+                        return
             print(f"Processing {strategy.__name__} for {ticker}")
-            strategy_doc = holdings_collection.find_one({"strategy": strategy.__name__})
-            if not strategy_doc:
+            if unit_of_work.strategy_doc(strategy.__name__) is None:
                 logging.warning(
                     f"Strategy {strategy.__name__} not in database. Skipping."
                 )
                 continue
 
-            account_cash = strategy_doc["amount_cash"]
-            total_portfolio_value = strategy_doc["portfolio_value"]
-
-            portfolio_qty = strategy_doc["holdings"].get(ticker, {}).get("quantity", 0)
-
             simulate_trade(
-                ticker,
-                strategy,
-                historical_data,
-                current_price,
-                account_cash,
-                portfolio_qty,
-                total_portfolio_value,
-                mongo_client,
+                ticker, strategy, historical_data, current_price, unit_of_work
             )
 
         print(f"{ticker} processing completed.")
@@ -103,181 +112,145 @@ def process_ticker(ticker, mongo_client):
         logging.error(f"Error in thread for {ticker}: {e}")
 
 
-def simulate_trade(
-    ticker,
-    strategy,
-    historical_data,
-    current_price,
-    account_cash,
-    portfolio_qty,
-    total_portfolio_value,
-    mongo_client,
-):
+def trade_points(current_price, purchase_price, time_delta):
     """
-    Simulates a trade based on the given strategy and updates MongoDB.
+    Returns (points, outcome counter) for selling at current_price a holding
+    bought at purchase_price.
     """
-
-    # Simulate trading action from strategy
-    print(
-        f"Simulating trade for {ticker} with strategy {strategy.__name__} and quantity of {portfolio_qty}"
-    )
-    action, quantity = simulate_strategy(
-        strategy,
-        ticker,
-        current_price,
-        historical_data,
-        account_cash,
-        portfolio_qty,
-        total_portfolio_value,
-    )
-
-    # MongoDB setup
-
-    db = mongo_client.trading_simulator
-    holdings_collection = db.algorithm_holdings
-    points_collection = db.points_tally
-
-    # Find the strategy document in MongoDB
-    strategy_doc = holdings_collection.find_one({"strategy": strategy.__name__})
-    holdings_doc = strategy_doc.get("holdings", {})
-    time_delta = db.time_delta.find_one({})["time_delta"]
-
-    # Update holdings and cash based on trade action
-    if (
-        action in ["buy"]
-        and strategy_doc["amount_cash"] - quantity * current_price
-        > rank_liquidity_limit
-        and quantity > 0
-        and ((portfolio_qty + quantity) * current_price) / total_portfolio_value
-        < rank_asset_limit
-    ):
-        logging.info(
-            f"Action: {action} | Ticker: {ticker} | Quantity: {quantity} | Price: {current_price}"
-        )
-        # Calculate average price if already holding some shares of the ticker
-        if ticker in holdings_doc:
-            current_qty = holdings_doc[ticker]["quantity"]
-            new_qty = current_qty + quantity
-            average_price = (
-                holdings_doc[ticker]["price"] * current_qty + current_price * quantity
-            ) / new_qty
+    price_change_ratio = current_price / purchase_price
+    if current_price > purchase_price:
+        # Calculate points to add if the current price is higher than the purchase price
+        if price_change_ratio < profit_price_change_ratio_d1:
+            points = time_delta * profit_profit_time_d1
+        elif price_change_ratio < profit_price_change_ratio_d2:
+            points = time_delta * profit_profit_time_d2
         else:
-            new_qty = quantity
-            average_price = current_price
+            points = time_delta * profit_profit_time_else
+        return points, "successful_trades"
+
+    # Calculate points to deduct if the current price is lower than the purchase price
+    if price_change_ratio > loss_price_change_ratio_d1:
+        points = -time_delta * loss_profit_time_d1
+    elif price_change_ratio > loss_price_change_ratio_d2:
+        points = -time_delta * loss_profit_time_d2
+    else:
+        points = -time_delta * loss_profit_time_else
+    if purchase_price == current_price:
+        return points, "neutral_trades"
+    return points, "failed_trades"
 
-        # Update the holdings document for the ticker.
-        holdings_doc[ticker] = {"quantity": new_qty, "price": average_price}
 
-        # Deduct the cash used for buying and increment total trades
-        holdings_collection.update_one(
-            {"strategy": strategy.__name__},
-            {
-                "$set": {
-                    "holdings": holdings_doc,
-                    "amount_cash": strategy_doc["amount_cash"]
-                    - quantity * current_price,
-                    "last_updated": datetime.now(),
-                },
-                "$inc": {"total_trades": 1},
-            },
-            upsert=True,
+def simulate_trade(ticker, strategy, historical_data, current_price, unit_of_work):
+    """
+    Simulates a trade based on the given strategy and applies it to the
+    cycle's unit of work, which writes it to MongoDB on commit.
+    """
+    # Only tickers trading the same strategy wait on each other here.
+    with unit_of_work.lock(strategy.__name__):
+        strategy_doc = unit_of_work.strategy_doc(strategy.__name__)
+        holdings_doc = strategy_doc["holdings"]
+        account_cash = strategy_doc["amount_cash"]
+        total_portfolio_value = strategy_doc["portfolio_value"]
+        portfolio_qty = holdings_doc.get(ticker, {}).get("quantity", 0)
+
+        # Simulate trading action from strategy
+        print(
+            f"Simulating trade for {ticker} with strategy {strategy.__name__} and quantity of {portfolio_qty}"
         )
-
-    elif (
-        action in ["sell"]
-        and str(ticker) in holdings_doc
-        and holdings_doc[str(ticker)]["quantity"] > 0
-    ):
-        logging.info(
-            f"Action: {action} | Ticker: {ticker} | Quantity: {quantity} | Price: {current_price}"
+        action, quantity = simulate_strategy(
+            strategy,
+            ticker,
+            current_price,
+            historical_data,
+            account_cash,
+            portfolio_qty,
+            total_portfolio_value,
         )
-        current_qty = holdings_doc[ticker]["quantity"]
 
-        # Ensure we do not sell more than we have
-        sell_qty = min(quantity, current_qty)
-        holdings_doc[ticker]["quantity"] = current_qty - sell_qty
+        # Update holdings and cash based on trade action
+        if (
+            action == BUY
+            and account_cash - quantity * current_price > rank_liquidity_limit
+            and quantity > 0
+            and ((portfolio_qty + quantity) * current_price) / total_portfolio_value
+            < rank_asset_limit
+        ):
+            logging.info(
+                f"Action: {signal_name(action)} | Ticker: {ticker} | Quantity: {quantity} | Price: {current_price}"
+            )
+            unit_of_work.buy(strategy.__name__, ticker, quantity, current_price)
 
-        price_change_ratio = (
-            current_price / holdings_doc[ticker]["price"]
-            if ticker in holdings_doc
-            else 1
-        )
+        elif action == SELL and portfolio_qty > 0:
+            logging.info(
+                f"Action: {signal_name(action)} | Ticker: {ticker} | Quantity: {quantity} | Price: {current_price}"
+            )
+            # Ensure we do not sell more than we have
+            sell_qty = min(quantity, portfolio_qty)
+            points, outcome = trade_points(
+                current_price, holdings_doc[ticker]["price"], unit_of_work.time_delta
+            )
+            unit_of_work.sell(
+                strategy.__name__, ticker, sell_qty, current_price, points, outcome
+            )
 
-        if current_price > holdings_doc[ticker]["price"]:
-            # increment successful trades
-            holdings_collection.update_one(
-                {"strategy": strategy.__name__},
-                {"$inc": {"successful_trades": 1}},
-                upsert=True,
+        else:
+            logging.info(
+                f"Action: {signal_name(action)} | Ticker: {ticker} | Quantity: {quantity} | Price: {current_price}"
             )
+    print(
+        f"Action: {signal_name(action)} | Ticker: {ticker} | Quantity: {quantity} | Price: {current_price}"
+    )
 
-            # Calculate points to add if the current price is higher than the purchase price
-            if price_change_ratio < profit_price_change_ratio_d1:
-                points = time_delta * profit_profit_time_d1
-            elif price_change_ratio < profit_price_change_ratio_d2:
-                points = time_delta * profit_profit_time_d2
-            else:
-                points = time_delta * profit_profit_time_else
 
-        else:
-            # Calculate points to deduct if the current price is lower than the purchase price
-            if holdings_doc[ticker]["price"] == current_price:
-                holdings_collection.update_one(
-                    {"strategy": strategy.__name__}, {"$inc": {"neutral_trades": 1}}
-                )
+async def process_ticker_async(ticker, motor_client, unit_of_work, ideal_periods):
+    """
+    process_ticker for the asyncio execution mode: database reads go through
+    motor and the ticker's history is read once, for its longest period.
+    """
+    current_price = await get_latest_price_async(ticker)
+    if current_price is None:
+        return
 
-            else:
-                holdings_collection.update_one(
-                    {"strategy": strategy.__name__},
-                    {"$inc": {"failed_trades": 1}},
-                    upsert=True,
-                )
+    histories = await get_histories_async(
+        ticker,
+        motor_client,
+        [ideal_periods[strategy.__name__] for strategy in strategies],
+        logging.getLogger(),
+    )
+    for strategy in strategies:
+        historical_data = histories.get(ideal_periods[strategy.__name__])
+        if historical_data is None:
+            continue
+        print(f"Processing {strategy.__name__} for {ticker}")
+        if unit_of_work.strategy_doc(strategy.__name__) is None:
+            logging.warning(f"Strategy {strategy.__name__} not in database. Skipping.")
+            continue
+        simulate_trade(ticker, strategy, historical_data, current_price, unit_of_work)
 
-            if price_change_ratio > loss_price_change_ratio_d1:
-                points = -time_delta * loss_profit_time_d1
-            elif price_change_ratio > loss_price_change_ratio_d2:
-                points = -time_delta * loss_profit_time_d2
-            else:
-                points = -time_delta * loss_profit_time_else
-
-        # Update the points tally
-        points_collection.update_one(
-            {"strategy": strategy.__name__},
-            {
-                "$set": {"last_updated": datetime.now()},
-                "$inc": {"total_points": points},
-            },
-            upsert=True,
-        )
-        if holdings_doc[ticker]["quantity"] == 0:
-            del holdings_doc[ticker]
-        # Update cash after selling
-        holdings_collection.update_one(
-            {"strategy": strategy.__name__},
-            {
-                "$set": {
-                    "holdings": holdings_doc,
-                    "amount_cash": strategy_doc["amount_cash"]
-                    + sell_qty * current_price,
-                    "last_updated": datetime.now(),
-                },
-                "$inc": {"total_trades": 1},
-            },
-            upsert=True,
-        )
+    print(f"{ticker} processing completed.")
 
-        # Remove the ticker if quantity reaches zero
-        if holdings_doc[ticker]["quantity"] == 0:
-            del holdings_doc[ticker]
 
-    else:
-        logging.info(
-            f"Action: {action} | Ticker: {ticker} | Quantity: {quantity} | Price: {current_price}"
-        )
-    print(
-        f"Action: {action} | Ticker: {ticker} | Quantity: {quantity} | Price: {current_price}"
+async def process_tickers_async(tickers, motor_client, ideal_periods):
+    """
+    Processes a cycle's tickers as coroutines, at most live_async_concurrency
+    at a time, and commits the cycle's trades.
+    """
+    _, unit_of_work = await asyncio.gather(
+        ideal_periods.refresh_async(motor_client),
+        RankingUnitOfWork.load_async(motor_client),
+    )
+    await gather_bounded(
+        process_ticker_async,
+        tickers,
+        motor_client,
+        unit_of_work,
+        ideal_periods,
+        concurrency=live_async_concurrency,
+        logger=logging.getLogger(),
+        task_timeout=live_task_timeout,
+        cycle_timeout=live_cycle_timeout,
     )
-    # Close the MongoDB connection
+    await unit_of_work.commit_async(motor_client, logging.getLogger())
 
 
 def update_portfolio_values(client):
@@ -288,31 +261,22 @@ def update_portfolio_values(client):
 
     db = client.trading_simulator
     holdings_collection = db.algorithm_holdings
+    strategy_docs = list(holdings_collection.find({}))
+    # Fetch every held ticker missing from the quote cache in one request
+    try:
+        quote_service.get_many(
+            {ticker for doc in strategy_docs for ticker in doc["holdings"]}
+        )
+    except Exception as e:
+        print(f"Error refreshing latest prices due to: {e}. Fetching per ticker...")
     # Update portfolio values
-    for strategy_doc in holdings_collection.find({}):
+    for strategy_doc in strategy_docs:
         # Calculate the portfolio value for the strategy
         portfolio_value = strategy_doc["amount_cash"]
 
         for ticker, holding in strategy_doc["holdings"].items():
-            # The current price can be gotten through a cache system maybe
-            # if polygon api is getting clogged - but that hasn't happened yet
-            # Also implement in C++ or C instead of python
-            # Get the current price of the ticker from the Polygon API
-            # Use a cache system to store the latest prices
-            # If the cache is empty, fetch the latest price from the Polygon API
-            # Cache should be updated every 60 seconds
-            current_price = None
-            while current_price is None:
-                try:
-                    # get latest price shouldn't cache - we should also do a delay
-                    current_price = get_latest_price(ticker)
-                except (
-                    Exception
-                ) as e:  # Replace 'Exception' with a more specific error if possible
-                    print(f"Error fetching price for {ticker} due to: {e}. Retrying...")
-                    break
-
-                    # Will sleep 120 seconds before retrying to get latest price
+            # Read from the shared quote cache filled above
+            current_price = get_latest_price(ticker)
             print(f"Current price of {ticker}: {current_price}")
             if current_price is None:
                 current_price = 0
@@ -407,34 +371,69 @@ def main():
     ndaq_tickers = []
     early_hour_first_iteration = True
     post_market_hour_first_iteration = True
+    executor = CycleExecutor(
+        live_max_workers, live_task_timeout, live_cycle_timeout, name="ranking"
+    )
+    # The database clients are long-lived and reused by every cycle.
+    mongo_client = MongoClient(mongo_url, tlsCAFile=ca)
+    # Latest prices come from Alpaca's batched latest trades endpoint.
+    quote_service.source = partial(
+        alpaca_latest_prices,
+        data_client=StockHistoricalDataClient(API_KEY, API_SECRET),
+    )
+    # Reloaded only when initialize_indicator_setup changes the periods.
+    ideal_periods = IdealPeriodRegistry()
+    event_loop = None
+    if live_execution_mode == "asyncio":
+        event_loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(event_loop)
+        motor_client = connect_to_motor(mongo_url)
 
     while True:
-        mongo_client = MongoClient(mongo_url, tlsCAFile=ca)
 
-        status = mongo_client.market_data.market_status.find_one({})["market_status"]
+        if event_loop is not None:
+            status = event_loop.run_until_complete(
+                motor_client.market_data.market_status.find_one({})
+            )["market_status"]
+        else:
+            status = mongo_client.market_data.market_status.find_one({})[
+                "market_status"
+            ]
 
         if status == "open":
-            # Connection pool is not thread safe. Create a new client for each thread.
-            # We can use ThreadPoolExecutor to manage threads - maybe use this but this risks clogging
-            # resources if we have too many threads or if a thread is on stall mode
-            # We can also use multiprocessing.Pool to manage threads
+            # Tickers run on a bounded pool (live_max_workers) and stalled tickers are
+            # abandoned after live_task_timeout, see helper_files/cycle_executor.py.
+            # With live_execution_mode = "asyncio" they run as coroutines instead.
 
             if not ndaq_tickers:
                 logging.info("Market is open. Processing strategies.")
                 ndaq_tickers = get_ndaq_tickers(mongo_client, FINANCIAL_PREP_API_KEY)
 
-            threads = []
-
-            for ticker in ndaq_tickers:
-                thread = threading.Thread(
-                    target=process_ticker, args=(ticker, mongo_client)
+            # Batched requests for every price this cycle reads.
+            try:
+                quote_service.refresh(ndaq_tickers)
+            except Exception as e:
+                logging.warning(
+                    f"Error refreshing latest prices, fetching them per ticker: {e}"
                 )
-                threads.append(thread)
-                thread.start()
 
-            # Wait for all threads to complete
-            for thread in threads:
-                thread.join()
+            if event_loop is not None:
+                event_loop.run_until_complete(
+                    process_tickers_async(ndaq_tickers, motor_client, ideal_periods)
+                )
+            else:
+                # Strategy state is read once and written once per cycle.
+                unit_of_work = RankingUnitOfWork.load(mongo_client)
+                ideal_periods.refresh(mongo_client)
+                executor.run(
+                    process_ticker,
+                    ndaq_tickers,
+                    HistoryProvider(mongo_client, ideal_periods.values()),
+                    unit_of_work,
+                    ideal_periods,
+                    logger=logging.getLogger(),
+                )
+                unit_of_work.commit(mongo_client, logging.getLogger())
 
             logging.info("Finished processing all strategies. Waiting for 30 seconds.")
             time.sleep(30)
@@ -489,7 +488,6 @@ def main():
         else:
             logging.error("An error occurred while checking market status.")
             time.sleep(60)
-        mongo_client.close()
 
 
 if __name__ == "__main__":
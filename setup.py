@@ -6,6 +6,7 @@ from pymongo import MongoClient, errors
 
 from config import API_KEY, API_SECRET, mongo_url
 from helper_files.client_helper import get_latest_price, strategies
+from helper_files.ideal_periods import bump_ideal_period_version
 
 indicator_periods = {
     "BBANDS_indicator": "1y",
@@ -289,6 +290,7 @@ def initialize_indicator_setup():
                 {"$set": {"ideal_period": period}},
                 upsert=True,
             )
+        bump_ideal_period_version(client)
 
         print("Indicators and their ideal periods are ensured in MongoDB.")
     except Exception as e:
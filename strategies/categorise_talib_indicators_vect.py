@@ -304,3 +304,56 @@ strategies = (
     + pattern_recognition
     + statistical_functions
 )
+
+# Warm-up: bars of price history a strategy needs before a date to
+# reproduce, on that date, the signal it gives with the full history.
+# Read from strategy.warmup by the incremental mode of
+# dbs/compute_store_strategy_decisions.py. None means the signal can depend
+# on the whole history, so the strategy is always run on all of it.
+WINDOW_WARMUP = 100  # rolling windows, longest is ICHIMOKU (52 + 26)
+RECURSIVE_WARMUP = 750  # EMA / Wilder smoothing, decays to exact
+ADAPTIVE_WARMUP = 1500  # adaptive smoothing and the Hilbert transform
+
+recursive_strategies = [
+    DEMA_indicator,
+    EMA_indicator,
+    KELTNER_indicator,
+    T3_indicator,
+    TEMA_indicator,
+    ADX_indicator,
+    ADXR_indicator,
+    CMO_indicator,
+    DX_indicator,
+    MACD_indicator,
+    MACDFIX_indicator,
+    PLUS_MINUS_DI_indicator,
+    MINUS_DM_indicator,
+    PLUS_DM_indicator,
+    RSI_indicator,
+    STOCHRSI_indicator,
+    TRIX_indicator,
+    ATR_indicator,
+    NATR_indicator,
+]
+adaptive_strategies = [
+    HT_TRENDLINE_indicator,
+    KAMA_indicator,
+    MAMA_indicator,
+] + cycle_indicators
+# Cumulative (AD, OBV) or path dependent (SAR) indicators.
+full_history_strategies = [
+    SAR_indicator,
+    SAREXT_indicator,
+    AD_indicator,
+    ADOSC_indicator,
+    OBV_indicator,
+]
+
+for strategy in strategies:
+    strategy.warmup = WINDOW_WARMUP
+for strategy in recursive_strategies:
+    strategy.warmup = RECURSIVE_WARMUP
+for strategy in adaptive_strategies:
+    strategy.warmup = ADAPTIVE_WARMUP
+for strategy in full_history_strategies:
+    strategy.warmup = None
@@ -0,0 +1,45 @@
+"""
+Integer trading signals shared by the strategies, the live clients, the
+simulator and the decision stores.
+
+Strategies return BUY, SELL or HOLD and every client compares those ints
+directly; MISSING marks a decision that was never computed (it fits the
+int8 decision arrays of TradeSim/decisions.py). The "Buy"/"Sell"/"Hold"
+strings are only produced for logs and stored documents (signal_name), and
+to_signal converts strings from older strategies or stored data.
+"""
+
+BUY = 1
+SELL = -1
+HOLD = 0
+MISSING = -128
+
+SIGNAL_NAMES = {BUY: "Buy", SELL: "Sell", HOLD: "Hold"}
+
+# Legacy action strings, in the spellings the clients used to pass around.
+_SIGNALS_BY_NAME = {
+    "Buy": BUY,
+    "Sell": SELL,
+    "Hold": HOLD,
+    "buy": BUY,
+    "sell": SELL,
+    "hold": HOLD,
+    "strong buy": BUY,
+    "strong sell": SELL,
+}
+
+
+def to_signal(action):
+    """
+    Returns the signal for an action: BUY/SELL/HOLD ints pass through and
+    legacy strings ("Buy", "sell", "strong buy", ...) are converted.
+    """
+    return _SIGNALS_BY_NAME.get(action, action)
+
+
+def signal_name(signal):
+    """
+    Returns "Buy", "Sell" or "Hold" for a signal, for logs and stored
+    documents.
+    """
+    return SIGNAL_NAMES.get(signal, str(signal))
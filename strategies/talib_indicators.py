@@ -2,11 +2,12 @@ import sys
 import time
 
 import numpy as np
-import pandas as pd
 import talib as ta
 import yfinance as yf
 
 from control import trade_asset_limit
+from helper_files.history_codec import decode_history, encode_history
+from strategies.signals import BUY, HOLD, SELL, to_signal
 from utils.session import limiter
 
 sys.path.append("..")
@@ -22,19 +23,12 @@ def get_data(ticker, mongo_client, period=None, start_date=None, end_date=None):
                 collection = db.HistoricalDatabase
                 data = collection.find_one({"ticker": ticker, "period": period})
                 if data:
-                    df = pd.DataFrame(data["data"])
-                    df["Date"] = pd.to_datetime(df["Date"])
-                    df.set_index("Date", inplace=True)
-                    return df
+                    return decode_history(data)
                 else:
                     ticker_obj = yf.Ticker(ticker, session=limiter)
                     data = ticker_obj.history(period=period)
 
-                    records = data.reset_index().to_dict("records")
-
-                    collection.insert_one(
-                        {"ticker": ticker, "period": period, "data": records}
-                    )
+                    collection.insert_one(encode_history(ticker, period, data))
 
                     print("Data fetched from Yahoo Finance")
                     return data
@@ -62,16 +56,16 @@ def simulate_strategy(
     total_portfolio_value,
 ):
     max_investment = total_portfolio_value * trade_asset_limit
-    action = strategy(ticker, historical_data)
+    action = to_signal(strategy(ticker, historical_data))
 
-    if action == "Buy":
-        return "buy", min(
+    if action == BUY:
+        return BUY, min(
             int(max_investment // current_price), int(account_cash // current_price)
         )
-    elif action == "Sell" and portfolio_qty > 0:
-        return "sell", min(portfolio_qty, max(1, int(portfolio_qty * 0.5)))
+    elif action == SELL and portfolio_qty > 0:
+        return SELL, min(portfolio_qty, max(1, int(portfolio_qty * 0.5)))
     else:
-        return "hold", 0
+        return HOLD, 0
 
 
 # Overlap Studies
@@ -82,11 +76,11 @@ def BBANDS_indicator(ticker, data):
 
     upper, middle, lower = ta.BBANDS(data["Close"], timeperiod=20)
     if data["Close"].iloc[-1] > upper.iloc[-1]:
-        return "Sell"
+        return SELL
     elif data["Close"].iloc[-1] < lower.iloc[-1]:
-        return "Buy"
+        return BUY
     else:
-        return "Hold"
+        return HOLD
 
 
 def DEMA_indicator(ticker, data):
@@ -94,11 +88,11 @@ def DEMA_indicator(ticker, data):
 
     dema = ta.DEMA(data["Close"], timeperiod=30)
     if data["Close"].iloc[-1] > dema.iloc[-1]:
-        return "Buy"
+        return BUY
     elif data["Close"].iloc[-1] < dema.iloc[-1]:
-        return "Sell"
+        return SELL
     else:
-        return "Hold"
+        return HOLD
 
 
 def EMA_indicator(ticker, data):
@@ -106,11 +100,11 @@ def EMA_indicator(ticker, data):
 
     ema = ta.EMA(data["Close"], timeperiod=30)
     if data["Close"].iloc[-1] > ema.iloc[-1]:
-        return "Buy"
+        return BUY
     elif data["Close"].iloc[-1] < ema.iloc[-1]:
-        return "Sell"
+        return SELL
     else:
-        return "Hold"
+        return HOLD
 
 
 def HT_TRENDLINE_indicator(ticker, data):
@@ -118,11 +112,11 @@ def HT_TRENDLINE_indicator(ticker, data):
 
     ht_trendline = ta.HT_TRENDLINE(data["Close"])
     if data["Close"].iloc[-1] > ht_trendline.iloc[-1]:
-        return "Buy"
+        return BUY
     elif data["Close"].iloc[-1] < ht_trendline.iloc[-1]:
-        return "Sell"
+        return SELL
     else:
-        return "Hold"
+        return HOLD
 
 
 def KAMA_indicator(ticker, data):
@@ -130,11 +124,11 @@ def KAMA_indicator(ticker, data):
 
     kama = ta.KAMA(data["Close"], timeperiod=30)
     if data["Close"].iloc[-1] > kama.iloc[-1]:
-        return "Buy"
+        return BUY
     elif data["Close"].iloc[-1] < kama.iloc[-1]:
-        return "Sell"
+        return SELL
     else:
-        return "Hold"
+        return HOLD
 
 
 def MA_indicator(ticker, data):
@@ -142,11 +136,11 @@ def MA_indicator(ticker, data):
 
     ma = ta.MA(data["Close"], timeperiod=30, matype=0)
     if data["Close"].iloc[-1] > ma.iloc[-1]:
-        return "Buy"
+        return BUY
     elif data["Close"].iloc[-1] < ma.iloc[-1]:
-        return "Sell"
+        return SELL
     else:
-        return "Hold"
+        return HOLD
 
 
 def MAMA_indicator(ticker, data):
@@ -157,7 +151,7 @@ def MAMA_indicator(ticker, data):
     - ticker (str): Stock ticker symbol.
 
     Returns:
-    - str: 'Buy', 'Sell', or 'Hold'.
+    - int: BUY, SELL or HOLD (see strategies.signals).
     """
 
     close_prices = data["Close"].values
@@ -179,11 +173,11 @@ def MAMA_indicator(ticker, data):
 
     # Generate signal
     if current_price > current_mama:
-        return "Buy"
+        return BUY
     elif current_price < current_mama:
-        return "Sell"
+        return SELL
     else:
-        return "Hold"
+        return HOLD
 
 
 def MAVP_indicator(ticker, data):
@@ -194,7 +188,7 @@ def MAVP_indicator(ticker, data):
     - ticker (str): Stock ticker symbol.
 
     Returns:
-    - str: 'Buy', 'Sell', or 'Hold'.
+    - int: BUY, SELL or HOLD (see strategies.signals).
     """
 
     close_prices = data["Close"].values
@@ -217,11 +211,11 @@ def MAVP_indicator(ticker, data):
 
     # Generate signal
     if current_price > current_mavp:
-        return "Buy"
+        return BUY
     elif current_price < current_mavp:
-        return "Sell"
+        return SELL
     else:
-        return "Hold"
+        return HOLD
 
 
 def MIDPOINT_indicator(ticker, data):
@@ -229,11 +223,11 @@ def MIDPOINT_indicator(ticker, data):
 
     midpoint = ta.MIDPOINT(data["Close"], timeperiod=14)
     if data["Close"].iloc[-1] > midpoint.iloc[-1]:
-        return "Buy"
+        return BUY
     elif data["Close"].iloc[-1] < midpoint.iloc[-1]:
-        return "Sell"
+        return SELL
     else:
-        return "Hold"
+        return HOLD
 
 
 def MIDPRICE_indicator(ticker, data):
@@ -241,11 +235,11 @@ def MIDPRICE_indicator(ticker, data):
 
     midprice = ta.MIDPRICE(data["High"], data["Low"], timeperiod=14)
     if data["Close"].iloc[-1] > midprice.iloc[-1]:
-        return "Buy"
+        return BUY
     elif data["Close"].iloc[-1] < midprice.iloc[-1]:
-        return "Sell"
+        return SELL
     else:
-        return "Hold"
+        return HOLD
 
 
 def SAR_indicator(ticker, data):
@@ -253,11 +247,11 @@ def SAR_indicator(ticker, data):
 
     sar = ta.SAR(data["High"], data["Low"], acceleration=0, maximum=0)
     if data["Close"].iloc[-1] > sar.iloc[-1]:
-        return "Buy"
+        return BUY
     elif data["Close"].iloc[-1] < sar.iloc[-1]:
-        return "Sell"
+        return SELL
     else:
-        return "Hold"
+        return HOLD
 
 
 def SAREXT_indicator(ticker, data):
@@ -276,11 +270,11 @@ def SAREXT_indicator(ticker, data):
         accelerationmaxshort=0,
     )
     if data["Close"].iloc[-1] > sarext.iloc[-1]:
-        return "Buy"
+        return BUY
     elif data["Close"].iloc[-1] < sarext.iloc[-1]:
-        return "Sell"
+        return SELL
     else:
-        return "Hold"
+        return HOLD
 
 
 def SMA_indicator(ticker, data):
@@ -288,11 +282,11 @@ def SMA_indicator(ticker, data):
 
     sma = ta.SMA(data["Close"], timeperiod=30)
     if data["Close"].iloc[-1] > sma.iloc[-1]:
-        return "Buy"
+        return BUY
     elif data["Close"].iloc[-1] < sma.iloc[-1]:
-        return "Sell"
+        return SELL
     else:
-        return "Hold"
+        return HOLD
 
 
 def T3_indicator(ticker, data):
@@ -300,11 +294,11 @@ def T3_indicator(ticker, data):
 
     t3 = ta.T3(data["Close"], timeperiod=30, vfactor=0)
     if data["Close"].iloc[-1] > t3.iloc[-1]:
-        return "Buy"
+        return BUY
     elif data["Close"].iloc[-1] < t3.iloc[-1]:
-        return "Sell"
+        return SELL
     else:
-        return "Hold"
+        return HOLD
 
 
 def TEMA_indicator(ticker, data):
@@ -312,11 +306,11 @@ def TEMA_indicator(ticker, data):
 
     tema = ta.TEMA(data["Close"], timeperiod=30)
     if data["Close"].iloc[-1] > tema.iloc[-1]:
-        return "Buy"
+        return BUY
     elif data["Close"].iloc[-1] < tema.iloc[-1]:
-        return "Sell"
+        return SELL
     else:
-        return "Hold"
+        return HOLD
 
 
 def TRIMA_indicator(ticker, data):
@@ -324,11 +318,11 @@ def TRIMA_indicator(ticker, data):
 
     trima = ta.TRIMA(data["Close"], timeperiod=30)
     if data["Close"].iloc[-1] > trima.iloc[-1]:
-        return "Buy"
+        return BUY
     elif data["Close"].iloc[-1] < trima.iloc[-1]:
-        return "Sell"
+        return SELL
     else:
-        return "Hold"
+        return HOLD
 
 
 def WMA_indicator(ticker, data):
@@ -336,11 +330,11 @@ def WMA_indicator(ticker, data):
 
     wma = ta.WMA(data["Close"], timeperiod=30)
     if data["Close"].iloc[-1] > wma.iloc[-1]:
-        return "Buy"
+        return BUY
     elif data["Close"].iloc[-1] < wma.iloc[-1]:
-        return "Sell"
+        return SELL
     else:
-        return "Hold"
+        return HOLD
 
 
 # Momentum Indicators
@@ -351,11 +345,11 @@ def ADX_indicator(ticker, data):
 
     adx = ta.ADX(data["High"], data["Low"], data["Close"], timeperiod=14)
     if adx.iloc[-1] > 25:
-        return "Buy"
+        return BUY
     elif adx.iloc[-1] < 20:
-        return "Sell"
+        return SELL
     else:
-        return "Hold"
+        return HOLD
 
 
 def ADXR_indicator(ticker, data):
@@ -363,11 +357,11 @@ def ADXR_indicator(ticker, data):
 
     adxr = ta.ADXR(data["High"], data["Low"], data["Close"], timeperiod=14)
     if adxr.iloc[-1] > 25:
-        return "Buy"
+        return BUY
     elif adxr.iloc[-1] < 20:
-        return "Sell"
+        return SELL
     else:
-        return "Hold"
+        return HOLD
 
 
 def APO_indicator(ticker, data):
@@ -375,11 +369,11 @@ def APO_indicator(ticker, data):
 
     apo = ta.APO(data["Close"], fastperiod=12, slowperiod=26, matype=0)
     if apo.iloc[-1] > 0:
-        return "Buy"
+        return BUY
     elif apo.iloc[-1] < 0:
-        return "Sell"
+        return SELL
     else:
-        return "Hold"
+        return HOLD
 
 
 def AROON_indicator(ticker, data):
@@ -387,11 +381,11 @@ def AROON_indicator(ticker, data):
 
     aroon_down, aroon_up = ta.AROON(data["High"], data["Low"], timeperiod=14)
     if aroon_up.iloc[-1] > 70:
-        return "Buy"
+        return BUY
     elif aroon_down.iloc[-1] > 70:
-        return "Sell"
+        return SELL
     else:
-        return "Hold"
+        return HOLD
 
 
 def AROONOSC_indicator(ticker, data):
@@ -399,11 +393,11 @@ def AROONOSC_indicator(ticker, data):
 
     aroonosc = ta.AROONOSC(data["High"], data["Low"], timeperiod=14)
     if aroonosc.iloc[-1] > 0:
-        return "Buy"
+        return BUY
     elif aroonosc.iloc[-1] < 0:
-        return "Sell"
+        return SELL
     else:
-        return "Hold"
+        return HOLD
 
 
 def BOP_indicator(ticker, data):
@@ -411,11 +405,11 @@ def BOP_indicator(ticker, data):
 
     bop = ta.BOP(data["Open"], data["High"], data["Low"], data["Close"])
     if bop.iloc[-1] > 0:
-        return "Buy"
+        return BUY
     elif bop.iloc[-1] < 0:
-        return "Sell"
+        return SELL
     else:
-        return "Hold"
+        return HOLD
 
 
 def CCI_indicator(ticker, data):
@@ -423,11 +417,11 @@ def CCI_indicator(ticker, data):
 
     cci = ta.CCI(data["High"], data["Low"], data["Close"], timeperiod=14)
     if cci.iloc[-1] > 100:
-        return "Buy"
+        return BUY
     elif cci.iloc[-1] < -100:
-        return "Sell"
+        return SELL
     else:
-        return "Hold"
+        return HOLD
 
 
 def CMO_indicator(ticker, data):
@@ -435,11 +429,11 @@ def CMO_indicator(ticker, data):
 
     cmo = ta.CMO(data["Close"], timeperiod=14)
     if cmo.iloc[-1] > 50:
-        return "Buy"
+        return BUY
     elif cmo.iloc[-1] < -50:
-        return "Sell"
+        return SELL
     else:
-        return "Hold"
+        return HOLD
 
 
 def DX_indicator(ticker, data):
@@ -447,11 +441,11 @@ def DX_indicator(ticker, data):
 
     dx = ta.DX(data["High"], data["Low"], data["Close"], timeperiod=14)
     if dx.iloc[-1] > 25:
-        return "Buy"
+        return BUY
     elif dx.iloc[-1] < 20:
-        return "Sell"
+        return SELL
     else:
-        return "Hold"
+        return HOLD
 
 
 def MACD_indicator(ticker, data):
@@ -461,11 +455,11 @@ def MACD_indicator(ticker, data):
         data["Close"], fastperiod=12, slowperiod=26, signalperiod=9
     )
     if macdhist.iloc[-1] > 0:
-        return "Buy"
+        return BUY
     elif macdhist.iloc[-1] < 0:
-        return "Sell"
+        return SELL
     else:
-        return "Hold"
+        return HOLD
 
 
 def MACDEXT_indicator(ticker, data):
@@ -481,11 +475,11 @@ def MACDEXT_indicator(ticker, data):
         signalmatype=0,
     )
     if macdhist.iloc[-1] > 0:
-        return "Buy"
+        return BUY
     elif macdhist.iloc[-1] < 0:
-        return "Sell"
+        return SELL
     else:
-        return "Hold"
+        return HOLD
 
 
 def MACDFIX_indicator(ticker, data):
@@ -493,11 +487,11 @@ def MACDFIX_indicator(ticker, data):
 
     macd, macdsignal, macdhist = ta.MACDFIX(data["Close"], signalperiod=9)
     if macdhist.iloc[-1] > 0:
-        return "Buy"
+        return BUY
     elif macdhist.iloc[-1] < 0:
-        return "Sell"
+        return SELL
     else:
-        return "Hold"
+        return HOLD
 
 
 def MFI_indicator(ticker, data):
@@ -507,11 +501,11 @@ def MFI_indicator(ticker, data):
         data["High"], data["Low"], data["Close"], data["Volume"], timeperiod=14
     )
     if mfi.iloc[-1] > 80:
-        return "Sell"
+        return SELL
     elif mfi.iloc[-1] < 20:
-        return "Buy"
+        return BUY
     else:
-        return "Hold"
+        return HOLD
 
 
 def MINUS_DI_indicator(ticker, data):
@@ -519,11 +513,11 @@ def MINUS_DI_indicator(ticker, data):
 
     minus_di = ta.MINUS_DI(data["High"], data["Low"], data["Close"], timeperiod=14)
     if minus_di.iloc[-1] > 25:
-        return "Sell"
+        return SELL
     elif minus_di.iloc[-1] < 20:
-        return "Buy"
+        return BUY
     else:
-        return "Hold"
+        return HOLD
 
 
 def MINUS_DM_indicator(ticker, data):
@@ -531,11 +525,11 @@ def MINUS_DM_indicator(ticker, data):
 
     minus_dm = ta.MINUS_DM(data["High"], data["Low"], timeperiod=14)
     if minus_dm.iloc[-1] > 0:
-        return "Sell"
+        return SELL
     elif minus_dm.iloc[-1] < 0:
-        return "Buy"
+        return BUY
     else:
-        return "Hold"
+        return HOLD
 
 
 def MOM_indicator(ticker, data):
@@ -543,11 +537,11 @@ def MOM_indicator(ticker, data):
 
     mom = ta.MOM(data["Close"], timeperiod=10)
     if mom.iloc[-1] > 0:
-        return "Buy"
+        return BUY
     elif mom.iloc[-1] < 0:
-        return "Sell"
+        return SELL
     else:
-        return "Hold"
+        return HOLD
 
 
 def PLUS_DI_indicator(ticker, data):
@@ -555,11 +549,11 @@ def PLUS_DI_indicator(ticker, data):
 
     plus_di = ta.PLUS_DI(data["High"], data["Low"], data["Close"], timeperiod=14)
     if plus_di.iloc[-1] > 25:
-        return "Buy"
+        return BUY
     elif plus_di.iloc[-1] < 20:
-        return "Sell"
+        return SELL
     else:
-        return "Hold"
+        return HOLD
 
 
 def PLUS_DM_indicator(ticker, data):
@@ -567,11 +561,11 @@ def PLUS_DM_indicator(ticker, data):
 
     plus_dm = ta.PLUS_DM(data["High"], data["Low"], timeperiod=14)
     if plus_dm.iloc[-1] > 0:
-        return "Buy"
+        return BUY
     elif plus_dm.iloc[-1] < 0:
-        return "Sell"
+        return SELL
     else:
-        return "Hold"
+        return HOLD
 
 
 def PPO_indicator(ticker, data):
@@ -579,11 +573,11 @@ def PPO_indicator(ticker, data):
 
     ppo = ta.PPO(data["Close"], fastperiod=12, slowperiod=26, matype=0)
     if ppo.iloc[-1] > 0:
-        return "Buy"
+        return BUY
     elif ppo.iloc[-1] < 0:
-        return "Sell"
+        return SELL
     else:
-        return "Hold"
+        return HOLD
 
 
 def ROC_indicator(ticker, data):
@@ -591,11 +585,11 @@ def ROC_indicator(ticker, data):
 
     roc = ta.ROC(data["Close"], timeperiod=10)
     if roc.iloc[-1] > 0:
-        return "Buy"
+        return BUY
     elif roc.iloc[-1] < 0:
-        return "Sell"
+        return SELL
     else:
-        return "Hold"
+        return HOLD
 
 
 def ROCP_indicator(ticker, data):
@@ -603,11 +597,11 @@ def ROCP_indicator(ticker, data):
 
     rocp = ta.ROCP(data["Close"], timeperiod=10)
     if rocp.iloc[-1] > 0:
-        return "Buy"
+        return BUY
     elif rocp.iloc[-1] < 0:
-        return "Sell"
+        return SELL
     else:
-        return "Hold"
+        return HOLD
 
 
 def ROCR_indicator(ticker, data):
@@ -615,11 +609,11 @@ def ROCR_indicator(ticker, data):
 
     rocr = ta.ROCR(data["Close"], timeperiod=10)
     if rocr.iloc[-1] > 1:
-        return "Buy"
+        return BUY
     elif rocr.iloc[-1] < 1:
-        return "Sell"
+        return SELL
     else:
-        return "Hold"
+        return HOLD
 
 
 def ROCR100_indicator(ticker, data):
@@ -627,11 +621,11 @@ def ROCR100_indicator(ticker, data):
 
     rocr100 = ta.ROCR100(data["Close"], timeperiod=10)
     if rocr100.iloc[-1] > 100:
-        return "Buy"
+        return BUY
     elif rocr100.iloc[-1] < 100:
-        return "Sell"
+        return SELL
     else:
-        return "Hold"
+        return HOLD
 
 
 def RSI_indicator(ticker, data):
@@ -639,11 +633,11 @@ def RSI_indicator(ticker, data):
 
     rsi = ta.RSI(data["Close"], timeperiod=14)
     if rsi.iloc[-1] > 70:
-        return "Sell"
+        return SELL
     elif rsi.iloc[-1] < 30:
-        return "Buy"
+        return BUY
     else:
-        return "Hold"
+        return HOLD
 
 
 def STOCH_indicator(ticker, data):
@@ -660,11 +654,11 @@ def STOCH_indicator(ticker, data):
         slowd_matype=0,
     )
     if slowk.iloc[-1] > 80:
-        return "Sell"
+        return SELL
     elif slowk.iloc[-1] < 20:
-        return "Buy"
+        return BUY
     else:
-        return "Hold"
+        return HOLD
 
 
 def STOCHF_indicator(ticker, data):
@@ -679,11 +673,11 @@ def STOCHF_indicator(ticker, data):
         fastd_matype=0,
     )
     if fastk.iloc[-1] > 80:
-        return "Sell"
+        return SELL
     elif fastk.iloc[-1] < 20:
-        return "Buy"
+        return BUY
     else:
-        return "Hold"
+        return HOLD
 
 
 def STOCHRSI_indicator(ticker, data):
@@ -693,11 +687,11 @@ def STOCHRSI_indicator(ticker, data):
         data["Close"], timeperiod=14, fastk_period=5, fastd_period=3, fastd_matype=0
     )
     if fastk.iloc[-1] > 80:
-        return "Sell"
+        return SELL
     elif fastk.iloc[-1] < 20:
-        return "Buy"
+        return BUY
     else:
-        return "Hold"
+        return HOLD
 
 
 def TRIX_indicator(ticker, data):
@@ -705,11 +699,11 @@ def TRIX_indicator(ticker, data):
 
     trix = ta.TRIX(data["Close"], timeperiod=30)
     if trix.iloc[-1] > 0:
-        return "Buy"
+        return BUY
     elif trix.iloc[-1] < 0:
-        return "Sell"
+        return SELL
     else:
-        return "Hold"
+        return HOLD
 
 
 def ULTOSC_indicator(ticker, data):
@@ -724,11 +718,11 @@ def ULTOSC_indicator(ticker, data):
         timeperiod3=28,
     )
     if ultosc.iloc[-1] > 70:
-        return "Sell"
+        return SELL
     elif ultosc.iloc[-1] < 30:
-        return "Buy"
+        return BUY
     else:
-        return "Hold"
+        return HOLD
 
 
 def WILLR_indicator(ticker, data):
@@ -736,11 +730,11 @@ def WILLR_indicator(ticker, data):
 
     willr = ta.WILLR(data["High"], data["Low"], data["Close"], timeperiod=14)
     if willr.iloc[-1] > -20:
-        return "Sell"
+        return SELL
     elif willr.iloc[-1] < -80:
-        return "Buy"
+        return BUY
     else:
-        return "Hold"
+        return HOLD
 
 
 # Volume Indicators
@@ -751,11 +745,11 @@ def AD_indicator(ticker, data):
 
     ad = ta.AD(data["High"], data["Low"], data["Close"], data["Volume"])
     if ad.iloc[-1] > 0:
-        return "Buy"
+        return BUY
     elif ad.iloc[-1] < 0:
-        return "Sell"
+        return SELL
     else:
-        return "Hold"
+        return HOLD
 
 
 def ADOSC_indicator(ticker, data):
@@ -770,11 +764,11 @@ def ADOSC_indicator(ticker, data):
         slowperiod=10,
     )
     if adosc.iloc[-1] > 0:
-        return "Buy"
+        return BUY
     elif adosc.iloc[-1] < 0:
-        return "Sell"
+        return SELL
     else:
-        return "Hold"
+        return HOLD
 
 
 def OBV_indicator(ticker, data):
@@ -782,11 +776,11 @@ def OBV_indicator(ticker, data):
 
     obv = ta.OBV(data["Close"], data["Volume"])
     if obv.iloc[-1] > 0:
-        return "Buy"
+        return BUY
     elif obv.iloc[-1] < 0:
-        return "Sell"
+        return SELL
     else:
-        return "Hold"
+        return HOLD
 
 
 # Cycle Indicators
@@ -797,11 +791,11 @@ def HT_DCPERIOD_indicator(ticker, data):
 
     ht_dcperiod = ta.HT_DCPERIOD(data["Close"])
     if ht_dcperiod.iloc[-1] > 20:
-        return "Buy"
+        return BUY
     elif ht_dcperiod.iloc[-1] < 10:
-        return "Sell"
+        return SELL
     else:
-        return "Hold"
+        return HOLD
 
 
 def HT_DCPHASE_indicator(ticker, data):
@@ -809,11 +803,11 @@ def HT_DCPHASE_indicator(ticker, data):
 
     ht_dcphase = ta.HT_DCPHASE(data["Close"])
     if ht_dcphase.iloc[-1] > 0:
-        return "Buy"
+        return BUY
     elif ht_dcphase.iloc[-1] < 0:
-        return "Sell"
+        return SELL
     else:
-        return "Hold"
+        return HOLD
 
 
 def HT_PHASOR_indicator(ticker, data):
@@ -821,11 +815,11 @@ def HT_PHASOR_indicator(ticker, data):
 
     inphase, quadrature = ta.HT_PHASOR(data["Close"])
     if inphase.iloc[-1] > 0:
-        return "Buy"
+        return BUY
     elif inphase.iloc[-1] < 0:
-        return "Sell"
+        return SELL
     else:
-        return "Hold"
+        return HOLD
 
 
 def HT_SINE_indicator(ticker, data):
@@ -833,11 +827,11 @@ def HT_SINE_indicator(ticker, data):
 
     sine, leadsine = ta.HT_SINE(data["Close"])
     if sine.iloc[-1] > 0:
-        return "Buy"
+        return BUY
     elif sine.iloc[-1] < 0:
-        return "Sell"
+        return SELL
     else:
-        return "Hold"
+        return HOLD
 
 
 def HT_TRENDMODE_indicator(ticker, data):
@@ -845,11 +839,11 @@ def HT_TRENDMODE_indicator(ticker, data):
 
     ht_trendmode = ta.HT_TRENDMODE(data["Close"])
     if ht_trendmode.iloc[-1] > 0:
-        return "Buy"
+        return BUY
     elif ht_trendmode.iloc[-1] < 0:
-        return "Sell"
+        return SELL
     else:
-        return "Hold"
+        return HOLD
 
 
 # Price Transform
@@ -860,11 +854,11 @@ def AVGPRICE_indicator(ticker, data):
 
     avgprice = ta.AVGPRICE(data["Open"], data["High"], data["Low"], data["Close"])
     if data["Close"].iloc[-1] > avgprice.iloc[-1]:
-        return "Buy"
+        return BUY
     elif data["Close"].iloc[-1] < avgprice.iloc[-1]:
-        return "Sell"
+        return SELL
     else:
-        return "Hold"
+        return HOLD
 
 
 def MEDPRICE_indicator(ticker, data):
@@ -872,11 +866,11 @@ def MEDPRICE_indicator(ticker, data):
 
     medprice = ta.MEDPRICE(data["High"], data["Low"])
     if data["Close"].iloc[-1] > medprice.iloc[-1]:
-        return "Buy"
+        return BUY
     elif data["Close"].iloc[-1] < medprice.iloc[-1]:
-        return "Sell"
+        return SELL
     else:
-        return "Hold"
+        return HOLD
 
 
 def TYPPRICE_indicator(ticker, data):
@@ -884,11 +878,11 @@ def TYPPRICE_indicator(ticker, data):
 
     typprice = ta.TYPPRICE(data["High"], data["Low"], data["Close"])
     if data["Close"].iloc[-1] > typprice.iloc[-1]:
-        return "Buy"
+        return BUY
     elif data["Close"].iloc[-1] < typprice.iloc[-1]:
-        return "Sell"
+        return SELL
     else:
-        return "Hold"
+        return HOLD
 
 
 def WCLPRICE_indicator(ticker, data):
@@ -896,11 +890,11 @@ def WCLPRICE_indicator(ticker, data):
 
     wclprice = ta.WCLPRICE(data["High"], data["Low"], data["Close"])
     if data["Close"].iloc[-1] > wclprice.iloc[-1]:
-        return "Buy"
+        return BUY
     elif data["Close"].iloc[-1] < wclprice.iloc[-1]:
-        return "Sell"
+        return SELL
     else:
-        return "Hold"
+        return HOLD
 
 
 # Volatility Indicators
@@ -911,11 +905,11 @@ def ATR_indicator(ticker, data):
 
     atr = ta.ATR(data["High"], data["Low"], data["Close"], timeperiod=14)
     if atr.iloc[-1] > 20:
-        return "Buy"
+        return BUY
     elif atr.iloc[-1] < 10:
-        return "Sell"
+        return SELL
     else:
-        return "Hold"
+        return HOLD
 
 
 def NATR_indicator(ticker, data):
@@ -923,11 +917,11 @@ def NATR_indicator(ticker, data):
 
     natr = ta.NATR(data["High"], data["Low"], data["Close"], timeperiod=14)
     if natr.iloc[-1] > 20:
-        return "Buy"
+        return BUY
     elif natr.iloc[-1] < 10:
-        return "Sell"
+        return SELL
     else:
-        return "Hold"
+        return HOLD
 
 
 def TRANGE_indicator(ticker, data):
@@ -935,11 +929,11 @@ def TRANGE_indicator(ticker, data):
 
     trange = ta.TRANGE(data["High"], data["Low"], data["Close"])
     if trange.iloc[-1] > 20:
-        return "Buy"
+        return BUY
     elif trange.iloc[-1] < 10:
-        return "Sell"
+        return SELL
     else:
-        return "Hold"
+        return HOLD
 
 
 # Pattern Recognition
@@ -950,11 +944,11 @@ def CDL2CROWS_indicator(ticker, data):
 
     cdl2crows = ta.CDL2CROWS(data["Open"], data["High"], data["Low"], data["Close"])
     if cdl2crows.iloc[-1] > 0:
-        return "Buy"
+        return BUY
     elif cdl2crows.iloc[-1] < 0:
-        return "Sell"
+        return SELL
     else:
-        return "Hold"
+        return HOLD
 
 
 def CDL3BLACKCROWS_indicator(ticker, data):
@@ -964,11 +958,11 @@ def CDL3BLACKCROWS_indicator(ticker, data):
         data["Open"], data["High"], data["Low"], data["Close"]
     )
     if cdl3blackcrows.iloc[-1] > 0:
-        return "Buy"
+        return BUY
     elif cdl3blackcrows.iloc[-1] < 0:
-        return "Sell"
+        return SELL
     else:
-        return "Hold"
+        return HOLD
 
 
 def CDL3INSIDE_indicator(ticker, data):
@@ -976,11 +970,11 @@ def CDL3INSIDE_indicator(ticker, data):
 
     cdl3inside = ta.CDL3INSIDE(data["Open"], data["High"], data["Low"], data["Close"])
     if cdl3inside.iloc[-1] > 0:
-        return "Buy"
+        return BUY
     elif cdl3inside.iloc[-1] < 0:
-        return "Sell"
+        return SELL
     else:
-        return "Hold"
+        return HOLD
 
 
 def CDL3LINESTRIKE_indicator(ticker, data):
@@ -990,11 +984,11 @@ def CDL3LINESTRIKE_indicator(ticker, data):
         data["Open"], data["High"], data["Low"], data["Close"]
     )
     if cdl3linestrike.iloc[-1] > 0:
-        return "Buy"
+        return BUY
     elif cdl3linestrike.iloc[-1] < 0:
-        return "Sell"
+        return SELL
     else:
-        return "Hold"
+        return HOLD
 
 
 def CDL3OUTSIDE_indicator(ticker, data):
@@ -1002,11 +996,11 @@ def CDL3OUTSIDE_indicator(ticker, data):
 
     cdl3outside = ta.CDL3OUTSIDE(data["Open"], data["High"], data["Low"], data["Close"])
     if cdl3outside.iloc[-1] > 0:
-        return "Buy"
+        return BUY
     elif cdl3outside.iloc[-1] < 0:
-        return "Sell"
+        return SELL
     else:
-        return "Hold"
+        return HOLD
 
 
 def CDL3STARSINSOUTH_indicator(ticker, data):
@@ -1016,11 +1010,11 @@ def CDL3STARSINSOUTH_indicator(ticker, data):
         data["Open"], data["High"], data["Low"], data["Close"]
     )
     if cdl3starsinsouth.iloc[-1] > 0:
-        return "Buy"
+        return BUY
     elif cdl3starsinsouth.iloc[-1] < 0:
-        return "Sell"
+        return SELL
     else:
-        return "Hold"
+        return HOLD
 
 
 def CDL3WHITESOLDIERS_indicator(ticker, data):
@@ -1030,11 +1024,11 @@ def CDL3WHITESOLDIERS_indicator(ticker, data):
         data["Open"], data["High"], data["Low"], data["Close"]
     )
     if cdl3whitesoldiers.iloc[-1] > 0:
-        return "Buy"
+        return BUY
     elif cdl3whitesoldiers.iloc[-1] < 0:
-        return "Sell"
+        return SELL
     else:
-        return "Hold"
+        return HOLD
 
 
 def CDLABANDONEDBABY_indicator(ticker, data):
@@ -1044,11 +1038,11 @@ def CDLABANDONEDBABY_indicator(ticker, data):
         data["Open"], data["High"], data["Low"], data["Close"], penetration=0
     )
     if cdlabandonedbaby.iloc[-1] > 0:
-        return "Buy"
+        return BUY
     elif cdlabandonedbaby.iloc[-1] < 0:
-        return "Sell"
+        return SELL
     else:
-        return "Hold"
+        return HOLD
 
 
 def CDLADVANCEBLOCK_indicator(ticker, data):
@@ -1058,11 +1052,11 @@ def CDLADVANCEBLOCK_indicator(ticker, data):
         data["Open"], data["High"], data["Low"], data["Close"]
     )
     if cdladvanceblock.iloc[-1] > 0:
-        return "Buy"
+        return BUY
     elif cdladvanceblock.iloc[-1] < 0:
-        return "Sell"
+        return SELL
     else:
-        return "Hold"
+        return HOLD
 
 
 def CDLBELTHOLD_indicator(ticker, data):
@@ -1070,11 +1064,11 @@ def CDLBELTHOLD_indicator(ticker, data):
 
     cdlbelthold = ta.CDLBELTHOLD(data["Open"], data["High"], data["Low"], data["Close"])
     if cdlbelthold.iloc[-1] > 0:
-        return "Buy"
+        return BUY
     elif cdlbelthold.iloc[-1] < 0:
-        return "Sell"
+        return SELL
     else:
-        return "Hold"
+        return HOLD
 
 
 def CDLBREAKAWAY_indicator(ticker, data):
@@ -1084,11 +1078,11 @@ def CDLBREAKAWAY_indicator(ticker, data):
         data["Open"], data["High"], data["Low"], data["Close"]
     )
     if cdlbreakaway.iloc[-1] > 0:
-        return "Buy"
+        return BUY
     elif cdlbreakaway.iloc[-1] < 0:
-        return "Sell"
+        return SELL
     else:
-        return "Hold"
+        return HOLD
 
 
 def CDLCLOSINGMARUBOZU_indicator(ticker, data):
@@ -1098,11 +1092,11 @@ def CDLCLOSINGMARUBOZU_indicator(ticker, data):
         data["Open"], data["High"], data["Low"], data["Close"]
     )
     if cdlclosingmarubozu.iloc[-1] > 0:
-        return "Buy"
+        return BUY
     elif cdlclosingmarubozu.iloc[-1] < 0:
-        return "Sell"
+        return SELL
     else:
-        return "Hold"
+        return HOLD
 
 
 def CDLCONCEALBABYSWALL_indicator(ticker, data):
@@ -1112,11 +1106,11 @@ def CDLCONCEALBABYSWALL_indicator(ticker, data):
         data["Open"], data["High"], data["Low"], data["Close"]
     )
     if cdlconcealbabyswall.iloc[-1] > 0:
-        return "Buy"
+        return BUY
     elif cdlconcealbabyswall.iloc[-1] < 0:
-        return "Sell"
+        return SELL
     else:
-        return "Hold"
+        return HOLD
 
 
 def CDLCOUNTERATTACK_indicator(ticker, data):
@@ -1126,11 +1120,11 @@ def CDLCOUNTERATTACK_indicator(ticker, data):
         data["Open"], data["High"], data["Low"], data["Close"]
     )
     if cdlcounterattack.iloc[-1] > 0:
-        return "Buy"
+        return BUY
     elif cdlcounterattack.iloc[-1] < 0:
-        return "Sell"
+        return SELL
     else:
-        return "Hold"
+        return HOLD
 
 
 def CDLDARKCLOUDCOVER_indicator(ticker, data):
@@ -1140,11 +1134,11 @@ def CDLDARKCLOUDCOVER_indicator(ticker, data):
         data["Open"], data["High"], data["Low"], data["Close"], penetration=0
     )
     if cdldarkcloudcover.iloc[-1] > 0:
-        return "Buy"
+        return BUY
     elif cdldarkcloudcover.iloc[-1] < 0:
-        return "Sell"
+        return SELL
     else:
-        return "Hold"
+        return HOLD
 
 
 def CDLDOJI_indicator(ticker, data):
@@ -1152,11 +1146,11 @@ def CDLDOJI_indicator(ticker, data):
 
     cdldoji = ta.CDLDOJI(data["Open"], data["High"], data["Low"], data["Close"])
     if cdldoji.iloc[-1] > 0:
-        return "Buy"
+        return BUY
     elif cdldoji.iloc[-1] < 0:
-        return "Sell"
+        return SELL
     else:
-        return "Hold"
+        return HOLD
 
 
 def CDLDOJISTAR_indicator(ticker, data):
@@ -1164,11 +1158,11 @@ def CDLDOJISTAR_indicator(ticker, data):
 
     cdldojistar = ta.CDLDOJISTAR(data["Open"], data["High"], data["Low"], data["Close"])
     if cdldojistar.iloc[-1] > 0:
-        return "Buy"
+        return BUY
     elif cdldojistar.iloc[-1] < 0:
-        return "Sell"
+        return SELL
     else:
-        return "Hold"
+        return HOLD
 
 
 def CDLDRAGONFLYDOJI_indicator(ticker, data):
@@ -1178,11 +1172,11 @@ def CDLDRAGONFLYDOJI_indicator(ticker, data):
         data["Open"], data["High"], data["Low"], data["Close"]
     )
     if cdldragonflydoji.iloc[-1] > 0:
-        return "Buy"
+        return BUY
     elif cdldragonflydoji.iloc[-1] < 0:
-        return "Sell"
+        return SELL
     else:
-        return "Hold"
+        return HOLD
 
 
 def CDLENGULFING_indicator(ticker, data):
@@ -1192,11 +1186,11 @@ def CDLENGULFING_indicator(ticker, data):
         data["Open"], data["High"], data["Low"], data["Close"]
     )
     if cdlengulfing.iloc[-1] > 0:
-        return "Buy"
+        return BUY
     elif cdlengulfing.iloc[-1] < 0:
-        return "Sell"
+        return SELL
     else:
-        return "Hold"
+        return HOLD
 
 
 def CDLEVENINGDOJISTAR_indicator(ticker, data):
@@ -1206,11 +1200,11 @@ def CDLEVENINGDOJISTAR_indicator(ticker, data):
         data["Open"], data["High"], data["Low"], data["Close"], penetration=0
     )
     if cdlEveningDojiStar.iloc[-1] > 0:
-        return "Buy"
+        return BUY
     elif cdlEveningDojiStar.iloc[-1] < 0:
-        return "Sell"
+        return SELL
     else:
-        return "Hold"
+        return HOLD
 
 
 def CDLEVENINGSTAR_indicator(ticker, data):
@@ -1220,11 +1214,11 @@ def CDLEVENINGSTAR_indicator(ticker, data):
         data["Open"], data["High"], data["Low"], data["Close"], penetration=0
     )
     if cdlEveningStar.iloc[-1] > 0:
-        return "Buy"
+        return BUY
     elif cdlEveningStar.iloc[-1] < 0:
-        return "Sell"
+        return SELL
     else:
-        return "Hold"
+        return HOLD
 
 
 def CDLGAPSIDESIDEWHITE_indicator(ticker, data):
@@ -1234,11 +1228,11 @@ def CDLGAPSIDESIDEWHITE_indicator(ticker, data):
         data["Open"], data["High"], data["Low"], data["Close"]
     )
     if cdlgapsidesidewhite.iloc[-1] > 0:
-        return "Buy"
+        return BUY
     elif cdlgapsidesidewhite.iloc[-1] < 0:
-        return "Sell"
+        return SELL
     else:
-        return "Hold"
+        return HOLD
 
 
 def CDLGRAVESTONEDOJI_indicator(ticker, data):
@@ -1248,11 +1242,11 @@ def CDLGRAVESTONEDOJI_indicator(ticker, data):
         data["Open"], data["High"], data["Low"], data["Close"]
     )
     if cdlgravestonedoji.iloc[-1] > 0:
-        return "Buy"
+        return BUY
     elif cdlgravestonedoji.iloc[-1] < 0:
-        return "Sell"
+        return SELL
     else:
-        return "Hold"
+        return HOLD
 
 
 def CDLHAMMER_indicator(ticker, data):
@@ -1260,11 +1254,11 @@ def CDLHAMMER_indicator(ticker, data):
 
     cdlhammer = ta.CDLHAMMER(data["Open"], data["High"], data["Low"], data["Close"])
     if cdlhammer.iloc[-1] > 0:
-        return "Buy"
+        return BUY
     elif cdlhammer.iloc[-1] < 0:
-        return "Sell"
+        return SELL
     else:
-        return "Hold"
+        return HOLD
 
 
 def CDLHANGINGMAN_indicator(ticker, data):
@@ -1274,11 +1268,11 @@ def CDLHANGINGMAN_indicator(ticker, data):
         data["Open"], data["High"], data["Low"], data["Close"]
     )
     if cdlhangingman.iloc[-1] > 0:
-        return "Buy"
+        return BUY
     elif cdlhangingman.iloc[-1] < 0:
-        return "Sell"
+        return SELL
     else:
-        return "Hold"
+        return HOLD
 
 
 def CDLHARAMI_indicator(ticker, data):
@@ -1286,11 +1280,11 @@ def CDLHARAMI_indicator(ticker, data):
 
     cdlharami = ta.CDLHARAMI(data["Open"], data["High"], data["Low"], data["Close"])
     if cdlharami.iloc[-1] > 0:
-        return "Buy"
+        return BUY
     elif cdlharami.iloc[-1] < 0:
-        return "Sell"
+        return SELL
     else:
-        return "Hold"
+        return HOLD
 
 
 def CDLHARAMICROSS_indicator(ticker, data):
@@ -1300,11 +1294,11 @@ def CDLHARAMICROSS_indicator(ticker, data):
         data["Open"], data["High"], data["Low"], data["Close"]
     )
     if cdlharamicross.iloc[-1] > 0:
-        return "Buy"
+        return BUY
     elif cdlharamicross.iloc[-1] < 0:
-        return "Sell"
+        return SELL
     else:
-        return "Hold"
+        return HOLD
 
 
 def CDLHIGHWAVE_indicator(ticker, data):
@@ -1312,11 +1306,11 @@ def CDLHIGHWAVE_indicator(ticker, data):
 
     cdlhighwave = ta.CDLHIGHWAVE(data["Open"], data["High"], data["Low"], data["Close"])
     if cdlhighwave.iloc[-1] > 0:
-        return "Buy"
+        return BUY
     elif cdlhighwave.iloc[-1] < 0:
-        return "Sell"
+        return SELL
     else:
-        return "Hold"
+        return HOLD
 
 
 def CDLHIKKAKE_indicator(ticker, data):
@@ -1324,11 +1318,11 @@ def CDLHIKKAKE_indicator(ticker, data):
 
     cdlhikkake = ta.CDLHIKKAKE(data["Open"], data["High"], data["Low"], data["Close"])
     if cdlhikkake.iloc[-1] > 0:
-        return "Buy"
+        return BUY
     elif cdlhikkake.iloc[-1] < 0:
-        return "Sell"
+        return SELL
     else:
-        return "Hold"
+        return HOLD
 
 
 def CDLHIKKAKEMOD_indicator(ticker, data):
@@ -1338,11 +1332,11 @@ def CDLHIKKAKEMOD_indicator(ticker, data):
         data["Open"], data["High"], data["Low"], data["Close"]
     )
     if cdlhikkakemod.iloc[-1] > 0:
-        return "Buy"
+        return BUY
     elif cdlhikkakemod.iloc[-1] < 0:
-        return "Sell"
+        return SELL
     else:
-        return "Hold"
+        return HOLD
 
 
 def CDLHOMINGPIGEON_indicator(ticker, data):
@@ -1352,11 +1346,11 @@ def CDLHOMINGPIGEON_indicator(ticker, data):
         data["Open"], data["High"], data["Low"], data["Close"]
     )
     if cdlhomingpigeon.iloc[-1] > 0:
-        return "Buy"
+        return BUY
     elif cdlhomingpigeon.iloc[-1] < 0:
-        return "Sell"
+        return SELL
     else:
-        return "Hold"
+        return HOLD
 
 
 def CDLIDENTICAL3CROWS_indicator(ticker, data):
@@ -1366,11 +1360,11 @@ def CDLIDENTICAL3CROWS_indicator(ticker, data):
         data["Open"], data["High"], data["Low"], data["Close"]
     )
     if cdlidentical3crows.iloc[-1] > 0:
-        return "Buy"
+        return BUY
     elif cdlidentical3crows.iloc[-1] < 0:
-        return "Sell"
+        return SELL
     else:
-        return "Hold"
+        return HOLD
 
 
 def CDLINNECK_indicator(ticker, data):
@@ -1378,11 +1372,11 @@ def CDLINNECK_indicator(ticker, data):
 
     cdlInNeck = ta.CDLINNECK(data["Open"], data["High"], data["Low"], data["Close"])
     if cdlInNeck.iloc[-1] > 0:
-        return "Buy"
+        return BUY
     elif cdlInNeck.iloc[-1] < 0:
-        return "Sell"
+        return SELL
     else:
-        return "Hold"
+        return HOLD
 
 
 def CDLINVERTEDHAMMER_indicator(ticker, data):
@@ -1392,11 +1386,11 @@ def CDLINVERTEDHAMMER_indicator(ticker, data):
         data["Open"], data["High"], data["Low"], data["Close"]
     )
     if cdlInvertedHammer.iloc[-1] > 0:
-        return "Buy"
+        return BUY
     elif cdlInvertedHammer.iloc[-1] < 0:
-        return "Sell"
+        return SELL
     else:
-        return "Hold"
+        return HOLD
 
 
 def CDLKICKING_indicator(ticker, data):
@@ -1404,11 +1398,11 @@ def CDLKICKING_indicator(ticker, data):
 
     cdlkicking = ta.CDLKICKING(data["Open"], data["High"], data["Low"], data["Close"])
     if cdlkicking.iloc[-1] > 0:
-        return "Buy"
+        return BUY
     elif cdlkicking.iloc[-1] < 0:
-        return "Sell"
+        return SELL
     else:
-        return "Hold"
+        return HOLD
 
 
 def CDLKICKINGBYLENGTH_indicator(ticker, data):
@@ -1418,11 +1412,11 @@ def CDLKICKINGBYLENGTH_indicator(ticker, data):
         data["Open"], data["High"], data["Low"], data["Close"]
     )
     if cdlkickingbylength.iloc[-1] > 0:
-        return "Buy"
+        return BUY
     elif cdlkickingbylength.iloc[-1] < 0:
-        return "Sell"
+        return SELL
     else:
-        return "Hold"
+        return HOLD
 
 
 def CDLLADDERBOTTOM_indicator(ticker, data):
@@ -1432,11 +1426,11 @@ def CDLLADDERBOTTOM_indicator(ticker, data):
         data["Open"], data["High"], data["Low"], data["Close"]
     )
     if cdlladderbottom.iloc[-1] > 0:
-        return "Buy"
+        return BUY
     elif cdlladderbottom.iloc[-1] < 0:
-        return "Sell"
+        return SELL
     else:
-        return "Hold"
+        return HOLD
 
 
 def CDLLONGLEGGEDDOJI_indicator(ticker, data):
@@ -1446,11 +1440,11 @@ def CDLLONGLEGGEDDOJI_indicator(ticker, data):
         data["Open"], data["High"], data["Low"], data["Close"]
     )
     if cdllongleggeddoji.iloc[-1] > 0:
-        return "Buy"
+        return BUY
     elif cdllongleggeddoji.iloc[-1] < 0:
-        return "Sell"
+        return SELL
     else:
-        return "Hold"
+        return HOLD
 
 
 def CDLLONGLINE_indicator(ticker, data):
@@ -1458,11 +1452,11 @@ def CDLLONGLINE_indicator(ticker, data):
 
     cdllongline = ta.CDLLONGLINE(data["Open"], data["High"], data["Low"], data["Close"])
     if cdllongline.iloc[-1] > 0:
-        return "Buy"
+        return BUY
     elif cdllongline.iloc[-1] < 0:
-        return "Sell"
+        return SELL
     else:
-        return "Hold"
+        return HOLD
 
 
 def CDLMARUBOZU_indicator(ticker, data):
@@ -1470,11 +1464,11 @@ def CDLMARUBOZU_indicator(ticker, data):
 
     cdlmarubozu = ta.CDLMARUBOZU(data["Open"], data["High"], data["Low"], data["Close"])
     if cdlmarubozu.iloc[-1] > 0:
-        return "Buy"
+        return BUY
     elif cdlmarubozu.iloc[-1] < 0:
-        return "Sell"
+        return SELL
     else:
-        return "Hold"
+        return HOLD
 
 
 def CDLMATCHINGLOW_indicator(ticker, data):
@@ -1484,11 +1478,11 @@ def CDLMATCHINGLOW_indicator(ticker, data):
         data["Open"], data["High"], data["Low"], data["Close"]
     )
     if cdlmatchinglow.iloc[-1] > 0:
-        return "Buy"
+        return BUY
     elif cdlmatchinglow.iloc[-1] < 0:
-        return "Sell"
+        return SELL
     else:
-        return "Hold"
+        return HOLD
 
 
 def CDLMATHOLD_indicator(ticker, data):
@@ -1498,11 +1492,11 @@ def CDLMATHOLD_indicator(ticker, data):
         data["Open"], data["High"], data["Low"], data["Close"], penetration=0
     )
     if cdlmathold.iloc[-1] > 0:
-        return "Buy"
+        return BUY
     elif cdlmathold.iloc[-1] < 0:
-        return "Sell"
+        return SELL
     else:
-        return "Hold"
+        return HOLD
 
 
 def CDLMORNINGDOJISTAR_indicator(ticker, data):
@@ -1512,11 +1506,11 @@ def CDLMORNINGDOJISTAR_indicator(ticker, data):
         data["Open"], data["High"], data["Low"], data["Close"], penetration=0
     )
     if cdlmorningdojistar.iloc[-1] > 0:
-        return "Buy"
+        return BUY
     elif cdlmorningdojistar.iloc[-1] < 0:
-        return "Sell"
+        return SELL
     else:
-        return "Hold"
+        return HOLD
 
 
 def CDLMORNINGSTAR_indicator(ticker, data):
@@ -1526,11 +1520,11 @@ def CDLMORNINGSTAR_indicator(ticker, data):
         data["Open"], data["High"], data["Low"], data["Close"], penetration=0
     )
     if cdlmorningstar.iloc[-1] > 0:
-        return "Buy"
+        return BUY
     elif cdlmorningstar.iloc[-1] < 0:
-        return "Sell"
+        return SELL
     else:
-        return "Hold"
+        return HOLD
 
 
 def CDLONNECK_indicator(ticker, data):
@@ -1538,11 +1532,11 @@ def CDLONNECK_indicator(ticker, data):
 
     cdlonneck = ta.CDLONNECK(data["Open"], data["High"], data["Low"], data["Close"])
     if cdlonneck.iloc[-1] > 0:
-        return "Buy"
+        return BUY
     elif cdlonneck.iloc[-1] < 0:
-        return "Sell"
+        return SELL
     else:
-        return "Hold"
+        return HOLD
 
 
 def CDLPIERCING_indicator(ticker, data):
@@ -1550,11 +1544,11 @@ def CDLPIERCING_indicator(ticker, data):
 
     cdlpiercing = ta.CDLPIERCING(data["Open"], data["High"], data["Low"], data["Close"])
     if cdlpiercing.iloc[-1] > 0:
-        return "Buy"
+        return BUY
     elif cdlpiercing.iloc[-1] < 0:
-        return "Sell"
+        return SELL
     else:
-        return "Hold"
+        return HOLD
 
 
 def CDLRICKSHAWMAN_indicator(ticker, data):
@@ -1564,11 +1558,11 @@ def CDLRICKSHAWMAN_indicator(ticker, data):
         data["Open"], data["High"], data["Low"], data["Close"]
     )
     if cdlrickshawman.iloc[-1] > 0:
-        return "Buy"
+        return BUY
     elif cdlrickshawman.iloc[-1] < 0:
-        return "Sell"
+        return SELL
     else:
-        return "Hold"
+        return HOLD
 
 
 def CDLRISEFALL3METHODS_indicator(ticker, data):
@@ -1578,11 +1572,11 @@ def CDLRISEFALL3METHODS_indicator(ticker, data):
         data["Open"], data["High"], data["Low"], data["Close"]
     )
     if cdlrisefall3methods.iloc[-1] > 0:
-        return "Buy"
+        return BUY
     elif cdlrisefall3methods.iloc[-1] < 0:
-        return "Sell"
+        return SELL
     else:
-        return "Hold"
+        return HOLD
 
 
 def CDLSEPARATINGLINES_indicator(ticker, data):
@@ -1592,11 +1586,11 @@ def CDLSEPARATINGLINES_indicator(ticker, data):
         data["Open"], data["High"], data["Low"], data["Close"]
     )
     if cdlseparatinglines.iloc[-1] > 0:
-        return "Buy"
+        return BUY
     elif cdlseparatinglines.iloc[-1] < 0:
-        return "Sell"
+        return SELL
     else:
-        return "Hold"
+        return HOLD
 
 
 def CDLSHOOTINGSTAR_indicator(ticker, data):
@@ -1606,11 +1600,11 @@ def CDLSHOOTINGSTAR_indicator(ticker, data):
         data["Open"], data["High"], data["Low"], data["Close"]
     )
     if cdlshootingstar.iloc[-1] > 0:
-        return "Buy"
+        return BUY
     elif cdlshootingstar.iloc[-1] < 0:
-        return "Sell"
+        return SELL
     else:
-        return "Hold"
+        return HOLD
 
 
 def CDLSHORTLINE_indicator(ticker, data):
@@ -1620,11 +1614,11 @@ def CDLSHORTLINE_indicator(ticker, data):
         data["Open"], data["High"], data["Low"], data["Close"]
     )
     if cdlshortline.iloc[-1] > 0:
-        return "Buy"
+        return BUY
     elif cdlshortline.iloc[-1] < 0:
-        return "Sell"
+        return SELL
     else:
-        return "Hold"
+        return HOLD
 
 
 def CDLSPINNINGTOP_indicator(ticker, data):
@@ -1634,11 +1628,11 @@ def CDLSPINNINGTOP_indicator(ticker, data):
         data["Open"], data["High"], data["Low"], data["Close"]
     )
     if cdlspinningtop.iloc[-1] > 0:
-        return "Buy"
+        return BUY
     elif cdlspinningtop.iloc[-1] < 0:
-        return "Sell"
+        return SELL
     else:
-        return "Hold"
+        return HOLD
 
 
 def CDLSTALLEDPATTERN_indicator(ticker, data):
@@ -1648,11 +1642,11 @@ def CDLSTALLEDPATTERN_indicator(ticker, data):
         data["Open"], data["High"], data["Low"], data["Close"]
     )
     if cdlstalledpattern.iloc[-1] > 0:
-        return "Buy"
+        return BUY
     elif cdlstalledpattern.iloc[-1] < 0:
-        return "Sell"
+        return SELL
     else:
-        return "Hold"
+        return HOLD
 
 
 def CDLSTICKSANDWICH_indicator(ticker, data):
@@ -1662,11 +1656,11 @@ def CDLSTICKSANDWICH_indicator(ticker, data):
         data["Open"], data["High"], data["Low"], data["Close"]
     )
     if cdlsticksandwich.iloc[-1] > 0:
-        return "Buy"
+        return BUY
     elif cdlsticksandwich.iloc[-1] < 0:
-        return "Sell"
+        return SELL
     else:
-        return "Hold"
+        return HOLD
 
 
 def CDLTAKURI_indicator(ticker, data):
@@ -1674,11 +1668,11 @@ def CDLTAKURI_indicator(ticker, data):
 
     cdltakuri = ta.CDLTAKURI(data["Open"], data["High"], data["Low"], data["Close"])
     if cdltakuri.iloc[-1] > 0:
-        return "Buy"
+        return BUY
     elif cdltakuri.iloc[-1] < 0:
-        return "Sell"
+        return SELL
     else:
-        return "Hold"
+        return HOLD
 
 
 def CDLTASUKIGAP_indicator(ticker, data):
@@ -1688,11 +1682,11 @@ def CDLTASUKIGAP_indicator(ticker, data):
         data["Open"], data["High"], data["Low"], data["Close"]
     )
     if cdltasukigap.iloc[-1] > 0:
-        return "Buy"
+        return BUY
     elif cdltasukigap.iloc[-1] < 0:
-        return "Sell"
+        return SELL
     else:
-        return "Hold"
+        return HOLD
 
 
 def CDLTHRUSTING_indicator(ticker, data):
@@ -1702,11 +1696,11 @@ def CDLTHRUSTING_indicator(ticker, data):
         data["Open"], data["High"], data["Low"], data["Close"]
     )
     if cdlthrusting.iloc[-1] > 0:
-        return "Buy"
+        return BUY
     elif cdlthrusting.iloc[-1] < 0:
-        return "Sell"
+        return SELL
     else:
-        return "Hold"
+        return HOLD
 
 
 def CDLTRISTAR_indicator(ticker, data):
@@ -1714,11 +1708,11 @@ def CDLTRISTAR_indicator(ticker, data):
 
     cdltristar = ta.CDLTRISTAR(data["Open"], data["High"], data["Low"], data["Close"])
     if cdltristar.iloc[-1] > 0:
-        return "Buy"
+        return BUY
     elif cdltristar.iloc[-1] < 0:
-        return "Sell"
+        return SELL
     else:
-        return "Hold"
+        return HOLD
 
 
 def CDLUNIQUE3RIVER_indicator(ticker, data):
@@ -1728,11 +1722,11 @@ def CDLUNIQUE3RIVER_indicator(ticker, data):
         data["Open"], data["High"], data["Low"], data["Close"]
     )
     if cdlunique3river.iloc[-1] > 0:
-        return "Buy"
+        return BUY
     elif cdlunique3river.iloc[-1] < 0:
-        return "Sell"
+        return SELL
     else:
-        return "Hold"
+        return HOLD
 
 
 def CDLUPSIDEGAP2CROWS_indicator(ticker, data):
@@ -1742,11 +1736,11 @@ def CDLUPSIDEGAP2CROWS_indicator(ticker, data):
         data["Open"], data["High"], data["Low"], data["Close"]
     )
     if cdlupsidegap2crows.iloc[-1] > 0:
-        return "Buy"
+        return BUY
     elif cdlupsidegap2crows.iloc[-1] < 0:
-        return "Sell"
+        return SELL
     else:
-        return "Hold"
+        return HOLD
 
 
 def CDLXSIDEGAP3METHODS_indicator(ticker, data):
@@ -1756,11 +1750,11 @@ def CDLXSIDEGAP3METHODS_indicator(ticker, data):
         data["Open"], data["High"], data["Low"], data["Close"]
     )
     if cdlxsidegap3methods.iloc[-1] > 0:
-        return "Buy"
+        return BUY
     elif cdlxsidegap3methods.iloc[-1] < 0:
-        return "Sell"
+        return SELL
     else:
-        return "Hold"
+        return HOLD
 
 
 # Statistic Functions
@@ -1771,11 +1765,11 @@ def BETA_indicator(ticker, data):
 
     beta = ta.BETA(data["High"], data["Low"], timeperiod=5)
     if beta.iloc[-1] > 1:
-        return "Buy"
+        return BUY
     elif beta.iloc[-1] < 1:
-        return "Sell"
+        return SELL
     else:
-        return "Hold"
+        return HOLD
 
 
 def CORREL_indicator(ticker, data):
@@ -1783,11 +1777,11 @@ def CORREL_indicator(ticker, data):
 
     correl = ta.CORREL(data["High"], data["Low"], timeperiod=30)
     if correl.iloc[-1] > 0.5:
-        return "Buy"
+        return BUY
     elif correl.iloc[-1] < -0.5:
-        return "Sell"
+        return SELL
     else:
-        return "Hold"
+        return HOLD
 
 
 def LINEARREG_indicator(ticker, data):
@@ -1795,11 +1789,11 @@ def LINEARREG_indicator(ticker, data):
 
     linearreg = ta.LINEARREG(data["Close"], timeperiod=14)
     if data["Close"].iloc[-1] > linearreg.iloc[-1]:
-        return "Buy"
+        return BUY
     elif data["Close"].iloc[-1] < linearreg.iloc[-1]:
-        return "Sell"
+        return SELL
     else:
-        return "Hold"
+        return HOLD
 
 
 def LINEARREG_ANGLE_indicator(ticker, data):
@@ -1807,11 +1801,11 @@ def LINEARREG_ANGLE_indicator(ticker, data):
 
     linearreg_angle = ta.LINEARREG_ANGLE(data["Close"], timeperiod=14)
     if linearreg_angle.iloc[-1] > 0:
-        return "Buy"
+        return BUY
     elif linearreg_angle.iloc[-1] < 0:
-        return "Sell"
+        return SELL
     else:
-        return "Hold"
+        return HOLD
 
 
 def LINEARREG_INTERCEPT_indicator(ticker, data):
@@ -1819,11 +1813,11 @@ def LINEARREG_INTERCEPT_indicator(ticker, data):
 
     linearreg_intercept = ta.LINEARREG_INTERCEPT(data["Close"], timeperiod=14)
     if data["Close"].iloc[-1] > linearreg_intercept.iloc[-1]:
-        return "Buy"
+        return BUY
     elif data["Close"].iloc[-1] < linearreg_intercept.iloc[-1]:
-        return "Sell"
+        return SELL
     else:
-        return "Hold"
+        return HOLD
 
 
 def LINEARREG_SLOPE_indicator(ticker, data):
@@ -1831,11 +1825,11 @@ def LINEARREG_SLOPE_indicator(ticker, data):
 
     linearreg_slope = ta.LINEARREG_SLOPE(data["Close"], timeperiod=14)
     if linearreg_slope.iloc[-1] > 0:
-        return "Buy"
+        return BUY
     elif linearreg_slope.iloc[-1] < 0:
-        return "Sell"
+        return SELL
     else:
-        return "Hold"
+        return HOLD
 
 
 def STDDEV_indicator(ticker, data):
@@ -1843,11 +1837,11 @@ def STDDEV_indicator(ticker, data):
 
     stddev = ta.STDDEV(data["Close"], timeperiod=20, nbdev=1)
     if stddev.iloc[-1] > 20:
-        return "Buy"
+        return BUY
     elif stddev.iloc[-1] < 10:
-        return "Sell"
+        return SELL
     else:
-        return "Hold"
+        return HOLD
 
 
 def TSF_indicator(ticker, data):
@@ -1855,11 +1849,11 @@ def TSF_indicator(ticker, data):
 
     tsf = ta.TSF(data["Close"], timeperiod=14)
     if data["Close"].iloc[-1] > tsf.iloc[-1]:
-        return "Buy"
+        return BUY
     elif data["Close"].iloc[-1] < tsf.iloc[-1]:
-        return "Sell"
+        return SELL
     else:
-        return "Hold"
+        return HOLD
 
 
 def VAR_indicator(ticker, data):
@@ -1867,8 +1861,8 @@ def VAR_indicator(ticker, data):
 
     var = ta.VAR(data["Close"], timeperiod=5, nbdev=1)
     if var.iloc[-1] > 20:
-        return "Buy"
+        return BUY
     elif var.iloc[-1] < 10:
-        return "Sell"
+        return SELL
     else:
-        return "Hold"
+        return HOLD
@@ -1,3 +1,6 @@
+from collections.abc import Mapping
+from functools import wraps
+
 import numpy as np
 import pandas as pd
 import talib as ta
@@ -8,31 +11,37 @@ import talib as ta
 Key Changes and Considerations:
 
     Vectorization: All calculations (ta.*) and comparisons (>, <)
-      are now done on entire Pandas Series.
+      are now done on entire NumPy arrays.
 
     numpy.select: This function is used to efficiently apply the conditional
-      logic ('Buy' if condition A, 'Sell' if condition B, 'Hold' otherwise)
-        across the whole Series.
+      logic (BUY = 1 if condition A, SELL = -1 if condition B, HOLD = 0
+        otherwise) across the whole Series.
+
+    Calling Convention: Strategies take read-only OHLCV arrays (PriceArrays)
+      and return a signal array. They never mutate or copy their input, so
+      one PriceArrays per ticker is shared by every strategy. Called with a
+      DataFrame, a strategy returns its signals as a Series named after the
+      strategy, indexed like the frame (see vectorized_strategy).
 
-    Return Value: Functions now modify the input DataFrame data by adding a
-      new signal column (e.g., data['SMA_Signal'] = ...) and return the
-        modified DataFrame. This is more flexible for further analysis.
+    Indicator Cache: Strategies get TA-Lib outputs through
+      PriceArrays.indicator, so a primitive shared by several strategies
+      (PLUS_DI/MINUS_DI, ADX, RSI, SMAs) is computed once per ticker.
 
     No .iloc[-1]: Accessing the last element (.iloc[-1]) is removed,
       as we operate on all rows.
 
     ticker Argument: The ticker argument is removed as it's no longer needed
      within the vectorized function. The function operates solely on the
-      provided data DataFrame.
+      provided price arrays.
 
     Helper Function:
       A _generate_signals helper simplifies the common np.select pattern.
 
     Pattern Recognition (CDL)*:
-      A helper _pattern_signals is used for the
-      standard Buy(100)/Sell(-100) logic of TA-Lib patterns.
-      You need to create a vectorized function for each CDL pattern similar
-        to the CDL2CROWS_vectorized example.
+      pattern_matrix evaluates every pattern in CDL_PATTERNS once per
+      ticker into an int8 (patterns x bars) matrix of Buy(1)/Sell(-1)/0.
+      Each CDL*_indicator returns its row (_pattern_signals). A new pattern
+      needs an entry in CDL_PATTERNS and a strategy like CDL2CROWS_indicator.
 
     Parameter Defaults:
       Some TA-Lib functions had unusual defaults in the
@@ -40,13 +49,10 @@ Key Changes and Considerations:
       in the vectorized versions but kept comments noting the original values.
       You can easily change these defaults.
 
-    MAMA/MAVP:
-      These functions sometimes require NumPy arrays instead of Series
-      depending on the TA-Lib version. The code includes a try-except block
-      to handle this, converting to .values if necessary and then back to a
-      Pandas Series with the correct index. For MAVP, you need to provide the
-      periods Series/array; the example shows how to create a basic one,
-      but your actual logic for variable periods might be more complex.
+    MAVP:
+      MAVP reads a "periods" array from the price arrays if there is one,
+      and otherwise uses a constant period of 30. Your actual logic for
+      variable periods might be more complex.
 
     Potentially Flawed Logic:
         Warnings have been added for indicators where the original Buy/Sell
@@ -55,9 +61,145 @@ Key Changes and Considerations:
         MINUS_DM/PLUS_DM comparison to 0, HT_TRENDMODE sell condition).
         Review these based on your actual trading strategy.
 
-    Clarity: Indicator values (like the actual SMA line) can optionally be
-    added to the DataFrame alongside the signals by uncommenting the relevant
-    lines (e.g., # data['SMA'] = sma)."""
+    Clarity: Indicator values (like the actual SMA line) are local arrays
+    and are not kept alongside the signals."""
+
+
+def _read_only(values):
+    """Returns a read-only view of values."""
+    values = np.asarray(values).view()
+    values.flags.writeable = False
+    return values
+
+
+class PriceArrays(Mapping):
+    """
+    Read-only mapping of price column name ("Open", "High", "Low", "Close",
+    "Volume", ...) to a float64 NumPy array, with the dates in .index.
+
+    from_frame views the frame's numeric columns without copying them where
+    pandas allows it; every array is marked read-only so strategies cannot
+    write into shared prices.
+
+    PriceArrays is also the ticker's indicator cache: indicator() computes a
+    TA-Lib function once per (function, input columns, parameters) and
+    returns the same read-only output to every strategy that asks for it.
+    indicator_hits and indicator_misses count cached and computed calls.
+    """
+
+    def __init__(self, arrays, index):
+        self._arrays = {}
+        for column, values in arrays.items():
+            self._arrays[column] = _read_only(
+                np.asarray(values, dtype=np.float64)
+            )
+        self.index = index
+        self._indicators = {}
+        self.indicator_hits = 0
+        self.indicator_misses = 0
+
+    @classmethod
+    def from_frame(cls, frame):
+        """
+        Builds PriceArrays from a DataFrame's numeric columns.
+        """
+        return cls(
+            {
+                column: frame[column].to_numpy(dtype=np.float64)
+                for column in frame.columns
+                if pd.api.types.is_numeric_dtype(frame[column])
+            },
+            frame.index,
+        )
+
+    @property
+    def columns(self):
+        return list(self._arrays)
+
+    def indicator(self, function, *columns, **params):
+        """
+        Returns function(*(self[column] for column in columns), **params),
+        computing it only the first time it is asked for.
+
+        Outputs are read-only arrays (a tuple of them for multi-output
+        functions such as MACD or STOCH).
+        """
+        key = (function, columns, tuple(sorted(params.items())))
+        result = self._indicators.get(key)
+        if result is not None:
+            self.indicator_hits += 1
+            return result
+        self.indicator_misses += 1
+        result = function(
+            *(self._arrays[column] for column in columns), **params
+        )
+        if isinstance(result, tuple):
+            result = tuple(_read_only(output) for output in result)
+        else:
+            result = _read_only(result)
+        self._indicators[key] = result
+        return result
+
+    def __getitem__(self, column):
+        return self._arrays[column]
+
+    def __iter__(self):
+        return iter(self._arrays)
+
+    def __len__(self):
+        return len(self._arrays)
+
+
+def vectorized_strategy(func):
+    """
+    Decorator for strategies written against PriceArrays.
+
+    Called with PriceArrays, the strategy returns its signal array. Called
+    with a DataFrame (the previous convention), the frame is viewed as
+    PriceArrays and the signals are returned as a Series named after the
+    strategy, indexed like the frame. The frame is left unchanged.
+    """
+
+    @wraps(func)
+    def strategy(data, *args, **kwargs):
+        if isinstance(data, pd.DataFrame):
+            return pd.Series(
+                func(PriceArrays.from_frame(data), *args, **kwargs),
+                index=data.index,
+                name=func.__name__,
+            )
+        return func(data, *args, **kwargs)
+
+    strategy.price_arrays = True
+    return strategy
+
+
+def strategy_signals(strategies, history, price_arrays=None):
+    """
+    Runs strategies over one ticker's price history.
+
+    PriceArrays strategies (vectorized_strategy) share a single read-only
+    view of the history, price_arrays if given. Other strategies get their
+    own copy of the frame and may return a Series or a DataFrame of signal
+    columns.
+
+    Returns a DataFrame of signal columns indexed like history.
+    """
+    if price_arrays is None:
+        price_arrays = PriceArrays.from_frame(history)
+    columns = {}
+    for strategy in strategies:
+        if getattr(strategy, "price_arrays", False):
+            columns[strategy.__name__] = strategy(price_arrays)
+            continue
+        result = strategy(history.copy())
+        if isinstance(result, pd.Series):
+            result = result.to_frame()
+        for column in result.columns:
+            columns[column] = result[column].to_numpy()
+    # copy=False keeps each signal array as its own block instead of
+    # consolidating (copying) them all into one.
+    return pd.DataFrame(columns, index=history.index, copy=False)
 
 
 # --- Helper Function for Common Logic ---
@@ -75,6 +217,30 @@ def _generate_signals(condition_buy, condition_sell, default=0):
     return np.select(conditions, choices, default=default)
 
 
+def _shift(values, periods):
+    """Shifts an array by periods (like Series.shift), filling with NaN."""
+    shifted = np.full(len(values), np.nan)
+    if abs(periods) >= len(values):
+        return shifted
+    if periods >= 0:
+        shifted[periods:] = values[: len(values) - periods]
+    else:
+        shifted[:periods] = values[-periods:]
+    return shifted
+
+
+def _sma_pair(data, fastperiod, slowperiod):
+    """
+    Returns the cached (fast, slow) SMAs of Close behind APO and PPO with
+    matype 0. Like TA-Lib, the shorter period is the fast one.
+    """
+    fastperiod, slowperiod = sorted((fastperiod, slowperiod))
+    return (
+        data.indicator(ta.SMA, "Close", timeperiod=fastperiod),
+        data.indicator(ta.SMA, "Close", timeperiod=slowperiod),
+    )
+
+
 # --- Numba-Accelerated Version ---
 # from numba import njit
 # @njit
@@ -105,157 +271,140 @@ def _generate_signals(condition_buy, condition_sell, default=0):
 # --- Overlap Studies ---
 
 
+@vectorized_strategy
 def BBANDS_indicator(data, timeperiod=20):
     """Vectorized Bollinger Bands (BBANDS) indicator signals."""
-    upper, middle, lower = ta.BBANDS(data["Close"], timeperiod=timeperiod)
-    data["BBANDS_indicator"] = _generate_signals(
+    upper, middle, lower = data.indicator(
+        ta.BBANDS, "Close", timeperiod=timeperiod
+    )
+    return _generate_signals(
         condition_buy=data["Close"] < lower,
         condition_sell=data["Close"] > upper,
     )
-    return data["BBANDS_indicator"]
 
 
+@vectorized_strategy
 def DEMA_indicator(data, timeperiod=30):
     """Vectorized Double Exponential Moving Average (DEMA)
     indicator signals."""
-    dema = ta.DEMA(data["Close"], timeperiod=timeperiod)
-    data["DEMA_indicator"] = _generate_signals(
+    dema = data.indicator(ta.DEMA, "Close", timeperiod=timeperiod)
+    return _generate_signals(
         condition_buy=data["Close"] > dema, condition_sell=data["Close"] < dema
     )
-    return data["DEMA_indicator"]
 
 
+@vectorized_strategy
 def EMA_indicator(data, timeperiod=30):
     """Vectorized Exponential Moving Average (EMA) indicator signals."""
-    ema = ta.EMA(data["Close"], timeperiod=timeperiod)
-    data["EMA_indicator"] = _generate_signals(
+    ema = data.indicator(ta.EMA, "Close", timeperiod=timeperiod)
+    return _generate_signals(
         condition_buy=data["Close"] > ema, condition_sell=data["Close"] < ema
     )
-    return data["EMA_indicator"]
 
 
+@vectorized_strategy
 def HT_TRENDLINE_indicator(data):
     """Vectorized Hilbert Transform -
     Instantaneous Trendline (HT_TRENDLINE) signals."""
-    ht_trendline = ta.HT_TRENDLINE(data["Close"])
-    data["HT_TRENDLINE_indicator"] = _generate_signals(
+    ht_trendline = data.indicator(ta.HT_TRENDLINE, "Close")
+    return _generate_signals(
         condition_buy=data["Close"] > ht_trendline,
         condition_sell=data["Close"] < ht_trendline,
     )
-    return data["HT_TRENDLINE_indicator"]
 
 
+@vectorized_strategy
 def KAMA_indicator(data, timeperiod=30):
     """Vectorized Kaufman Adaptive Moving Average (KAMA) indicator signals."""
-    kama = ta.KAMA(data["Close"], timeperiod=timeperiod)
-    data["KAMA_indicator"] = _generate_signals(
+    kama = data.indicator(ta.KAMA, "Close", timeperiod=timeperiod)
+    return _generate_signals(
         condition_buy=data["Close"] > kama, condition_sell=data["Close"] < kama
     )
-    return data["KAMA_indicator"]
 
 
+@vectorized_strategy
 def MA_indicator(data, timeperiod=30, matype=0):
     """Vectorized Moving average (MA) indicator signals."""
-    ma = ta.MA(
-        data["Close"], timeperiod=timeperiod, matype=matype  # type: ignore
-    )
-    data["MA_indicator"] = _generate_signals(
+    if matype == 0:
+        # MA with matype 0 is the SMA, shared with SMA_indicator.
+        ma = data.indicator(ta.SMA, "Close", timeperiod=timeperiod)
+    else:
+        ma = data.indicator(
+            ta.MA, "Close", timeperiod=timeperiod, matype=matype
+        )
+    return _generate_signals(
         condition_buy=data["Close"] > ma, condition_sell=data["Close"] < ma
     )
-    return data["MA_indicator"]
 
 
+@vectorized_strategy
 def MAMA_indicator(data, fastlimit=0.5, slowlimit=0.05):
     """Vectorized MESA Adaptive Moving Average (MAMA) indicator signals."""
-    try:
-        mama, fama = ta.MAMA(
-            data["Close"], fastlimit=fastlimit, slowlimit=slowlimit
-        )
-    except TypeError:
-        mama_vals, fama_vals = ta.MAMA(
-            data["Close"].values, fastlimit=fastlimit, slowlimit=slowlimit
-        )
-        mama = pd.Series(mama_vals, index=data.index)
-        # fama = pd.Series(fama_vals, index=data.index)
-
-    data["MAMA_indicator"] = _generate_signals(
+    mama, fama = data.indicator(
+        ta.MAMA, "Close", fastlimit=fastlimit, slowlimit=slowlimit
+    )
+    return _generate_signals(
         condition_buy=data["Close"] > mama, condition_sell=data["Close"] < mama
     )
-    return data["MAMA_indicator"]
 
 
+@vectorized_strategy
 def MAVP_indicator(data, minperiod=2, maxperiod=30, matype=0):
     if "periods" not in data.columns:
         # logger.warning(
         #     "Warning: 'periods' column not found for MAVP_indicator.
-        #  Creating a constant period Series (30.0)."
+        #  Creating a constant period array (30.0)."
         # )
-        periods_series = pd.Series(30.0, index=data.index)
-
-        periods_input = periods_series
+        periods = np.full(len(data["Close"]), 30.0)
     else:
-        periods_input = data["periods"].astype(float)
-
-    # periods_aligned = (
-    #     periods_input.reindex(data.index).fillna(method="ffill").fillna(30.0)
-    # )
-    periods_aligned = periods_input.reindex(data.index).ffill().fillna(30.0)
-
-    try:
-        mavp = ta.MAVP(
-            data["Close"],
-            periods=periods_aligned,  # type: ignore
-            minperiod=minperiod,
-            maxperiod=maxperiod,
-            matype=matype,  # type: ignore
-        )
-    except TypeError:
-        mavp_vals = ta.MAVP(
-            data["Close"].values,
-            periods=periods_aligned.values,  # type: ignore
-            minperiod=minperiod,
-            maxperiod=maxperiod,
-            matype=matype,  # type: ignore
-        )
-        mavp = pd.Series(mavp_vals, index=data.index)
+        periods = pd.Series(data["periods"]).ffill().fillna(30.0).to_numpy()
 
-    data["MAVP_indicator"] = _generate_signals(
+    mavp = ta.MAVP(
+        data["Close"],
+        periods=periods,  # type: ignore
+        minperiod=minperiod,
+        maxperiod=maxperiod,
+        matype=matype,  # type: ignore
+    )
+    return _generate_signals(
         condition_buy=data["Close"] > mavp, condition_sell=data["Close"] < mavp
     )
-    return data["MAVP_indicator"]
 
 
+@vectorized_strategy
 def MIDPOINT_indicator(data, timeperiod=14):
     """Vectorized MidPoint over period (MIDPOINT) indicator signals."""
-    midpoint = ta.MIDPOINT(data["Close"], timeperiod=timeperiod)
-    data["MIDPOINT_indicator"] = _generate_signals(
+    midpoint = data.indicator(ta.MIDPOINT, "Close", timeperiod=timeperiod)
+    return _generate_signals(
         condition_buy=data["Close"] > midpoint,
         condition_sell=data["Close"] < midpoint,
     )
-    return data["MIDPOINT_indicator"]
 
 
+@vectorized_strategy
 def MIDPRICE_indicator(data, timeperiod=14):
     """Vectorized Midpoint Price over period (MIDPRICE) indicator signals."""
-    midprice = ta.MIDPRICE(data["High"], data["Low"], timeperiod=timeperiod)
-    data["MIDPRICE_indicator"] = _generate_signals(
+    midprice = data.indicator(
+        ta.MIDPRICE, "High", "Low", timeperiod=timeperiod
+    )
+    return _generate_signals(
         condition_buy=data["Close"] > midprice,
         condition_sell=data["Close"] < midprice,
     )
-    return data["MIDPRICE_indicator"]
 
 
+@vectorized_strategy
 def SAR_indicator(data, acceleration=0.02, maximum=0.2):
     """Vectorized Parabolic SAR (SAR) indicator signals."""
-    sar = ta.SAR(
-        data["High"], data["Low"], acceleration=acceleration, maximum=maximum
+    sar = data.indicator(
+        ta.SAR, "High", "Low", acceleration=acceleration, maximum=maximum
     )
-    data["SAR_indicator"] = _generate_signals(
+    return _generate_signals(
         condition_buy=data["Close"] > sar, condition_sell=data["Close"] < sar
     )
-    return data["SAR_indicator"]
 
 
+@vectorized_strategy
 def SAREXT_indicator(
     data,
     startvalue=0,
@@ -268,9 +417,10 @@ def SAREXT_indicator(
     accelerationmaxshort=0.2,
 ):
     """Vectorized Parabolic SAR - Extended (SAREXT) indicator signals."""
-    sarext = ta.SAREXT(
-        data["High"],
-        data["Low"],
+    sarext = data.indicator(
+        ta.SAREXT,
+        "High",
+        "Low",
         startvalue=startvalue,
         offsetonreverse=offsetonreverse,
         accelerationinitlong=accelerationinitlong,
@@ -280,95 +430,90 @@ def SAREXT_indicator(
         accelerationshort=accelerationshort,
         accelerationmaxshort=accelerationmaxshort,
     )
-    data["SAREXT_indicator"] = _generate_signals(
+    return _generate_signals(
         condition_buy=data["Close"] > sarext,
         condition_sell=data["Close"] < sarext,
     )
-    return data["SAREXT_indicator"]
 
 
+@vectorized_strategy
 def SMA_indicator(data, timeperiod=30):
     """Vectorized Simple Moving Average (SMA) indicator signals."""
-    sma = ta.SMA(data["Close"], timeperiod=timeperiod)
-    data["SMA_indicator"] = _generate_signals(
+    sma = data.indicator(ta.SMA, "Close", timeperiod=timeperiod)
+    return _generate_signals(
         condition_buy=data["Close"] > sma, condition_sell=data["Close"] < sma
     )
-    return data["SMA_indicator"]
 
 
+@vectorized_strategy
 def T3_indicator(data, timeperiod=5, vfactor=0.7):
     """Vectorized Triple Exponential Moving Average (T3) indicator signals."""
-    t3 = ta.T3(data["Close"], timeperiod=timeperiod, vfactor=vfactor)
-    data["T3_indicator"] = _generate_signals(
+    t3 = data.indicator(ta.T3, "Close", timeperiod=timeperiod, vfactor=vfactor)
+    return _generate_signals(
         condition_buy=data["Close"] > t3, condition_sell=data["Close"] < t3
     )
-    return data["T3_indicator"]
 
 
+@vectorized_strategy
 def TEMA_indicator(data, timeperiod=30):
     """Vectorized Triple Exponential Moving Average (TEMA) indicator sigs."""
-    tema = ta.TEMA(data["Close"], timeperiod=timeperiod)
-    data["TEMA_indicator"] = _generate_signals(
+    tema = data.indicator(ta.TEMA, "Close", timeperiod=timeperiod)
+    return _generate_signals(
         condition_buy=data["Close"] > tema, condition_sell=data["Close"] < tema
     )
-    return data["TEMA_indicator"]
 
 
+@vectorized_strategy
 def TRIMA_indicator(data, timeperiod=30):
     """Vectorized Triangular Moving Average (TRIMA) indicator signals."""
-    trima = ta.TRIMA(data["Close"], timeperiod=timeperiod)
-    data["TRIMA_indicator"] = _generate_signals(
+    trima = data.indicator(ta.TRIMA, "Close", timeperiod=timeperiod)
+    return _generate_signals(
         condition_buy=data["Close"] > trima,
         condition_sell=data["Close"] < trima,
     )
-    return data["TRIMA_indicator"]
 
 
+@vectorized_strategy
 def WMA_indicator(data, timeperiod=30):
     """Vectorized Weighted Moving Average (WMA) indicator signals."""
-    wma = ta.WMA(data["Close"], timeperiod=timeperiod)
-    data["WMA_indicator"] = _generate_signals(
+    wma = data.indicator(ta.WMA, "Close", timeperiod=timeperiod)
+    return _generate_signals(
         condition_buy=data["Close"] > wma, condition_sell=data["Close"] < wma
     )
-    return data["WMA_indicator"]
 
 
 # --- Revised Momentum Indicators ---
 
 
+@vectorized_strategy
 def ADX_indicator(data, timeperiod=14, adx_threshold=20):
     """
     Vectorized ADX indicator signals based on DI+/DI- crossover,
     filtered by ADX strength.
     """
-    adx = ta.ADX(
-        data["High"], data["Low"], data["Close"], timeperiod=timeperiod
+    adx = data.indicator(ta.ADX, "High", "Low", "Close", timeperiod=timeperiod)
+    plus_di = data.indicator(
+        ta.PLUS_DI, "High", "Low", "Close", timeperiod=timeperiod
     )
-    plus_di = ta.PLUS_DI(
-        data["High"], data["Low"], data["Close"], timeperiod=timeperiod
-    )
-    minus_di = ta.MINUS_DI(
-        data["High"], data["Low"], data["Close"], timeperiod=timeperiod
+    minus_di = data.indicator(
+        ta.MINUS_DI, "High", "Low", "Close", timeperiod=timeperiod
     )
 
     di_cross_up = (plus_di > minus_di) & (
-        plus_di.shift(1) <= minus_di.shift(1)  # type: ignore
+        _shift(plus_di, 1) <= _shift(minus_di, 1)
     )
     di_cross_down = (minus_di > plus_di) & (
-        minus_di.shift(1) <= plus_di.shift(1)  # type: ignore
+        _shift(minus_di, 1) <= _shift(plus_di, 1)
     )
     is_trending = adx > adx_threshold
 
-    conditions = [
-        (di_cross_up) & is_trending,
-        (di_cross_down) & is_trending,
-    ]
-    choices = ["Buy", "Sell"]
-    data["ADX_indicator"] = np.select(conditions, choices, default="Hold")
-
-    return data["ADX_indicator"]
+    return _generate_signals(
+        condition_buy=di_cross_up & is_trending,
+        condition_sell=di_cross_down & is_trending,
+    )
 
 
+@vectorized_strategy
 def ADXR_indicator(data, timeperiod=14, adx_threshold=20):
     """
     Vectorized ADXR indicator signals. ADXR smooths ADX.
@@ -376,32 +521,31 @@ def ADXR_indicator(data, timeperiod=14, adx_threshold=20):
     Note:
     Using ADXR > threshold is less common than ADX > threshold for filtering.
     """
-    adxr = ta.ADXR(
-        data["High"], data["Low"], data["Close"], timeperiod=timeperiod
+    # ADXR averages ADX with its value timeperiod - 1 bars earlier, which is
+    # how TA-Lib computes it; the ADX is shared with ADX_indicator.
+    adx = data.indicator(ta.ADX, "High", "Low", "Close", timeperiod=timeperiod)
+    adxr = (adx + _shift(adx, timeperiod - 1)) / 2
+    plus_di = data.indicator(
+        ta.PLUS_DI, "High", "Low", "Close", timeperiod=timeperiod
     )
-    plus_di = ta.PLUS_DI(
-        data["High"], data["Low"], data["Close"], timeperiod=timeperiod
-    )
-    minus_di = ta.MINUS_DI(
-        data["High"], data["Low"], data["Close"], timeperiod=timeperiod
+    minus_di = data.indicator(
+        ta.MINUS_DI, "High", "Low", "Close", timeperiod=timeperiod
     )
 
     is_trending = adxr > adx_threshold
 
-    conditions = [
-        (plus_di > minus_di) & is_trending,
-        (minus_di > plus_di) & is_trending,
-    ]
-    choices = ["Buy", "Sell"]
-    data["ADXR_indicator"] = np.select(conditions, choices, default="Hold")
+    return _generate_signals(
+        condition_buy=(plus_di > minus_di) & is_trending,
+        condition_sell=(minus_di > plus_di) & is_trending,
+    )
 
     # logger.warning(
     #     "Warning: Filtering signals based on ADXR >
     #  threshold is less common than using ADX."
     # )
-    return data["ADXR_indicator"]
 
 
+@vectorized_strategy
 def CCI_indicator(data, timeperiod=14, buy_level=-100, sell_level=100):
     """
     Vectorized Commodity Channel Index (CCI) indicator signals.
@@ -409,75 +553,69 @@ def CCI_indicator(data, timeperiod=14, buy_level=-100, sell_level=100):
     Sell when crossing DOWN from overbought (> sell_level).
     Simplified version: Buy if < buy_level, Sell if > sell_level.
     """
-    cci = ta.CCI(
-        data["High"], data["Low"], data["Close"], timeperiod=timeperiod
-    )
+    cci = data.indicator(ta.CCI, "High", "Low", "Close", timeperiod=timeperiod)
 
-    data["CCI_indicator"] = _generate_signals(
+    return _generate_signals(
         condition_buy=cci < buy_level,
         condition_sell=cci > sell_level,
     )
-    return data["CCI_indicator"]
 
 
+@vectorized_strategy
 def CMO_indicator(data, timeperiod=14, buy_level=-50, sell_level=50):
     """
     Vectorized Chande Momentum Oscillator (CMO) indicator signals.
     Standard interpretation: Buy when oversold (< buy_level),
     Sell when overbought (> sell_level).
     """
-    cmo = ta.CMO(data["Close"], timeperiod=timeperiod)
+    cmo = data.indicator(ta.CMO, "Close", timeperiod=timeperiod)
 
-    data["CMO_indicator"] = _generate_signals(
+    return _generate_signals(
         condition_buy=cmo < buy_level,
         condition_sell=cmo > sell_level,
     )
-    return data["CMO_indicator"]
 
 
+@vectorized_strategy
 def DX_indicator(data, timeperiod=14, dx_threshold=20):
     """
     Vectorized Directional Movement Index (DX) indicator signals.
     DX measures spread between DI+ and DI-. High DX = Strong trend.
     Using DI+/DI- crossover logic, filtered by DX strength.
     """
-    dx = ta.DX(data["High"], data["Low"], data["Close"], timeperiod=timeperiod)
-    plus_di = ta.PLUS_DI(
-        data["High"], data["Low"], data["Close"], timeperiod=timeperiod
+    dx = data.indicator(ta.DX, "High", "Low", "Close", timeperiod=timeperiod)
+    plus_di = data.indicator(
+        ta.PLUS_DI, "High", "Low", "Close", timeperiod=timeperiod
     )
-    minus_di = ta.MINUS_DI(
-        data["High"], data["Low"], data["Close"], timeperiod=timeperiod
+    minus_di = data.indicator(
+        ta.MINUS_DI, "High", "Low", "Close", timeperiod=timeperiod
     )
 
     is_trending = dx > dx_threshold
 
-    conditions = [
-        (plus_di > minus_di) & is_trending,
-        (minus_di > plus_di) & is_trending,
-    ]
-    choices = ["Buy", "Sell"]
-    data["DX_indicator"] = np.select(conditions, choices, default="Hold")
-
-    return data["DX_indicator"]
+    return _generate_signals(
+        condition_buy=(plus_di > minus_di) & is_trending,
+        condition_sell=(minus_di > plus_di) & is_trending,
+    )
 
 
+@vectorized_strategy
 def PLUS_MINUS_DI_indicator(data, timeperiod=14):
     """
     Vectorized Minus Directional Indicator (MINUS_DI) signals.
     Revised Logic: Sell if DI- is dominant (DI- > DI+).
     """
-    plus_di = ta.PLUS_DI(
-        data["High"], data["Low"], data["Close"], timeperiod=timeperiod
+    plus_di = data.indicator(
+        ta.PLUS_DI, "High", "Low", "Close", timeperiod=timeperiod
     )
-    minus_di = ta.MINUS_DI(
-        data["High"], data["Low"], data["Close"], timeperiod=timeperiod
+    minus_di = data.indicator(
+        ta.MINUS_DI, "High", "Low", "Close", timeperiod=timeperiod
     )
 
-    data["PLUS_MINUS_DI_indicator"] = _generate_signals(
+    return _generate_signals(
         condition_buy=plus_di > minus_di,
         condition_sell=minus_di > plus_di,
     )
-    return data["PLUS_MINUS_DI_indicator"]
 
 
 # --- Momentum Indicators ---
@@ -505,47 +643,50 @@ def PLUS_MINUS_DI_indicator(data, timeperiod=14):
 #     return data["ADXR_indicator"]
 
 
+@vectorized_strategy
 def APO_indicator(data, fastperiod=12, slowperiod=26, matype=0):
     """Vectorized Absolute Price Oscillator (APO) indicator signals."""
-    apo = ta.APO(
-        data["Close"],
-        fastperiod=fastperiod,
-        slowperiod=slowperiod,
-        matype=matype,  # type: ignore
-    )
-    data["APO_indicator"] = _generate_signals(
-        condition_buy=apo > 0, condition_sell=apo < 0
-    )
-    return data["APO_indicator"]
+    if matype == 0:
+        fast, slow = _sma_pair(data, fastperiod, slowperiod)
+        apo = fast - slow
+    else:
+        apo = data.indicator(
+            ta.APO,
+            "Close",
+            fastperiod=fastperiod,
+            slowperiod=slowperiod,
+            matype=matype,
+        )
+    return _generate_signals(condition_buy=apo > 0, condition_sell=apo < 0)
 
 
+@vectorized_strategy
 def AROON_indicator(data, timeperiod=14):
     """Vectorized Aroon (AROON) indicator signals."""
-    aroon_down, aroon_up = ta.AROON(
-        data["High"], data["Low"], timeperiod=timeperiod
+    aroon_down, aroon_up = data.indicator(
+        ta.AROON, "High", "Low", timeperiod=timeperiod
     )
-    data["AROON_indicator"] = _generate_signals(
+    return _generate_signals(
         condition_buy=aroon_up > 70, condition_sell=aroon_down > 70
     )
-    return data["AROON_indicator"]
 
 
+@vectorized_strategy
 def AROONOSC_indicator(data, timeperiod=14):
     """Vectorized Aroon Oscillator (AROONOSC) indicator signals."""
-    aroonosc = ta.AROONOSC(data["High"], data["Low"], timeperiod=timeperiod)
-    data["AROONOSC_indicator"] = _generate_signals(
+    aroonosc = data.indicator(
+        ta.AROONOSC, "High", "Low", timeperiod=timeperiod
+    )
+    return _generate_signals(
         condition_buy=aroonosc > 0, condition_sell=aroonosc < 0
     )
-    return data["AROONOSC_indicator"]
 
 
+@vectorized_strategy
 def BOP_indicator(data):
     """Vectorized Balance Of Power (BOP) indicator signals."""
-    bop = ta.BOP(data["Open"], data["High"], data["Low"], data["Close"])
-    data["BOP_indicator"] = _generate_signals(
-        condition_buy=bop > 0, condition_sell=bop < 0
-    )
-    return data["BOP_indicator"]
+    bop = data.indicator(ta.BOP, "Open", "High", "Low", "Close")
+    return _generate_signals(condition_buy=bop > 0, condition_sell=bop < 0)
 
 
 # def CCI_indicator_old(data, timeperiod=14):
@@ -577,22 +718,24 @@ def BOP_indicator(data):
 #     return data["DX_indicator"]
 
 
+@vectorized_strategy
 def MACD_indicator(data, fastperiod=12, slowperiod=26, signalperiod=9):
     """Vectorized Moving Average Convergence/Divergence (MACD)
     indicator signals."""
-    macd, macdsignal, macdhist = ta.MACD(
-        data["Close"],
+    macd, macdsignal, macdhist = data.indicator(
+        ta.MACD,
+        "Close",
         fastperiod=fastperiod,
         slowperiod=slowperiod,
         signalperiod=signalperiod,
     )
-    data["MACD_indicator"] = _generate_signals(
+    return _generate_signals(
         condition_buy=macdhist > 0,
         condition_sell=macdhist < 0,
     )
-    return data["MACD_indicator"]
 
 
+@vectorized_strategy
 def MACDEXT_indicator(
     data,
     fastperiod=12,
@@ -603,48 +746,42 @@ def MACDEXT_indicator(
     signalmatype=0,
 ):
     """Vectorized MACD with controllable MA type (MACDEXT)."""
-    macd, macdsignal, macdhist = ta.MACDEXT(
-        data["Close"],
+    macd, macdsignal, macdhist = data.indicator(
+        ta.MACDEXT,
+        "Close",
         fastperiod=fastperiod,
-        fastmatype=fastmatype,  # type: ignore
+        fastmatype=fastmatype,
         slowperiod=slowperiod,
-        slowmatype=slowmatype,  # type: ignore
+        slowmatype=slowmatype,
         signalperiod=signalperiod,
-        signalmatype=signalmatype,  # type: ignore
+        signalmatype=signalmatype,
     )
-    data["MACDEXT_indicator"] = _generate_signals(
+    return _generate_signals(
         condition_buy=macdhist > 0, condition_sell=macdhist < 0
     )
-    return data["MACDEXT_indicator"]
 
 
+@vectorized_strategy
 def MACDFIX_indicator(data, signalperiod=9):
     """Vectorized Moving Average Convergence/Divergence Fix 12/26 (MACDFIX)."""
-    macd, macdsignal, macdhist = ta.MACDFIX(
-        data["Close"], signalperiod=signalperiod
+    macd, macdsignal, macdhist = data.indicator(
+        ta.MACDFIX, "Close", signalperiod=signalperiod
     )
-    data["MACDFIX_indicator"] = _generate_signals(
+    return _generate_signals(
         condition_buy=macdhist > 0, condition_sell=macdhist < 0
     )
-    return data["MACDFIX_indicator"]
 
 
+@vectorized_strategy
 def MFI_indicator(data, timeperiod=14):
     """Vectorized Money Flow Index (MFI) indicator signals."""
     if "Volume" not in data.columns:
         raise ValueError("MFI_indicator requires 'Volume' column in data")
 
-    mfi = ta.MFI(
-        data["High"],
-        data["Low"],
-        data["Close"],
-        data["Volume"],
-        timeperiod=timeperiod,
+    mfi = data.indicator(
+        ta.MFI, "High", "Low", "Close", "Volume", timeperiod=timeperiod
     )
-    data["MFI_indicator"] = _generate_signals(
-        condition_buy=mfi < 20, condition_sell=mfi > 80
-    )
-    return data["MFI_indicator"]
+    return _generate_signals(condition_buy=mfi < 20, condition_sell=mfi > 80)
 
 
 # def MINUS_DI_indicator_old(data, timeperiod=14):
@@ -671,10 +808,13 @@ def MFI_indicator(data, timeperiod=14):
 #     return data["PLUS_DI_indicator"]
 
 
+@vectorized_strategy
 def MINUS_DM_indicator(data, timeperiod=14):
     """Vectorized Minus Directional Movement (MINUS_DM) indicator signals."""
-    minus_dm = ta.MINUS_DM(data["High"], data["Low"], timeperiod=timeperiod)
-    data["MINUS_DM_indicator"] = _generate_signals(
+    minus_dm = data.indicator(
+        ta.MINUS_DM, "High", "Low", timeperiod=timeperiod
+    )
+    return _generate_signals(
         condition_buy=minus_dm < 0,
         condition_sell=minus_dm > 0,
     )
@@ -682,13 +822,13 @@ def MINUS_DM_indicator(data, timeperiod=14):
     #     "Warning: The implemented logic for MINUS_DM_indicator based on the
     #        original function seems potentially incorrect."
     # )
-    return data["MINUS_DM_indicator"]
 
 
+@vectorized_strategy
 def PLUS_DM_indicator(data, timeperiod=14):
     """Vectorized Plus Directional Movement (PLUS_DM) indicator signals."""
-    plus_dm = ta.PLUS_DM(data["High"], data["Low"], timeperiod=timeperiod)
-    data["PLUS_DM_indicator"] = _generate_signals(
+    plus_dm = data.indicator(ta.PLUS_DM, "High", "Low", timeperiod=timeperiod)
+    return _generate_signals(
         condition_buy=plus_dm > 0,
         condition_sell=plus_dm < 0,
     )
@@ -696,77 +836,71 @@ def PLUS_DM_indicator(data, timeperiod=14):
     #     "Warning: The implemented logic for PLUS_DM_indicator based on the
     #        original function seems potentially incorrect."
     # )
-    return data["PLUS_DM_indicator"]
 
 
+@vectorized_strategy
 def MOM_indicator(data, timeperiod=10):
     """Vectorized Momentum (MOM) indicator signals."""
-    mom = ta.MOM(data["Close"], timeperiod=timeperiod)
-    data["MOM_indicator"] = _generate_signals(
-        condition_buy=mom > 0, condition_sell=mom < 0
-    )
-    return data["MOM_indicator"]
+    mom = data.indicator(ta.MOM, "Close", timeperiod=timeperiod)
+    return _generate_signals(condition_buy=mom > 0, condition_sell=mom < 0)
 
 
+@vectorized_strategy
 def PPO_indicator(data, fastperiod=12, slowperiod=26, matype=0):
     """Vectorized Percentage Price Oscillator (PPO) indicator signals."""
-    ppo = ta.PPO(
-        data["Close"],
-        fastperiod=fastperiod,
-        slowperiod=slowperiod,
-        matype=matype,  # type: ignore
-    )
-    data["PPO_indicator"] = _generate_signals(
-        condition_buy=ppo > 0, condition_sell=ppo < 0
-    )
-    return data["PPO_indicator"]
+    if matype == 0:
+        fast, slow = _sma_pair(data, fastperiod, slowperiod)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            ppo = np.where(slow != 0, ((fast - slow) / slow) * 100, 0.0)
+    else:
+        ppo = data.indicator(
+            ta.PPO,
+            "Close",
+            fastperiod=fastperiod,
+            slowperiod=slowperiod,
+            matype=matype,
+        )
+    return _generate_signals(condition_buy=ppo > 0, condition_sell=ppo < 0)
 
 
+@vectorized_strategy
 def ROC_indicator(data, timeperiod=10):
     """Vectorized Rate of change : ((price/prevPrice)-1)*100 (ROC) signals."""
-    roc = ta.ROC(data["Close"], timeperiod=timeperiod)
-    data["ROC_indicator"] = _generate_signals(
-        condition_buy=roc > 0, condition_sell=roc < 0
-    )
-    return data["ROC_indicator"]
+    roc = data.indicator(ta.ROC, "Close", timeperiod=timeperiod)
+    return _generate_signals(condition_buy=roc > 0, condition_sell=roc < 0)
 
 
+@vectorized_strategy
 def ROCP_indicator(data, timeperiod=10):
     """Vectorized Rate of change Percentage: (price-prevPrice)/prevPrice."""
-    rocp = ta.ROCP(data["Close"], timeperiod=timeperiod)
-    data["ROCP_indicator"] = _generate_signals(
-        condition_buy=rocp > 0, condition_sell=rocp < 0
-    )
-    return data["ROCP_indicator"]
+    rocp = data.indicator(ta.ROCP, "Close", timeperiod=timeperiod)
+    return _generate_signals(condition_buy=rocp > 0, condition_sell=rocp < 0)
 
 
+@vectorized_strategy
 def ROCR_indicator(data, timeperiod=10):
     """Vectorized Rate of change ratio: (price/prevPrice) signals."""
-    rocr = ta.ROCR(data["Close"], timeperiod=timeperiod)
-    data["ROCR_indicator"] = _generate_signals(
-        condition_buy=rocr > 1, condition_sell=rocr < 1
-    )
-    return data["ROCR_indicator"]
+    rocr = data.indicator(ta.ROCR, "Close", timeperiod=timeperiod)
+    return _generate_signals(condition_buy=rocr > 1, condition_sell=rocr < 1)
 
 
+@vectorized_strategy
 def ROCR100_indicator(data, timeperiod=10):
     """Vectorized Rate of change ratio 100 scale: (price/prevPrice)*100."""
-    rocr100 = ta.ROCR100(data["Close"], timeperiod=timeperiod)
-    data["ROCR100_indicator"] = _generate_signals(
+    rocr100 = data.indicator(ta.ROCR100, "Close", timeperiod=timeperiod)
+    return _generate_signals(
         condition_buy=rocr100 > 100, condition_sell=rocr100 < 100
     )
-    return data["ROCR100_indicator"]
 
 
+@vectorized_strategy
 def RSI_indicator(data, timeperiod=14):
     """Vectorized Relative Strength Index (RSI) indicator signals."""
-    rsi = ta.RSI(data["Close"], timeperiod=timeperiod)
-    data["RSI_indicator"] = _generate_signals(
-        condition_buy=rsi < 30, condition_sell=rsi > 70
-    )
-    return data["RSI_indicator"]
+    rsi = data.indicator(ta.RSI, "Close", timeperiod=timeperiod)
+    return _generate_signals(condition_buy=rsi < 30, condition_sell=rsi > 70)
 
 
+@vectorized_strategy
 def STOCH_indicator(
     data,
     fastk_period=5,
@@ -776,95 +910,100 @@ def STOCH_indicator(
     slowd_matype=0,
 ):
     """Vectorized Stochastic (STOCH) indicator signals (using SlowK)."""
-    slowk, slowd = ta.STOCH(
-        data["High"],
-        data["Low"],
-        data["Close"],
+    slowk, slowd = data.indicator(
+        ta.STOCH,
+        "High",
+        "Low",
+        "Close",
         fastk_period=fastk_period,
         slowk_period=slowk_period,
-        slowk_matype=slowk_matype,  # type: ignore
+        slowk_matype=slowk_matype,
         slowd_period=slowd_period,
-        slowd_matype=slowd_matype,  # type: ignore
+        slowd_matype=slowd_matype,
     )
-    data["STOCH_indicator"] = _generate_signals(
+    return _generate_signals(
         condition_buy=slowk < 20, condition_sell=slowk > 80
     )
-    return data["STOCH_indicator"]
 
 
+@vectorized_strategy
 def STOCHF_indicator(data, fastk_period=5, fastd_period=3, fastd_matype=0):
     """Vectorized Stochastic Fast (STOCHF) indicator signals (using FastK)."""
-    fastk, fastd = ta.STOCHF(
-        data["High"],
-        data["Low"],
-        data["Close"],
+    fastk, fastd = data.indicator(
+        ta.STOCHF,
+        "High",
+        "Low",
+        "Close",
         fastk_period=fastk_period,
         fastd_period=fastd_period,
-        fastd_matype=fastd_matype,  # type: ignore
+        fastd_matype=fastd_matype,
     )
-    data["STOCHF_indicator"] = _generate_signals(
+    return _generate_signals(
         condition_buy=fastk < 20, condition_sell=fastk > 80
     )
-    return data["STOCHF_indicator"]
 
 
+@vectorized_strategy
 def STOCHRSI_indicator(
     data, timeperiod=14, fastk_period=5, fastd_period=3, fastd_matype=0
 ):
     """Vectorized Stochastic Relative Strength Index (STOCHRSI)
     signals (using FastK)."""
-    fastk, fastd = ta.STOCHRSI(
-        data["Close"],
-        timeperiod=timeperiod,
+    # STOCHRSI is STOCHF over the RSI, as in TA-Lib; the RSI is shared with
+    # RSI_indicator.
+    rsi = data.indicator(ta.RSI, "Close", timeperiod=timeperiod)
+    fastk, fastd = ta.STOCHF(
+        rsi,
+        rsi,
+        rsi,
         fastk_period=fastk_period,
         fastd_period=fastd_period,
         fastd_matype=fastd_matype,  # type: ignore
     )
-    data["STOCHRSI_indicator"] = _generate_signals(
+    return _generate_signals(
         condition_buy=fastk < 20, condition_sell=fastk > 80
     )
-    return data["STOCHRSI_indicator"]
 
 
+@vectorized_strategy
 def TRIX_indicator(data, timeperiod=30):
     """Vectorized 1-day ROC of a Triple Smooth EMA (TRIX) indicator signals."""
-    trix = ta.TRIX(data["Close"], timeperiod=timeperiod)
-    data["TRIX_indicator"] = _generate_signals(
-        condition_buy=trix > 0, condition_sell=trix < 0
-    )
-    return data["TRIX_indicator"]
+    trix = data.indicator(ta.TRIX, "Close", timeperiod=timeperiod)
+    return _generate_signals(condition_buy=trix > 0, condition_sell=trix < 0)
 
 
+@vectorized_strategy
 def ULTOSC_indicator(data, timeperiod1=7, timeperiod2=14, timeperiod3=28):
     """Vectorized Ultimate Oscillator (ULTOSC) indicator signals."""
-    ultosc = ta.ULTOSC(
-        data["High"],
-        data["Low"],
-        data["Close"],
+    ultosc = data.indicator(
+        ta.ULTOSC,
+        "High",
+        "Low",
+        "Close",
         timeperiod1=timeperiod1,
         timeperiod2=timeperiod2,
         timeperiod3=timeperiod3,
     )
-    data["ULTOSC_indicator"] = _generate_signals(
+    return _generate_signals(
         condition_buy=ultosc < 30, condition_sell=ultosc > 70
     )
-    return data["ULTOSC_indicator"]
 
 
+@vectorized_strategy
 def WILLR_indicator(data, timeperiod=14):
     """Vectorized Williams' %R (WILLR) indicator signals."""
-    willr = ta.WILLR(
-        data["High"], data["Low"], data["Close"], timeperiod=timeperiod
+    willr = data.indicator(
+        ta.WILLR, "High", "Low", "Close", timeperiod=timeperiod
     )
-    data["WILLR_indicator"] = _generate_signals(
+    return _generate_signals(
         condition_buy=willr < -80, condition_sell=willr > -20
     )
-    return data["WILLR_indicator"]
 
 
 # --- Revised Volume Indicators ---
 
 
+@vectorized_strategy
 def AD_indicator(data, ma_period=20):
     """
     Vectorized Chaikin A/D Line (AD) indicator signals.
@@ -872,18 +1011,18 @@ def AD_indicator(data, ma_period=20):
     """
     if "Volume" not in data.columns:
         raise ValueError("AD_indicator requires 'Volume' column in data")
-    ad = ta.AD(data["High"], data["Low"], data["Close"], data["Volume"])
+    ad = data.indicator(ta.AD, "High", "Low", "Close", "Volume")
     ad_ma = ta.SMA(ad, timeperiod=ma_period)
 
-    data["AD_indicator"] = _generate_signals(
+    return _generate_signals(
         condition_buy=ad > ad_ma,
         condition_sell=ad < ad_ma,
     )
     # logger.warning("Note: AD_indicator revised logic
     #                    uses AD crossing its SMA.")
-    return data["AD_indicator"]
 
 
+@vectorized_strategy
 def OBV_indicator(data, ma_period=20):
     """
     Vectorized On Balance Volume (OBV) indicator signals.
@@ -891,16 +1030,15 @@ def OBV_indicator(data, ma_period=20):
     """
     if "Volume" not in data.columns:
         raise ValueError("OBV_indicator requires 'Volume' column in data")
-    obv = ta.OBV(data["Close"], data["Volume"])
+    obv = data.indicator(ta.OBV, "Close", "Volume")
     obv_ma = ta.SMA(obv, timeperiod=ma_period)
 
-    data["OBV_indicator"] = _generate_signals(
+    return _generate_signals(
         condition_buy=obv > obv_ma,
         condition_sell=obv < obv_ma,
     )
     # logger.warning("Note: OBV_indicator revised logic uses OBV crossing
     #                    its SMA.")
-    return data["OBV_indicator"]
 
 
 # --- Volume Indicators ---
@@ -921,22 +1059,21 @@ def OBV_indicator(data, ma_period=20):
 #     return data["AD_indicator"]
 
 
+@vectorized_strategy
 def ADOSC_indicator(data, fastperiod=3, slowperiod=10):
     """Vectorized Chaikin A/D Oscillator (ADOSC) indicator signals."""
     if "Volume" not in data.columns:
         raise ValueError("ADOSC_indicator requires 'Volume' column in data")
-    adosc = ta.ADOSC(
-        data["High"],
-        data["Low"],
-        data["Close"],
-        data["Volume"],
+    adosc = data.indicator(
+        ta.ADOSC,
+        "High",
+        "Low",
+        "Close",
+        "Volume",
         fastperiod=fastperiod,
         slowperiod=slowperiod,
     )
-    data["ADOSC_indicator"] = _generate_signals(
-        condition_buy=adosc > 0, condition_sell=adosc < 0
-    )
-    return data["ADOSC_indicator"]
+    return _generate_signals(condition_buy=adosc > 0, condition_sell=adosc < 0)
 
 
 # def OBV_indicator_old(data):
@@ -957,14 +1094,15 @@ def ADOSC_indicator(data, fastperiod=3, slowperiod=10):
 # --- Revised Cycle Indicators ---
 
 
+@vectorized_strategy
 def HT_TRENDMODE_indicator(data):
     """
     Vectorized Hilbert Transform - Trend vs Cycle Mode (HT_TRENDMODE) signals.
     Revised logic: Buy in Trend Mode (1), Sell in Cycle Mode (0).
     """
-    ht_trendmode = ta.HT_TRENDMODE(data["Close"])
+    ht_trendmode = data.indicator(ta.HT_TRENDMODE, "Close")
 
-    data["HT_TRENDMODE_indicator"] = _generate_signals(
+    return _generate_signals(
         condition_buy=ht_trendmode == 1,
         condition_sell=ht_trendmode == 0,
     )
@@ -972,50 +1110,49 @@ def HT_TRENDMODE_indicator(data):
     #     "Note: HT_TRENDMODE_indicator revised logic: Buy on Trend(1),
     #        Sell on Cycle(0)."
     # )
-    return data["HT_TRENDMODE_indicator"]
 
 
 # --- Cycle Indicators ---
 
 
+@vectorized_strategy
 def HT_DCPERIOD_indicator(data):
     """Vectorized Hilbert Transform - Dominant Cycle Period (HT_DCPERIOD)."""
-    ht_dcperiod = ta.HT_DCPERIOD(data["Close"])
-    data["HT_DCPERIOD_indicator"] = _generate_signals(
+    ht_dcperiod = data.indicator(ta.HT_DCPERIOD, "Close")
+    return _generate_signals(
         condition_buy=ht_dcperiod > 20,
         condition_sell=ht_dcperiod < 10,
     )
-    return data["HT_DCPERIOD_indicator"]
 
 
+@vectorized_strategy
 def HT_DCPHASE_indicator(data):
     """Vectorized Hilbert Transform - Dominant Cycle Phase (HT_DCPHASE)."""
-    ht_dcphase = ta.HT_DCPHASE(data["Close"])
-    data["HT_DCPHASE_indicator"] = _generate_signals(
+    ht_dcphase = data.indicator(ta.HT_DCPHASE, "Close")
+    return _generate_signals(
         condition_buy=ht_dcphase > 0, condition_sell=ht_dcphase < 0
     )
-    return data["HT_DCPHASE_indicator"]
 
 
+@vectorized_strategy
 def HT_PHASOR_indicator(data):
     """Vectorized Hilbert Transform - Phasor Components (HT_PHASOR)
     signals (using inphase)."""
-    inphase, quadrature = ta.HT_PHASOR(data["Close"])
-    data["HT_PHASOR_indicator"] = _generate_signals(
+    inphase, quadrature = data.indicator(ta.HT_PHASOR, "Close")
+    return _generate_signals(
         condition_buy=inphase > 0, condition_sell=inphase < 0
     )
-    return data["HT_PHASOR_indicator"]
 
 
+@vectorized_strategy
 def HT_SINE_indicator(data):
     """Vectorized Hilbert Transform - SineWave (HT_SINE) indicator signals
     (using sine)."""
-    sine, leadsine = ta.HT_SINE(data["Close"])
-    data["HT_SINE_indicator"] = _generate_signals(
+    sine, leadsine = data.indicator(ta.HT_SINE, "Close")
+    return _generate_signals(
         condition_buy=sine > 0,
         condition_sell=sine < 0,
     )
-    return data["HT_SINE_indicator"]
 
 
 # def HT_TRENDMODE_indicator_old(data):
@@ -1035,63 +1172,60 @@ def HT_SINE_indicator(data):
 # --- Price Transform ---
 
 
+@vectorized_strategy
 def AVGPRICE_indicator(data):
     """Vectorized Average Price (AVGPRICE) indicator signals."""
-    avgprice = ta.AVGPRICE(
-        data["Open"], data["High"], data["Low"], data["Close"]
-    )
-    data["AVGPRICE_indicator"] = _generate_signals(
+    avgprice = data.indicator(ta.AVGPRICE, "Open", "High", "Low", "Close")
+    return _generate_signals(
         condition_buy=data["Close"] > avgprice,
         condition_sell=data["Close"] < avgprice,
     )
-    return data["AVGPRICE_indicator"]
 
 
+@vectorized_strategy
 def MEDPRICE_indicator(data):
     """Vectorized Median Price (MEDPRICE) indicator signals."""
-    medprice = ta.MEDPRICE(data["High"], data["Low"])
-    data["MEDPRICE_indicator"] = _generate_signals(
+    medprice = data.indicator(ta.MEDPRICE, "High", "Low")
+    return _generate_signals(
         condition_buy=data["Close"] > medprice,
         condition_sell=data["Close"] < medprice,
     )
-    return data["MEDPRICE_indicator"]
 
 
+@vectorized_strategy
 def TYPPRICE_indicator(data):
     """Vectorized Typical Price (TYPPRICE) indicator signals."""
-    typprice = ta.TYPPRICE(data["High"], data["Low"], data["Close"])
-    data["TYPPRICE_indicator"] = _generate_signals(
+    typprice = data.indicator(ta.TYPPRICE, "High", "Low", "Close")
+    return _generate_signals(
         condition_buy=data["Close"] > typprice,
         condition_sell=data["Close"] < typprice,
     )
-    return data["TYPPRICE_indicator"]
 
 
+@vectorized_strategy
 def WCLPRICE_indicator(data):
     """Vectorized Weighted Close Price (WCLPRICE) indicator signals."""
-    wclprice = ta.WCLPRICE(data["High"], data["Low"], data["Close"])
-    data["WCLPRICE_indicator"] = _generate_signals(
+    wclprice = data.indicator(ta.WCLPRICE, "High", "Low", "Close")
+    return _generate_signals(
         condition_buy=data["Close"] > wclprice,
         condition_sell=data["Close"] < wclprice,
     )
-    return data["WCLPRICE_indicator"]
 
 
 # --- Revised Volatility Indicators ---
 
 
+@vectorized_strategy
 def ATR_indicator(data, timeperiod=14, ma_period=14):
     """
     Vectorized Average True Range (ATR) indicator signals.
     Revised logic: Compare ATR to its moving average.
     WARNING: This is not a standard signal generation technique for ATR.
     """
-    atr = ta.ATR(
-        data["High"], data["Low"], data["Close"], timeperiod=timeperiod
-    )
+    atr = data.indicator(ta.ATR, "High", "Low", "Close", timeperiod=timeperiod)
     atr_ma = ta.SMA(atr, timeperiod=ma_period)
 
-    data["ATR_indicator"] = _generate_signals(
+    return _generate_signals(
         condition_buy=atr > atr_ma,
         condition_sell=atr < atr_ma,
     )
@@ -1099,21 +1233,21 @@ def ATR_indicator(data, timeperiod=14, ma_period=14):
     #     "Warning: ATR_indicator revised logic (ATR vs MA) is unconventional
     #        for Buy/Sell signals."
     # )
-    return data["ATR_indicator"]
 
 
+@vectorized_strategy
 def NATR_indicator(data, timeperiod=14, ma_period=14):
     """
     Vectorized Normalized Average True Range (NATR) indicator signals.
     Revised logic: Compare NATR to its moving average.
     WARNING: This is not a standard signal generation technique for NATR.
     """
-    natr = ta.NATR(
-        data["High"], data["Low"], data["Close"], timeperiod=timeperiod
+    natr = data.indicator(
+        ta.NATR, "High", "Low", "Close", timeperiod=timeperiod
     )
     natr_ma = ta.SMA(natr, timeperiod=ma_period)
 
-    data["NATR_indicator"] = _generate_signals(
+    return _generate_signals(
         condition_buy=natr > natr_ma,
         condition_sell=natr < natr_ma,
     )
@@ -1121,19 +1255,19 @@ def NATR_indicator(data, timeperiod=14, ma_period=14):
     #     "Warning: NATR_indicator revised logic (NATR vs MA) is
     #        unconventional for Buy/Sell signals."
     # )
-    return data["NATR_indicator"]
 
 
+@vectorized_strategy
 def TRANGE_indicator(data, ma_period=14):
     """
     Vectorized True Range (TRANGE) indicator signals.
     Revised logic: Compare TRANGE to its moving average.
     WARNING: This is not a standard signal generation technique for TRANGE.
     """
-    trange = ta.TRANGE(data["High"], data["Low"], data["Close"])
+    trange = data.indicator(ta.TRANGE, "High", "Low", "Close")
     trange_ma = ta.SMA(trange, timeperiod=ma_period)
 
-    data["TRANGE_indicator"] = _generate_signals(
+    return _generate_signals(
         condition_buy=trange > trange_ma,
         condition_sell=trange < trange_ma,
     )
@@ -1141,7 +1275,6 @@ def TRANGE_indicator(data, ma_period=14):
     #     "Warning: TRANGE_indicator revised logic (TRANGE vs MA) is
     #        unconventional for Buy/Sell signals."
     # )
-    return data["TRANGE_indicator"]
 
 
 # --- Volatility Indicators ---
@@ -1191,598 +1324,500 @@ def TRANGE_indicator(data, ma_period=14):
 # --- Pattern Recognition ---
 
 
-def _pattern_signals(pattern_series):
-    """Helper for standard pattern recognition signals."""
-    return _generate_signals(
-        condition_buy=pattern_series > 0,
-        condition_sell=pattern_series < 0,
+# TA-Lib candlestick patterns behind the CDL*_indicator strategies, in
+# pattern_matrix row order.
+CDL_PATTERNS = [
+    "CDL2CROWS",
+    "CDL3BLACKCROWS",
+    "CDL3INSIDE",
+    "CDL3LINESTRIKE",
+    "CDL3OUTSIDE",
+    "CDL3STARSINSOUTH",
+    "CDL3WHITESOLDIERS",
+    "CDLABANDONEDBABY",
+    "CDLADVANCEBLOCK",
+    "CDLBELTHOLD",
+    "CDLBREAKAWAY",
+    "CDLCLOSINGMARUBOZU",
+    "CDLCONCEALBABYSWALL",
+    "CDLCOUNTERATTACK",
+    "CDLDARKCLOUDCOVER",
+    "CDLDOJI",
+    "CDLDOJISTAR",
+    "CDLDRAGONFLYDOJI",
+    "CDLENGULFING",
+    "CDLEVENINGDOJISTAR",
+    "CDLEVENINGSTAR",
+    "CDLGAPSIDESIDEWHITE",
+    "CDLGRAVESTONEDOJI",
+    "CDLHAMMER",
+    "CDLHANGINGMAN",
+    "CDLHARAMI",
+    "CDLHARAMICROSS",
+    "CDLHIGHWAVE",
+    "CDLHIKKAKE",
+    "CDLHIKKAKEMOD",
+    "CDLHOMINGPIGEON",
+    "CDLIDENTICAL3CROWS",
+    "CDLINNECK",
+    "CDLINVERTEDHAMMER",
+    "CDLKICKING",
+    "CDLKICKINGBYLENGTH",
+    "CDLLADDERBOTTOM",
+    "CDLLONGLEGGEDDOJI",
+    "CDLLONGLINE",
+    "CDLMARUBOZU",
+    "CDLMATCHINGLOW",
+    "CDLMATHOLD",
+    "CDLMORNINGDOJISTAR",
+    "CDLMORNINGSTAR",
+    "CDLONNECK",
+    "CDLPIERCING",
+    "CDLRICKSHAWMAN",
+    "CDLRISEFALL3METHODS",
+    "CDLSEPARATINGLINES",
+    "CDLSHOOTINGSTAR",
+    "CDLSHORTLINE",
+    "CDLSPINNINGTOP",
+    "CDLSTALLEDPATTERN",
+    "CDLSTICKSANDWICH",
+    "CDLTAKURI",
+    "CDLTASUKIGAP",
+    "CDLTHRUSTING",
+    "CDLTRISTAR",
+    "CDLUNIQUE3RIVER",
+    "CDLUPSIDEGAP2CROWS",
+    "CDLXSIDEGAP3METHODS",
+]
+PATTERN_ROWS = {pattern: row for row, pattern in enumerate(CDL_PATTERNS)}
+
+# Patterns that take a penetration parameter.
+PENETRATION_PATTERNS = frozenset(
+    [
+        "CDLABANDONEDBABY",
+        "CDLDARKCLOUDCOVER",
+        "CDLEVENINGDOJISTAR",
+        "CDLEVENINGSTAR",
+        "CDLMATHOLD",
+        "CDLMORNINGDOJISTAR",
+        "CDLMORNINGSTAR",
+    ]
+)
+
+
+def pattern_matrix(open_, high, low, close, penetration=0):
+    """
+    Evaluates every candlestick pattern in CDL_PATTERNS over one set of OHLC
+    arrays.
+
+    Returns a (patterns x bars) int8 matrix with one row per pattern, in
+    CDL_PATTERNS order: 1 where TA-Lib reports the pattern bullish, -1
+    bearish, 0 otherwise. penetration applies to PENETRATION_PATTERNS.
+    """
+    inputs = [
+        np.asarray(values, dtype=np.float64)
+        for values in (open_, high, low, close)
+    ]
+    matrix = np.empty((len(CDL_PATTERNS), len(inputs[3])), dtype=np.int8)
+    for row, pattern in enumerate(CDL_PATTERNS):
+        params = (
+            {"penetration": penetration}
+            if pattern in PENETRATION_PATTERNS
+            else {}
+        )
+        np.sign(
+            getattr(ta, pattern)(*inputs, **params),
+            out=matrix[row],
+            casting="unsafe",
+        )
+    return matrix
+
+
+def _pattern_signals(data, pattern, penetration=0):
+    """
+    Returns a pattern's signals: its row of the ticker's pattern_matrix,
+    which is computed once and shared by every CDL strategy.
+    """
+    matrix = data.indicator(
+        pattern_matrix, "Open", "High", "Low", "Close", penetration=penetration
     )
+    return matrix[PATTERN_ROWS[pattern]]
 
 
+@vectorized_strategy
 def CDL2CROWS_indicator(data):
     """Vectorized Two Crows (CDL2CROWS) indicator signals."""
-    pattern = ta.CDL2CROWS(
-        data["Open"], data["High"], data["Low"], data["Close"]
-    )
-    data["CDL2CROWS_indicator"] = _pattern_signals(pattern)
-    return data["CDL2CROWS_indicator"]
+    return _pattern_signals(data, "CDL2CROWS")
 
 
+@vectorized_strategy
 def CDL3BLACKCROWS_indicator(data):
     """Vectorized Three Black Crows (CDL3BLACKCROWS) indicator signals."""
-    pattern = ta.CDL3BLACKCROWS(
-        data["Open"], data["High"], data["Low"], data["Close"]
-    )
-    data["CDL3BLACKCROWS_indicator"] = _pattern_signals(pattern)
-    return data["CDL3BLACKCROWS_indicator"]
+    return _pattern_signals(data, "CDL3BLACKCROWS")
 
 
+@vectorized_strategy
 def CDL3INSIDE_indicator(data):
     """Vectorized Three Inside Up/Down (CDL3INSIDE) indicator signals."""
-    pattern = ta.CDL3INSIDE(
-        data["Open"], data["High"], data["Low"], data["Close"]
-    )
-    data["CDL3INSIDE_indicator"] = _pattern_signals(pattern)
-    return data["CDL3INSIDE_indicator"]
+    return _pattern_signals(data, "CDL3INSIDE")
 
 
+@vectorized_strategy
 def CDL3LINESTRIKE_indicator(data):
     """Vectorized Three-Line Strike (CDL3LINESTRIKE) indicator signals."""
-    pattern = ta.CDL3LINESTRIKE(
-        data["Open"], data["High"], data["Low"], data["Close"]
-    )
-    data["CDL3LINESTRIKE_indicator"] = _pattern_signals(pattern)
-    return data["CDL3LINESTRIKE_indicator"]
+    return _pattern_signals(data, "CDL3LINESTRIKE")
 
 
+@vectorized_strategy
 def CDL3OUTSIDE_indicator(data):
     """Vectorized Three Outside Up/Down (CDL3OUTSIDE) indicator signals."""
-    pattern = ta.CDL3OUTSIDE(
-        data["Open"], data["High"], data["Low"], data["Close"]
-    )
-    data["CDL3OUTSIDE_indicator"] = _pattern_signals(pattern)
-    return data["CDL3OUTSIDE_indicator"]
+    return _pattern_signals(data, "CDL3OUTSIDE")
 
 
+@vectorized_strategy
 def CDL3STARSINSOUTH_indicator(data):
     """Vectorized Three Stars In The South (CDL3STARSINSOUTH) indicator."""
-    pattern = ta.CDL3STARSINSOUTH(
-        data["Open"], data["High"], data["Low"], data["Close"]
-    )
-    data["CDL3STARSINSOUTH_indicator"] = _pattern_signals(pattern)
-    return data["CDL3STARSINSOUTH_indicator"]
+    return _pattern_signals(data, "CDL3STARSINSOUTH")
 
 
+@vectorized_strategy
 def CDL3WHITESOLDIERS_indicator(data):
     """Vectorized Three Advancing White Soldiers (CDL3WHITESOLDIERS)."""
-    pattern = ta.CDL3WHITESOLDIERS(
-        data["Open"], data["High"], data["Low"], data["Close"]
-    )
-    data["CDL3WHITESOLDIERS_indicator"] = _pattern_signals(pattern)
-    return data["CDL3WHITESOLDIERS_indicator"]
+    return _pattern_signals(data, "CDL3WHITESOLDIERS")
 
 
+@vectorized_strategy
 def CDLABANDONEDBABY_indicator(data, penetration=0):
     """Vectorized Abandoned Baby (CDLABANDONEDBABY) indicator signals."""
-    pattern = ta.CDLABANDONEDBABY(
-        data["Open"],
-        data["High"],
-        data["Low"],
-        data["Close"],
-        penetration=penetration,
-    )
-    data["CDLABANDONEDBABY_indicator"] = _pattern_signals(pattern)
-    return data["CDLABANDONEDBABY_indicator"]
+    return _pattern_signals(data, "CDLABANDONEDBABY", penetration)
 
 
+@vectorized_strategy
 def CDLADVANCEBLOCK_indicator(data):
     """Vectorized Advance Block (CDLADVANCEBLOCK) indicator signals."""
-    pattern = ta.CDLADVANCEBLOCK(
-        data["Open"], data["High"], data["Low"], data["Close"]
-    )
-    data["CDLADVANCEBLOCK_indicator"] = _pattern_signals(pattern)
-    return data["CDLADVANCEBLOCK_indicator"]
+    return _pattern_signals(data, "CDLADVANCEBLOCK")
 
 
+@vectorized_strategy
 def CDLBELTHOLD_indicator(data):
     """Vectorized Belt-hold (CDLBELTHOLD) indicator signals."""
-    pattern = ta.CDLBELTHOLD(
-        data["Open"], data["High"], data["Low"], data["Close"]
-    )
-    data["CDLBELTHOLD_indicator"] = _pattern_signals(pattern)
-    return data["CDLBELTHOLD_indicator"]
+    return _pattern_signals(data, "CDLBELTHOLD")
 
 
+@vectorized_strategy
 def CDLBREAKAWAY_indicator(data):
     """Vectorized Breakaway (CDLBREAKAWAY) indicator signals."""
-    pattern = ta.CDLBREAKAWAY(
-        data["Open"], data["High"], data["Low"], data["Close"]
-    )
-    data["CDLBREAKAWAY_indicator"] = _pattern_signals(pattern)
-    return data["CDLBREAKAWAY_indicator"]
+    return _pattern_signals(data, "CDLBREAKAWAY")
 
 
+@vectorized_strategy
 def CDLCLOSINGMARUBOZU_indicator(data):
     """Vectorized Closing Marubozu (CDLCLOSINGMARUBOZU) indicator signals."""
-    pattern = ta.CDLCLOSINGMARUBOZU(
-        data["Open"], data["High"], data["Low"], data["Close"]
-    )
-    data["CDLCLOSINGMARUBOZU_indicator"] = _pattern_signals(pattern)
-    return data["CDLCLOSINGMARUBOZU_indicator"]
+    return _pattern_signals(data, "CDLCLOSINGMARUBOZU")
 
 
+@vectorized_strategy
 def CDLCONCEALBABYSWALL_indicator(data):
     """Vectorized Concealing Baby Swallow (CDLCONCEALBABYSWALL) indicator."""
-    pattern = ta.CDLCONCEALBABYSWALL(
-        data["Open"], data["High"], data["Low"], data["Close"]
-    )
-    data["CDLCONCEALBABYSWALL_indicator"] = _pattern_signals(pattern)
-    return data["CDLCONCEALBABYSWALL_indicator"]
+    return _pattern_signals(data, "CDLCONCEALBABYSWALL")
 
 
+@vectorized_strategy
 def CDLCOUNTERATTACK_indicator(data):
     """Vectorized Counterattack (CDLCOUNTERATTACK) indicator signals."""
-    pattern = ta.CDLCOUNTERATTACK(
-        data["Open"], data["High"], data["Low"], data["Close"]
-    )
-    data["CDLCOUNTERATTACK_indicator"] = _pattern_signals(pattern)
-    return data["CDLCOUNTERATTACK_indicator"]
+    return _pattern_signals(data, "CDLCOUNTERATTACK")
 
 
+@vectorized_strategy
 def CDLDARKCLOUDCOVER_indicator(data, penetration=0):
     """Vectorized Dark Cloud Cover (CDLDARKCLOUDCOVER) indicator signals."""
-    pattern = ta.CDLDARKCLOUDCOVER(
-        data["Open"],
-        data["High"],
-        data["Low"],
-        data["Close"],
-        penetration=penetration,
-    )
-    data["CDLDARKCLOUDCOVER_indicator"] = _pattern_signals(pattern)
-    return data["CDLDARKCLOUDCOVER_indicator"]
+    return _pattern_signals(data, "CDLDARKCLOUDCOVER", penetration)
 
 
+@vectorized_strategy
 def CDLDOJI_indicator(data):
     """Vectorized Doji (CDLDOJI) indicator signals."""
-    pattern = ta.CDLDOJI(
-        data["Open"], data["High"], data["Low"], data["Close"]
-    )
-    data["CDLDOJI_indicator"] = _pattern_signals(pattern)
-    return data["CDLDOJI_indicator"]
+    return _pattern_signals(data, "CDLDOJI")
 
 
+@vectorized_strategy
 def CDLDOJISTAR_indicator(data):
     """Vectorized Doji Star (CDLDOJISTAR) indicator signals."""
-    pattern = ta.CDLDOJISTAR(
-        data["Open"], data["High"], data["Low"], data["Close"]
-    )
-    data["CDLDOJISTAR_indicator"] = _pattern_signals(pattern)
-    return data["CDLDOJISTAR_indicator"]
+    return _pattern_signals(data, "CDLDOJISTAR")
 
 
+@vectorized_strategy
 def CDLDRAGONFLYDOJI_indicator(data):
     """Vectorized Dragonfly Doji (CDLDRAGONFLYDOJI) indicator signals."""
-    pattern = ta.CDLDRAGONFLYDOJI(
-        data["Open"], data["High"], data["Low"], data["Close"]
-    )
-    data["CDLDRAGONFLYDOJI_indicator"] = _pattern_signals(pattern)
-    return data["CDLDRAGONFLYDOJI_indicator"]
+    return _pattern_signals(data, "CDLDRAGONFLYDOJI")
 
 
+@vectorized_strategy
 def CDLENGULFING_indicator(data):
     """Vectorized Engulfing Pattern (CDLENGULFING) indicator signals."""
-    pattern = ta.CDLENGULFING(
-        data["Open"], data["High"], data["Low"], data["Close"]
-    )
-    data["CDLENGULFING_indicator"] = _pattern_signals(pattern)
-    return data["CDLENGULFING_indicator"]
+    return _pattern_signals(data, "CDLENGULFING")
 
 
+@vectorized_strategy
 def CDLEVENINGDOJISTAR_indicator(data, penetration=0):
     """Vectorized Evening Doji Star (CDLEVENINGDOJISTAR) indicator signals."""
-    pattern = ta.CDLEVENINGDOJISTAR(
-        data["Open"],
-        data["High"],
-        data["Low"],
-        data["Close"],
-        penetration=penetration,
-    )
-    data["CDLEVENINGDOJISTAR_indicator"] = _pattern_signals(pattern)
-    return data["CDLEVENINGDOJISTAR_indicator"]
+    return _pattern_signals(data, "CDLEVENINGDOJISTAR", penetration)
 
 
+@vectorized_strategy
 def CDLEVENINGSTAR_indicator(data, penetration=0):
     """Vectorized Evening Star (CDLEVENINGSTAR) indicator signals."""
-    pattern = ta.CDLEVENINGSTAR(
-        data["Open"],
-        data["High"],
-        data["Low"],
-        data["Close"],
-        penetration=penetration,
-    )
-    data["CDLEVENINGSTAR_indicator"] = _pattern_signals(pattern)
-    return data["CDLEVENINGSTAR_indicator"]
+    return _pattern_signals(data, "CDLEVENINGSTAR", penetration)
 
 
+@vectorized_strategy
 def CDLGAPSIDESIDEWHITE_indicator(data):
     """Vectorized Up/Down-gap side-by-side white lines
     (CDLGAPSIDESIDEWHITE) indicator signals."""
-    pattern = ta.CDLGAPSIDESIDEWHITE(
-        data["Open"], data["High"], data["Low"], data["Close"]
-    )
-    data["CDLGAPSIDESIDEWHITE_indicator"] = _pattern_signals(pattern)
-    return data["CDLGAPSIDESIDEWHITE_indicator"]
+    return _pattern_signals(data, "CDLGAPSIDESIDEWHITE")
 
 
+@vectorized_strategy
 def CDLGRAVESTONEDOJI_indicator(data):
     """Vectorized Gravestone Doji (CDLGRAVESTONEDOJI) indicator signals."""
-    pattern = ta.CDLGRAVESTONEDOJI(
-        data["Open"], data["High"], data["Low"], data["Close"]
-    )
-    data["CDLGRAVESTONEDOJI_indicator"] = _pattern_signals(pattern)
-    return data["CDLGRAVESTONEDOJI_indicator"]
+    return _pattern_signals(data, "CDLGRAVESTONEDOJI")
 
 
+@vectorized_strategy
 def CDLHAMMER_indicator(data):
     """Vectorized Hammer (CDLHAMMER) indicator signals."""
-    pattern = ta.CDLHAMMER(
-        data["Open"], data["High"], data["Low"], data["Close"]
-    )
-    data["CDLHAMMER_indicator"] = _pattern_signals(pattern)
-    return data["CDLHAMMER_indicator"]
+    return _pattern_signals(data, "CDLHAMMER")
 
 
+@vectorized_strategy
 def CDLHANGINGMAN_indicator(data):
     """Vectorized Hanging Man (CDLHANGINGMAN) indicator signals."""
-    pattern = ta.CDLHANGINGMAN(
-        data["Open"], data["High"], data["Low"], data["Close"]
-    )
-    data["CDLHANGINGMAN_indicator"] = _pattern_signals(pattern)
-    return data["CDLHANGINGMAN_indicator"]
+    return _pattern_signals(data, "CDLHANGINGMAN")
 
 
+@vectorized_strategy
 def CDLHARAMI_indicator(data):
     """Vectorized Harami Pattern (CDLHARAMI) indicator signals."""
-    pattern = ta.CDLHARAMI(
-        data["Open"], data["High"], data["Low"], data["Close"]
-    )
-    data["CDLHARAMI_indicator"] = _pattern_signals(pattern)
-    return data["CDLHARAMI_indicator"]
+    return _pattern_signals(data, "CDLHARAMI")
 
 
+@vectorized_strategy
 def CDLHARAMICROSS_indicator(data):
     """Vectorized Harami Cross Pattern (CDLHARAMICROSS) indicator signals."""
-    pattern = ta.CDLHARAMICROSS(
-        data["Open"], data["High"], data["Low"], data["Close"]
-    )
-    data["CDLHARAMICROSS_indicator"] = _pattern_signals(pattern)
-    return data["CDLHARAMICROSS_indicator"]
+    return _pattern_signals(data, "CDLHARAMICROSS")
 
 
+@vectorized_strategy
 def CDLHIGHWAVE_indicator(data):
     """Vectorized High-Wave Candle (CDLHIGHWAVE) indicator signals."""
-    pattern = ta.CDLHIGHWAVE(
-        data["Open"], data["High"], data["Low"], data["Close"]
-    )
-    data["CDLHIGHWAVE_indicator"] = _pattern_signals(pattern)
-    return data["CDLHIGHWAVE_indicator"]
+    return _pattern_signals(data, "CDLHIGHWAVE")
 
 
+@vectorized_strategy
 def CDLHIKKAKE_indicator(data):
     """Vectorized Hikkake Pattern (CDLHIKKAKE) indicator signals."""
-    pattern = ta.CDLHIKKAKE(
-        data["Open"], data["High"], data["Low"], data["Close"]
-    )
-    data["CDLHIKKAKE_indicator"] = _pattern_signals(pattern)
-    return data["CDLHIKKAKE_indicator"]
+    return _pattern_signals(data, "CDLHIKKAKE")
 
 
+@vectorized_strategy
 def CDLHIKKAKEMOD_indicator(data):
     """Vectorized Modified Hikkake Pattern (CDLHIKKAKEMOD) indicator."""
-    pattern = ta.CDLHIKKAKEMOD(
-        data["Open"], data["High"], data["Low"], data["Close"]
-    )
-    data["CDLHIKKAKEMOD_indicator"] = _pattern_signals(pattern)
-    return data["CDLHIKKAKEMOD_indicator"]
+    return _pattern_signals(data, "CDLHIKKAKEMOD")
 
 
+@vectorized_strategy
 def CDLHOMINGPIGEON_indicator(data):
     """Vectorized Homing Pigeon (CDLHOMINGPIGEON) indicator signals."""
-    pattern = ta.CDLHOMINGPIGEON(
-        data["Open"], data["High"], data["Low"], data["Close"]
-    )
-    data["CDLHOMINGPIGEON_indicator"] = _pattern_signals(pattern)
-    return data["CDLHOMINGPIGEON_indicator"]
+    return _pattern_signals(data, "CDLHOMINGPIGEON")
 
 
+@vectorized_strategy
 def CDLIDENTICAL3CROWS_indicator(data):
     """Vectorized Identical Three Crows (CDLIDENTICAL3CROWS) indicator."""
-    pattern = ta.CDLIDENTICAL3CROWS(
-        data["Open"], data["High"], data["Low"], data["Close"]
-    )
-    data["CDLIDENTICAL3CROWS_indicator"] = _pattern_signals(pattern)
-    return data["CDLIDENTICAL3CROWS_indicator"]
+    return _pattern_signals(data, "CDLIDENTICAL3CROWS")
 
 
+@vectorized_strategy
 def CDLINNECK_indicator(data):
     """Vectorized In-Neck Pattern (CDLINNECK) indicator signals."""
-    pattern = ta.CDLINNECK(
-        data["Open"], data["High"], data["Low"], data["Close"]
-    )
-    data["CDLINNECK_indicator"] = _pattern_signals(pattern)
-    return data["CDLINNECK_indicator"]
+    return _pattern_signals(data, "CDLINNECK")
 
 
+@vectorized_strategy
 def CDLINVERTEDHAMMER_indicator(data):
     """Vectorized Inverted Hammer (CDLINVERTEDHAMMER) indicator signals."""
-    pattern = ta.CDLINVERTEDHAMMER(
-        data["Open"], data["High"], data["Low"], data["Close"]
-    )
-    data["CDLINVERTEDHAMMER_indicator"] = _pattern_signals(pattern)
-    return data["CDLINVERTEDHAMMER_indicator"]
+    return _pattern_signals(data, "CDLINVERTEDHAMMER")
 
 
+@vectorized_strategy
 def CDLKICKING_indicator(data):
     """Vectorized Kicking (CDLKICKING) indicator signals."""
-    pattern = ta.CDLKICKING(
-        data["Open"], data["High"], data["Low"], data["Close"]
-    )
-    data["CDLKICKING_indicator"] = _pattern_signals(pattern)
-    return data["CDLKICKING_indicator"]
+    return _pattern_signals(data, "CDLKICKING")
 
 
+@vectorized_strategy
 def CDLKICKINGBYLENGTH_indicator(data):
     """Vectorized Kicking - bull/bear determined by the longer marubozu
     (CDLKICKINGBYLENGTH) indicator signals."""
-    pattern = ta.CDLKICKINGBYLENGTH(
-        data["Open"], data["High"], data["Low"], data["Close"]
-    )
-    data["CDLKICKINGBYLENGTH_indicator"] = _pattern_signals(pattern)
-    return data["CDLKICKINGBYLENGTH_indicator"]
+    return _pattern_signals(data, "CDLKICKINGBYLENGTH")
 
 
+@vectorized_strategy
 def CDLLADDERBOTTOM_indicator(data):
     """Vectorized Ladder Bottom (CDLLADDERBOTTOM) indicator signals."""
-    pattern = ta.CDLLADDERBOTTOM(
-        data["Open"], data["High"], data["Low"], data["Close"]
-    )
-    data["CDLLADDERBOTTOM_indicator"] = _pattern_signals(pattern)
-    return data["CDLLADDERBOTTOM_indicator"]
+    return _pattern_signals(data, "CDLLADDERBOTTOM")
 
 
+@vectorized_strategy
 def CDLLONGLEGGEDDOJI_indicator(data):
     """Vectorized Long Legged Doji (CDLLONGLEGGEDDOJI) indicator signals."""
-    pattern = ta.CDLLONGLEGGEDDOJI(
-        data["Open"], data["High"], data["Low"], data["Close"]
-    )
-    data["CDLLONGLEGGEDDOJI_indicator"] = _pattern_signals(pattern)
-    return data["CDLLONGLEGGEDDOJI_indicator"]
+    return _pattern_signals(data, "CDLLONGLEGGEDDOJI")
 
 
+@vectorized_strategy
 def CDLLONGLINE_indicator(data):
     """Vectorized Long Line Candle (CDLLONGLINE) indicator signals."""
-    pattern = ta.CDLLONGLINE(
-        data["Open"], data["High"], data["Low"], data["Close"]
-    )
-    data["CDLLONGLINE_indicator"] = _pattern_signals(pattern)
-    return data["CDLLONGLINE_indicator"]
+    return _pattern_signals(data, "CDLLONGLINE")
 
 
+@vectorized_strategy
 def CDLMARUBOZU_indicator(data):
     """Vectorized Marubozu (CDLMARUBOZU) indicator signals."""
-    pattern = ta.CDLMARUBOZU(
-        data["Open"], data["High"], data["Low"], data["Close"]
-    )
-    data["CDLMARUBOZU_indicator"] = _pattern_signals(pattern)
-    return data["CDLMARUBOZU_indicator"]
+    return _pattern_signals(data, "CDLMARUBOZU")
 
 
+@vectorized_strategy
 def CDLMATCHINGLOW_indicator(data):
     """Vectorized Matching Low (CDLMATCHINGLOW) indicator signals."""
-    pattern = ta.CDLMATCHINGLOW(
-        data["Open"], data["High"], data["Low"], data["Close"]
-    )
-    data["CDLMATCHINGLOW_indicator"] = _pattern_signals(pattern)
-    return data["CDLMATCHINGLOW_indicator"]
+    return _pattern_signals(data, "CDLMATCHINGLOW")
 
 
+@vectorized_strategy
 def CDLMATHOLD_indicator(data, penetration=0):
     """Vectorized Mat Hold (CDLMATHOLD) indicator signals."""
-    pattern = ta.CDLMATHOLD(
-        data["Open"],
-        data["High"],
-        data["Low"],
-        data["Close"],
-        penetration=penetration,
-    )
-    data["CDLMATHOLD_indicator"] = _pattern_signals(pattern)
-    return data["CDLMATHOLD_indicator"]
+    return _pattern_signals(data, "CDLMATHOLD", penetration)
 
 
+@vectorized_strategy
 def CDLMORNINGDOJISTAR_indicator(data, penetration=0):
     """Vectorized Morning Doji Star (CDLMORNINGDOJISTAR) indicator signals."""
-    pattern = ta.CDLMORNINGDOJISTAR(
-        data["Open"],
-        data["High"],
-        data["Low"],
-        data["Close"],
-        penetration=penetration,
-    )
-    data["CDLMORNINGDOJISTAR_indicator"] = _pattern_signals(pattern)
-    return data["CDLMORNINGDOJISTAR_indicator"]
+    return _pattern_signals(data, "CDLMORNINGDOJISTAR", penetration)
 
 
+@vectorized_strategy
 def CDLMORNINGSTAR_indicator(data, penetration=0):
     """Vectorized Morning Star (CDLMORNINGSTAR) indicator signals."""
-    pattern = ta.CDLMORNINGSTAR(
-        data["Open"],
-        data["High"],
-        data["Low"],
-        data["Close"],
-        penetration=penetration,
-    )
-    data["CDLMORNINGSTAR_indicator"] = _pattern_signals(pattern)
-    return data["CDLMORNINGSTAR_indicator"]
+    return _pattern_signals(data, "CDLMORNINGSTAR", penetration)
 
 
+@vectorized_strategy
 def CDLONNECK_indicator(data):
     """Vectorized On-Neck Pattern (CDLONNECK) indicator signals."""
-    pattern = ta.CDLONNECK(
-        data["Open"], data["High"], data["Low"], data["Close"]
-    )
-    data["CDLONNECK_indicator"] = _pattern_signals(pattern)
-    return data["CDLONNECK_indicator"]
+    return _pattern_signals(data, "CDLONNECK")
 
 
+@vectorized_strategy
 def CDLPIERCING_indicator(data):
     """Vectorized Piercing Pattern (CDLPIERCING) indicator signals."""
-    pattern = ta.CDLPIERCING(
-        data["Open"], data["High"], data["Low"], data["Close"]
-    )
-    data["CDLPIERCING_indicator"] = _pattern_signals(pattern)
-    return data["CDLPIERCING_indicator"]
+    return _pattern_signals(data, "CDLPIERCING")
 
 
+@vectorized_strategy
 def CDLRICKSHAWMAN_indicator(data):
     """Vectorized Rickshaw Man (CDLRICKSHAWMAN) indicator signals."""
-    pattern = ta.CDLRICKSHAWMAN(
-        data["Open"], data["High"], data["Low"], data["Close"]
-    )
-    data["CDLRICKSHAWMAN_indicator"] = _pattern_signals(pattern)
-    return data["CDLRICKSHAWMAN_indicator"]
+    return _pattern_signals(data, "CDLRICKSHAWMAN")
 
 
+@vectorized_strategy
 def CDLRISEFALL3METHODS_indicator(data):
     """Vectorized Rising/Falling Three Methods
     (CDLRISEFALL3METHODS) indicator."""
-    pattern = ta.CDLRISEFALL3METHODS(
-        data["Open"], data["High"], data["Low"], data["Close"]
-    )
-    data["CDLRISEFALL3METHODS_indicator"] = _pattern_signals(pattern)
-    return data["CDLRISEFALL3METHODS_indicator"]
+    return _pattern_signals(data, "CDLRISEFALL3METHODS")
 
 
+@vectorized_strategy
 def CDLSEPARATINGLINES_indicator(data):
     """Vectorized Separating Lines (CDLSEPARATINGLINES) indicator signals."""
-    pattern = ta.CDLSEPARATINGLINES(
-        data["Open"], data["High"], data["Low"], data["Close"]
-    )
-    data["CDLSEPARATINGLINES_indicator"] = _pattern_signals(pattern)
-    return data["CDLSEPARATINGLINES_indicator"]
+    return _pattern_signals(data, "CDLSEPARATINGLINES")
 
 
+@vectorized_strategy
 def CDLSHOOTINGSTAR_indicator(data):
     """Vectorized Shooting Star (CDLSHOOTINGSTAR) indicator signals."""
-    pattern = ta.CDLSHOOTINGSTAR(
-        data["Open"], data["High"], data["Low"], data["Close"]
-    )
-    data["CDLSHOOTINGSTAR_indicator"] = _pattern_signals(pattern)
-    return data["CDLSHOOTINGSTAR_indicator"]
+    return _pattern_signals(data, "CDLSHOOTINGSTAR")
 
 
+@vectorized_strategy
 def CDLSHORTLINE_indicator(data):
     """Vectorized Short Line Candle (CDLSHORTLINE) indicator signals."""
-    pattern = ta.CDLSHORTLINE(
-        data["Open"], data["High"], data["Low"], data["Close"]
-    )
-    data["CDLSHORTLINE_indicator"] = _pattern_signals(pattern)
-    return data["CDLSHORTLINE_indicator"]
+    return _pattern_signals(data, "CDLSHORTLINE")
 
 
+@vectorized_strategy
 def CDLSPINNINGTOP_indicator(data):
     """Vectorized Spinning Top (CDLSPINNINGTOP) indicator signals."""
-    pattern = ta.CDLSPINNINGTOP(
-        data["Open"], data["High"], data["Low"], data["Close"]
-    )
-    data["CDLSPINNINGTOP_indicator"] = _pattern_signals(pattern)
-    return data["CDLSPINNINGTOP_indicator"]
+    return _pattern_signals(data, "CDLSPINNINGTOP")
 
 
+@vectorized_strategy
 def CDLSTALLEDPATTERN_indicator(data):
     """Vectorized Stalled Pattern (CDLSTALLEDPATTERN) indicator signals."""
-    pattern = ta.CDLSTALLEDPATTERN(
-        data["Open"], data["High"], data["Low"], data["Close"]
-    )
-    data["CDLSTALLEDPATTERN_indicator"] = _pattern_signals(pattern)
-    return data["CDLSTALLEDPATTERN_indicator"]
+    return _pattern_signals(data, "CDLSTALLEDPATTERN")
 
 
+@vectorized_strategy
 def CDLSTICKSANDWICH_indicator(data):
     """Vectorized Stick Sandwich (CDLSTICKSANDWICH) indicator signals."""
-    pattern = ta.CDLSTICKSANDWICH(
-        data["Open"], data["High"], data["Low"], data["Close"]
-    )
-    data["CDLSTICKSANDWICH_indicator"] = _pattern_signals(pattern)
-    return data["CDLSTICKSANDWICH_indicator"]
+    return _pattern_signals(data, "CDLSTICKSANDWICH")
 
 
+@vectorized_strategy
 def CDLTAKURI_indicator(data):
     """Vectorized Takuri (Dragonfly Doji with very long lower shadow)
     (CDLTAKURI) indicator signals."""
-    pattern = ta.CDLTAKURI(
-        data["Open"], data["High"], data["Low"], data["Close"]
-    )
-    data["CDLTAKURI_indicator"] = _pattern_signals(pattern)
-    return data["CDLTAKURI_indicator"]
+    return _pattern_signals(data, "CDLTAKURI")
 
 
+@vectorized_strategy
 def CDLTASUKIGAP_indicator(data):
     """Vectorized Tasuki Gap (CDLTASUKIGAP) indicator signals."""
-    pattern = ta.CDLTASUKIGAP(
-        data["Open"], data["High"], data["Low"], data["Close"]
-    )
-    data["CDLTASUKIGAP_indicator"] = _pattern_signals(pattern)
-    return data["CDLTASUKIGAP_indicator"]
+    return _pattern_signals(data, "CDLTASUKIGAP")
 
 
+@vectorized_strategy
 def CDLTHRUSTING_indicator(data):
     """Vectorized Thrusting Pattern (CDLTHRUSTING) indicator signals."""
-    pattern = ta.CDLTHRUSTING(
-        data["Open"], data["High"], data["Low"], data["Close"]
-    )
-    data["CDLTHRUSTING_indicator"] = _pattern_signals(pattern)
-    return data["CDLTHRUSTING_indicator"]
+    return _pattern_signals(data, "CDLTHRUSTING")
 
 
+@vectorized_strategy
 def CDLTRISTAR_indicator(data):
     """Vectorized Tristar Pattern (CDLTRISTAR) indicator signals."""
-    pattern = ta.CDLTRISTAR(
-        data["Open"], data["High"], data["Low"], data["Close"]
-    )
-    data["CDLTRISTAR_indicator"] = _pattern_signals(pattern)
-    return data["CDLTRISTAR_indicator"]
+    return _pattern_signals(data, "CDLTRISTAR")
 
 
+@vectorized_strategy
 def CDLUNIQUE3RIVER_indicator(data):
     """Vectorized Unique 3 River (CDLUNIQUE3RIVER) indicator signals."""
-    pattern = ta.CDLUNIQUE3RIVER(
-        data["Open"], data["High"], data["Low"], data["Close"]
-    )
-    data["CDLUNIQUE3RIVER_indicator"] = _pattern_signals(pattern)
-    return data["CDLUNIQUE3RIVER_indicator"]
+    return _pattern_signals(data, "CDLUNIQUE3RIVER")
 
 
+@vectorized_strategy
 def CDLUPSIDEGAP2CROWS_indicator(data):
     """Vectorized Upside Gap Two Crows (CDLUPSIDEGAP2CROWS) indicator."""
-    pattern = ta.CDLUPSIDEGAP2CROWS(
-        data["Open"], data["High"], data["Low"], data["Close"]
-    )
-    data["CDLUPSIDEGAP2CROWS_indicator"] = _pattern_signals(pattern)
-    return data["CDLUPSIDEGAP2CROWS_indicator"]
+    return _pattern_signals(data, "CDLUPSIDEGAP2CROWS")
 
 
+@vectorized_strategy
 def CDLXSIDEGAP3METHODS_indicator(data):
     """Vectorized Upside/Downside Gap Three Methods (CDLXSIDEGAP3METHODS)."""
-    pattern = ta.CDLXSIDEGAP3METHODS(
-        data["Open"], data["High"], data["Low"], data["Close"]
-    )
-    data["CDLXSIDEGAP3METHODS_indicator"] = _pattern_signals(pattern)
-    return data["CDLXSIDEGAP3METHODS_indicator"]
+    return _pattern_signals(data, "CDLXSIDEGAP3METHODS")
 
 
 # --- Revised Statistic Functions ---
 
 
+@vectorized_strategy
 def BETA_indicator(data, timeperiod=5):
     """
     Vectorized Beta (BETA) indicator signals.
@@ -1790,18 +1825,16 @@ def BETA_indicator(data, timeperiod=5):
     Signal interpretation (Buy/Sell) is highly strategy-dependent.
     Keeping original logic but adding warning.
     """
-    beta = ta.BETA(data["High"], data["Low"], timeperiod=timeperiod)
-    data["BETA_indicator"] = _generate_signals(
-        condition_buy=beta > 1, condition_sell=beta < 1
-    )
+    beta = data.indicator(ta.BETA, "High", "Low", timeperiod=timeperiod)
+    return _generate_signals(condition_buy=beta > 1, condition_sell=beta < 1)
     # logger.warning(
     #     "Warning: BETA_indicator Buy/Sell signals based on
     #        Beta > 1 or < 1 are highly context-dependent
     #        and may not be meaningful."
     # )
-    return data["BETA_indicator"]
 
 
+@vectorized_strategy
 def CORREL_indicator(data, timeperiod=30):
     """
     Vectorized Pearson's Correlation Coefficient (CORREL) indicator signals.
@@ -1809,17 +1842,17 @@ def CORREL_indicator(data, timeperiod=30):
     Signal interpretation (Buy/Sell based on >0.5 or <-0.5) is arbitrary.
     Keeping original logic but adding warning.
     """
-    correl = ta.CORREL(data["High"], data["Low"], timeperiod=timeperiod)
-    data["CORREL_indicator"] = _generate_signals(
+    correl = data.indicator(ta.CORREL, "High", "Low", timeperiod=timeperiod)
+    return _generate_signals(
         condition_buy=correl > 0.5, condition_sell=correl < -0.5
     )
     # logger.warning(
     #     "Warning: CORREL_indicator Buy/Sell signals based on fixed
     #        correlation levels are arbitrary and context-dependent."
     # )
-    return data["CORREL_indicator"]
 
 
+@vectorized_strategy
 def LINEARREG_INTERCEPT_indicator(data, timeperiod=14):
     """
     Vectorized Linear Regression Intercept (LINEARREG_INTERCEPT) indicator.
@@ -1827,9 +1860,9 @@ def LINEARREG_INTERCEPT_indicator(data, timeperiod=14):
       not the intercept.
     This makes it logically identical to LINEARREG_indicator.
     """
-    linearreg = ta.LINEARREG(data["Close"], timeperiod=timeperiod)
+    linearreg = data.indicator(ta.LINEARREG, "Close", timeperiod=timeperiod)
 
-    data["LINEARREG_INTERCEPT_indicator"] = _generate_signals(
+    return _generate_signals(
         condition_buy=data["Close"] > linearreg,
         condition_sell=data["Close"] < linearreg,
     )
@@ -1838,19 +1871,21 @@ def LINEARREG_INTERCEPT_indicator(data, timeperiod=14):
     #       Close vs LINEARREG (forecast), making it equivalent to
     #       LINEARREG_indicator."
     # )
-    return data["LINEARREG_INTERCEPT_indicator"]
 
 
+@vectorized_strategy
 def STDDEV_indicator(data, timeperiod=20, nbdev=1, ma_period=20):
     """
     Vectorized Standard Deviation (STDDEV) indicator signals.
     Revised logic: Compare STDDEV to its moving average.
     WARNING: This is not a standard signal generation technique for STDDEV.
     """
-    stddev = ta.STDDEV(data["Close"], timeperiod=timeperiod, nbdev=nbdev)
+    stddev = data.indicator(
+        ta.STDDEV, "Close", timeperiod=timeperiod, nbdev=nbdev
+    )
     stddev_ma = ta.SMA(stddev, timeperiod=ma_period)
 
-    data["STDDEV_indicator"] = _generate_signals(
+    return _generate_signals(
         condition_buy=stddev > stddev_ma,
         condition_sell=stddev < stddev_ma,
     )
@@ -1858,19 +1893,19 @@ def STDDEV_indicator(data, timeperiod=20, nbdev=1, ma_period=20):
     #     "Warning: STDDEV_indicator revised logic (STDDEV vs MA)
     #        is unconventional for Buy/Sell signals."
     # )
-    return data["STDDEV_indicator"]
 
 
+@vectorized_strategy
 def VAR_indicator(data, timeperiod=5, nbdev=1, ma_period=5):
     """
     Vectorized Variance (VAR) indicator signals.
     Revised logic: Compare VAR to its moving average.
     WARNING: This is not a standard signal generation technique for VAR.
     """
-    var = ta.VAR(data["Close"], timeperiod=timeperiod, nbdev=nbdev)
+    var = data.indicator(ta.VAR, "Close", timeperiod=timeperiod, nbdev=nbdev)
     var_ma = ta.SMA(var, timeperiod=ma_period)
 
-    data["VAR_indicator"] = _generate_signals(
+    return _generate_signals(
         condition_buy=var > var_ma,
         condition_sell=var < var_ma,
     )
@@ -1878,7 +1913,6 @@ def VAR_indicator(data, timeperiod=5, nbdev=1, ma_period=5):
     #     "Warning: VAR_indicator revised logic (VAR vs MA) is unconventional
     #        for Buy/Sell signals."
     # )
-    return data["VAR_indicator"]
 
 
 # --- Statistic Functions ---
@@ -1912,14 +1946,16 @@ def VAR_indicator(data, timeperiod=5, nbdev=1, ma_period=5):
 #     return data["LINEARREG_indicator"]
 
 
+@vectorized_strategy
 def LINEARREG_ANGLE_indicator(data, timeperiod=14):
     """Vectorized Linear Regression Angle (LINEARREG_ANGLE) indicator."""
-    linearreg_angle = ta.LINEARREG_ANGLE(data["Close"], timeperiod=timeperiod)
-    data["LINEARREG_ANGLE_indicator"] = _generate_signals(
+    linearreg_angle = data.indicator(
+        ta.LINEARREG_ANGLE, "Close", timeperiod=timeperiod
+    )
+    return _generate_signals(
         condition_buy=linearreg_angle > 0,
         condition_sell=linearreg_angle < 0,
     )
-    return data["LINEARREG_ANGLE_indicator"]
 
 
 # def LINEARREG_INTERCEPT_indicator_old(data, timeperiod=14):
@@ -1937,14 +1973,16 @@ def LINEARREG_ANGLE_indicator(data, timeperiod=14):
 #     return data["LINEARREG_INTERCEPT_indicator"]
 
 
+@vectorized_strategy
 def LINEARREG_SLOPE_indicator(data, timeperiod=14):
     """Vectorized Linear Regression Slope (LINEARREG_SLOPE) indicator."""
-    linearreg_slope = ta.LINEARREG_SLOPE(data["Close"], timeperiod=timeperiod)
-    data["LINEARREG_SLOPE_indicator"] = _generate_signals(
+    linearreg_slope = data.indicator(
+        ta.LINEARREG_SLOPE, "Close", timeperiod=timeperiod
+    )
+    return _generate_signals(
         condition_buy=linearreg_slope > 0,
         condition_sell=linearreg_slope < 0,
     )
-    return data["LINEARREG_SLOPE_indicator"]
 
 
 # def STDDEV_indicator_old(data, timeperiod=20, nbdev=1):
@@ -1960,13 +1998,13 @@ def LINEARREG_SLOPE_indicator(data, timeperiod=14):
 #     return data["STDDEV_indicator"]
 
 
+@vectorized_strategy
 def TSF_indicator(data, timeperiod=14):
     """Vectorized Time Series Forecast (TSF) indicator signals."""
-    tsf = ta.TSF(data["Close"], timeperiod=timeperiod)
-    data["TSF_indicator"] = _generate_signals(
+    tsf = data.indicator(ta.TSF, "Close", timeperiod=timeperiod)
+    return _generate_signals(
         condition_buy=data["Close"] > tsf, condition_sell=data["Close"] < tsf
     )
-    return data["TSF_indicator"]
 
 
 # def VAR_indicator_old(data, timeperiod=5, nbdev=1):
@@ -1985,20 +2023,20 @@ def TSF_indicator(data, timeperiod=14):
 # --- New Indicator Functions ---
 
 
+@vectorized_strategy
 def ICHIMOKU_indicator(
     data, period_tenkan=9, period_kijun=26, period_senkou_b=52
 ):
     """
-    Calculates Ichimoku Cloud components and adds them to the DataFrame.
-    Also adds a basic Price vs Cloud signal.
+    Calculates Ichimoku Cloud components and a basic Price vs Cloud signal.
 
-    Components Added:
-    - Ichi_Tenkan: Tenkan-sen (Conversion Line)
-    - Ichi_Kijun: Kijun-sen (Base Line)
-    - Ichi_SenkouA: Senkou Span A (Leading Span A)
-    - Ichi_SenkouB: Senkou Span B (Leading Span B)
-    - Ichi_Chikou: Chikou Span (Lagging Span)
-    - Ichimoku_Signal: Basic signal based on Price position relative to Cloud.
+    Components:
+    - tenkan: Tenkan-sen (Conversion Line)
+    - kijun: Kijun-sen (Base Line)
+    - senkou_a: Senkou Span A (Leading Span A)
+    - senkou_b: Senkou Span B (Leading Span B)
+
+    The Chikou Span (Lagging Span) looks ahead and is not used by the signal.
 
     Standard Periods: tenkan=9, kijun=26, senkou_b=52.
       Kijun period is also used for shifts.
@@ -2007,104 +2045,77 @@ def ICHIMOKU_indicator(
     if not all(col in data.columns for col in required_cols):
         raise ValueError(f"Data must include columns: {required_cols}")
 
-    high_prices = data["High"]
-    low_prices = data["Low"]
+    high_prices = pd.Series(data["High"])
+    low_prices = pd.Series(data["Low"])
     close_prices = data["Close"]
 
     nine_period_high = high_prices.rolling(window=period_tenkan).max()
     nine_period_low = low_prices.rolling(window=period_tenkan).min()
-    data["Ichi_Tenkan"] = (nine_period_high + nine_period_low) / 2
+    tenkan = ((nine_period_high + nine_period_low) / 2).to_numpy()
 
     twenty_six_period_high = high_prices.rolling(window=period_kijun).max()
     twenty_six_period_low = low_prices.rolling(window=period_kijun).min()
-    data["Ichi_Kijun"] = (twenty_six_period_high + twenty_six_period_low) / 2
+    kijun = ((twenty_six_period_high + twenty_six_period_low) / 2).to_numpy()
 
-    data["Ichi_SenkouA"] = (
-        (data["Ichi_Tenkan"] + data["Ichi_Kijun"]) / 2
-    ).shift(period_kijun)
+    senkou_a = _shift((tenkan + kijun) / 2, period_kijun)
 
     fifty_two_period_high = high_prices.rolling(window=period_senkou_b).max()
     fifty_two_period_low = low_prices.rolling(window=period_senkou_b).min()
-    data["Ichi_SenkouB"] = (
-        (fifty_two_period_high + fifty_two_period_low) / 2
-    ).shift(period_kijun)
-
-    data["Ichi_Chikou"] = close_prices.shift(-period_kijun)
-
-    above_cloud = (close_prices > data["Ichi_SenkouA"]) & (
-        close_prices > data["Ichi_SenkouB"]
-    )
-    below_cloud = (close_prices < data["Ichi_SenkouA"]) & (
-        close_prices < data["Ichi_SenkouB"]
+    senkou_b = _shift(
+        ((fifty_two_period_high + fifty_two_period_low) / 2).to_numpy(),
+        period_kijun,
     )
 
-    data["ICHIMOKU_indicator"] = _generate_signals(
+    above_cloud = (close_prices > senkou_a) & (close_prices > senkou_b)
+    below_cloud = (close_prices < senkou_a) & (close_prices < senkou_b)
+
+    return _generate_signals(
         condition_buy=above_cloud, condition_sell=below_cloud
     )
-    data.drop(
-        columns=[
-            "Ichi_Tenkan",
-            "Ichi_Kijun",
-            "Ichi_SenkouA",
-            "Ichi_SenkouB",
-            "Ichi_Chikou",
-        ],
-        inplace=True,
-    )
-    return data["ICHIMOKU_indicator"]
 
 
+@vectorized_strategy
 def KELTNER_indicator(data, period_ema=20, period_atr=10, multiplier=2.0):
     """
-    Calculates Keltner Channels and adds them to the DataFrame.
-    Also adds a basic channel breakout signal.
-
-    Components Added:
-    - KC_Middle: Middle Line (EMA)
-    - KC_Upper: Upper Keltner Channel
-    - KC_Lower: Lower Keltner Channel
-    - Keltner_Signal: Basic signal based on Price breaking
-                         outside the channels.
+    Calculates Keltner Channels and a basic channel breakout signal.
+
+    Components:
+    - kc_middle: Middle Line (EMA)
+    - kc_upper: Upper Keltner Channel
+    - kc_lower: Lower Keltner Channel
     """
     required_cols = ["High", "Low", "Close"]
     if not all(col in data.columns for col in required_cols):
         raise ValueError(f"Data must include columns: {required_cols}")
 
-    data["KC_Middle"] = ta.EMA(data["Close"], timeperiod=period_ema)
+    kc_middle = data.indicator(ta.EMA, "Close", timeperiod=period_ema)
 
-    atr = ta.ATR(
-        data["High"], data["Low"], data["Close"], timeperiod=period_atr
-    )
+    atr = data.indicator(ta.ATR, "High", "Low", "Close", timeperiod=period_atr)
 
-    data["KC_Upper"] = data["KC_Middle"] + (multiplier * atr)
-    data["KC_Lower"] = data["KC_Middle"] - (multiplier * atr)
+    kc_upper = kc_middle + (multiplier * atr)
+    kc_lower = kc_middle - (multiplier * atr)
 
-    data["KELTNER_indicator"] = _generate_signals(
-        condition_buy=data["Close"] > data["KC_Upper"],
-        condition_sell=data["Close"] < data["KC_Lower"],
+    return _generate_signals(
+        condition_buy=data["Close"] > kc_upper,
+        condition_sell=data["Close"] < kc_lower,
     )
-    data.drop(columns=["KC_Middle", "KC_Upper", "KC_Lower"], inplace=True)
-    return data["KELTNER_indicator"]
 
 
+@vectorized_strategy
 def VWAP_indicator(data, window=14):
     """
     Calculates a rolling Volume Weighted Average Price (VWAP)
-    and adds it to the DataFrame.
-    Also adds a basic Price vs VWAP signal.
+    and a basic Price vs VWAP signal.
 
     Note: This is a ROLLING VWAP over the specified window.
     For intraday trading, VWAP is often reset daily.
     This requires different logic (groupby date).
-
-    Components Added:
-    - VWAP: Rolling VWAP value
-    - VWAP_Signal: Basic signal based on Close price relative to VWAP.
     """
     required_cols = ["High", "Low", "Close", "Volume"]
     if not all(col in data.columns for col in required_cols):
         raise ValueError(f"Data must include columns: {required_cols}")
-    if data["Volume"].isnull().any() or (data["Volume"] < 0).any():
+    volume = pd.Series(data["Volume"])
+    if volume.isnull().any() or (volume < 0).any():
         ...
         # logger.warning(
         #     "Warning: VWAP calculation encountered missing or
@@ -2112,21 +2123,13 @@ def VWAP_indicator(data, window=14):
         # )
 
     typical_price = (data["High"] + data["Low"] + data["Close"]) / 3
-
-    tp_vol = typical_price * data["Volume"]
+    tp_vol = pd.Series(typical_price * data["Volume"])
     sum_tp_vol = tp_vol.rolling(window=window, min_periods=window).sum()
-    sum_vol = data["Volume"].rolling(window=window, min_periods=window).sum()
-
+    sum_vol = volume.rolling(window=window, min_periods=window).sum()
     sum_vol_safe = sum_vol.replace(0, np.nan)
-    data["VWAP"] = sum_tp_vol / sum_vol_safe
-    # data["VWAP"] = data["VWAP"].fillna(method="ffill")
-    data["VWAP"] = data["VWAP"].ffill()
+    vwap = (sum_tp_vol / sum_vol_safe).ffill().to_numpy()
 
-    data["VWAP_indicator"] = _generate_signals(
-        condition_buy=data["Close"] > data["VWAP"],
-        condition_sell=data["Close"] < data["VWAP"],
+    return _generate_signals(
+        condition_buy=data["Close"] > vwap,
+        condition_sell=data["Close"] < vwap,
     )
-
-    data.drop(columns=["VWAP"], inplace=True)
-
-    return data["VWAP_indicator"]
@@ -1,10 +1,13 @@
+import asyncio
 import heapq
 import logging
 import threading
 import time
+from functools import partial
 from statistics import median
 
 import certifi
+import numpy as np
 from alpaca.data.historical.stock import StockHistoricalDataClient
 from alpaca.trading.client import TradingClient
 from alpaca.trading.enums import OrderSide
@@ -18,15 +21,38 @@ from config import (
     POLYGON_API_KEY,
     mongo_url,
 )
-from control import suggestion_heap_limit, trade_asset_limit, trade_liquidity_limit
+from control import (
+    live_async_concurrency,
+    live_cycle_timeout,
+    live_execution_mode,
+    live_max_workers,
+    live_task_timeout,
+    suggestion_heap_limit,
+    trade_asset_limit,
+    trade_liquidity_limit,
+)
+from helper_files.async_client_helper import (
+    connect_to_motor,
+    gather_bounded,
+    get_histories_async,
+    get_latest_price_async,
+    place_order_async,
+)
 from helper_files.client_helper import (
     get_latest_price,
     get_ndaq_tickers,
     market_status,
     place_order,
+    quote_service,
     strategies,
+    wait_for_price,
 )
-from strategies.talib_indicators import get_data, simulate_strategy
+from helper_files.cycle_executor import CycleExecutor
+from helper_files.history_provider import HistoryProvider
+from helper_files.ideal_periods import IdealPeriodRegistry
+from helper_files.quote_service import alpaca_latest_prices
+from strategies.signals import BUY, HOLD, SELL, signal_name
+from strategies.talib_indicators import simulate_strategy
 
 buy_heap = []
 suggestion_heap = []
@@ -49,13 +75,10 @@ ca = certifi.where()
 
 def weighted_majority_decision_and_median_quantity(decisions_and_quantities):
     """
-    Determines the majority decision (buy, sell, or hold) and returns the weighted median quantity for the chosen action.
-    Groups 'strong buy' with 'buy' and 'strong sell' with 'sell'.
+    Determines the majority decision (BUY, SELL, or HOLD) and returns the weighted median quantity for the chosen action.
+    Decisions are strategies.signals codes (convert legacy strings such as 'strong buy' with to_signal first).
     Applies weights to quantities based on strategy coefficients.
     """
-    buy_decisions = ["buy", "strong buy"]
-    sell_decisions = ["sell", "strong sell"]
-
     weighted_buy_quantities = []
     weighted_sell_quantities = []
     buy_weight = 0
@@ -64,19 +87,19 @@ def weighted_majority_decision_and_median_quantity(decisions_and_quantities):
 
     # Process decisions with weights
     for decision, quantity, weight in decisions_and_quantities:
-        if decision in buy_decisions:
-            weighted_buy_quantities.extend([quantity])
+        if decision == BUY:
+            weighted_buy_quantities.append(quantity)
             buy_weight += weight
-        elif decision in sell_decisions:
-            weighted_sell_quantities.extend([quantity])
+        elif decision == SELL:
+            weighted_sell_quantities.append(quantity)
             sell_weight += weight
-        elif decision == "hold":
+        elif decision == HOLD:
             hold_weight += weight
 
     # Determine the majority decision based on the highest accumulated weight
     if buy_weight > sell_weight and buy_weight > hold_weight:
         return (
-            "buy",
+            BUY,
             median(weighted_buy_quantities) if weighted_buy_quantities else 0,
             buy_weight,
             sell_weight,
@@ -84,19 +107,163 @@ def weighted_majority_decision_and_median_quantity(decisions_and_quantities):
         )
     elif sell_weight > buy_weight and sell_weight > hold_weight:
         return (
-            "sell",
+            SELL,
             median(weighted_sell_quantities) if weighted_sell_quantities else 0,
             buy_weight,
             sell_weight,
             hold_weight,
         )
     else:
-        return "hold", 0, buy_weight, sell_weight, hold_weight
+        return HOLD, 0, buy_weight, sell_weight, hold_weight
+
+
+def _running_total(values):
+    """
+    Sums each row left to right (like the += loop of
+    weighted_majority_decision_and_median_quantity), so the float results,
+    and ties between them, match it exactly.
+    """
+    if values.shape[1] == 0:
+        return np.zeros(len(values))
+    return np.cumsum(values, axis=1)[:, -1]
+
+
+def _masked_median(values, mask):
+    """
+    Returns the median of each row's values where mask is set (statistics.median
+    arithmetic), and 0 for rows with nothing set.
+    """
+    if values.shape[1] == 0:
+        return np.zeros(len(values))
+    counts = np.count_nonzero(mask, axis=1)
+    # Unset entries sort last; the middle one or two set values average
+    # like statistics.median (an odd count averages a value with itself).
+    ordered = np.sort(np.where(mask, values, np.inf), axis=1)
+    rows = np.arange(len(values))
+    low = np.maximum(counts - 1, 0) // 2
+    high = counts // 2
+    medians = (ordered[rows, low] + ordered[rows, high]) / 2
+    return np.where(counts > 0, medians, 0.0)
+
+
+def weighted_majority_decisions(decisions, quantities, weights):
+    """
+    Batched weighted_majority_decision_and_median_quantity: one vote per row.
+
+    Args:
+        decisions: (tickers x strategies) strategies.signals codes. Other
+          codes (e.g. MISSING) do not vote.
+        quantities: (tickers x strategies) quantities, or None to skip the
+          medians.
+        weights: (strategies,) or (tickers x strategies) strategy coefficients.
+
+    Returns (decision, quantity, buy_weight, sell_weight, hold_weight) arrays
+    with one entry per ticker (quantity is None if quantities is None). The
+    values, ties included, are those of
+    weighted_majority_decision_and_median_quantity on each row.
+    """
+    decisions = np.asarray(decisions)
+    weights = np.broadcast_to(np.asarray(weights, dtype=np.float64), decisions.shape)
+    is_buy = decisions == BUY
+    is_sell = decisions == SELL
+    buy_weight = _running_total(np.where(is_buy, weights, 0.0))
+    sell_weight = _running_total(np.where(is_sell, weights, 0.0))
+    hold_weight = _running_total(np.where(decisions == HOLD, weights, 0.0))
+
+    buys = (buy_weight > sell_weight) & (buy_weight > hold_weight)
+    sells = (sell_weight > buy_weight) & (sell_weight > hold_weight)
+    decision = np.full(len(decisions), HOLD, dtype=np.int8)
+    decision[buys] = BUY
+    decision[sells] = SELL
+
+    quantity = None
+    if quantities is not None:
+        quantities = np.asarray(quantities, dtype=np.float64)
+        quantity = np.where(
+            buys,
+            _masked_median(quantities, is_buy),
+            np.where(sells, _masked_median(quantities, is_sell), 0.0),
+        )
+    return decision, quantity, buy_weight, sell_weight, hold_weight
+
+
+def plan_ticker_order(
+    ticker,
+    decision,
+    quantity,
+    buy_weight,
+    sell_weight,
+    hold_weight,
+    current_price,
+    buying_power,
+    portfolio_qty,
+    portfolio_value,
+):
+    """
+    Decides what to do with a ticker's weighted majority vote.
+
+    Returns ("buy", buy_heap entry), ("suggestion", suggestion_heap entry),
+    ("sell", quantity to sell now) or (None, None) to hold.
+    """
+    if (
+        decision == BUY
+        and buying_power > trade_liquidity_limit
+        and (((quantity + portfolio_qty) * current_price) / portfolio_value)
+        < trade_asset_limit
+    ):
+        return "buy", (
+            -(buy_weight - (sell_weight + (hold_weight * 0.5))),
+            quantity,
+            ticker,
+        )
+    elif decision == SELL and portfolio_qty > 0:
+        print(f"Executing SELL order for {ticker}")
+        print(f"Executing quantity of {quantity} for {ticker}")
+        return "sell", max(quantity, 1)
+    elif (
+        portfolio_qty == 0.0
+        and buy_weight > sell_weight
+        and (((quantity + portfolio_qty) * current_price) / portfolio_value)
+        < trade_asset_limit
+        and buying_power > trade_liquidity_limit
+    ):
+        max_investment = portfolio_value * trade_asset_limit
+        buy_quantity = min(
+            int(max_investment // current_price),
+            int(buying_power // current_price),
+        )
+        if buy_weight > suggestion_heap_limit:
+            buy_quantity = max(buy_quantity, 2)
+            buy_quantity = buy_quantity // 2
+            print(
+                f"Suggestions for buying for {ticker} with a weight of {buy_weight} and quantity of {buy_quantity}"
+            )
+            return "suggestion", (-(buy_weight - sell_weight), buy_quantity, ticker)
+        else:
+            logging.info(f"Holding for {ticker}, no action taken.")
+    else:
+        logging.info(f"Holding for {ticker}, no action taken.")
+    return None, None
 
 
 def process_ticker(
-    ticker, client, trading_client, data_client, mongo_client, strategy_to_coefficient
+    ticker,
+    client,
+    trading_client,
+    data_client,
+    mongo_client,
+    strategy_to_coefficient,
+    ideal_periods,
+    histories,
+    cancel_event=None,
 ):
+    """
+    Votes on a ticker and queues or places its order, reading its histories
+    from the cycle's HistoryProvider. cancel_event is set by the cycle
+    executor when the cycle stops waiting for this ticker.
+    """
+    if cancel_event is None:
+        cancel_event = threading.Event()
     global buy_heap
     global suggestion_heap
     global sold
@@ -105,16 +272,7 @@ def process_ticker(
     else:
         try:
             decisions_and_quantities = []
-            current_price = None
-
-            while current_price is None:
-                try:
-                    current_price = get_latest_price(ticker)
-                except Exception as fetch_error:
-                    logging.warning(
-                        f"Error fetching price for {ticker}. Retrying... {fetch_error}"
-                    )
-                    break
+            current_price = wait_for_price(ticker, cancel_event)
             if current_price is None:
                 return
             print(f"Current price of {ticker}: {current_price}")
@@ -153,24 +311,21 @@ def process_ticker(
                     logging.info(f"Executed SELL order for {ticker}: {order}")
                     return
 
-            indicator_tb = mongo_client.IndicatorsDatabase
-            indicator_collection = indicator_tb.Indicators
-
             for strategy in strategies:
+                if cancel_event.is_set():
+                    return
                 historical_data = None
                 while historical_data is None:
                     try:
-                        period = indicator_collection.find_one(
-                            {"indicator": strategy.__name__}
-                        )
-                        historical_data = get_data(
-                            ticker, mongo_client, period["ideal_period"]
+                        historical_data = histories.get(
+                            ticker, ideal_periods[strategy.__name__]
                         )
                     except Exception as fetch_error:
                         logging.warning(
                             f"Error fetching historical data for {ticker}. Retrying... {fetch_error}"
                         )
-                        time.sleep(60)
+                        if cancel_event.wait(60):
+                            return
 
                 decision, quantity = simulate_strategy(
                     strategy,
@@ -182,7 +337,7 @@ def process_ticker(
                     portfolio_value,
                 )
                 print(
-                    f"Strategy: {strategy.__name__}, Decision: {decision}, Quantity: {quantity} for {ticker}"
+                    f"Strategy: {strategy.__name__}, Decision: {signal_name(decision)}, Quantity: {quantity} for {ticker}"
                 )
                 weight = strategy_to_coefficient[strategy.__name__]
                 decisions_and_quantities.append((decision, quantity, weight))
@@ -195,67 +350,321 @@ def process_ticker(
                 hold_weight,
             ) = weighted_majority_decision_and_median_quantity(decisions_and_quantities)
             print(
-                f"Ticker: {ticker}, Decision: {decision}, Quantity: {quantity}, Weights: Buy: {buy_weight}, Sell: {sell_weight}, Hold: {hold_weight}"
+                f"Ticker: {ticker}, Decision: {signal_name(decision)}, Quantity: {quantity}, "
+                f"Weights: Buy: {buy_weight}, Sell: {sell_weight}, Hold: {hold_weight}"
             )
+            if cancel_event.is_set():
+                return
 
-            if (
-                decision == "buy"
-                and float(account.cash) > trade_liquidity_limit
-                and (((quantity + portfolio_qty) * current_price) / portfolio_value)
-                < trade_asset_limit
-            ):
-                heapq.heappush(
-                    buy_heap,
-                    (
-                        -(buy_weight - (sell_weight + (hold_weight * 0.5))),
-                        quantity,
-                        ticker,
-                    ),
-                )
-            elif decision == "sell" and portfolio_qty > 0:
-                print(f"Executing SELL order for {ticker}")
-                print(f"Executing quantity of {quantity} for {ticker}")
+            order_kind, order_value = plan_ticker_order(
+                ticker,
+                decision,
+                quantity,
+                buy_weight,
+                sell_weight,
+                hold_weight,
+                current_price,
+                buying_power,
+                portfolio_qty,
+                portfolio_value,
+            )
+            if order_kind == "buy":
+                heapq.heappush(buy_heap, order_value)
+            elif order_kind == "suggestion":
+                heapq.heappush(suggestion_heap, order_value)
+            elif order_kind == "sell":
                 sold = True
-                quantity = max(quantity, 1)
                 order = place_order(
                     trading_client,
                     symbol=ticker,
                     side=OrderSide.SELL,
-                    quantity=quantity,
+                    quantity=order_value,
                     mongo_client=mongo_client,
                 )
                 logging.info(f"Executed SELL order for {ticker}: {order}")
-            elif (
-                portfolio_qty == 0.0
-                and buy_weight > sell_weight
-                and (((quantity + portfolio_qty) * current_price) / portfolio_value)
-                < trade_asset_limit
-                and float(account.cash) > trade_liquidity_limit
-            ):
-                max_investment = portfolio_value * trade_asset_limit
-                buy_quantity = min(
-                    int(max_investment // current_price),
-                    int(buying_power // current_price),
-                )
-                if buy_weight > suggestion_heap_limit:
-                    buy_quantity = max(buy_quantity, 2)
-                    buy_quantity = buy_quantity // 2
-                    print(
-                        f"Suggestions for buying for {ticker} with a weight of {buy_weight} and quantity of {buy_quantity}"
-                    )
-                    heapq.heappush(
-                        suggestion_heap,
-                        (-(buy_weight - sell_weight), buy_quantity, ticker),
-                    )
-                else:
-                    logging.info(f"Holding for {ticker}, no action taken.")
-            else:
-                logging.info(f"Holding for {ticker}, no action taken.")
 
         except Exception as e:
             logging.error(f"Error processing {ticker}: {e}")
 
 
+async def process_ticker_async(
+    ticker,
+    trading_client,
+    motor_client,
+    strategy_to_coefficient,
+    ideal_periods,
+    account,
+):
+    """
+    process_ticker for the asyncio execution mode: database I/O goes through
+    motor, the ticker's history is read once for its longest period, and
+    the account is read once per cycle by the caller.
+    """
+    global sold
+    if sold is True:
+        print("Sold boolean is True. Exiting process_ticker function.")
+        return
+
+    current_price = await get_latest_price_async(ticker)
+    if current_price is None:
+        return
+    print(f"Current price of {ticker}: {current_price}")
+
+    buying_power = float(account.cash)
+    portfolio_value = float(account.portfolio_value)
+    trades_db = motor_client.trades
+    asset_info, limit_info = await asyncio.gather(
+        trades_db.assets_quantities.find_one({"symbol": ticker}),
+        trades_db.assets_limit.find_one({"symbol": ticker}),
+    )
+    portfolio_qty = asset_info["quantity"] if asset_info else 0.0
+    print(f"Portfolio quantity for {ticker}: {portfolio_qty}")
+
+    if limit_info and (
+        current_price <= limit_info["stop_loss_price"]
+        or current_price >= limit_info["take_profit_price"]
+    ):
+        sold = True
+        print(
+            f"Executing SELL order for {ticker} due to stop-loss or take-profit condition"
+        )
+        order = await place_order_async(
+            trading_client, ticker, OrderSide.SELL, portfolio_qty, motor_client
+        )
+        logging.info(f"Executed SELL order for {ticker}: {order}")
+        return
+
+    histories = await get_histories_async(
+        ticker,
+        motor_client,
+        [ideal_periods[strategy.__name__] for strategy in strategies],
+        logging.getLogger(),
+    )
+    decisions_and_quantities = []
+    for strategy in strategies:
+        historical_data = histories.get(ideal_periods[strategy.__name__])
+        if historical_data is None:
+            continue
+        decision, quantity = simulate_strategy(
+            strategy,
+            ticker,
+            current_price,
+            historical_data,
+            buying_power,
+            portfolio_qty,
+            portfolio_value,
+        )
+        print(
+            f"Strategy: {strategy.__name__}, Decision: {signal_name(decision)}, Quantity: {quantity} for {ticker}"
+        )
+        weight = strategy_to_coefficient[strategy.__name__]
+        decisions_and_quantities.append((decision, quantity, weight))
+
+    (
+        decision,
+        quantity,
+        buy_weight,
+        sell_weight,
+        hold_weight,
+    ) = weighted_majority_decision_and_median_quantity(decisions_and_quantities)
+    print(
+        f"Ticker: {ticker}, Decision: {signal_name(decision)}, Quantity: {quantity}, "
+        f"Weights: Buy: {buy_weight}, Sell: {sell_weight}, Hold: {hold_weight}"
+    )
+
+    order_kind, order_value = plan_ticker_order(
+        ticker,
+        decision,
+        quantity,
+        buy_weight,
+        sell_weight,
+        hold_weight,
+        current_price,
+        buying_power,
+        portfolio_qty,
+        portfolio_value,
+    )
+    if order_kind == "buy":
+        heapq.heappush(buy_heap, order_value)
+    elif order_kind == "suggestion":
+        heapq.heappush(suggestion_heap, order_value)
+    elif order_kind == "sell":
+        sold = True
+        order = await place_order_async(
+            trading_client, ticker, OrderSide.SELL, order_value, motor_client
+        )
+        logging.info(f"Executed SELL order for {ticker}: {order}")
+
+
+async def process_tickers_async(
+    tickers, trading_client, motor_client, strategy_to_coefficient, ideal_periods
+):
+    """
+    Processes a cycle's tickers as coroutines, at most live_async_concurrency
+    at a time.
+    """
+    _, account = await asyncio.gather(
+        ideal_periods.refresh_async(motor_client),
+        asyncio.to_thread(trading_client.get_account),
+    )
+    await gather_bounded(
+        process_ticker_async,
+        tickers,
+        trading_client,
+        motor_client,
+        strategy_to_coefficient,
+        ideal_periods,
+        account,
+        concurrency=live_async_concurrency,
+        logger=logging.getLogger(),
+        task_timeout=live_task_timeout,
+        cycle_timeout=live_cycle_timeout,
+    )
+
+
+def load_strategy_coefficients(mongo_client):
+    """
+    Returns {strategy name: coefficient of the strategy's rank}.
+    """
+    db = mongo_client.trading_simulator
+    strategy_to_coefficient = {}
+    for strategy in strategies:
+        rank = db.rank.find_one({"strategy": strategy.__name__})["rank"]
+        strategy_to_coefficient[strategy.__name__] = db.rank_to_coefficient.find_one(
+            {"rank": rank}
+        )["coefficient"]
+    return strategy_to_coefficient
+
+
+async def load_strategy_coefficients_async(motor_client):
+    """
+    load_strategy_coefficients for a motor client.
+    """
+    db = motor_client.trading_simulator
+    strategy_to_coefficient = {}
+    for strategy in strategies:
+        rank = (await db.rank.find_one({"strategy": strategy.__name__}))["rank"]
+        strategy_to_coefficient[strategy.__name__] = (
+            await db.rank_to_coefficient.find_one({"rank": rank})
+        )["coefficient"]
+    return strategy_to_coefficient
+
+
+def portfolio_value_updates(portfolio_value, qqq_latest, spy_latest):
+    """
+    Returns the (filter, update) pairs that record the portfolio's, the
+    NASDAQ's and the S&P 500's change in trades.portfolio_values.
+    """
+    return [
+        (
+            {"name": "portfolio_percentage"},
+            {"$set": {"portfolio_value": (portfolio_value - 50491.13) / 50491.13}},
+        ),
+        (
+            {"name": "ndaq_percentage"},
+            {"$set": {"portfolio_value": (qqq_latest - 518.58) / 518.58}},
+        ),
+        (
+            {"name": "spy_percentage"},
+            {"$set": {"portfolio_value": (spy_latest - 591.95) / 591.95}},
+        ),
+    ]
+
+
+def place_buy_orders(trading_client, mongo_client):
+    """
+    Places the cycle's queued buy orders, the buy heap before the
+    suggestions, while the cash stays above trade_liquidity_limit.
+    """
+    account = trading_client.get_account()
+    while (
+        (buy_heap or suggestion_heap)
+        and float(account.cash) > trade_liquidity_limit
+        and sold is False
+    ):
+        try:
+            account = trading_client.get_account()
+            print(f"Cash: {account.cash}")
+            if float(account.cash) > trade_liquidity_limit:
+                _, quantity, ticker = heapq.heappop(buy_heap or suggestion_heap)
+                print(f"Executing BUY order for {ticker} of quantity {quantity}")
+                order = place_order(
+                    trading_client,
+                    symbol=ticker,
+                    side=OrderSide.BUY,
+                    quantity=quantity,
+                    mongo_client=mongo_client,
+                )
+                logging.info(f"Executed BUY order for {ticker}: {order}")
+            # Lets the order propagate so the next cash balance is accurate.
+            time.sleep(5)
+        except Exception as e:
+            print(f"Error occurred while executing buy order due to {e}. Continuing...")
+            break
+
+
+async def place_buy_orders_async(trading_client, motor_client):
+    """
+    place_buy_orders for a motor client.
+    """
+    account = await asyncio.to_thread(trading_client.get_account)
+    while (
+        (buy_heap or suggestion_heap)
+        and float(account.cash) > trade_liquidity_limit
+        and sold is False
+    ):
+        try:
+            account = await asyncio.to_thread(trading_client.get_account)
+            print(f"Cash: {account.cash}")
+            if float(account.cash) > trade_liquidity_limit:
+                _, quantity, ticker = heapq.heappop(buy_heap or suggestion_heap)
+                print(f"Executing BUY order for {ticker} of quantity {quantity}")
+                order = await place_order_async(
+                    trading_client, ticker, OrderSide.BUY, quantity, motor_client
+                )
+                logging.info(f"Executed BUY order for {ticker}: {order}")
+            # Lets the order propagate so the next cash balance is accurate.
+            await asyncio.sleep(5)
+        except Exception as e:
+            print(f"Error occurred while executing buy order due to {e}. Continuing...")
+            break
+
+
+async def trading_cycle_async(
+    tickers, trading_client, motor_client, strategy_to_coefficient, ideal_periods
+):
+    """
+    One open-market cycle in the asyncio execution mode: records the
+    portfolio values, votes on every ticker and places the queued buy
+    orders. Database I/O goes through motor and the blocking API calls run
+    on the default thread pool.
+    """
+    account = await asyncio.to_thread(trading_client.get_account)
+    # Batched requests for every price this cycle reads.
+    try:
+        await asyncio.to_thread(quote_service.refresh, tickers + ["QQQ", "SPY"])
+    except Exception as e:
+        logging.warning(
+            f"Error refreshing latest prices, fetching them per ticker: {e}"
+        )
+    qqq_latest, spy_latest = await asyncio.gather(
+        get_latest_price_async("QQQ"), get_latest_price_async("SPY")
+    )
+    portfolio_collection = motor_client.trades.portfolio_values
+    await asyncio.gather(
+        *(
+            portfolio_collection.update_one(filter, update)
+            for filter, update in portfolio_value_updates(
+                float(account.portfolio_value), qqq_latest, spy_latest
+            )
+        )
+    )
+    await process_tickers_async(
+        tickers, trading_client, motor_client, strategy_to_coefficient, ideal_periods
+    )
+    await place_buy_orders_async(trading_client, motor_client)
+
+
 def main():
     """
     Main function to control the workflow based on the market's status.
@@ -271,143 +680,104 @@ def main():
     client = RESTClient(api_key=POLYGON_API_KEY)
     trading_client = TradingClient(API_KEY, API_SECRET)
     data_client = StockHistoricalDataClient(API_KEY, API_SECRET)
+    # Latest prices come from Alpaca's batched latest trades endpoint.
+    quote_service.source = partial(alpaca_latest_prices, data_client=data_client)
     mongo_client = MongoClient(mongo_url, tlsCAFile=ca)
     # db = mongo_client.trades
     # asset_collection = db.assets_quantities
     # limits_collection = db.assets_limit
     strategy_to_coefficient = {}
+    # Reloaded only when initialize_indicator_setup changes the periods.
+    ideal_periods = IdealPeriodRegistry()
     sold = False
+    executor = CycleExecutor(
+        live_max_workers, live_task_timeout, live_cycle_timeout, name="trading"
+    )
+    # The API clients are long-lived and reused by every cycle.
+    event_loop = None
+    if live_execution_mode == "asyncio":
+        event_loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(event_loop)
+        motor_client = connect_to_motor(mongo_url)
     while True:
-        client = RESTClient(api_key=POLYGON_API_KEY)
-        trading_client = TradingClient(API_KEY, API_SECRET)
-        data_client = StockHistoricalDataClient(API_KEY, API_SECRET)
         status = market_status(client)  # Use the helper function for market status
         # db = mongo_client.trades
         # asset_collection = db.assets_quantities
         # limits_collection = db.assets_limit
-        market_db = mongo_client.market_data
-        market_collection = market_db.market_status
         # indicator_tb = mongo_client.IndicatorsDatabase
         # indicator_collection = indicator_tb.Indicators
 
-        market_collection.update_one({}, {"$set": {"market_status": status}})
+        if event_loop is not None:
+            event_loop.run_until_complete(
+                motor_client.market_data.market_status.update_one(
+                    {}, {"$set": {"market_status": status}}
+                )
+            )
+        else:
+            mongo_client.market_data.market_status.update_one(
+                {}, {"$set": {"market_status": status}}
+            )
 
         if status == "open":
             if not ndaq_tickers:
                 logging.info("Market is open")
                 ndaq_tickers = get_ndaq_tickers(mongo_client, FINANCIAL_PREP_API_KEY)
-                sim_db = mongo_client.trading_simulator
-                rank_collection = sim_db.rank
-                r_t_c_collection = sim_db.rank_to_coefficient
-                for strategy in strategies:
-                    rank = rank_collection.find_one({"strategy": strategy.__name__})[
-                        "rank"
-                    ]
-                    coefficient = r_t_c_collection.find_one({"rank": rank})[
-                        "coefficient"
-                    ]
-                    strategy_to_coefficient[strategy.__name__] = coefficient
-                    early_hour_first_iteration = False
-                    post_hour_first_iteration = True
-            trading_client = TradingClient(API_KEY, API_SECRET)
-            account = trading_client.get_account()
-            # buying_power = float(account.cash)
-            portfolio_value = float(account.portfolio_value)
-            # cash_to_portfolio_ratio = buying_power / portfolio_value
-            qqq_latest = get_latest_price("QQQ")
-            spy_latest = get_latest_price("SPY")
+                if event_loop is not None:
+                    strategy_to_coefficient = event_loop.run_until_complete(
+                        load_strategy_coefficients_async(motor_client)
+                    )
+                else:
+                    strategy_to_coefficient = load_strategy_coefficients(mongo_client)
+                early_hour_first_iteration = False
+                post_hour_first_iteration = True
             buy_heap = []
             suggestion_heap = []
-
-            trades_db = mongo_client.trades
-            portfolio_collection = trades_db.portfolio_values
-
-            portfolio_collection.update_one(
-                {"name": "portfolio_percentage"},
-                {"$set": {"portfolio_value": (portfolio_value - 50491.13) / 50491.13}},
-            )
-            portfolio_collection.update_one(
-                {"name": "ndaq_percentage"},
-                {"$set": {"portfolio_value": (qqq_latest - 518.58) / 518.58}},
-            )
-            portfolio_collection.update_one(
-                {"name": "spy_percentage"},
-                {"$set": {"portfolio_value": (spy_latest - 591.95) / 591.95}},
-            )
-
-            threads = []
-
-            for ticker in ndaq_tickers:
-                thread = threading.Thread(
-                    target=process_ticker,
-                    args=(
-                        ticker,
-                        client,
+            if event_loop is not None:
+                event_loop.run_until_complete(
+                    trading_cycle_async(
+                        ndaq_tickers,
                         trading_client,
-                        data_client,
-                        mongo_client,
+                        motor_client,
                         strategy_to_coefficient,
-                    ),
+                        ideal_periods,
+                    )
                 )
-                threads.append(thread)
-                thread.start()
-
-            # Wait for all threads to complete
-            for thread in threads:
-                thread.join()
-
-            trading_client = TradingClient(API_KEY, API_SECRET)
-            account = trading_client.get_account()
-            while (
-                (buy_heap or suggestion_heap)
-                and float(account.cash) > trade_liquidity_limit
-                and sold is False
-            ):
+            else:
+                account = trading_client.get_account()
+                # buying_power = float(account.cash)
+                portfolio_value = float(account.portfolio_value)
+                # cash_to_portfolio_ratio = buying_power / portfolio_value
+                # Batched requests for every price this cycle reads.
                 try:
-                    trading_client = TradingClient(API_KEY, API_SECRET)
-                    account = trading_client.get_account()
-                    print(f"Cash: {account.cash}")
-                    if buy_heap and float(account.cash) > trade_liquidity_limit:
-                        _, quantity, ticker = heapq.heappop(buy_heap)
-                        print(
-                            f"Executing BUY order for {ticker} of quantity {quantity}"
-                        )
+                    quote_service.refresh(ndaq_tickers + ["QQQ", "SPY"])
+                except Exception as e:
+                    logging.warning(
+                        f"Error refreshing latest prices, fetching them per ticker: {e}"
+                    )
+                qqq_latest = get_latest_price("QQQ")
+                spy_latest = get_latest_price("SPY")
 
-                        order = place_order(
-                            trading_client,
-                            symbol=ticker,
-                            side=OrderSide.BUY,
-                            quantity=quantity,
-                            mongo_client=mongo_client,
-                        )
-                        logging.info(f"Executed BUY order for {ticker}: {order}")
-
-                    elif (
-                        suggestion_heap and float(account.cash) > trade_liquidity_limit
-                    ):
-                        _, quantity, ticker = heapq.heappop(suggestion_heap)
-                        print(
-                            f"Executing BUY order for {ticker} of quantity {quantity}"
-                        )
+                portfolio_collection = mongo_client.trades.portfolio_values
+                for filter, update in portfolio_value_updates(
+                    portfolio_value, qqq_latest, spy_latest
+                ):
+                    portfolio_collection.update_one(filter, update)
 
-                        order = place_order(
-                            trading_client,
-                            symbol=ticker,
-                            side=OrderSide.BUY,
-                            quantity=quantity,
-                            mongo_client=mongo_client,
-                        )
-                        logging.info(f"Executed BUY order for {ticker}: {order}")
+                ideal_periods.refresh(mongo_client)
+                executor.run(
+                    process_ticker,
+                    ndaq_tickers,
+                    client,
+                    trading_client,
+                    data_client,
+                    mongo_client,
+                    strategy_to_coefficient,
+                    ideal_periods,
+                    HistoryProvider(mongo_client, ideal_periods.values()),
+                    logger=logging.getLogger(),
+                )
 
-                    time.sleep(5)
-                    """
-                    This is here so order will propage through and we will have an accurate cash balance recorded
-                    """
-                except Exception as e:
-                    print(
-                        f"Error occurred while executing buy order due to {e}. Continuing..."
-                    )
-                    break
+                place_buy_orders(trading_client, mongo_client)
             buy_heap = []
             suggestion_heap = []
             sold = False
@@ -417,19 +787,14 @@ def main():
         elif status == "early_hours":
             if early_hour_first_iteration:
                 ndaq_tickers = get_ndaq_tickers(mongo_client, FINANCIAL_PREP_API_KEY)
-                sim_db = mongo_client.trading_simulator
-                rank_collection = sim_db.rank
-                r_t_c_collection = sim_db.rank_to_coefficient
-                for strategy in strategies:
-                    rank = rank_collection.find_one({"strategy": strategy.__name__})[
-                        "rank"
-                    ]
-                    coefficient = r_t_c_collection.find_one({"rank": rank})[
-                        "coefficient"
-                    ]
-                    strategy_to_coefficient[strategy.__name__] = coefficient
-                    early_hour_first_iteration = False
-                    post_hour_first_iteration = True
+                if event_loop is not None:
+                    strategy_to_coefficient = event_loop.run_until_complete(
+                        load_strategy_coefficients_async(motor_client)
+                    )
+                else:
+                    strategy_to_coefficient = load_strategy_coefficients(mongo_client)
+                early_hour_first_iteration = False
+                post_hour_first_iteration = True
                 logging.info("Market is in early hours. Waiting for 30 seconds.")
             time.sleep(30)
 